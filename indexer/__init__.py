@@ -31,6 +31,8 @@ from .decode.log_decoder import LogDecoder
 from .pipeline.indexing_pipeline import IndexingPipeline  
 from .pipeline.batch_pipeline import BatchPipeline
 from .storage.gcs_handler import GCSHandler
+from .storage.local_cache import LocalBlockCache
+from .storage.block_manifest import BlockManifest
 from .transform.manager import TransformManager
 from .transform.registry import TransformRegistry
 from .types import DatabaseConfig, EvmAddress, ContractConfig, StorageConfig
@@ -151,6 +153,7 @@ def _configure_logging_early(env: dict):
     console_enabled = env.get("INDEXER_LOG_CONSOLE", "true").lower() == "true"
     file_enabled = env.get("INDEXER_LOG_FILE", "true").lower() == "true"
     structured_format = env.get("INDEXER_LOG_STRUCTURED", "false").lower() == "true"
+    hot_path_quiet = env.get("INDEXER_LOG_HOT_PATH_QUIET", "false").lower() == "true"
     
     IndexerLogger.configure(
         log_dir=log_dir,
@@ -159,6 +162,8 @@ def _configure_logging_early(env: dict):
         file_enabled=file_enabled,
         structured_format=structured_format
     )
+    if hot_path_quiet:
+        IndexerLogger.set_hot_path_quiet(True)
 
 def _register_services(container: IndexerContainer, shared_db_manager: SharedDatabaseManager, model_db_manager: ModelDatabaseManager, secrets_service: SecretsService):
     logger = IndexerLogger.get_logger('core.services')
@@ -303,7 +308,8 @@ def _create_gcs_handler(env: dict) -> GCSHandler:
             processing_prefix=f"models/{model_name}/processing/",
             complete_prefix=f"models/{model_name}/complete/",
             processing_format="block_{:012d}.json",
-            complete_format="block_{:012d}.json"
+            complete_format="block_{:012d}.json",
+            block_format=env.get("INDEXER_BLOCK_FORMAT", "json")
         )
 
     log_with_context(logger, DEBUG, "Storage configuration created",
@@ -311,8 +317,33 @@ def _create_gcs_handler(env: dict) -> GCSHandler:
                     processing_prefix=storage.processing_prefix,
                     complete_prefix=storage.complete_prefix)
         
+    block_cache = None
+    cache_dir = env.get("INDEXER_BLOCK_CACHE_DIR")
+    if cache_dir:
+        block_cache = LocalBlockCache(
+            cache_dir=cache_dir,
+            max_bytes=int(env.get("INDEXER_BLOCK_CACHE_MAX_MB", "10240")) * 1024 * 1024,
+            offline=env.get("INDEXER_BLOCK_CACHE_OFFLINE", "false").lower() == "true"
+        )
+        log_with_context(logger, DEBUG, "Local block cache enabled",
+                        cache_dir=cache_dir,
+                        offline=block_cache.offline)
+    
+    block_manifest = None
+    manifest_dir = env.get("INDEXER_BLOCK_MANIFEST_DIR")
+    if manifest_dir:
+        block_manifest = BlockManifest(
+            manifest_dir=manifest_dir,
+            full_sync_seconds=float(env.get("INDEXER_BLOCK_MANIFEST_FULL_SYNC", "3600"))
+        )
+        log_with_context(logger, DEBUG, "Block manifest enabled",
+                        manifest_dir=manifest_dir,
+                        full_sync_seconds=block_manifest.full_sync_seconds)
+        
     return GCSHandler(
         storage_config=storage,
         gcs_project=project_id,
         bucket_name=bucket_name,
+        block_cache=block_cache,
+        block_manifest=block_manifest,
     )
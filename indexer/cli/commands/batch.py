@@ -201,8 +201,17 @@ def redirect_to_log(log_file_path: str, quiet: bool = False):
 @click.option('--log-file', help='Custom log file path')
 @click.option('--no-log', is_flag=True, help='Disable automatic logging')
 @click.option('--quiet', '-q', is_flag=True, help='Minimal output (just start/completion status)')
+@click.option('--parallel-workers', type=int, help='Decode/transform block range jobs across N processes')
+@click.option('--prefetch-depth', type=int, help='Download up to N blocks ahead in block range jobs')
+@click.option('--stage-index-ttl', type=int, help='Resolve block storage stage from listings refreshed every N seconds')
+@click.option('--copy-load', is_flag=True, help='Write domain events with COPY bulk loading (backfills)')
+@click.option('--claim-batch-size', type=int, help='Jobs claimed per queue round-trip (default: 1)')
+@click.option('--lease-seconds', type=int, help='Lease on claimed jobs, kept alive by heartbeat (default: 300)')
+@click.option('--keep-alive', is_flag=True, help='Wait for new jobs when the queue is empty instead of exiting')
+@click.option('--no-listen', is_flag=True, help='Poll for jobs instead of waking on LISTEN/NOTIFY')
 @click.pass_context
-def process_queue(ctx, max_jobs, timeout, worker_name, log_file, no_log, quiet):
+def process_queue(ctx, max_jobs, timeout, worker_name, log_file, no_log, quiet, parallel_workers, prefetch_depth, stage_index_ttl, copy_load,
+                  claim_batch_size, lease_seconds, keep_alive, no_listen):
     """Process queued jobs with automatic logging
     
     Examples:
@@ -214,6 +223,24 @@ def process_queue(ctx, max_jobs, timeout, worker_name, log_file, no_log, quiet):
         
         # Process without logging (output to console)
         batch process --no-log
+        
+        # Decode/transform across 8 processes on this host
+        batch process --parallel-workers 8
+        
+        # Overlap block downloads with processing, 16 blocks ahead
+        batch process --prefetch-depth 16
+        
+        # Skip per-stage lookups using storage listings refreshed every 5 minutes
+        batch process --stage-index-ttl 300
+        
+        # Backfill with COPY-based bulk loading of domain events
+        batch process --copy-load
+        
+        # Claim 10 jobs at a time; jobs of a dead worker are requeued after 10 minutes
+        batch process --claim-batch-size 10 --lease-seconds 600
+        
+        # Near-real-time: stay up and wake as soon as new jobs are queued
+        batch process --keep-alive
     """
     # IMPORTANT: Setup logging BEFORE importing BatchRunner
     log_path = None
@@ -239,7 +266,18 @@ def process_queue(ctx, max_jobs, timeout, worker_name, log_file, no_log, quiet):
     
     try:
         model_name = ctx.obj.get('model')
-        runner = BatchRunner(model_name=model_name)
+        runner = BatchRunner(
+            model_name=model_name, 
+            parallel_workers=parallel_workers, 
+            prefetch_depth=prefetch_depth,
+            stage_index_ttl=stage_index_ttl,
+            copy_load=copy_load,
+            claim_batch_size=claim_batch_size,
+            lease_seconds=lease_seconds,
+            worker_id=worker_name,
+            keep_alive=keep_alive,
+            listen_for_jobs=not no_listen
+        )
         
         # Show job start status (only if not quiet or if no logging)
         if not quiet or no_log:
@@ -248,6 +286,10 @@ def process_queue(ctx, max_jobs, timeout, worker_name, log_file, no_log, quiet):
                 print(f"📊 Max jobs: {max_jobs:,}")
             if timeout:
                 print(f"⏱️  Timeout: {timeout:,} seconds")
+            if parallel_workers:
+                print(f"⚙️  Parallel workers: {parallel_workers}")
+            if prefetch_depth:
+                print(f"⚙️  Prefetch depth: {prefetch_depth}")
             if log_path and not quiet:
                 print(f"📝 Logging to: {log_path}")
             print()
@@ -432,53 +474,87 @@ def test_block(ctx, block_number):
 @batch.command('multi-worker')
 @click.argument('worker_count', type=int)
 @click.option('--max-jobs', type=int, help='Maximum jobs per worker')
-@click.option('--timeout', type=int, help='Timeout per worker in seconds')
+@click.option('--timeout', type=int, help='Drain all workers after N seconds')
+@click.option('--parallel-workers', type=int, help='Decode/transform block range jobs across N processes per worker')
+@click.option('--prefetch-depth', type=int, help='Download up to N blocks ahead in block range jobs')
+@click.option('--stage-index-ttl', type=int, help='Resolve block storage stage from listings refreshed every N seconds')
+@click.option('--copy-load', is_flag=True, help='Write domain events with COPY bulk loading (backfills)')
+@click.option('--claim-batch-size', type=int, help='Jobs claimed per queue round-trip (default: 1)')
+@click.option('--lease-seconds', type=int, help='Lease on claimed jobs, kept alive by heartbeat (default: 300)')
+@click.option('--keep-alive', is_flag=True, help='Workers wait for new jobs instead of exiting when the queue is empty')
+@click.option('--no-listen', is_flag=True, help='Poll for jobs instead of waking on LISTEN/NOTIFY')
+@click.option('--log-level', default='WARNING', help='Log level inside workers (default: WARNING)')
+@click.option('--restart-backoff', type=float, default=1.0, help='Initial restart delay for crashed workers, doubling up to 60s (default: 1)')
+@click.option('--max-restarts', type=int, help='Give up on a worker after N restarts (default: unlimited)')
+@click.option('--status-interval', type=float, default=5.0, help='Seconds between status line updates (default: 5)')
+@click.option('--drain-timeout', type=float, default=120.0, help='Seconds to wait for workers to drain before killing them (default: 120)')
 @click.pass_context
-def start_multi_worker(ctx, worker_count, max_jobs, timeout):
-    """Start multiple workers (helper command - shows commands to run)
+def start_multi_worker(ctx, worker_count, max_jobs, timeout, parallel_workers, prefetch_depth, stage_index_ttl, copy_load,
+                       claim_batch_size, lease_seconds, keep_alive, no_listen, log_level, restart_backoff, max_restarts, status_interval, drain_timeout):
+    """Run and supervise multiple worker processes
     
-    This doesn't actually start workers, but shows you the commands to run
-    for proper multi-worker coordination.
+    Starts WORKER_COUNT queue workers (worker_1 .. worker_N), each logging to
+    logs/batch_processing/{model}/worker_N.log. Crashed workers are restarted
+    with backoff. Ctrl-C or SIGTERM drains the workers (current jobs finish,
+    unstarted claimed jobs go back to the queue); a second signal kills them.
     
     Examples:
-        # Show commands for 4 workers
+        # Run 4 workers until the queue is drained
         batch multi-worker 4
         
-        # Show commands with job limits
+        # With job limits
         batch multi-worker 4 --max-jobs 50
+        
+        # 8 workers claiming 10 jobs at a time, stop after an hour
+        batch multi-worker 8 --claim-batch-size 10 --timeout 3600
+        
+        # Keep 4 workers indexing new jobs as they are queued
+        batch multi-worker 4 --keep-alive
     """
-    model_name = ctx.obj.get('model') or 'blub_test'
+    from ...pipeline.worker_supervisor import WorkerSupervisor
     
-    click.echo(f"🚀 Multi-Worker Setup for {worker_count} workers")
+    model_name = ctx.obj.get('model') or os.environ.get('INDEXER_MODEL')
+    
+    runner_options = {
+        'parallel_workers': parallel_workers,
+        'prefetch_depth': prefetch_depth,
+        'stage_index_ttl': stage_index_ttl,
+        'copy_load': copy_load,
+        'claim_batch_size': claim_batch_size,
+        'lease_seconds': lease_seconds,
+        'keep_alive': keep_alive,
+        'listen_for_jobs': not no_listen
+    }
+    
+    supervisor = WorkerSupervisor(
+        model_name=model_name,
+        worker_count=worker_count,
+        runner_options=runner_options,
+        max_jobs=max_jobs,
+        timeout_seconds=timeout,
+        log_level=log_level.upper(),
+        restart_backoff=restart_backoff,
+        max_restarts=max_restarts,
+        status_interval=status_interval,
+        drain_timeout=drain_timeout
+    )
+    
+    click.echo(f"🚀 Starting {worker_count} workers for {model_name}")
+    click.echo(f"📝 Logs: {supervisor.log_dir}/worker_*.log")
     click.echo("=" * 60)
-    click.echo("Run these commands in separate terminals:")
-    click.echo()
     
-    for i in range(1, worker_count + 1):
-        cmd_parts = [
-            f"python -m indexer.cli",
-            f"--model {model_name}" if model_name != 'blub_test' else "",
-            f"batch process",
-            f"--worker-name worker_{i}"
-        ]
-        
-        if max_jobs:
-            cmd_parts.append(f"--max-jobs {max_jobs}")
-        if timeout:
-            cmd_parts.append(f"--timeout {timeout}")
-        
-        cmd_parts.append("&")  # Background process
-        
-        cmd = " ".join(filter(None, cmd_parts))
-        click.echo(f"# Worker {i}")
-        click.echo(f"{cmd}")
-        click.echo()
+    summary = supervisor.run()
     
-    click.echo("Monitor all workers:")
-    click.echo(f"tail -f logs/batch_processing/{model_name}/worker_*.log")
     click.echo()
-    click.echo("Check status:")
-    click.echo(f"python -m indexer.cli --model {model_name} batch status")
+    click.echo(f"✅ Workers finished in {summary['elapsed_seconds']:,} seconds")
+    click.echo(f"   🎯 Jobs processed: {summary['jobs_processed']:,} ({summary['jobs_failed']:,} failed)")
+    click.echo(f"   📦 Blocks: {summary['blocks_processed']:,}")
+    click.echo(f"   📝 Events: {summary['events_written']:,}")
+    click.echo(f"   🔁 Restarts: {summary['restarts']}")
+    
+    if summary['failed_workers']:
+        click.echo(f"   ❌ Workers that did not exit cleanly: {', '.join(summary['failed_workers'])}", err=True)
+        sys.exit(1)
 
 
 @batch.command('monitor')
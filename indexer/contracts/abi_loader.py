@@ -4,6 +4,8 @@ import json
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from ..core.logging import LoggingMixin, INFO, DEBUG, WARNING, ERROR, CRITICAL
+from .event_index import EventDecoder, build_event_index
+from .function_index import FunctionDecoder, build_function_index
 
 
 class ABILoader(LoggingMixin):
@@ -17,6 +19,8 @@ class ABILoader(LoggingMixin):
         
         self.abi_base_path = abi_base_path
         self._abi_cache: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+        self._event_index_cache: Dict[str, Dict[str, EventDecoder]] = {}
+        self._function_index_cache: Dict[str, Dict[str, FunctionDecoder]] = {}
         
         self.log_debug("ABI loader initialized", abi_base_path=str(self.abi_base_path))
     
@@ -92,9 +96,43 @@ class ABILoader(LoggingMixin):
             self._abi_cache[cache_key] = None
             return None
     
+    def load_event_index(self, abi_dir: str, abi_file: str) -> Dict[str, EventDecoder]:
+        """Get topic0 -> EventDecoder index for an ABI file, built once and shared by all contracts using it"""
+        cache_key = f"{abi_dir}/{abi_file}"
+        
+        if cache_key in self._event_index_cache:
+            return self._event_index_cache[cache_key]
+        
+        event_index = build_event_index(self.load_abi(abi_dir, abi_file))
+        self._event_index_cache[cache_key] = event_index
+        
+        self.log_debug("Event index built", 
+                     abi_key=cache_key,
+                     indexed_events=len(event_index))
+        
+        return event_index
+    
+    def load_function_index(self, abi_dir: str, abi_file: str) -> Dict[str, FunctionDecoder]:
+        """Get selector -> FunctionDecoder index for an ABI file, built once and shared by all contracts using it"""
+        cache_key = f"{abi_dir}/{abi_file}"
+        
+        if cache_key in self._function_index_cache:
+            return self._function_index_cache[cache_key]
+        
+        function_index = build_function_index(self.load_abi(abi_dir, abi_file))
+        self._function_index_cache[cache_key] = function_index
+        
+        self.log_debug("Function index built", 
+                     abi_key=cache_key,
+                     indexed_functions=len(function_index))
+        
+        return function_index
+    
     def clear_cache(self):
         """Clear the ABI cache"""
         self._abi_cache.clear()
+        self._event_index_cache.clear()
+        self._function_index_cache.clear()
         self.log_debug("ABI cache cleared")
     
     def get_cache_stats(self) -> Dict[str, Any]:
@@ -107,5 +145,7 @@ class ABILoader(LoggingMixin):
             "total_entries": total_entries,
             "successful_loads": successful_loads,
             "failed_loads": failed_loads,
+            "event_indexes": len(self._event_index_cache),
+            "function_indexes": len(self._function_index_cache),
             "cache_hit_ratio": successful_loads / total_entries if total_entries > 0 else 0
         }
\ No newline at end of file
@@ -0,0 +1,49 @@
+# indexer/contracts/event_index.py
+
+from typing import Optional, List, Dict, Any
+from eth_utils import event_abi_to_log_topic
+from web3._utils.events import get_event_data
+
+
+class EventDecoder:
+    """
+    Decoder for a single event ABI, keyed by its topic0 hash.
+
+    Built once per ABI so that a log only needs a dictionary lookup on topic0
+    and a single decode, instead of trying every event in the contract ABI.
+    """
+
+    __slots__ = ('name', 'topic0', 'abi', 'indexed_count')
+
+    def __init__(self, event_abi: Dict[str, Any]):
+        self.name: str = event_abi["name"]
+        self.topic0: str = "0x" + event_abi_to_log_topic(event_abi).hex()
+        self.abi = event_abi
+        self.indexed_count = sum(1 for item in event_abi.get("inputs", []) if item.get("indexed"))
+
+    def matches(self, topics: List[str]) -> bool:
+        """Cheap shape check before decoding (topic0 + one topic per indexed input)"""
+        return len(topics) == self.indexed_count + 1
+
+    def decode(self, codec, log_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Decode log using this event ABI. Raises on mismatched data."""
+        return get_event_data(codec, self.abi, log_dict)
+
+
+def build_event_index(abi: Optional[List[Dict[str, Any]]]) -> Dict[str, EventDecoder]:
+    """Build topic0 -> EventDecoder index for an ABI. Anonymous events are skipped."""
+    index: Dict[str, EventDecoder] = {}
+    if not abi:
+        return index
+
+    for item in abi:
+        if item.get("type") != "event" or item.get("anonymous"):
+            continue
+        try:
+            decoder = EventDecoder(item)
+        except Exception:
+            continue
+        # First definition wins, matching the order the linear scan would have tried
+        index.setdefault(decoder.topic0, decoder)
+
+    return index
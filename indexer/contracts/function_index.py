@@ -0,0 +1,83 @@
+# indexer/contracts/function_index.py
+
+from typing import Optional, List, Dict, Any, Callable, Tuple
+from eth_utils import to_checksum_address, function_abi_to_4byte_selector
+from eth_utils.abi import collapse_if_tuple
+
+Converter = Optional[Callable[[Any], Any]]
+
+
+def _compile_converter(abi_input: Dict[str, Any]) -> Converter:
+    """
+    Compile the output normalization web3 applies to decoded function inputs:
+    checksummed addresses, arrays as lists and tuples as dicts keyed by component name.
+    Returns None when the decoded value can be used as-is.
+    """
+    type_str = abi_input["type"]
+
+    if type_str.endswith("]"):
+        item_converter = _compile_converter({**abi_input, "type": type_str[:type_str.rindex("[")]})
+        if item_converter is None:
+            return list
+        return lambda value: [item_converter(item) for item in value]
+
+    if type_str == "tuple":
+        components = [
+            (component.get("name", ""), _compile_converter(component))
+            for component in abi_input.get("components", [])
+        ]
+        return lambda value: {
+            name: converter(item) if converter else item
+            for (name, converter), item in zip(components, value)
+        }
+
+    if type_str == "address":
+        return to_checksum_address
+
+    return None
+
+
+class FunctionDecoder:
+    """
+    Decoder for a single function ABI, keyed by its 4-byte selector.
+
+    Holds the eth_abi type list and compiled converters so call data is
+    decoded directly through the codec without walking the contract ABI.
+    """
+
+    __slots__ = ('name', 'selector', 'types', 'fields')
+
+    def __init__(self, function_abi: Dict[str, Any]):
+        inputs = function_abi.get("inputs", [])
+        self.name: str = function_abi["name"]
+        self.selector: str = "0x" + function_abi_to_4byte_selector(function_abi).hex()
+        self.types: List[str] = [collapse_if_tuple(item) for item in inputs]
+        self.fields: List[Tuple[str, Converter]] = [
+            (item.get("name", ""), _compile_converter(item)) for item in inputs
+        ]
+
+    def decode(self, codec, input_data: str) -> Dict[str, Any]:
+        """Decode hex call data (selector included). Raises on malformed data."""
+        values = codec.decode(self.types, bytes.fromhex(input_data[10:]))
+        return {
+            name: converter(value) if converter else value
+            for (name, converter), value in zip(self.fields, values)
+        }
+
+
+def build_function_index(abi: Optional[List[Dict[str, Any]]]) -> Dict[str, FunctionDecoder]:
+    """Build selector -> FunctionDecoder index for an ABI"""
+    index: Dict[str, FunctionDecoder] = {}
+    if not abi:
+        return index
+
+    for item in abi:
+        if item.get("type") != "function":
+            continue
+        try:
+            decoder = FunctionDecoder(item)
+        except Exception:
+            continue
+        index.setdefault(decoder.selector, decoder)
+
+    return index
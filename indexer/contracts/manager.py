@@ -5,6 +5,8 @@ from web3.contract import Contract
 from typing import Optional, Dict, Any
 
 from .registry import ContractRegistry
+from .event_index import EventDecoder
+from .function_index import FunctionDecoder
 
 
 class ContractManager:
@@ -16,6 +18,8 @@ class ContractManager:
         self.registry = registry
         self.w3 = Web3()  # No provider needed for ABI decoding
         self.contract_cache: Dict[str, Contract] = {}
+        self.event_index_cache: Dict[str, Dict[str, EventDecoder]] = {}
+        self.function_index_cache: Dict[str, Dict[str, FunctionDecoder]] = {}
 
     def get_contract(self, address: str) -> Optional[Contract]:
         """Get or create Web3 contract instance"""
@@ -34,6 +38,46 @@ class ContractManager:
 
         return None
 
+    def get_event_index(self, address: str) -> Dict[str, EventDecoder]:
+        """Get topic0 -> EventDecoder index for a contract, built once per address"""
+        address = address.lower()
+
+        event_index = self.event_index_cache.get(address)
+        if event_index is not None:
+            return event_index
+
+        try:
+            event_index = self.registry.get_event_index(address)
+        except Exception:
+            event_index = {}
+
+        self.event_index_cache[address] = event_index
+        return event_index
+
+    def get_event_decoder(self, address: str, topic0: str) -> Optional[EventDecoder]:
+        """Get the decoder for a log's topic0 on a specific contract"""
+        return self.get_event_index(address).get(topic0.lower())
+
+    def get_function_index(self, address: str) -> Dict[str, FunctionDecoder]:
+        """Get selector -> FunctionDecoder index for a contract, built once per address"""
+        address = address.lower()
+
+        function_index = self.function_index_cache.get(address)
+        if function_index is not None:
+            return function_index
+
+        try:
+            function_index = self.registry.get_function_index(address)
+        except Exception:
+            function_index = {}
+
+        self.function_index_cache[address] = function_index
+        return function_index
+
+    def get_function_decoder(self, address: str, selector: str) -> Optional[FunctionDecoder]:
+        """Get the decoder for a transaction's 4-byte selector on a specific contract"""
+        return self.get_function_index(address).get(selector.lower())
+
     def has_contract(self, address: str) -> bool:
         """Check if contract exists in registry"""
         return self.registry.has_contract(address.lower())
@@ -52,4 +96,6 @@ class ContractManager:
 
     def clear_cache(self) -> None:
         """Clear the contract cache"""
-        self.contract_cache.clear()
\ No newline at end of file
+        self.contract_cache.clear()
+        self.event_index_cache.clear()
+        self.function_index_cache.clear()
\ No newline at end of file
@@ -1,12 +1,14 @@
 # indexer/contracts/registry.py
 
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 from web3 import Web3
 from web3.contract import Contract
 
 from ..core.indexer_config import IndexerConfig
 from ..types import EvmAddress
 from .abi_loader import ABILoader
+from .event_index import EventDecoder
+from .function_index import FunctionDecoder
 
 
 class ContractRegistry:
@@ -29,30 +31,53 @@ class ContractRegistry:
         """Get contract config by address"""
         return self.contracts.get(address.lower())
 
-    def get_abi(self, address: str) -> Optional[List[Dict[str, Any]]]:
-        """Get contract ABI by address, loading from filesystem if needed"""
-        address = address.lower()
-        
-        # Check cache first
-        if address in self._abi_cache:
-            return self._abi_cache[address]
-        
+    def _get_abi_source(self, address: str) -> Optional[Tuple[str, str]]:
+        """(abi_dir, abi_file) configured for a contract, or None if it has no ABI"""
         contract = self.get_contract(address)
         if not contract:
-            self._abi_cache[address] = None
             return None
         
         abi_dir = getattr(contract, 'abi_dir', None)
         abi_file = getattr(contract, 'abi_file', None)
 
         if not abi_dir or not abi_file:
+            return None
+        
+        return abi_dir, abi_file
+
+    def get_abi(self, address: str) -> Optional[List[Dict[str, Any]]]:
+        """Get contract ABI by address, loading from filesystem if needed"""
+        address = address.lower()
+        
+        # Check cache first
+        if address in self._abi_cache:
+            return self._abi_cache[address]
+        
+        abi_source = self._get_abi_source(address)
+        if not abi_source:
             self._abi_cache[address] = None
             return None
 
-        abi = self.abi_loader.load_abi(abi_dir, abi_file)
+        abi = self.abi_loader.load_abi(*abi_source)
         self._abi_cache[address] = abi
         return abi
 
+    def get_event_index(self, address: str) -> Dict[str, EventDecoder]:
+        """Get topic0 -> EventDecoder index for a contract (empty if no ABI)"""
+        abi_source = self._get_abi_source(address)
+        if not abi_source:
+            return {}
+        
+        return self.abi_loader.load_event_index(*abi_source)
+
+    def get_function_index(self, address: str) -> Dict[str, FunctionDecoder]:
+        """Get selector -> FunctionDecoder index for a contract (empty if no ABI)"""
+        abi_source = self._get_abi_source(address)
+        if not abi_source:
+            return {}
+        
+        return self.abi_loader.load_function_index(*abi_source)
+
     def get_web3_contract(self, address: str, w3: Web3) -> Optional[Contract]:
         """Get or create Web3 contract instance"""
         address = address.lower()
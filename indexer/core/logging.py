@@ -6,14 +6,23 @@ Provides:
 - IndexerLogger: Global logging configuration
 - LoggingMixin: Consistent logging behavior for classes
 - Utility functions: Context logging helpers
+- lazy(): Deferred context values, evaluated only when the record is emitted
+- Optional queue-based handlers, moving formatting and I/O to a listener thread
 """
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Tuple, List
 from datetime import datetime
 
+import msgspec
+
 DEBUG = logging.DEBUG
 INFO = logging.INFO
 WARNING = logging.WARNING
@@ -21,6 +30,45 @@ ERROR = logging.ERROR
 CRITICAL = logging.CRITICAL
 Logger = logging.Logger
 
+# Per-log/per-transaction loggers silenced below WARNING in hot path quiet mode
+HOT_PATH_LOGGERS = ('indexer.transform', 'indexer.decode')
+
+# Queue-based logging: what to do when the bounded queue is full
+QUEUE_POLICY_BLOCK = "block"
+QUEUE_POLICY_DROP = "drop"
+QUEUE_POLICIES = (QUEUE_POLICY_BLOCK, QUEUE_POLICY_DROP)
+DEFAULT_QUEUE_SIZE = 10000
+
+# Attributes every LogRecord has; anything else on a record is structured context
+_STANDARD_RECORD_ATTRS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__
+) | {"message", "asctime"}
+
+# Bumped whenever IndexerLogger changes levels, invalidating LoggingMixin level caches
+_level_generation = 0
+
+
+def _bump_level_generation() -> None:
+    global _level_generation
+    _level_generation += 1
+
+
+class LazyValue:
+    """Context value computed only if the log record is actually emitted"""
+    __slots__ = ('func',)
+    
+    def __init__(self, func: Callable[[], Any]):
+        self.func = func
+
+
+def lazy(func: Callable[[], Any]) -> LazyValue:
+    """
+    Defer an expensive context value until the level check has passed.
+    
+        self.log_debug("Signals generated", signal_types=lazy(lambda: [type(s).__name__ for s in signals.values()]))
+    """
+    return LazyValue(func)
+
 class IndexerFormatter(logging.Formatter):
     def __init__(self, include_context: bool = False):
         self.include_context = include_context
@@ -47,12 +95,71 @@ class IndexerFormatter(logging.Formatter):
         return base_msg
 
 
+class IndexerJsonFormatter(logging.Formatter):
+    """
+    One JSON object per line: timestamp, logger, level, message and every
+    context attribute set on the record (whatever log_with_context attached).
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._encoder = msgspec.json.Encoder(enc_hook=str)
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return self._encoder.encode(entry).decode()
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler over a bounded queue.
+    
+    With the "block" policy a full queue makes the logging thread wait for the
+    listener; with "drop" the record is discarded and counted.
+    """
+    
+    def __init__(self, log_queue: queue.Queue, policy: str = QUEUE_POLICY_BLOCK):
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Unknown log queue policy: {policy} (expected one of {QUEUE_POLICIES})")
+        super().__init__(log_queue)
+        self.policy = policy
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.policy == QUEUE_POLICY_BLOCK:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+
+def _env_flag(name: str, default: bool = False) -> bool:
+    return os.environ.get(name, str(default)).lower() == "true"
+
+
 class IndexerLogger:
     _configured = False
     _log_dir: Optional[Path] = None
     _log_level = INFO
     _console_enabled = True
     _file_enabled = True
+    _hot_path_quiet = False
+    _queue_handler: Optional[BoundedQueueHandler] = None
+    _queue_listener: Optional[logging.handlers.QueueListener] = None
     
     @classmethod
     def configure(cls, 
@@ -60,10 +167,30 @@ class IndexerLogger:
                   log_level: str = "INFO",
                   console_enabled: bool = True,
                   file_enabled: bool = True,
-                  structured_format: bool = True) -> None:
+                  structured_format: bool = True,
+                  async_handlers: Optional[bool] = None,
+                  queue_size: Optional[int] = None,
+                  queue_policy: Optional[str] = None,
+                  json_format: Optional[bool] = None) -> None:
+        """
+        Configure the 'indexer' logger hierarchy (first call wins).
+        
+        async_handlers, queue_size, queue_policy and json_format default to the
+        INDEXER_LOG_ASYNC, INDEXER_LOG_QUEUE_SIZE, INDEXER_LOG_QUEUE_POLICY and
+        INDEXER_LOG_JSON environment variables.
+        """
         
         if cls._configured:
             return
+        
+        if async_handlers is None:
+            async_handlers = _env_flag("INDEXER_LOG_ASYNC")
+        if queue_size is None:
+            queue_size = int(os.environ.get("INDEXER_LOG_QUEUE_SIZE", DEFAULT_QUEUE_SIZE))
+        if queue_policy is None:
+            queue_policy = os.environ.get("INDEXER_LOG_QUEUE_POLICY", QUEUE_POLICY_BLOCK).lower()
+        if json_format is None:
+            json_format = _env_flag("INDEXER_LOG_JSON")
             
         cls._log_dir = log_dir
         cls._log_level = getattr(logging, log_level.upper())
@@ -77,35 +204,99 @@ class IndexerLogger:
         root_logger.setLevel(cls._log_level)
         
         root_logger.handlers.clear()
+        handlers: List[logging.Handler] = []
         
         if console_enabled:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(cls._log_level)
             
-            if structured_format:
+            if json_format:
+                console_formatter = IndexerJsonFormatter()
+            elif structured_format:
                 console_formatter = IndexerFormatter(include_context=True)
             else:
                 console_formatter = logging.Formatter(
                     '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
                 )
             console_handler.setFormatter(console_formatter)
-            root_logger.addHandler(console_handler)
+            handlers.append(console_handler)
         
         if file_enabled and log_dir:
             # Main log file
             file_handler = logging.FileHandler(log_dir / 'indexer.log')
             file_handler.setLevel(cls._log_level)
-            file_formatter = IndexerFormatter(include_context=True)
+            file_formatter = IndexerJsonFormatter() if json_format else IndexerFormatter(include_context=True)
             file_handler.setFormatter(file_formatter)
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
             
             # Error log file
             error_handler = logging.FileHandler(log_dir / 'indexer_errors.log')
             error_handler.setLevel(ERROR)
             error_handler.setFormatter(file_formatter)
-            root_logger.addHandler(error_handler)
+            handlers.append(error_handler)
+        
+        if async_handlers and handlers:
+            # Callers only enqueue; a listener thread formats and writes
+            cls._queue_handler = BoundedQueueHandler(queue.Queue(maxsize=queue_size), queue_policy)
+            cls._queue_listener = logging.handlers.QueueListener(
+                cls._queue_handler.queue, *handlers, respect_handler_level=True
+            )
+            cls._queue_listener.start()
+            atexit.register(cls.shutdown)
+            root_logger.addHandler(cls._queue_handler)
+        else:
+            for handler in handlers:
+                root_logger.addHandler(handler)
         
         cls._configured = True
+        _bump_level_generation()
+    
+    @classmethod
+    def shutdown(cls) -> None:
+        """Flush queued records and stop the listener thread (no-op without async handlers)"""
+        listener = cls._queue_listener
+        if listener is None:
+            return
+        cls._queue_listener = None
+        listener.stop()
+        if cls._queue_handler and cls._queue_handler.dropped:
+            sys.stderr.write(f"indexer logging: dropped {cls._queue_handler.dropped} records (log queue full)\n")
+    
+    @classmethod
+    def get_queue_stats(cls) -> Dict[str, Any]:
+        handler = cls._queue_handler
+        if handler is None:
+            return {"async": False}
+        return {
+            "async": cls._queue_listener is not None,
+            "policy": handler.policy,
+            "queued": handler.queue.qsize(),
+            "capacity": handler.queue.maxsize,
+            "dropped": handler.dropped,
+        }
+    
+    @classmethod
+    def set_level(cls, log_level: str, logger_name: str = 'indexer') -> None:
+        """Change a logger's level; use this rather than Logger.setLevel so LoggingMixin caches refresh"""
+        logging.getLogger(logger_name).setLevel(getattr(logging, log_level.upper()))
+        _bump_level_generation()
+    
+    @classmethod
+    def set_hot_path_quiet(cls, enabled: bool = True) -> None:
+        """
+        Silence DEBUG/INFO from per-log transform and decode loggers.
+        
+        Warnings and errors still get through. Disabling restores the inherited level.
+        """
+        level = WARNING if enabled else logging.NOTSET
+        for logger_name in HOT_PATH_LOGGERS:
+            logging.getLogger(logger_name).setLevel(level)
+        cls._hot_path_quiet = enabled
+        _bump_level_generation()
+    
+    @classmethod
+    def is_hot_path_quiet(cls) -> bool:
+        return cls._hot_path_quiet
     
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
@@ -133,12 +324,18 @@ def get_class_logger(cls_instance) -> logging.Logger:
 
 def log_with_context(logger: logging.Logger, level: int, message: str, **context) -> None:
     if logger.isEnabledFor(level):
-        record = logger.makeRecord(
-            logger.name, level, "", 0, message, (), None
-        )
-        for key, value in context.items():
-            setattr(record, key, value)
-        logger.handle(record)
+        _emit(logger, level, message, context)
+
+
+def _emit(logger: logging.Logger, level: int, message: str, context: Dict[str, Any]) -> None:
+    record = logger.makeRecord(
+        logger.name, level, "", 0, message, (), None
+    )
+    for key, value in context.items():
+        if isinstance(value, LazyValue):
+            value = value.func()
+        setattr(record, key, value)
+    logger.handle(record)
 
 
 # === LoggingMixin for Classes ===
@@ -149,8 +346,12 @@ class LoggingMixin:
     
     Provides convenient logging methods that automatically:
     - Create class-specific loggers
-    - Support structured context logging
+    - Support structured context logging (lazy() values are only built when emitted)
+    - Cache the logger's effective level, so disabled calls cost one comparison
     - Handle common logging patterns
+    
+    Hot paths should guard any context that is expensive to build with
+    `if self.debug_enabled:` or pass it as lazy(...).
     """
     
     @property
@@ -159,17 +360,43 @@ class LoggingMixin:
             self._logger = get_class_logger(self)
         return self._logger
     
+    def _effective_level(self) -> int:
+        cached: Optional[Tuple[int, int]] = getattr(self, '_level_cache', None)
+        if cached is None or cached[0] != _level_generation:
+            logger = self.logger
+            if logger.disabled:
+                level = CRITICAL + 1
+            else:
+                level = max(logger.getEffectiveLevel(), logger.manager.disable + 1)
+            cached = self._level_cache = (_level_generation, level)
+        return cached[1]
+    
+    def log_enabled(self, level: int) -> bool:
+        return level >= self._effective_level()
+    
+    @property
+    def debug_enabled(self) -> bool:
+        return DEBUG >= self._effective_level()
+    
+    @property
+    def info_enabled(self) -> bool:
+        return INFO >= self._effective_level()
+    
     def log_debug(self, message: str, **context) -> None:
-        log_with_context(self.logger, DEBUG, message, **context)
+        if DEBUG >= self._effective_level():
+            _emit(self.logger, DEBUG, message, context)
     
     def log_info(self, message: str, **context) -> None:
-        log_with_context(self.logger, INFO, message, **context)
+        if INFO >= self._effective_level():
+            _emit(self.logger, INFO, message, context)
     
     def log_warning(self, message: str, **context) -> None:
-        log_with_context(self.logger, WARNING, message, **context)
+        if WARNING >= self._effective_level():
+            _emit(self.logger, WARNING, message, context)
     
     def log_error(self, message: str, **context) -> None:
-        log_with_context(self.logger, ERROR, message, **context)
+        if ERROR >= self._effective_level():
+            _emit(self.logger, ERROR, message, context)
     
     def log_transaction_context(self, tx_hash: str, **additional_context) -> Dict[str, Any]:
         context = {'tx_hash': tx_hash}
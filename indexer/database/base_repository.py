@@ -1,8 +1,10 @@
 # indexer/database/base_repository.py
 
-from typing import TypeVar, Generic, Type, List, Optional, Dict
+from typing import TypeVar, Generic, Type, List, Optional, Dict, Tuple
+from decimal import Decimal
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, func, literal, exists, values, column, Integer
+from sqlalchemy.dialects.postgresql import insert as pg_insert, NUMERIC
 
 from ..core.logging import IndexerLogger, INFO, DEBUG, WARNING, ERROR, CRITICAL
 from ..types.new import EvmHash, DomainEventId
@@ -10,6 +12,22 @@ from ..types.new import EvmHash, DomainEventId
 
 T = TypeVar('T')
 
+
+def token_amount(raw_amount, decimals: int):
+    """SQL expression for a signed raw amount column as an absolute token amount (exact NUMERIC scaling)"""
+    return func.abs(raw_amount) * literal(Decimal(1).scaleb(-decimals), NUMERIC)
+
+
+def in_block_ranges(block_number, block_ranges: List[Tuple[int, int]]):
+    """SQL condition: block_number within one of the (start, end) inclusive ranges, passed as one VALUES list"""
+    ranges = values(
+        column('start_block', Integer),
+        column('end_block', Integer),
+        name='block_ranges'
+    ).data(block_ranges)
+    return exists().where(block_number.between(ranges.c.start_block, ranges.c.end_block))
+
+
 class BaseRepository(Generic[T]):    
     def __init__(self, db_manager, model_class: Type[T]):
         self.db_manager = db_manager
@@ -152,15 +170,7 @@ class DomainEventBaseRepository(BaseRepository[T]):
                 self.logger.debug(f"All {len(items)} {self.model_class.__name__} records already exist, skipping")
                 return 0
             
-            cleaned_items = []
-            for item in new_items:
-                cleaned_item = {}
-                for key, value in item.items():
-                    if value == 'None' and key in ['token_id', 'custodian']:
-                        cleaned_item[key] = None
-                    else:
-                        cleaned_item[key] = value
-                cleaned_items.append(cleaned_item)
+            cleaned_items = [self._clean_item(item) for item in new_items]
             
             session.bulk_insert_mappings(self.model_class, cleaned_items)
             session.flush()
@@ -174,6 +184,50 @@ class DomainEventBaseRepository(BaseRepository[T]):
         except Exception as e:
             self.logger.error(f"Error bulk creating {self.model_class.__name__} with skip existing: {e}")
             raise
+    
+    def bulk_insert_skip_conflicts(self, session: Session, items: List[Dict]) -> List[DomainEventId]:
+        """
+        Insert items with INSERT ... ON CONFLICT (content_id) DO NOTHING RETURNING content_id.
+        
+        One statement per batch instead of an existence query plus insert.
+        Returns the content_ids actually inserted.
+        """
+        if not items:
+            return []
+            
+        try:
+            table = self.model_class.__table__
+            column_names = set(table.columns.keys())
+            
+            # A multi-row insert needs the same keys in every row; group rows by key set rather than
+            # padding with None, so omitted columns still get their defaults
+            groups: Dict[Tuple[str, ...], List[Dict]] = {}
+            for item in items:
+                row = {key: value for key, value in self._clean_item(item).items() if key in column_names}
+                groups.setdefault(tuple(sorted(row)), []).append(row)
+            
+            stmt = (
+                pg_insert(table)
+                .on_conflict_do_nothing(index_elements=['content_id'])
+                .returning(table.c.content_id)
+            )
+            inserted = []
+            for rows in groups.values():
+                inserted.extend(session.execute(stmt, rows).scalars())
+            
+            self.logger.debug(f"Inserted {len(inserted)} {self.model_class.__name__} records, skipped {len(items) - len(inserted)} existing")
+            return inserted
+            
+        except Exception as e:
+            self.logger.error(f"Error inserting {self.model_class.__name__} with skip conflicts: {e}")
+            raise
+    
+    @staticmethod
+    def _clean_item(item: Dict) -> Dict:
+        return {
+            key: None if value == 'None' and key in ['token_id', 'custodian'] else value
+            for key, value in item.items()
+        }
 
 
 class ProcessingBaseRepository(BaseRepository[T]):
@@ -16,8 +16,9 @@ from .pool_swap_detail_repository import PoolSwapDetailRepository
 from .trade_detail_repository import TradeDetailRepository
 from .event_detail_repository import EventDetailRepository
 
-# Processing repository
+# Processing repositories
 from .processing_repository import ProcessingRepository
+from .processing_job_repository import ProcessingJobRepository
 
 # Calculation service repositories (ADDED)
 from .asset_price_repository import AssetPriceRepository
@@ -40,8 +41,9 @@ __all__ = [
     'TradeDetailRepository',
     'EventDetailRepository',
     
-    # Processing repository
+    # Processing repositories
     'ProcessingRepository',
+    'ProcessingJobRepository',
     
     # Calculation service repositories (ADDED)
     'AssetPriceRepository',
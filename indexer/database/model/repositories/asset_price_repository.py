@@ -1,9 +1,10 @@
 # indexer/database/model/repositories/asset_price_repository.py
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from decimal import Decimal
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, desc, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from ...connection import ModelDatabaseManager
 from ...base_repository import BaseRepository
@@ -297,6 +298,66 @@ class AssetPriceRepository(BaseRepository):
             )
             raise
     
+    def insert_candles(
+        self,
+        session: Session,
+        asset_address: str,
+        candles: List[Tuple[int, PricingDenomination, Decimal, Decimal, Decimal, Decimal]],
+        batch_size: int = 5000
+    ) -> List[Tuple[int, PricingDenomination]]:
+        """
+        Insert (period_id, denom, open, high, low, close) candles with multi-row INSERTs.
+        
+        Callers pick periods without candles (see TradeDetailRepository.get_period_ohlc);
+        candles written meanwhile by an overlapping run are kept (ON CONFLICT DO NOTHING).
+        
+        Returns:
+            (period_id, denom) of the candles created
+        """
+        if not candles:
+            return []
+        
+        try:
+            asset = asset_address.lower()
+            table = DBAssetPrice.__table__
+            created = []
+            
+            for offset in range(0, len(candles), batch_size):
+                stmt = pg_insert(table).values([
+                    {
+                        'period_id': period_id,
+                        'asset': asset,
+                        'denom': denom,
+                        'open': open_price,
+                        'high': high_price,
+                        'low': low_price,
+                        'close': close_price,
+                    }
+                    for period_id, denom, open_price, high_price, low_price, close_price in candles[offset:offset + batch_size]
+                ]).on_conflict_do_nothing(
+                    constraint='uq_asset_price_period_asset_denom'
+                ).returning(table.c.period_id, table.c.denom)
+                
+                created.extend(tuple(row) for row in session.execute(stmt).fetchall())
+            
+            log_with_context(
+                self.logger, DEBUG, "OHLC candles inserted",
+                asset_address=asset_address,
+                candle_count=len(candles),
+                created=len(created)
+            )
+            
+            return created
+            
+        except Exception as e:
+            log_with_context(
+                self.logger, ERROR, "Error inserting OHLC candles",
+                asset_address=asset_address,
+                candle_count=len(candles),
+                error=str(e)
+            )
+            raise
+    
     def get_candle_stats(
         self,
         session: Session,
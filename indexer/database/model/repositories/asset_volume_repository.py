@@ -1,9 +1,10 @@
 # indexer/database/model/repositories/asset_volume_repository.py
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple, Set
 from decimal import Decimal
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, desc, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from ...connection import ModelDatabaseManager
 from ...base_repository import BaseRepository
@@ -369,6 +370,96 @@ class AssetVolumeRepository(BaseRepository):
             )
             return []
 
+    def get_existing_volume_keys(
+        self,
+        session: Session,
+        asset_address: str,
+        period_ids: List[int],
+        denominations: List[PricingDenomination]
+    ) -> Set[Tuple[int, PricingDenomination, str]]:
+        """(period_id, denom, protocol) of volume records already stored for an asset, in one query"""
+        if not period_ids:
+            return set()
+        
+        try:
+            rows = session.query(
+                DBAssetVolume.period_id,
+                DBAssetVolume.denom,
+                DBAssetVolume.protocol
+            ).filter(
+                DBAssetVolume.asset == asset_address.lower(),
+                DBAssetVolume.period_id.in_(period_ids),
+                DBAssetVolume.denom.in_(denominations)
+            ).all()
+            
+            return {tuple(row) for row in rows}
+            
+        except Exception as e:
+            log_with_context(
+                self.logger, ERROR, "Error getting existing volume keys",
+                asset_address=asset_address,
+                period_count=len(period_ids),
+                error=str(e)
+            )
+            raise
+
+    def insert_volumes(
+        self,
+        session: Session,
+        asset_address: str,
+        volumes: List[Tuple[int, PricingDenomination, str, Decimal]],
+        batch_size: int = 5000
+    ) -> List[Tuple[int, PricingDenomination, str]]:
+        """
+        Insert (period_id, denom, protocol, volume) records with multi-row INSERTs.
+        
+        Records written meanwhile by an overlapping run are kept (ON CONFLICT DO NOTHING).
+        
+        Returns:
+            (period_id, denom, protocol) of the records created
+        """
+        if not volumes:
+            return []
+        
+        try:
+            asset = asset_address.lower()
+            table = DBAssetVolume.__table__
+            created = []
+            
+            for offset in range(0, len(volumes), batch_size):
+                stmt = pg_insert(table).values([
+                    {
+                        'period_id': period_id,
+                        'asset': asset,
+                        'denom': denom,
+                        'protocol': protocol,
+                        'volume': volume,
+                    }
+                    for period_id, denom, protocol, volume in volumes[offset:offset + batch_size]
+                ]).on_conflict_do_nothing(
+                    constraint='uq_asset_volume_period_asset_denom_protocol'
+                ).returning(table.c.period_id, table.c.denom, table.c.protocol)
+                
+                created.extend(tuple(row) for row in session.execute(stmt).fetchall())
+            
+            log_with_context(
+                self.logger, DEBUG, "Volume records inserted",
+                asset_address=asset_address,
+                record_count=len(volumes),
+                created=len(created)
+            )
+            
+            return created
+            
+        except Exception as e:
+            log_with_context(
+                self.logger, ERROR, "Error inserting volume records",
+                asset_address=asset_address,
+                record_count=len(volumes),
+                error=str(e)
+            )
+            raise
+
     # =====================================================================
     # CONVENIENCE METHODS FOR CALCULATION SERVICE
     # =====================================================================
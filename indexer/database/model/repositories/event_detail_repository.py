@@ -1,20 +1,32 @@
 # indexer/database/model/repositories/event_detail_repository.py
 
-from typing import List, Optional, Dict
+import uuid
+from typing import List, Optional, Dict, Tuple
 from decimal import Decimal
 from datetime import datetime, timedelta
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc, func, case, exists
+from sqlalchemy import and_, or_, desc, func, case, exists, select, union
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from ....types import DomainEventId
 from ...connection import ModelDatabaseManager
-from ...base_repository import BaseRepository
+from ...base_repository import BaseRepository, token_amount
 from ....core.logging import log_with_context, INFO, DEBUG, WARNING, ERROR, CRITICAL
 
-from ..tables import DBEventDetail
-from ...shared.tables import DBPeriod
-from ...types import PeriodType, PricingDenomination, PricingMethod
+from ..tables import DBEventDetail, DBTransfer, DBLiquidity, DBReward, DBPosition
+from ...types import PricingDenomination, PricingMethod
+
+
+# Event tables valued by canonical price: event type -> (table, asset column, amount column)
+VALUED_EVENT_COLUMNS = {
+    'transfers': (DBTransfer, 'token', 'amount'),
+    'liquidity': (DBLiquidity, 'base_token', 'base_amount'),
+    'rewards': (DBReward, 'token', 'amount'),
+    'positions': (DBPosition, 'token', 'amount'),
+}
+
+FIVE_MINUTE_SECONDS = 300
 
 
 class EventDetailRepository(BaseRepository):
@@ -331,27 +343,51 @@ class EventDetailRepository(BaseRepository):
     def find_periods_with_unvalued_events(
         self,
         session: Session,
-        asset_address: str
-    ) -> List:  # Returns Period objects
+        asset_address: str,
+        denomination: Optional[PricingDenomination] = None,
+        limit: int = 1000
+    ) -> List[int]:
         """
-        Find periods that have events but missing valuations.
+        Find five-minute periods that have events but missing valuations.
         
         Used by CalculationService.update_event_valuations() for gap detection.
+        One query over the valued event tables (anti-join against event_details),
+        bucketing events into five-minute periods by timestamp.
+        
+        Args:
+            denomination: Missing valuation in this denomination, or None for either
+            limit: Most recent periods to return
+            
+        Returns:
+            Period time_open values, oldest first
         """
+        denominations = [denomination] if denomination else [PricingDenomination.USD, PricingDenomination.AVAX]
+        
         try:
-            # This is a simplified implementation - you may want to customize
-            # based on which specific event types need valuation
-
-            # Get recent periods (last 1000 5-minute periods)
-            with self.db_manager.get_shared_session() as shared_session:
-                recent_periods = shared_session.query(DBPeriod).filter(
-                    DBPeriod.period_type == PeriodType.FIVE_MINUTE
-                ).order_by(desc(DBPeriod.id)).limit(1000).all()
-
-            # For now, return all recent periods
-            # In a more sophisticated implementation, you'd check which periods
-            # have events but missing valuations
-            return recent_periods
+            period_selects = []
+            for event_table, asset_column, _ in VALUED_EVENT_COLUMNS.values():
+                time_open = event_table.timestamp - event_table.timestamp % FIVE_MINUTE_SECONDS
+                period_selects.append(
+                    select(time_open.label('time_open')).where(
+                        getattr(event_table, asset_column) == asset_address.lower(),
+                        or_(*[
+                            ~exists().where(
+                                and_(
+                                    DBEventDetail.content_id == event_table.content_id,
+                                    DBEventDetail.denom == denom
+                                )
+                            )
+                            for denom in denominations
+                        ])
+                    )
+                )
+            
+            periods = union(*period_selects).subquery()
+            rows = session.execute(
+                select(periods.c.time_open).order_by(desc(periods.c.time_open)).limit(limit)
+            ).all()
+            
+            return sorted(int(time_open) for time_open, in rows)
             
         except Exception as e:
             log_with_context(
@@ -440,40 +476,113 @@ class EventDetailRepository(BaseRepository):
             )
             raise
 
-    def get_valuations_in_period(
+    def get_unvalued_event_amounts(
         self,
         session: Session,
-        period_id: int,
+        event_type: str,
         asset_address: str,
-        denomination: PricingDenomination
-    ) -> List[DBEventDetail]:
-        """Get all event valuations for a specific period"""
+        start_timestamp: int,
+        end_timestamp: int,
+        denomination: PricingDenomination,
+        decimals: int
+    ) -> List[Tuple[DomainEventId, int, Decimal]]:
+        """
+        Events of one type without a valuation in denomination, in one anti-join query.
+        
+        Args:
+            event_type: Key of VALUED_EVENT_COLUMNS
+            start_timestamp: Earliest event timestamp (inclusive)
+            end_timestamp: Latest event timestamp (inclusive)
+            decimals: Decimals of the asset, to scale raw amounts to token units
+            
+        Returns:
+            (content_id, timestamp, absolute amount in token units) ordered by timestamp
+        """
+        event_table, asset_column, amount_column = VALUED_EVENT_COLUMNS[event_type]
+        
+        try:
+            return session.query(
+                event_table.content_id,
+                event_table.timestamp,
+                token_amount(getattr(event_table, amount_column), decimals)
+            ).filter(
+                getattr(event_table, asset_column) == asset_address.lower(),
+                event_table.timestamp >= start_timestamp,
+                event_table.timestamp <= end_timestamp,
+                ~exists().where(
+                    and_(
+                        DBEventDetail.content_id == event_table.content_id,
+                        DBEventDetail.denom == denomination
+                    )
+                )
+            ).order_by(event_table.timestamp).all()
+            
+        except Exception as e:
+            log_with_context(
+                self.logger, ERROR, "Error getting unvalued events",
+                event_type=event_type,
+                asset_address=asset_address,
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+                denomination=denomination.value,
+                error=str(e)
+            )
+            raise
+
+    def insert_valuations(
+        self,
+        session: Session,
+        denomination: PricingDenomination,
+        valuations: List[Tuple[DomainEventId, Decimal]],
+        batch_size: int = 5000
+    ) -> int:
+        """
+        Insert (content_id, value) valuations with multi-row INSERTs.
+        
+        Existing valuations are kept (ON CONFLICT DO NOTHING).
+        
+        Returns:
+            Number of valuations created
+        """
+        if not valuations:
+            return 0
+        
         try:
-            # Get the period timeframe
-            with self.db_manager.get_shared_session() as shared_session:
-                period = shared_session.query(DBPeriod).filter(DBPeriod.id == period_id).first()
-                if not period:
-                    return []
+            table = DBEventDetail.__table__
+            created = 0
+            
+            for offset in range(0, len(valuations), batch_size):
+                stmt = pg_insert(table).values([
+                    {
+                        'id': uuid.uuid4(),
+                        'content_id': content_id,
+                        'denom': denomination,
+                        'value': value,
+                    }
+                    for content_id, value in valuations[offset:offset + batch_size]
+                ]).on_conflict_do_nothing(
+                    constraint='uq_event_detail_content_denom'
+                ).returning(table.c.content_id)
                 
-                # Calculate period start/end times
-                period_start = period.timestamp
-                period_end = period_start + timedelta(minutes=5)  # Assuming 5-minute periods
+                created += len(session.execute(stmt).fetchall())
             
-            # This is a simplified implementation - you'd want to join with
-            # specific event tables to filter by asset and time range
-            return session.query(DBEventDetail).filter(
-                DBEventDetail.denom == denomination
-            ).all()  # Placeholder - implement proper filtering
+            log_with_context(
+                self.logger, DEBUG, "Event valuations inserted",
+                denomination=denomination.value,
+                valuation_count=len(valuations),
+                created=created
+            )
+            
+            return created
             
         except Exception as e:
             log_with_context(
-                self.logger, ERROR, "Error getting valuations in period",
-                period_id=period_id,
-                asset_address=asset_address,
+                self.logger, ERROR, "Error inserting event valuations",
                 denomination=denomination.value,
+                valuation_count=len(valuations),
                 error=str(e)
             )
-            return []
+            raise
 
     def update_valuation(
         self,
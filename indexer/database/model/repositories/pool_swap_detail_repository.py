@@ -1,14 +1,15 @@
 # indexer/database/model/repositories/pool_swap_detail_repository.py
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc, case, func
+from sqlalchemy import and_, or_, desc, case, func, exists, literal, select, values, column, Integer
+from sqlalchemy.dialects.postgresql import insert as pg_insert, NUMERIC
 from decimal import Decimal
 
 from ....types import DomainEventId
 from ...connection import ModelDatabaseManager
-from ...base_repository import BaseRepository
+from ...base_repository import BaseRepository, token_amount, in_block_ranges
 from ....core.logging import IndexerLogger, log_with_context, INFO, DEBUG, WARNING, ERROR, CRITICAL
 
 from ..tables import DBPoolSwap, DBPoolSwapDetail
@@ -293,6 +294,70 @@ class PoolSwapDetailRepository(BaseRepository):
             )
             return []
 
+    def get_minute_vwap_aggregates(
+        self,
+        session: Session,
+        pool_windows: List[Tuple[str, int, Optional[int]]],
+        start_timestamp: int,
+        end_timestamp: int,
+        denomination: PricingDenomination,
+        base_decimals: int
+    ) -> List[Tuple[int, Decimal, Decimal]]:
+        """
+        Per-minute swap volume and price-weighted volume for pricing pools, in one query.
+        
+        Swap base amounts are signed raw pool amounts; volume is their absolute
+        value in token units, so buys and sells in a minute add up instead of cancelling.
+        
+        Args:
+            pool_windows: (pool address, pricing_start, pricing_end) block windows
+            start_timestamp: First minute (inclusive)
+            end_timestamp: Last minute (inclusive, covers swaps up to end_timestamp + 59)
+            base_decimals: Decimals of the base token (the priced asset)
+            
+        Returns:
+            (minute timestamp, base volume, sum(base volume * price)) ordered by minute
+        """
+        if not pool_windows:
+            return []
+        
+        try:
+            pool_filters = []
+            for pool, pricing_start, pricing_end in pool_windows:
+                conditions = [DBPoolSwap.pool == pool, DBPoolSwap.block_number >= pricing_start]
+                if pricing_end is not None:
+                    conditions.append(DBPoolSwap.block_number <= pricing_end)
+                pool_filters.append(and_(*conditions))
+            
+            minute = (DBPoolSwap.timestamp - DBPoolSwap.timestamp % 60).label('minute')
+            base_volume = token_amount(DBPoolSwap.base_amount, base_decimals)
+            
+            rows = session.query(
+                minute,
+                func.sum(base_volume),
+                func.sum(base_volume * DBPoolSwapDetail.price)
+            ).join(
+                DBPoolSwap, DBPoolSwapDetail.content_id == DBPoolSwap.content_id
+            ).filter(
+                DBPoolSwapDetail.denom == denomination,
+                DBPoolSwap.timestamp >= start_timestamp,
+                DBPoolSwap.timestamp < end_timestamp + 60,
+                or_(*pool_filters)
+            ).group_by(minute).order_by(minute).all()
+            
+            return [(int(minute_ts), Decimal(volume), Decimal(weighted)) for minute_ts, volume, weighted in rows]
+            
+        except Exception as e:
+            log_with_context(
+                self.logger, ERROR, "Error getting minute VWAP aggregates",
+                pool_count=len(pool_windows),
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+                denomination=denomination.value,
+                error=str(e)
+            )
+            raise
+
     def create_global_pricing_detail(
         self,
         session: Session,
@@ -345,6 +410,117 @@ class PoolSwapDetailRepository(BaseRepository):
             )
             raise
 
+    def apply_global_pricing(
+        self,
+        session: Session,
+        asset_address: str,
+        minute_prices: List[Tuple[int, Decimal]],
+        denomination: PricingDenomination,
+        base_decimals: int,
+        start_block: Optional[int] = None,
+        end_block: Optional[int] = None,
+        block_ranges: Optional[List[Tuple[int, int]]] = None,
+        batch_size: int = 5000
+    ) -> int:
+        """
+        Price swaps without direct pricing from canonical prices, set-based.
+        
+        One INSERT ... SELECT per batch of minutes joins pool_swaps to the canonical
+        prices (passed in as a VALUES list, since price_vwap lives in the shared
+        database) on the swap's minute. Swaps that already have direct pricing are
+        skipped, existing details are left alone (ON CONFLICT DO NOTHING) and the
+        inserted rows are counted through RETURNING.
+        
+        Value is the swap's absolute base amount in token units times the price.
+        
+        Args:
+            minute_prices: (timestamp_minute, price_vwap) ordered by minute
+            base_decimals: Decimals of the base token (the priced asset)
+            start_block: Only swaps at or after this block
+            end_block: Only swaps at or before this block
+            block_ranges: Only swaps in these (start, end) inclusive block ranges
+            
+        Returns:
+            Number of pool swap details created
+        """
+        if not minute_prices:
+            return 0
+        
+        try:
+            table = DBPoolSwapDetail.__table__
+            minute = DBPoolSwap.timestamp - DBPoolSwap.timestamp % 60
+            
+            block_filters = []
+            if start_block is not None:
+                block_filters.append(DBPoolSwap.block_number >= start_block)
+            if end_block is not None:
+                block_filters.append(DBPoolSwap.block_number <= end_block)
+            if block_ranges:
+                block_filters.append(in_block_ranges(DBPoolSwap.block_number, block_ranges))
+            
+            created = 0
+            for offset in range(0, len(minute_prices), batch_size):
+                batch = minute_prices[offset:offset + batch_size]
+                canonical = values(
+                    column('minute', Integer),
+                    column('price', NUMERIC(precision=20, scale=8)),
+                    name='canonical_prices'
+                ).data(batch)
+                
+                priced_swaps = select(
+                    func.gen_random_uuid(),
+                    DBPoolSwap.content_id,
+                    literal(denomination, table.c.denom.type),
+                    token_amount(DBPoolSwap.base_amount, base_decimals) * canonical.c.price,
+                    canonical.c.price,
+                    literal(PricingMethod.GLOBAL, table.c.price_method.type)
+                ).select_from(DBPoolSwap).join(
+                    canonical, canonical.c.minute == minute
+                ).where(
+                    DBPoolSwap.base_token == asset_address.lower(),
+                    DBPoolSwap.timestamp >= batch[0][0],
+                    DBPoolSwap.timestamp < batch[-1][0] + 60,
+                    ~exists().where(
+                        and_(
+                            DBPoolSwapDetail.content_id == DBPoolSwap.content_id,
+                            DBPoolSwapDetail.price_method.in_([
+                                PricingMethod.DIRECT_AVAX,
+                                PricingMethod.DIRECT_USD
+                            ])
+                        )
+                    ),
+                    *block_filters
+                )
+                
+                stmt = pg_insert(table).from_select(
+                    ['id', 'content_id', 'denom', 'value', 'price', 'price_method'],
+                    priced_swaps
+                ).on_conflict_do_nothing(
+                    constraint='uq_pool_swap_detail_content_denom'
+                ).returning(table.c.content_id)
+                
+                created += len(session.execute(stmt).fetchall())
+            
+            log_with_context(
+                self.logger, DEBUG, "Global pricing applied to pool swaps",
+                asset_address=asset_address,
+                denomination=denomination.value,
+                minute_count=len(minute_prices),
+                details_created=created
+            )
+            
+            return created
+            
+        except Exception as e:
+            log_with_context(
+                self.logger, ERROR, "Error applying global pricing to pool swaps",
+                asset_address=asset_address,
+                denomination=denomination.value,
+                minute_count=len(minute_prices),
+                error=str(e)
+            )
+            raise
+
     def get_direct_pricing_stats(
         self,
         session: Session,
@@ -423,6 +599,78 @@ class PoolSwapDetailRepository(BaseRepository):
             )
             return None
 
+    def get_period_pool_volumes(
+        self,
+        session: Session,
+        asset_address: str,
+        periods: List[Tuple[int, int, int]],
+        denominations: List[PricingDenomination],
+        batch_size: int = 5000
+    ) -> List[Tuple[int, PricingDenomination, str, Decimal, int]]:
+        """
+        Swap volume per period, denomination and pool in one grouped query per batch.
+        
+        Periods are passed in as a VALUES list (they live in the shared database);
+        pool to protocol attribution is left to the caller for the same reason.
+        
+        Args:
+            periods: (period_id, time_open, time_close) with inclusive bounds
+            
+        Returns:
+            (period_id, denom, pool, sum(value), swap_count) ordered by period, denomination and pool
+        """
+        if not periods or not denominations:
+            return []
+        
+        try:
+            pool_volumes = []
+            
+            for offset in range(0, len(periods), batch_size):
+                period_values = values(
+                    column('period_id', Integer),
+                    column('time_open', Integer),
+                    column('time_close', Integer),
+                    name='periods'
+                ).data(periods[offset:offset + batch_size])
+                
+                rows = session.execute(
+                    select(
+                        period_values.c.period_id,
+                        DBPoolSwapDetail.denom,
+                        DBPoolSwap.pool,
+                        func.sum(DBPoolSwapDetail.value),
+                        func.count(DBPoolSwapDetail.content_id.distinct())
+                    ).select_from(period_values).join(
+                        DBPoolSwap,
+                        and_(
+                            DBPoolSwap.timestamp >= period_values.c.time_open,
+                            DBPoolSwap.timestamp <= period_values.c.time_close
+                        )
+                    ).join(
+                        DBPoolSwapDetail, DBPoolSwapDetail.content_id == DBPoolSwap.content_id
+                    ).where(
+                        DBPoolSwap.base_token == asset_address.lower(),
+                        DBPoolSwapDetail.denom.in_(denominations)
+                    ).group_by(
+                        period_values.c.period_id, DBPoolSwapDetail.denom, DBPoolSwap.pool
+                    ).order_by(
+                        period_values.c.period_id, DBPoolSwapDetail.denom, DBPoolSwap.pool
+                    )
+                ).all()
+                
+                pool_volumes.extend(tuple(row) for row in rows)
+            
+            return pool_volumes
+            
+        except Exception as e:
+            log_with_context(
+                self.logger, ERROR, "Error getting period pool volumes",
+                asset_address=asset_address,
+                period_count=len(periods),
+                error=str(e)
+            )
+            raise
+
     def get_protocol_volume_aggregation(
         self,
         model_session: Session,
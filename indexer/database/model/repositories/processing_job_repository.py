@@ -0,0 +1,281 @@
+# indexer/database/model/repositories/processing_job_repository.py
+
+import uuid
+from typing import List, Iterable
+from datetime import timedelta
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, func, and_, text
+
+from ...connection import ModelDatabaseManager
+from ...base_repository import BaseRepository
+from ....core.logging import IndexerLogger, log_with_context, INFO, DEBUG, WARNING, ERROR, CRITICAL
+
+from ..tables import DBProcessingJob
+from ...types import JobStatus
+from ....utils.block_ranges import BlockRangeSet
+
+# Channel NOTIFYed when jobs become claimable; idle workers LISTEN on it
+JOB_NOTIFY_CHANNEL = "indexer_processing_jobs"
+
+# Block runs referenced by any job: single block jobs, explicit block lists, block range sets
+# and plain start_block..end_block range jobs (mirrors BlockRangeSet.from_job_data)
+HANDLED_BLOCK_RANGES_SQL = text("""
+    SELECT (job_data->>'block_number')::bigint AS start_block,
+           (job_data->>'block_number')::bigint AS end_block
+    FROM processing_jobs
+    WHERE job_data ? 'block_number'
+    UNION ALL
+    SELECT block.value::bigint, block.value::bigint
+    FROM processing_jobs
+    CROSS JOIN LATERAL jsonb_array_elements_text(job_data->'block_list') AS block(value)
+    WHERE jsonb_typeof(job_data->'block_list') = 'array'
+    UNION ALL
+    SELECT (run.value->>0)::bigint, (run.value->>1)::bigint
+    FROM processing_jobs
+    CROSS JOIN LATERAL jsonb_array_elements(job_data->'block_ranges') AS run(value)
+    WHERE jsonb_typeof(job_data->'block_ranges') = 'array'
+    UNION ALL
+    SELECT (job_data->>'start_block')::bigint, (job_data->>'end_block')::bigint
+    FROM processing_jobs
+    WHERE job_data ?& array['start_block', 'end_block']
+      AND NOT job_data ?| array['block_number', 'block_list', 'block_ranges']
+    ORDER BY start_block
+""")
+
+
+class ProcessingJobRepository(BaseRepository):
+    """
+    Repository for the processing job queue with lease-based claiming.
+
+    Workers claim jobs in one short UPDATE ... RETURNING over a FOR UPDATE SKIP
+    LOCKED subquery and commit straight away, so no row lock or transaction is
+    held while jobs run. A claimed job carries a lease (lease_expires_at) that
+    its worker extends by heartbeat; jobs whose lease runs out are reaped back
+    to PENDING (or FAILED once out of retries).
+
+    Whenever jobs become claimable (created, released or requeued) a NOTIFY is
+    sent on JOB_NOTIFY_CHANNEL, delivered when the enclosing transaction commits.
+    """
+
+    def __init__(self, db_manager: ModelDatabaseManager):
+        super().__init__(db_manager, DBProcessingJob)
+        self.logger = IndexerLogger.get_logger('database.repositories.processing_job')
+
+    def claim_jobs(self, session: Session, worker_id: str, limit: int, lease_seconds: int) -> List[DBProcessingJob]:
+        """Mark up to `limit` pending jobs PROCESSING for worker_id, in queue order"""
+        try:
+            pending = select(DBProcessingJob.id).where(
+                DBProcessingJob.status == JobStatus.PENDING
+            ).order_by(
+                DBProcessingJob.priority.asc(),
+                DBProcessingJob.created_at.asc()
+            ).limit(limit).with_for_update(skip_locked=True)
+
+            now = func.now()
+            stmt = update(DBProcessingJob).where(
+                DBProcessingJob.id.in_(pending.scalar_subquery())
+            ).values(
+                status=JobStatus.PROCESSING,
+                worker_id=worker_id,
+                started_at=now,
+                completed_at=None,
+                lease_expires_at=now + timedelta(seconds=lease_seconds)
+            ).returning(DBProcessingJob).execution_options(synchronize_session=False)
+
+            jobs = list(session.scalars(stmt))
+            # RETURNING order is unspecified
+            jobs.sort(key=lambda job: (job.priority, job.created_at))
+            return jobs
+
+        except Exception as e:
+            log_with_context(self.logger, ERROR, "Error claiming jobs",
+                            worker_id=worker_id,
+                            limit=limit,
+                            error=str(e))
+            raise
+
+    def notify_jobs_available(self, session: Session, job_count: int = 1) -> None:
+        """Wake listening workers once the session's transaction commits"""
+        if job_count <= 0:
+            return
+
+        try:
+            session.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {'channel': JOB_NOTIFY_CHANNEL, 'payload': str(job_count)}
+            )
+
+        except Exception as e:
+            log_with_context(self.logger, ERROR, "Error notifying job availability",
+                            job_count=job_count,
+                            error=str(e))
+            raise
+
+    def get_handled_block_ranges(self, session: Session, fetch_size: int = 100000) -> BlockRangeSet:
+        """
+        Blocks referenced by any job, in any status.
+
+        Computed in PostgreSQL and streamed in chunks straight into a
+        BlockRangeSet, so neither job rows nor per-block lists are held.
+        """
+        try:
+            result = session.execute(
+                HANDLED_BLOCK_RANGES_SQL.execution_options(yield_per=fetch_size)
+            )
+            return BlockRangeSet.from_sorted_ranges(
+                (start_block, end_block) for start_block, end_block in result
+            )
+
+        except Exception as e:
+            log_with_context(self.logger, ERROR, "Error getting handled block ranges",
+                            error=str(e))
+            raise
+
+    def extend_leases(self, session: Session, worker_id: str, job_ids: Iterable[uuid.UUID], lease_seconds: int) -> int:
+        """Push out the lease of jobs still held by worker_id, returning how many were extended"""
+        job_ids = list(job_ids)
+        if not job_ids:
+            return 0
+
+        try:
+            result = session.execute(
+                update(DBProcessingJob).where(
+                    and_(
+                        DBProcessingJob.id.in_(job_ids),
+                        DBProcessingJob.worker_id == worker_id,
+                        DBProcessingJob.status == JobStatus.PROCESSING
+                    )
+                ).values(
+                    lease_expires_at=func.now() + timedelta(seconds=lease_seconds)
+                ).execution_options(synchronize_session=False)
+            )
+            return result.rowcount
+
+        except Exception as e:
+            log_with_context(self.logger, ERROR, "Error extending job leases",
+                            worker_id=worker_id,
+                            job_count=len(job_ids),
+                            error=str(e))
+            raise
+
+    def finish_job(self, session: Session, job_id: uuid.UUID, worker_id: str, success: bool, error_message: str = None) -> bool:
+        """
+        Record a claimed job's outcome.
+
+        Only applies while worker_id still holds the job, so a job that was reaped
+        and re-claimed elsewhere is left alone. Returns False in that case.
+        """
+        try:
+            if success:
+                values = {'status': JobStatus.COMPLETE, 'error_message': None}
+            else:
+                values = {
+                    'status': JobStatus.FAILED,
+                    'retry_count': DBProcessingJob.retry_count + 1,
+                    'error_message': error_message
+                }
+
+            result = session.execute(
+                update(DBProcessingJob).where(
+                    and_(
+                        DBProcessingJob.id == job_id,
+                        DBProcessingJob.worker_id == worker_id,
+                        DBProcessingJob.status == JobStatus.PROCESSING
+                    )
+                ).values(
+                    completed_at=func.now(),
+                    lease_expires_at=None,
+                    **values
+                ).execution_options(synchronize_session=False)
+            )
+            return result.rowcount > 0
+
+        except Exception as e:
+            log_with_context(self.logger, ERROR, "Error finishing job",
+                            job_id=job_id,
+                            worker_id=worker_id,
+                            error=str(e))
+            raise
+
+    def release_jobs(self, session: Session, worker_id: str, job_ids: Iterable[uuid.UUID]) -> int:
+        """Return claimed but unstarted jobs to the queue (e.g. on shutdown)"""
+        job_ids = list(job_ids)
+        if not job_ids:
+            return 0
+
+        try:
+            result = session.execute(
+                update(DBProcessingJob).where(
+                    and_(
+                        DBProcessingJob.id.in_(job_ids),
+                        DBProcessingJob.worker_id == worker_id,
+                        DBProcessingJob.status == JobStatus.PROCESSING
+                    )
+                ).values(
+                    status=JobStatus.PENDING,
+                    worker_id=None,
+                    started_at=None,
+                    lease_expires_at=None
+                ).execution_options(synchronize_session=False)
+            )
+            self.notify_jobs_available(session, result.rowcount)
+            return result.rowcount
+
+        except Exception as e:
+            log_with_context(self.logger, ERROR, "Error releasing jobs",
+                            worker_id=worker_id,
+                            job_count=len(job_ids),
+                            error=str(e))
+            raise
+
+    def reap_expired_leases(self, session: Session) -> dict:
+        """
+        Reclaim PROCESSING jobs whose lease has expired (their worker died or stalled).
+
+        Each expiry counts as a failed attempt: jobs with retries left go back to
+        PENDING, the rest are marked FAILED.
+
+        Returns: {'requeued': n, 'failed': n}
+        """
+        try:
+            expired = and_(
+                DBProcessingJob.status == JobStatus.PROCESSING,
+                DBProcessingJob.lease_expires_at < func.now()
+            )
+
+            failed = session.execute(
+                update(DBProcessingJob).where(
+                    and_(expired, DBProcessingJob.retry_count + 1 >= DBProcessingJob.max_retries)
+                ).values(
+                    status=JobStatus.FAILED,
+                    retry_count=DBProcessingJob.retry_count + 1,
+                    completed_at=func.now(),
+                    lease_expires_at=None,
+                    error_message="Job lease expired"
+                ).execution_options(synchronize_session=False)
+            ).rowcount
+
+            requeued = session.execute(
+                update(DBProcessingJob).where(expired).values(
+                    status=JobStatus.PENDING,
+                    retry_count=DBProcessingJob.retry_count + 1,
+                    worker_id=None,
+                    started_at=None,
+                    lease_expires_at=None
+                ).execution_options(synchronize_session=False)
+            ).rowcount
+
+            self.notify_jobs_available(session, requeued)
+
+            if requeued or failed:
+                log_with_context(self.logger, WARNING, "Reaped jobs with expired leases",
+                                requeued=requeued,
+                                failed=failed)
+
+            return {'requeued': requeued, 'failed': failed}
+
+        except Exception as e:
+            log_with_context(self.logger, ERROR, "Error reaping expired job leases",
+                            error=str(e))
+            raise
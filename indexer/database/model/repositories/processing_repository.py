@@ -1,9 +1,11 @@
 # indexer/database/model/repositories/processing_repository.py
 
-from typing import List
+from typing import List, Dict
+from datetime import datetime, timezone
 
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from ....types import EvmHash
 from ...connection import ModelDatabaseManager
@@ -11,6 +13,7 @@ from ...base_repository import BaseRepository
 from ....core.logging import IndexerLogger, log_with_context, INFO, DEBUG, WARNING, ERROR, CRITICAL
 
 from ..tables import DBTransactionProcessing
+from ...types import TransactionStatus
 
 
 class ProcessingRepository(BaseRepository):
@@ -45,3 +48,40 @@ class ProcessingRepository(BaseRepository):
             log_with_context(self.logger, ERROR, "Error getting failed transactions",
                             error=str(e))
             raise
+    
+    def bulk_upsert_completed(self, session: Session, rows: List[Dict]) -> int:
+        """
+        Create or update processing records as completed in one statement.
+        
+        Each row needs tx_hash, block_number, timestamp, tx_success and events_generated.
+        Uses INSERT ... ON CONFLICT (tx_hash) DO UPDATE, so no per-transaction lookups.
+        """
+        if not rows:
+            return 0
+        
+        try:
+            now = datetime.now(timezone.utc)
+            values = [
+                {**row, 'status': TransactionStatus.COMPLETED, 'last_processed_at': now}
+                for row in rows
+            ]
+            
+            stmt = pg_insert(DBTransactionProcessing.__table__)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['tx_hash'],
+                set_={
+                    'status': stmt.excluded.status,
+                    'tx_success': stmt.excluded.tx_success,
+                    'events_generated': stmt.excluded.events_generated,
+                    'last_processed_at': stmt.excluded.last_processed_at,
+                    'updated_at': now,
+                }
+            )
+            session.execute(stmt, values)
+            return len(values)
+            
+        except Exception as e:
+            log_with_context(self.logger, ERROR, "Error upserting completed processing records",
+                            row_count=len(rows),
+                            error=str(e))
+            raise
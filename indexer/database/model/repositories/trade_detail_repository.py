@@ -1,17 +1,18 @@
 # indexer/database/model/repositories/trade_detail_repository.py
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc, func, case, exists
+from sqlalchemy import and_, desc, func, case, exists, literal, select, values, column, Integer
+from sqlalchemy.dialects.postgresql import insert as pg_insert, NUMERIC
 
 from ....types import DomainEventId
 from ...connection import ModelDatabaseManager
-from ...base_repository import BaseRepository
+from ...base_repository import BaseRepository, token_amount, in_block_ranges
 from ....core.logging import IndexerLogger, log_with_context, INFO, DEBUG, WARNING, ERROR, CRITICAL
 
-from ..tables import DBPoolSwap, DBPoolSwapDetail, DBTrade, DBTradeDetail
+from ..tables import DBPoolSwap, DBPoolSwapDetail, DBTrade, DBTradeDetail, DBAssetPrice
 from ...shared.tables import DBContract, DBPeriod
 from ...types import PricingDenomination, TradePricingMethod
 
@@ -286,6 +287,105 @@ class TradeDetailRepository(BaseRepository):
             )
             raise
 
+    def apply_global_pricing(
+        self,
+        session: Session,
+        asset_address: str,
+        minute_prices: List[Tuple[int, Decimal]],
+        denomination: PricingDenomination,
+        base_decimals: int,
+        start_block: Optional[int] = None,
+        end_block: Optional[int] = None,
+        block_ranges: Optional[List[Tuple[int, int]]] = None,
+        batch_size: int = 5000
+    ) -> int:
+        """
+        Price trades without direct pricing from canonical prices, set-based.
+        
+        Same shape as PoolSwapDetailRepository.apply_global_pricing(): one
+        INSERT ... SELECT per batch of minutes joining trades to the canonical
+        prices VALUES list, skipping directly priced trades, ON CONFLICT DO
+        NOTHING and counting inserted rows through RETURNING. Value is the
+        trade's base amount in token units times the price.
+        
+        Returns:
+            Number of trade details created
+        """
+        if not minute_prices:
+            return 0
+
+        try:
+            table = DBTradeDetail.__table__
+            minute = DBTrade.timestamp - DBTrade.timestamp % 60
+
+            block_filters = []
+            if start_block is not None:
+                block_filters.append(DBTrade.block_number >= start_block)
+            if end_block is not None:
+                block_filters.append(DBTrade.block_number <= end_block)
+            if block_ranges:
+                block_filters.append(in_block_ranges(DBTrade.block_number, block_ranges))
+
+            created = 0
+            for offset in range(0, len(minute_prices), batch_size):
+                batch = minute_prices[offset:offset + batch_size]
+                canonical = values(
+                    column('minute', Integer),
+                    column('price', NUMERIC(precision=20, scale=8)),
+                    name='canonical_prices'
+                ).data(batch)
+
+                priced_trades = select(
+                    func.gen_random_uuid(),
+                    DBTrade.content_id,
+                    literal(denomination, table.c.denom.type),
+                    token_amount(DBTrade.base_amount, base_decimals) * canonical.c.price,
+                    canonical.c.price,
+                    literal(TradePricingMethod.GLOBAL, table.c.price_method.type)
+                ).select_from(DBTrade).join(
+                    canonical, canonical.c.minute == minute
+                ).where(
+                    DBTrade.base_token == asset_address.lower(),
+                    DBTrade.timestamp >= batch[0][0],
+                    DBTrade.timestamp < batch[-1][0] + 60,
+                    ~exists().where(
+                        and_(
+                            DBTradeDetail.content_id == DBTrade.content_id,
+                            DBTradeDetail.price_method == TradePricingMethod.DIRECT
+                        )
+                    ),
+                    *block_filters
+                )
+
+                stmt = pg_insert(table).from_select(
+                    ['id', 'content_id', 'denom', 'value', 'price', 'price_method'],
+                    priced_trades
+                ).on_conflict_do_nothing(
+                    constraint='uq_trade_detail_content_denom'
+                ).returning(table.c.content_id)
+
+                created += len(session.execute(stmt).fetchall())
+
+            log_with_context(
+                self.logger, DEBUG, "Global pricing applied to trades",
+                asset_address=asset_address,
+                denomination=denomination.value,
+                minute_count=len(minute_prices),
+                details_created=created
+            )
+
+            return created
+
+        except Exception as e:
+            log_with_context(
+                self.logger, ERROR, "Error applying global pricing to trades",
+                asset_address=asset_address,
+                denomination=denomination.value,
+                minute_count=len(minute_prices),
+                error=str(e)
+            )
+            raise
+
     def get_trades_in_period(
         self,
         session: Session,
@@ -326,98 +426,251 @@ class TradeDetailRepository(BaseRepository):
             )
             return []
 
+    def get_period_ohlc(
+        self,
+        session: Session,
+        asset_address: str,
+        periods: List[Tuple[int, int, int]],
+        denominations: List[PricingDenomination],
+        missing_only: bool = True,
+        batch_size: int = 5000
+    ) -> List[Tuple[int, PricingDenomination, Decimal, Decimal, Decimal, Decimal, Decimal, int]]:
+        """
+        OHLC of priced trades for many periods and denominations in one query per batch.
+        
+        Periods are passed in as a VALUES list (they live in the shared database)
+        and trades are matched to them by timestamp. Open and close come from
+        row_number() windows ordered by (timestamp, content_id); trade details
+        with a zero price or value are ignored.
+        
+        Args:
+            periods: (period_id, time_open, time_close) with inclusive bounds
+            missing_only: Skip periods and denominations that already have an asset_price candle
+            
+        Returns:
+            (period_id, denom, open, high, low, close, volume, trade_count) ordered by period and denomination
+        """
+        if not periods or not denominations:
+            return []
+        
+        try:
+            asset = asset_address.lower()
+            candles = []
+            
+            for offset in range(0, len(periods), batch_size):
+                period_values = values(
+                    column('period_id', Integer),
+                    column('time_open', Integer),
+                    column('time_close', Integer),
+                    name='periods'
+                ).data(periods[offset:offset + batch_size])
+                
+                window = (period_values.c.period_id, DBTradeDetail.denom)
+                filters = [
+                    DBTrade.base_token == asset,
+                    DBTradeDetail.denom.in_(denominations),
+                    DBTradeDetail.price != 0,
+                    DBTradeDetail.value != 0,
+                ]
+                if missing_only:
+                    filters.append(
+                        ~exists().where(
+                            and_(
+                                DBAssetPrice.period_id == period_values.c.period_id,
+                                DBAssetPrice.asset == asset,
+                                DBAssetPrice.denom == DBTradeDetail.denom
+                            )
+                        )
+                    )
+                
+                ranked = select(
+                    period_values.c.period_id,
+                    DBTradeDetail.denom,
+                    DBTradeDetail.price,
+                    DBTradeDetail.value,
+                    func.row_number().over(
+                        partition_by=window,
+                        order_by=(DBTrade.timestamp, DBTrade.content_id)
+                    ).label('first_rank'),
+                    func.row_number().over(
+                        partition_by=window,
+                        order_by=(DBTrade.timestamp.desc(), DBTrade.content_id.desc())
+                    ).label('last_rank')
+                ).select_from(period_values).join(
+                    DBTrade,
+                    and_(
+                        DBTrade.timestamp >= period_values.c.time_open,
+                        DBTrade.timestamp <= period_values.c.time_close
+                    )
+                ).join(
+                    DBTradeDetail, DBTradeDetail.content_id == DBTrade.content_id
+                ).where(*filters).subquery()
+                
+                rows = session.execute(
+                    select(
+                        ranked.c.period_id,
+                        ranked.c.denom,
+                        func.max(case((ranked.c.first_rank == 1, ranked.c.price))),
+                        func.max(ranked.c.price),
+                        func.min(ranked.c.price),
+                        func.max(case((ranked.c.last_rank == 1, ranked.c.price))),
+                        func.sum(ranked.c.value),
+                        func.count()
+                    ).group_by(
+                        ranked.c.period_id, ranked.c.denom
+                    ).order_by(
+                        ranked.c.period_id, ranked.c.denom
+                    )
+                ).all()
+                
+                candles.extend(tuple(row) for row in rows)
+            
+            return candles
+            
+        except Exception as e:
+            log_with_context(
+                self.logger, ERROR, "Error getting period OHLC",
+                asset_address=asset_address,
+                period_count=len(periods),
+                error=str(e)
+            )
+            raise
+
     def calculate_direct_pricing(
         self,
         session: Session,
         asset_address: str,
-        days_back: Optional[int] = None
+        days_back: Optional[int] = None,
+        start_block: Optional[int] = None,
+        end_block: Optional[int] = None
     ) -> Dict[str, int]:
         """
         Calculate direct pricing for trades using volume-weighted aggregation from constituent swaps.
         
-        Enhanced version of existing method to support the new pricing service.
-        This method should aggregate pricing from constituent pool swap details.
+        One INSERT ... SELECT groups the constituent pool swap details of every
+        trade without direct pricing by (trade, denomination):
+        value = SUM(value), price = SUM(value) / SUM(value / price). The
+        aggregation stays in NUMERIC, global details for the same trade and
+        denomination are replaced, and created rows are counted through RETURNING.
+        
+        Args:
+            days_back: Only trades from the last days_back days
+            start_block: Only trades at or after this block (chunking large backfills)
+            end_block: Only trades at or before this block
+            
+        Returns:
+            Dict with trades_priced (trade details written, one per denomination) and errors
         """
         try:
-            # Build base query for trades without direct pricing
-            query = session.query(DBTrade).filter(
-                DBTrade.base_token == asset_address.lower()  # Use base_token instead of asset_in
-            )
+            table = DBTradeDetail.__table__
             
-            # Add time filter if specified
+            filters = [DBTrade.base_token == asset_address.lower()]
             if days_back:
                 cutoff_time = datetime.now(timezone.utc) - timedelta(days=days_back)
-                query = query.filter(DBTrade.timestamp >= cutoff_time)
-
-            # Find trades without direct pricing (no TradeDetail with DIRECT method)
-            trades_without_direct_pricing = query.filter(
+                filters.append(DBTrade.timestamp >= int(cutoff_time.timestamp()))
+            if start_block is not None:
+                filters.append(DBTrade.block_number >= start_block)
+            if end_block is not None:
+                filters.append(DBTrade.block_number <= end_block)
+            
+            # Trades without direct pricing (no TradeDetail with DIRECT method)
+            filters.append(
                 ~exists().where(
                     and_(
                         DBTradeDetail.content_id == DBTrade.content_id,
-                        DBTradeDetail.price_method == TradePricingMethod.DIRECT  # ✅ Fixed: Correct field name
+                        DBTradeDetail.price_method == TradePricingMethod.DIRECT
                     )
                 )
-            ).all()
+            )
             
-            results = {'trades_priced': 0, 'errors': 0}
-            
-            for trade in trades_without_direct_pricing:
-                try:
-                    # Get constituent pool swap details for this trade
-                    swap_details = session.query(DBPoolSwapDetail).join(
-                        DBPoolSwap, DBPoolSwapDetail.content_id == DBPoolSwap.content_id
-                    ).filter(
-                        DBPoolSwap.trade_id == trade.content_id
-                    ).all()
-                    
-                    if not swap_details:
-                        continue
-                    
-                    # Aggregate pricing by denomination
-                    for denomination in [PricingDenomination.USD, PricingDenomination.AVAX]:
-                        denom_details = [d for d in swap_details if d.denom == denomination]  # ✅ Fixed: Correct field name
-                        
-                        if not denom_details:
-                            continue
-                        
-                        # Calculate volume-weighted average price
-                        total_value = sum(float(detail.value) for detail in denom_details)  # ✅ Fixed: Use actual field
-                        total_volume = sum(float(detail.value) / float(detail.price) for detail in denom_details if detail.price > 0)  # ✅ Fixed: Use actual fields
-                        
-                        if total_volume > 0:
-                            volume_weighted_price = total_value / total_volume
-                            
-                            # Create trade detail record
-                            self.create_detail(
-                                session=session,
-                                content_id=trade.content_id,
-                                denom=denomination,
-                                value=Decimal(str(total_value)),
-                                price=Decimal(str(volume_weighted_price)),
-                                price_method=TradePricingMethod.DIRECT
-                            )
-                            
-                            results['trades_priced'] += 1
-                    
-                except Exception as e:
-                    results['errors'] += 1
-                    log_with_context(
-                        self.logger, ERROR, "Error pricing individual trade",
-                        trade_id=trade.content_id,
-                        error=str(e)
-                    )
-                    continue
+            total_value = func.sum(DBPoolSwapDetail.value)
+            total_volume = func.sum(
+                case(
+                    (DBPoolSwapDetail.price > 0, DBPoolSwapDetail.value / DBPoolSwapDetail.price),
+                    else_=None
+                )
+            )
             
-            return results
+            aggregated = select(
+                func.gen_random_uuid(),
+                DBTrade.content_id,
+                DBPoolSwapDetail.denom,
+                total_value,
+                total_value / total_volume,
+                literal(TradePricingMethod.DIRECT, table.c.price_method.type)
+            ).select_from(DBTrade).join(
+                DBPoolSwap, DBPoolSwap.trade_id == DBTrade.content_id
+            ).join(
+                DBPoolSwapDetail, DBPoolSwapDetail.content_id == DBPoolSwap.content_id
+            ).where(
+                *filters
+            ).group_by(
+                DBTrade.content_id, DBPoolSwapDetail.denom
+            ).having(
+                total_volume > 0
+            )
+            
+            stmt = pg_insert(table).from_select(
+                ['id', 'content_id', 'denom', 'value', 'price', 'price_method'],
+                aggregated
+            )
+            stmt = stmt.on_conflict_do_update(
+                constraint='uq_trade_detail_content_denom',
+                set_={
+                    'value': stmt.excluded.value,
+                    'price': stmt.excluded.price,
+                    'price_method': stmt.excluded.price_method,
+                    'updated_at': func.now(),
+                },
+                where=table.c.price_method != TradePricingMethod.DIRECT
+            ).returning(table.c.content_id)
+            
+            trades_priced = len(session.execute(stmt).fetchall())
+            
+            log_with_context(
+                self.logger, DEBUG, "Direct trade pricing calculated",
+                asset_address=asset_address,
+                start_block=start_block,
+                end_block=end_block,
+                trades_priced=trades_priced
+            )
+            
+            return {'trades_priced': trades_priced, 'errors': 0}
             
         except Exception as e:
             log_with_context(
                 self.logger, ERROR, "Error calculating direct pricing",
                 asset_address=asset_address,
+                start_block=start_block,
+                end_block=end_block,
                 error=str(e)
             )
             return {'trades_priced': 0, 'errors': 1}
 
+    def get_trade_block_bounds(
+        self,
+        session: Session,
+        asset_address: str,
+        days_back: Optional[int] = None
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """First and last block with trades of an asset, optionally within the last days_back days"""
+        try:
+            query = session.query(func.min(DBTrade.block_number), func.max(DBTrade.block_number)).filter(
+                DBTrade.base_token == asset_address.lower()
+            )
+            if days_back:
+                cutoff_time = datetime.now(timezone.utc) - timedelta(days=days_back)
+                query = query.filter(DBTrade.timestamp >= int(cutoff_time.timestamp()))
+            return query.one()
+            
+        except Exception as e:
+            log_with_context(
+                self.logger, ERROR, "Error getting trade block bounds",
+                asset_address=asset_address,
+                error=str(e)
+            )
+            return None, None
+
     def get_direct_pricing_stats(
         self,
         session: Session,
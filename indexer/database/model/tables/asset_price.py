@@ -1,6 +1,6 @@
 # indexer/database/model/tables/asset_price.py
 
-from sqlalchemy import Column, Integer, Enum, Index
+from sqlalchemy import Column, Integer, Enum, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import NUMERIC
 
 from ...base import DBBaseModel
@@ -19,6 +19,7 @@ class DBAssetPrice(DBBaseModel):
     close = Column(NUMERIC(precision=20, scale=8), nullable=False)
 
     __table_args__ = (
+        UniqueConstraint('period_id', 'asset', 'denom', name='uq_asset_price_period_asset_denom'),
         Index('idx_asset_price_period', 'period_id'),
         Index('idx_asset_price_asset', 'asset'),
         Index('idx_asset_price_asset_period', 'asset', 'period_id'),
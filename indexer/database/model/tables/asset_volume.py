@@ -1,6 +1,6 @@
 # indexer/database/model/tables/asset_volume.py
 
-from sqlalchemy import Column, Integer, Text, Index, Enum
+from sqlalchemy import Column, Integer, Text, Index, Enum, UniqueConstraint
 from sqlalchemy.dialects.postgresql import NUMERIC
 
 from ...base import DBBaseModel
@@ -17,6 +17,7 @@ class DBAssetVolume(DBBaseModel):
     volume = Column(NUMERIC(precision=30, scale=8), nullable=False)
     
     __table_args__ = (
+        UniqueConstraint('period_id', 'asset', 'denom', 'protocol', name='uq_asset_volume_period_asset_denom_protocol'),
         Index('idx_asset_volume_period', 'period_id'),
         Index('idx_asset_volume_asset', 'asset'),
         Index('idx_asset_volume_protocol', 'protocol'),
@@ -7,6 +7,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 
 from ...base import DBBaseModel
 from ...types import EvmHashType, JobType, JobStatus, TransactionStatus
+from ....utils.block_ranges import BlockRangeSet
 
 
 class DBTransactionProcessing(DBBaseModel):
@@ -111,9 +112,11 @@ class DBProcessingJob(DBBaseModel):
     error_message = Column(Text, nullable=True)
     started_at = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
     
     __table_args__ = (
         Index('idx_job_queue_pickup', 'status', 'priority', 'created_at'),
+        Index('idx_job_lease_expiry', 'status', 'lease_expires_at'),
         Index('idx_job_worker_status', 'worker_id', 'status'),
         Index('idx_job_type_status', 'job_type', 'status'),
     )
@@ -136,6 +139,20 @@ class DBProcessingJob(DBBaseModel):
             priority=priority
         )
 
+    @classmethod
+    def create_block_ranges_job(cls, blocks: BlockRangeSet, priority: int = 0):
+        """Job over an arbitrary block set, stored as [start, end] runs"""
+        return cls(
+            job_type=JobType.BLOCK_RANGE,
+            status=JobStatus.PENDING,
+            job_data={
+                'block_ranges': blocks.to_json(),
+                'start_block': blocks.first,
+                'end_block': blocks.last
+            },
+            priority=priority
+        )
+
     @classmethod
     def create_transactions_job(cls, tx_hashes: list, priority: int = 0):
         return cls(
@@ -161,6 +178,10 @@ class DBProcessingJob(DBBaseModel):
         if error_message:
             self.error_message = error_message
     
+    def get_block_set(self) -> BlockRangeSet:
+        """Blocks this job covers, whatever its job_data format"""
+        return BlockRangeSet.from_job_data(self.job_data)
+    
     def can_retry(self) -> bool:
         return self.retry_count < self.max_retries
     
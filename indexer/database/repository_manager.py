@@ -11,6 +11,7 @@ from .model.repositories.trade_repository import TradeRepository
 from .model.repositories.pool_swap_repository import PoolSwapRepository
 from .model.repositories.position_repository import PositionRepository
 from .model.repositories.processing_repository import ProcessingRepository
+from .model.repositories.processing_job_repository import ProcessingJobRepository
 from .model.repositories.pool_swap_detail_repository import PoolSwapDetailRepository
 from .model.repositories.trade_detail_repository import TradeDetailRepository
 from .model.repositories.event_detail_repository import EventDetailRepository
@@ -73,6 +74,7 @@ class RepositoryManager:
         """Initialize repositories for indexer database (model-specific data)"""
         # Processing repositories
         self.processing = ProcessingRepository(self.model_db_manager)
+        self.processing_jobs = ProcessingJobRepository(self.model_db_manager)
         
         # Domain event repositories
         self.trades = TradeRepository(self.model_db_manager)
@@ -93,7 +95,7 @@ class RepositoryManager:
         
         log_with_context(
             self.logger, DEBUG, "Indexer database repositories initialized",
-            repository_count=11
+            repository_count=12
         )
     
     def _init_shared_repositories(self):
@@ -117,6 +119,18 @@ class RepositoryManager:
         with self.model_db_manager.get_session() as session:
             yield session
     
+    @contextmanager
+    def get_session(self):
+        """Get session from model database manager (alias used by the pipelines)"""
+        with self.model_db_manager.get_session() as session:
+            yield session
+    
+    @contextmanager
+    def get_transaction(self):
+        """Get a model database session committed on success and rolled back on error"""
+        with self.model_db_manager.get_transaction() as session:
+            yield session
+    
     @contextmanager
     def get_shared_session(self):
         """Get session from shared database manager"""
@@ -135,6 +149,10 @@ class RepositoryManager:
         """Get processing repository for batch processing operations"""
         return self.processing
     
+    def get_processing_job_repository(self) -> ProcessingJobRepository:
+        """Get processing job repository for lease-based job claiming"""
+        return self.processing_jobs
+    
     # Domain event repositories (indexer database)
     def get_trade_repository(self) -> TradeRepository:
         """Get trade repository for trade event operations"""
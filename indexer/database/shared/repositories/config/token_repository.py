@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from .config_base_repository import ConfigRepositoryBase
 from ...tables import DBToken, DBAddress
 from .....types import TokenConfig, EvmAddress
+from .....core.logging import log_with_context, ERROR
 
 
 class TokenRepository(ConfigRepositoryBase[DBToken, TokenConfig]):    
@@ -58,6 +59,21 @@ class TokenRepository(ConfigRepositoryBase[DBToken, TokenConfig]):
         with self.db_manager.get_session() as session:
             return self._get_by_identifier(session, address)
     
+    def get_decimals(self, session: Session, address: str) -> Optional[int]:
+        """Token decimals for scaling raw amounts; None (logged) if the token is not configured"""
+        decimals = session.query(DBToken.decimals).join(
+            DBAddress, DBToken.address_id == DBAddress.id
+        ).filter(
+            DBAddress.address == address.lower()
+        ).scalar()
+        
+        if decimals is None:
+            log_with_context(
+                self.logger, ERROR, "No token configured for asset, cannot scale amounts",
+                asset_address=address
+            )
+        return decimals
+    
     def get_by_symbol(self, symbol: str) -> List[DBToken]:
         with self.db_manager.get_session() as session:
             return session.query(DBToken).filter(DBToken.symbol == symbol).all()
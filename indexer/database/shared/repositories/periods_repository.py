@@ -442,9 +442,9 @@ class PeriodsRepository(BaseRepository):
             periods = session.query(DBPeriod).filter(
                 and_(
                     DBPeriod.period_type == period_type,
-                    DBPeriod.timestamp >= cutoff_time
+                    DBPeriod.time_open >= int(cutoff_time.timestamp())
                 )
-            ).order_by(DBPeriod.timestamp).all()
+            ).order_by(DBPeriod.time_open).all()
 
             log_with_context(
                 self.logger, DEBUG, "Periods retrieved since cutoff",
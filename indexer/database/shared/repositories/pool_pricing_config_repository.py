@@ -1,6 +1,6 @@
 # indexer/database/shared/repositories/pool_pricing_config_repository.py
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 from sqlalchemy import or_, and_
@@ -151,6 +151,42 @@ class PoolPricingConfigRepository:
             )
             return []
     
+    def get_pricing_pool_windows(self, session: Session, model_id: int,
+                                 asset_address: str) -> List[Tuple[str, int, Optional[int]]]:
+        """
+        Get (pool address, pricing_start, pricing_end) for every pricing pool of a model
+        whose base token is asset_address, in one query.
+        
+        Block windows are returned rather than resolved per block so callers can
+        filter a whole time range of swaps by pool and block in a single query.
+        """
+        try:
+            rows = session.query(
+                DBAddress.address,
+                DBPricing.pricing_start,
+                DBPricing.pricing_end
+            ).join(
+                DBPool, DBPricing.pool_id == DBPool.id
+            ).join(
+                DBAddress, DBPool.address_id == DBAddress.id
+            ).filter(
+                DBPricing.model_id == model_id,
+                DBPricing.price_feed == True,
+                DBPricing.status == 'active',
+                DBPool.base_token == asset_address.lower()
+            ).all()
+            
+            return [(address.lower(), pricing_start, pricing_end) for address, pricing_start, pricing_end in rows]
+            
+        except Exception as e:
+            log_with_context(
+                self.logger, ERROR, "Error getting pricing pool windows",
+                model_id=model_id,
+                asset_address=asset_address,
+                error=str(e)
+            )
+            return []
+    
     def get_all_configs_for_model(self, session: Session, model_id: int) -> List[DBPricing]:
         """Get all pricing configurations for a model"""
         try:
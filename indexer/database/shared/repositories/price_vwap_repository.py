@@ -1,10 +1,11 @@
 # indexer/database/shared/repositories/price_vwap_repository.py
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime, timezone
 from decimal import Decimal
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, desc, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from ..tables.price_vwap import DBPriceVwap
 from ...connection import SharedDatabaseManager
@@ -14,6 +15,13 @@ from ...base_repository import BaseRepository
 from ....database.model.tables.detail.pool_swap_detail import PricingDenomination
 
 
+def _minute_timestamp(time: datetime) -> int:
+    """Unix minute of a price_vwap time (stored without time zone, as UTC)"""
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=timezone.utc)
+    return int(time.timestamp()) // 60 * 60
+
+
 class PriceVwapRepository(BaseRepository):
     """
     Repository for canonical pricing data (VWAP-based pricing).
@@ -141,6 +149,153 @@ class PriceVwapRepository(BaseRepository):
             )
             return []
     
+    def get_canonical_price_map(
+        self,
+        session: Session,
+        asset_address: str,
+        start_timestamp_minute: int,
+        end_timestamp_minute: int,
+        denomination: PricingDenomination
+    ) -> Dict[int, Tuple[Decimal, Decimal]]:
+        """Get {timestamp_minute: (price_period, base_volume)} for an asset over a minute range in one query"""
+        try:
+            rows = session.query(
+                DBPriceVwap.time,
+                DBPriceVwap.price_period,
+                DBPriceVwap.base_volume
+            ).filter(
+                and_(
+                    DBPriceVwap.asset == asset_address.lower(),
+                    DBPriceVwap.time >= datetime.fromtimestamp(start_timestamp_minute, tz=timezone.utc),
+                    DBPriceVwap.time <= datetime.fromtimestamp(end_timestamp_minute, tz=timezone.utc),
+                    DBPriceVwap.denom == denomination
+                )
+            ).all()
+            
+            return {
+                _minute_timestamp(time): (Decimal(price_period), Decimal(base_volume))
+                for time, price_period, base_volume in rows
+            }
+            
+        except Exception as e:
+            log_with_context(
+                self.logger, ERROR, "Error getting canonical price map",
+                asset_address=asset_address,
+                start_timestamp_minute=start_timestamp_minute,
+                end_timestamp_minute=end_timestamp_minute,
+                denomination=denomination.value,
+                error=str(e)
+            )
+            raise
+
+    def get_canonical_vwap_series(
+        self,
+        session: Session,
+        asset_address: str,
+        start_timestamp_minute: int,
+        end_timestamp_minute: int,
+        denomination: PricingDenomination
+    ) -> List[Tuple[int, Decimal]]:
+        """Get (timestamp_minute, price_vwap) for an asset over a minute range in one query, ordered by minute"""
+        try:
+            rows = session.query(
+                DBPriceVwap.time,
+                DBPriceVwap.price_vwap
+            ).filter(
+                and_(
+                    DBPriceVwap.asset == asset_address.lower(),
+                    DBPriceVwap.time >= datetime.fromtimestamp(start_timestamp_minute, tz=timezone.utc),
+                    DBPriceVwap.time <= datetime.fromtimestamp(end_timestamp_minute, tz=timezone.utc),
+                    DBPriceVwap.denom == denomination
+                )
+            ).order_by(DBPriceVwap.time).all()
+
+            return [(_minute_timestamp(time), Decimal(price_vwap)) for time, price_vwap in rows]
+
+        except Exception as e:
+            log_with_context(
+                self.logger, ERROR, "Error getting canonical VWAP series",
+                asset_address=asset_address,
+                start_timestamp_minute=start_timestamp_minute,
+                end_timestamp_minute=end_timestamp_minute,
+                denomination=denomination.value,
+                error=str(e)
+            )
+            raise
+
+    def upsert_canonical_prices(
+        self,
+        session: Session,
+        asset_address: str,
+        denomination: PricingDenomination,
+        prices: List[Tuple[int, Decimal, Decimal, Decimal, Decimal]],
+        batch_size: int = 5000
+    ) -> int:
+        """
+        Insert or replace canonical prices in bulk.
+        
+        Args:
+            prices: (timestamp_minute, base_volume, quote_volume, price_period, price_vwap) rows
+            
+        Returns:
+            Number of rows written
+        """
+        if not prices:
+            return 0
+        
+        try:
+            asset = asset_address.lower()
+            now = datetime.now(timezone.utc)
+            
+            stmt = pg_insert(DBPriceVwap.__table__)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['time', 'asset', 'denom'],
+                set_={
+                    'base_volume': stmt.excluded.base_volume,
+                    'quote_volume': stmt.excluded.quote_volume,
+                    'price_period': stmt.excluded.price_period,
+                    'price_vwap': stmt.excluded.price_vwap,
+                    'updated_at': now,
+                }
+            )
+            
+            for offset in range(0, len(prices), batch_size):
+                values = [
+                    {
+                        'time': datetime.fromtimestamp(timestamp_minute, tz=timezone.utc),
+                        'asset': asset,
+                        'denom': denomination,
+                        'base_volume': base_volume,
+                        'quote_volume': quote_volume,
+                        'price_period': price_period,
+                        'price_vwap': price_vwap,
+                        'created_at': now,
+                        'updated_at': now,
+                    }
+                    for timestamp_minute, base_volume, quote_volume, price_period, price_vwap
+                    in prices[offset:offset + batch_size]
+                ]
+                session.execute(stmt, values)
+            
+            log_with_context(
+                self.logger, DEBUG, "Canonical prices upserted",
+                asset_address=asset_address,
+                denomination=denomination.value,
+                price_count=len(prices)
+            )
+            
+            return len(prices)
+            
+        except Exception as e:
+            log_with_context(
+                self.logger, ERROR, "Error upserting canonical prices",
+                asset_address=asset_address,
+                denomination=denomination.value,
+                price_count=len(prices),
+                error=str(e)
+            )
+            raise
+    
     def find_canonical_pricing_gaps(
         self, 
         session: Session, 
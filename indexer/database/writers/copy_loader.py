@@ -0,0 +1,207 @@
+# indexer/database/writers/copy_loader.py
+
+import enum
+import json
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Any, List, Iterable, Iterator, Optional, Tuple, Union
+
+from sqlalchemy import Enum, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from ..model.tables import DBTrade, DBPoolSwap, DBTransfer, DBLiquidity, DBReward, DBPosition
+from ...core.logging import IndexerLogger, log_with_context, INFO, DEBUG, WARNING, ERROR, CRITICAL
+
+
+# Domain event tables that support COPY loading, keyed by table name
+COPY_TABLES = {
+    model.__tablename__: model
+    for model in (DBTrade, DBPoolSwap, DBTransfer, DBLiquidity, DBReward, DBPosition)
+}
+
+# Rows buffered per write to the COPY stream
+COPY_CHUNK_ROWS = 5000
+
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def _copy_value(value: Any) -> str:
+    """Format one value for PostgreSQL COPY text format"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, enum.Enum):
+        value = value.value
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    elif isinstance(value, (int, float, Decimal, uuid.UUID)):
+        return str(value)
+    return str(value).translate(_COPY_ESCAPES)
+
+
+class CopyBulkLoader:
+    """
+    Bulk loader for domain event tables using PostgreSQL COPY.
+
+    Rows are streamed with COPY FROM STDIN into a temporary staging table shaped
+    like the target, then merged with INSERT ... SELECT ... ON CONFLICT (content_id)
+    DO NOTHING, so re-loading overlapping ranges is safe. Runs inside the caller's
+    transaction; the staging table is dropped on commit.
+
+    Works with both psycopg (3, cursor.copy) and psycopg2 (copy_expert) connections.
+    """
+
+    def __init__(self, chunk_rows: int = COPY_CHUNK_ROWS):
+        self.chunk_rows = chunk_rows
+        self.logger = IndexerLogger.get_logger('database.writers.copy_loader')
+
+    def load(
+        self,
+        connection: Union[Session, Connection],
+        table_name: str,
+        rows: Iterable[Dict[str, Any]],
+        columns: Optional[List[str]] = None,
+        bind_types: bool = True
+    ) -> int:
+        """
+        COPY rows into table_name, skipping content_ids that already exist.
+
+        Args:
+            connection: Session or Connection whose transaction the load joins
+            table_name: One of COPY_TABLES
+            rows: Row dicts keyed by column name
+            columns: Columns to load (defaults to the first row's keys that are table columns)
+            bind_types: Convert enum members to their stored names; pass False
+                for rows read straight from another database
+
+        Returns:
+            Number of rows inserted into the target table
+        """
+        if table_name not in COPY_TABLES:
+            raise ValueError(f"COPY loading not supported for table: {table_name}")
+
+        table = COPY_TABLES[table_name].__table__
+        if isinstance(connection, Session):
+            connection = connection.connection()
+
+        row_iter = iter(rows)
+        first_row = next(row_iter, None)
+        if first_row is None:
+            return 0
+
+        if columns is None:
+            columns = [name for name in first_row if name in table.columns]
+
+        # Only enum columns need converting (member -> stored name); numeric bind
+        # processors would coerce uint256 amounts to float
+        processors = [
+            table.columns[name].type.bind_processor(connection.dialect)
+            if bind_types and isinstance(table.columns[name].type, Enum) else None
+            for name in columns
+        ]
+
+        staging_table = f"_copy_stage_{table_name}"
+        quoted_columns = ", ".join(f'"{name}"' for name in columns)
+
+        connection.execute(text(
+            f'CREATE TEMP TABLE IF NOT EXISTS "{staging_table}" '
+            f'(LIKE "{table_name}" INCLUDING DEFAULTS) ON COMMIT DROP'
+        ))
+        connection.execute(text(f'TRUNCATE "{staging_table}"'))
+
+        copy_sql = f'COPY "{staging_table}" ({quoted_columns}) FROM STDIN'
+        chunks = self._encode_chunks(_chain_first(first_row, row_iter), columns, processors)
+        staged = self._copy(connection, copy_sql, chunks)
+
+        result = connection.execute(text(
+            f'INSERT INTO "{table_name}" ({quoted_columns}) '
+            f'SELECT {quoted_columns} FROM "{staging_table}" '
+            f'ON CONFLICT (content_id) DO NOTHING'
+        ))
+        inserted = result.rowcount
+
+        log_with_context(
+            self.logger, DEBUG, "COPY bulk load complete",
+            table=table_name,
+            staged=staged,
+            inserted=inserted,
+            skipped=staged - inserted
+        )
+
+        return inserted
+
+    def _encode_chunks(self, rows: Iterator[Dict[str, Any]], columns: List[str], processors: List) -> Iterator[Tuple[int, bytes]]:
+        """Yield (row_count, COPY text bytes) chunks"""
+        lines = []
+        for row in rows:
+            values = []
+            for name, processor in zip(columns, processors):
+                value = row.get(name)
+                if processor is not None and value is not None:
+                    value = processor(value)
+                values.append(_copy_value(value))
+            lines.append("\t".join(values))
+
+            if len(lines) >= self.chunk_rows:
+                yield len(lines), ("\n".join(lines) + "\n").encode()
+                lines = []
+
+        if lines:
+            yield len(lines), ("\n".join(lines) + "\n").encode()
+
+    def _copy(self, connection: Connection, copy_sql: str, chunks: Iterator) -> int:
+        """Stream chunks through the driver's COPY API, returning rows staged"""
+        driver_connection = connection.connection.driver_connection
+        staged = 0
+
+        with driver_connection.cursor() as cursor:
+            if hasattr(cursor, "copy"):
+                # psycopg 3
+                with cursor.copy(copy_sql) as copy:
+                    for row_count, data in chunks:
+                        copy.write(data)
+                        staged += row_count
+            else:
+                # psycopg2
+                stream = _ChunkStream(chunks)
+                cursor.copy_expert(copy_sql, stream)
+                staged = stream.rows
+
+        return staged
+
+
+def _chain_first(first: Dict[str, Any], rest: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    yield first
+    yield from rest
+
+
+class _ChunkStream:
+    """File-like reader over encoded COPY chunks, for psycopg2 copy_expert"""
+
+    def __init__(self, chunks: Iterator):
+        self._chunks = chunks
+        self._buffer = b""
+        self.rows = 0
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            row_count, data = chunk
+            self.rows += row_count
+            self._buffer += data
+
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def readline(self, size: int = -1) -> bytes:
+        return self.read(size)
@@ -1,6 +1,6 @@
 # indexer/database/writers/domain_event_writer.py
 
-from typing import Dict, Tuple, Any, List
+from typing import Dict, Tuple, Any, List, Iterable
 import traceback
 from collections import defaultdict
 
@@ -9,8 +9,9 @@ from sqlalchemy.exc import IntegrityError
 
 from ..connection import ModelDatabaseManager
 from ..model.tables.processing import DBTransactionProcessing, TransactionStatus
+from .copy_loader import CopyBulkLoader, COPY_TABLES
 from ...core.logging import IndexerLogger, log_with_context, INFO, DEBUG, WARNING, ERROR, CRITICAL
-from ...types import EvmHash, DomainEventId, Position
+from ...types import EvmHash, DomainEventId, Position, Block
 
 
 class DomainEventWriter:
@@ -33,6 +34,7 @@ class DomainEventWriter:
     
     def __init__(self, model_db_manager: ModelDatabaseManager):
         self.model_db_manager = model_db_manager
+        self.copy_loader = CopyBulkLoader()
         self.logger = IndexerLogger.get_logger('database.writers.domain_event_writer')
         
         log_with_context(self.logger, INFO, "DomainEventWriter initialized")
@@ -109,6 +111,122 @@ class DomainEventWriter:
             )
             raise
     
+    def write_block_results(self, block: Block, use_copy: bool = False) -> Tuple[int, int, int]:
+        """
+        Write domain events, positions and processing records for every transaction of a block.
+        
+        Returns (events_written, positions_written, events_skipped)
+        """
+        return self.write_blocks_results([block], use_copy=use_copy)
+    
+    def write_blocks_results(self, blocks: Iterable[Block], use_copy: bool = False) -> Tuple[int, int, int]:
+        """
+        Write results for one or more blocks in a single database transaction.
+        
+        Rows are collected per table across all transactions, then written with one
+        INSERT ... ON CONFLICT statement per table, so round-trips scale with the number
+        of tables rather than transactions × tables. Existing content_ids are skipped
+        and processing records are upserted straight to completed.
+        
+        With use_copy, event and position tables are loaded through COPY into a staging
+        table instead (CopyBulkLoader), which is faster for large backfill batches.
+        
+        Returns (events_written, positions_written, events_skipped)
+        """
+        
+        events_by_type: Dict[str, List[Dict]] = defaultdict(list)
+        position_data_list: List[Dict] = []
+        processing_rows: List[Dict] = []
+        block_numbers = []
+        
+        for block in blocks:
+            block_numbers.append(block.block_number)
+            for tx_hash, transaction in (block.transactions or {}).items():
+                events = transaction.events or {}
+                positions = transaction.positions or {}
+                
+                for event_type, event_data_list in self._group_events_by_type(
+                    events, tx_hash, transaction.block, transaction.timestamp
+                ).items():
+                    events_by_type[event_type].extend(event_data_list)
+                
+                position_data_list.extend(
+                    self._prepare_position_data(positions, tx_hash, transaction.block, transaction.timestamp)
+                )
+                
+                processing_rows.append({
+                    'tx_hash': tx_hash,
+                    'block_number': transaction.block,
+                    'timestamp': transaction.timestamp,
+                    'tx_success': transaction.tx_success,
+                    'events_generated': len(events),
+                })
+        
+        if not processing_rows:
+            return (0, 0, 0)
+        
+        try:
+            with self.model_db_manager.get_transaction() as session:
+                events_written = 0
+                events_skipped = 0
+                
+                for event_type, event_data_list in events_by_type.items():
+                    try:
+                        repository = self._get_event_repository(event_type)
+                    except ValueError:
+                        log_with_context(
+                            self.logger, WARNING, "No table for event type, skipping",
+                            event_type=event_type,
+                            event_count=len(event_data_list)
+                        )
+                        continue
+                    
+                    inserted_count = self._insert_rows(session, repository, event_data_list, use_copy)
+                    events_written += inserted_count
+                    events_skipped += len(event_data_list) - inserted_count
+                
+                position_repo = self.model_db_manager.get_position_repo()
+                positions_written = self._insert_rows(session, position_repo, position_data_list, use_copy)
+                
+                processing_repo = self.model_db_manager.get_processing_repo()
+                processing_repo.bulk_upsert_completed(session, processing_rows)
+                
+            log_with_context(
+                self.logger, INFO, "Block results written successfully (batched)",
+                block_count=len(block_numbers),
+                first_block=min(block_numbers),
+                last_block=max(block_numbers),
+                transactions=len(processing_rows),
+                events_written=events_written,
+                positions_written=positions_written,
+                events_skipped=events_skipped
+            )
+            
+            return (events_written, positions_written, events_skipped)
+            
+        except Exception as e:
+            log_with_context(
+                self.logger, ERROR, "Failed to write block results",
+                block_numbers=block_numbers,
+                error=str(e),
+                exception_type=type(e).__name__,
+                traceback=traceback.format_exc()
+            )
+            raise
+    
+    def _insert_rows(self, session: Session, repository, rows: List[Dict], use_copy: bool) -> int:
+        """Insert rows skipping existing content_ids, returning the inserted count"""
+        if not rows:
+            return 0
+        
+        table_name = repository.model_class.__tablename__
+        if use_copy and table_name in COPY_TABLES:
+            cleaned_rows = [repository._clean_item(row) for row in rows]
+            columns = sorted({key for row in cleaned_rows for key in row if key in repository.model_class.__table__.columns})
+            return self.copy_loader.load(session, table_name, cleaned_rows, columns=columns)
+        
+        return len(repository.bulk_insert_skip_conflicts(session, rows))
+    
     def _update_transaction_processing(
         self,
         session: Session,
@@ -218,17 +336,7 @@ class DomainEventWriter:
         
         try:
             # Prepare position data for bulk insert
-            position_data_list = []
-            
-            for position_id, position in positions.items():
-                position_data = self._extract_position_data(position)
-                position_data.update({
-                    'content_id': position_id,
-                    'tx_hash': tx_hash,
-                    'block_number': block_number,
-                    'timestamp': timestamp
-                })
-                position_data_list.append(position_data)
+            position_data_list = self._prepare_position_data(positions, tx_hash, block_number, timestamp)
             
             # Get position repository and use bulk operations
             position_repo = self.model_db_manager.get_position_repo()
@@ -253,6 +361,28 @@ class DomainEventWriter:
             )
             raise
     
+    def _prepare_position_data(
+        self,
+        positions: Dict[DomainEventId, Position],
+        tx_hash: EvmHash,
+        block_number: int,
+        timestamp: int
+    ) -> List[Dict]:
+        """Prepare position rows for bulk insertion"""
+        
+        position_data_list = []
+        for position_id, position in positions.items():
+            position_data = self._extract_position_data(position)
+            position_data.update({
+                'content_id': position_id,
+                'tx_hash': tx_hash,
+                'block_number': block_number,
+                'timestamp': timestamp
+            })
+            position_data_list.append(position_data)
+        
+        return position_data_list
+    
     def _mark_transaction_complete(
         self,
         session: Session,
@@ -3,7 +3,6 @@
 from typing import Optional, Union
 from web3 import Web3
 import msgspec
-from web3._utils.events import get_event_data
 from hexbytes import HexBytes
 from eth_utils import is_bytes, is_hex
 
@@ -34,64 +33,60 @@ class LogDecoder(LoggingMixin):
             return None
 
     def decode(self, log: EvmLog) -> Optional[Union[DecodedLog, EncodedLog]]:
-        if not log.address:
+        if not log.address or not log.topics:
             return self.build_encoded_log(log)
             
-        contract = self.contract_manager.get_contract(log.address)
-        if not contract:
+        # Single topic0 lookup against the contract's precomputed event index
+        event_decoder = self.contract_manager.get_event_decoder(log.address, log.topics[0])
+        if not event_decoder or not event_decoder.matches(log.topics):
             return self.build_encoded_log(log)
 
-        event_abis = [abi for abi in contract.abi if abi["type"] == "event"]
-        log_dict = msgspec.structs.asdict(log)
-
-        for event_abi in event_abis:
-            try:
-                event_data = get_event_data(self.w3.codec, event_abi, log_dict)
-                
-                # Handle specific case: convert bytes in 'amounts' field to hex strings
-                args = dict(event_data["args"])
+        try:
+            event_data = event_decoder.decode(self.w3.codec, msgspec.structs.asdict(log))
+            log_index = self.w3.to_int(hexstr=log.logIndex)
+            
+            # Handle specific case: convert bytes in 'amounts' field to hex strings
+            args = dict(event_data["args"])
+            
+            if 'amounts' in args and isinstance(args['amounts'], list):
+                self.log_debug("Processing amounts field",
+                            log_index=log_index,
+                            event_name=event_data["event"],
+                            amounts_count=len(args['amounts']),
+                            first_amount_type=type(args['amounts'][0]).__name__ if args['amounts'] else None)
                 
-                if 'amounts' in args and isinstance(args['amounts'], list):
-                    self.log_debug("Processing amounts field",
-                                log_index=self.w3.to_int(hexstr=log.logIndex),
-                                event_name=event_data["event"],
-                                amounts_count=len(args['amounts']),
-                                first_amount_type=type(args['amounts'][0]).__name__ if args['amounts'] else None)
-                    
-                    converted_amounts = []
-                    for i, item in enumerate(args['amounts']):
-                        if isinstance(item, (bytes, HexBytes)):
-                            hex_value = item.hex()
-                            converted_amounts.append(hex_value)
-                            self.log_debug("Converted bytes to hex",
-                                        log_index=self.w3.to_int(hexstr=log.logIndex),
-                                        amount_index=i,
-                                        original_type=type(item).__name__,
-                                        hex_length=len(hex_value))
-                        else:
-                            converted_amounts.append(item)
-                            self.log_debug("Amount already correct type",
-                                        log_index=self.w3.to_int(hexstr=log.logIndex),
-                                        amount_index=i,
-                                        item_type=type(item).__name__)
-                    
-                    args['amounts'] = converted_amounts
-                    self.log_debug("Amounts field processing completed",
-                                log_index=self.w3.to_int(hexstr=log.logIndex),
-                                final_count=len(converted_amounts))
+                converted_amounts = []
+                for i, item in enumerate(args['amounts']):
+                    if isinstance(item, (bytes, HexBytes)):
+                        hex_value = item.hex()
+                        converted_amounts.append(hex_value)
+                        self.log_debug("Converted bytes to hex",
+                                    log_index=log_index,
+                                    amount_index=i,
+                                    original_type=type(item).__name__,
+                                    hex_length=len(hex_value))
+                    else:
+                        converted_amounts.append(item)
+                        self.log_debug("Amount already correct type",
+                                    log_index=log_index,
+                                    amount_index=i,
+                                    item_type=type(item).__name__)
                 
-                return DecodedLog(
-                    index=self.w3.to_int(hexstr=log.logIndex),
-                    removed=log.removed,
-                    contract=log.address.lower(),
-                    signature=log.topics[0] if log.topics else None,
-                    name=event_data["event"],
-                    attributes=args,
-                )
-            except Exception:
-                continue
-
-        return self.build_encoded_log(log)
+                args['amounts'] = converted_amounts
+                self.log_debug("Amounts field processing completed",
+                            log_index=log_index,
+                            final_count=len(converted_amounts))
+            
+            return DecodedLog(
+                index=log_index,
+                removed=log.removed,
+                contract=log.address.lower(),
+                signature=log.topics[0],
+                name=event_data["event"],
+                attributes=args,
+            )
+        except Exception:
+            return self.build_encoded_log(log)
 
     def _normalize_decoded_attributes(self, attributes: dict) -> dict:
         normalized = {}
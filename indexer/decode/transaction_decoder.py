@@ -33,19 +33,20 @@ class TransactionDecoder:
         self.w3 = Web3()
 
     def decode_function(self, tx: EvmTransaction) -> Union[EncodedMethod, DecodedMethod]:
-        if not tx.to:
+        if not tx.to or not tx.input or len(tx.input) < 10:
             return EncodedMethod(data=tx.input)
 
-        contract = self.contract_manager.get_contract(tx.to)
-        if not contract or not tx.input or tx.input == '0x':
+        # Unknown contracts and selectors short-circuit without raising
+        selector = tx.input[:10]
+        function_decoder = self.contract_manager.get_function_decoder(tx.to, selector)
+        if not function_decoder:
             return EncodedMethod(data=tx.input)
 
         try:
-            func_obj, func_params = contract.decode_function_input(tx.input)
             return DecodedMethod(
-                selector=tx.input[:10],
-                name=func_obj.fn_name,
-                args=dict(func_params),
+                selector=selector,
+                name=function_decoder.name,
+                args=function_decoder.decode(self.w3.codec, tx.input),
             )
         except Exception:
             return EncodedMethod(data=tx.input)
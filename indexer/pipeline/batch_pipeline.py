@@ -14,6 +14,7 @@ from ..database.model.tables.processing import ProcessingJob, JobStatus, JobType
 from ..storage.gcs_handler import GCSHandler
 from .indexing_pipeline import IndexingPipeline
 from ..core.indexer_config import IndexerConfig
+from ..utils.block_ranges import BlockRangeSet
 
 
 class BatchPipeline:
@@ -75,6 +76,7 @@ class BatchPipeline:
             # Combine blocks from all storage locations
             processing_blocks = self.storage_handler.list_processing_blocks()
             complete_blocks = self.storage_handler.list_complete_blocks()
+            self.storage_handler.update_stage_index(processing_blocks, complete_blocks)
             
             # Get primary source for RPC blocks
             try:
@@ -94,7 +96,10 @@ class BatchPipeline:
                 rpc_blocks = []
             
             # Combine all available blocks
-            all_blocks = set(processing_blocks + complete_blocks + rpc_blocks)
+            all_blocks = BlockRangeSet.from_sorted(processing_blocks).union(
+                BlockRangeSet.from_sorted(complete_blocks),
+                BlockRangeSet.from_sorted(rpc_blocks)
+            )
             
             if not all_blocks:
                 log_with_context(
@@ -105,8 +110,8 @@ class BatchPipeline:
                 )
                 return []
             
-            # Sort blocks for consistent processing order
-            sorted_blocks = sorted(all_blocks)
+            # Sorted for consistent processing order
+            sorted_blocks = list(all_blocks)
             
             log_with_context(
                 self.logger, INFO, "Block discovery completed",
@@ -114,8 +119,8 @@ class BatchPipeline:
                 processing_blocks=len(processing_blocks),
                 complete_blocks=len(complete_blocks),
                 rpc_blocks=len(rpc_blocks),
-                earliest_block=min(sorted_blocks),
-                latest_block=max(sorted_blocks)
+                earliest_block=all_blocks.first,
+                latest_block=all_blocks.last
             )
             
             return sorted_blocks
@@ -176,30 +181,17 @@ class BatchPipeline:
                 "has_shared_db": False
             }
         
-    def get_processed_blocks(self) -> Set[int]:
+    def get_processed_blocks(self) -> BlockRangeSet:
         """
         Get set of blocks that have already been processed successfully.
         
         Returns:
-            Set[int]: Block numbers that have completed processing
+            BlockRangeSet: Block numbers that have completed processing
         """
         
         try:
             with self.repository_manager.get_session() as session:
-                # Query for completed block jobs
-                completed_jobs = session.query(ProcessingJob).filter(
-                    and_(
-                        ProcessingJob.job_type == JobType.BLOCK,
-                        ProcessingJob.status == JobStatus.COMPLETE
-                    )
-                ).all()
-                
-                # Extract block numbers from job data
-                processed_blocks = set()
-                for job in completed_jobs:
-                    block_number = job.job_data.get('block_number')
-                    if block_number:
-                        processed_blocks.add(int(block_number))
+                processed_blocks = self._get_job_blocks(session, [JobStatus.COMPLETE])
                 
                 log_with_context(
                     self.logger, DEBUG, "Retrieved processed blocks",
@@ -213,32 +205,36 @@ class BatchPipeline:
                 self.logger, ERROR, "Failed to get processed blocks",
                 error=str(e)
             )
-            return set()
+            return BlockRangeSet()
+    
+    def _get_job_blocks(self, session, statuses: List[JobStatus]) -> BlockRangeSet:
+        """Blocks covered by block and block range jobs in the given statuses, in any job data format"""
+        job_data_rows = session.query(ProcessingJob.job_data).filter(
+            and_(
+                ProcessingJob.job_type.in_([JobType.BLOCK, JobType.BLOCK_RANGE]),
+                ProcessingJob.status.in_(statuses)
+            )
+        )
+        
+        return BlockRangeSet(
+            block_range
+            for job_data, in job_data_rows
+            for block_range in BlockRangeSet.from_job_data(job_data).ranges()
+        )
     
-    def get_pending_blocks(self) -> Set[int]:
+    def get_pending_blocks(self) -> BlockRangeSet:
         """
         Get set of blocks that are already queued for processing.
         
         Returns:
-            Set[int]: Block numbers that are pending or currently processing
+            BlockRangeSet: Block numbers that are pending or currently processing
         """
         
         try:
             with self.repository_manager.get_session() as session:
-                # Query for pending/processing block jobs
-                pending_jobs = session.query(ProcessingJob).filter(
-                    and_(
-                        ProcessingJob.job_type == JobType.BLOCK,
-                        ProcessingJob.status.in_([JobStatus.PENDING, JobStatus.PROCESSING])
-                    )
-                ).all()
-                
-                # Extract block numbers from job data
-                pending_blocks = set()
-                for job in pending_jobs:
-                    block_number = job.job_data.get('block_number')
-                    if block_number:
-                        pending_blocks.add(int(block_number))
+                pending_blocks = self._get_job_blocks(
+                    session, [JobStatus.PENDING, JobStatus.PROCESSING]
+                )
                 
                 log_with_context(
                     self.logger, DEBUG, "Retrieved pending blocks",
@@ -252,7 +248,7 @@ class BatchPipeline:
                 self.logger, ERROR, "Failed to get pending blocks",
                 error=str(e)
             )
-            return set()
+            return BlockRangeSet()
     
     def queue_available_blocks(
         self,
@@ -293,10 +289,7 @@ class BatchPipeline:
             pending_blocks = self.get_pending_blocks()
             
             # Blocks that need processing (not processed and not already queued)
-            unprocessed_blocks = [
-                block for block in available_blocks 
-                if block not in processed_blocks and block not in pending_blocks
-            ]
+            unprocessed_blocks = BlockRangeSet.from_sorted(available_blocks) - processed_blocks - pending_blocks
             
             if not unprocessed_blocks:
                 log_with_context(
@@ -312,9 +305,9 @@ class BatchPipeline:
             
             # Step 3: Select target blocks based on preference and limit
             if earliest_first:
-                target_blocks = sorted(unprocessed_blocks)[:max_blocks]
+                target_blocks = unprocessed_blocks.head(max_blocks)
             else:
-                target_blocks = sorted(unprocessed_blocks, reverse=True)[:max_blocks]
+                target_blocks = unprocessed_blocks.tail(max_blocks)
             
             # Step 4: Create jobs for target blocks
             total_jobs_created = 0
@@ -323,12 +316,12 @@ class BatchPipeline:
             if batch_size <= 1:
                 # Create individual block jobs
                 total_jobs_created, total_blocks_queued = self._queue_individual_blocks(
-                    target_blocks, priority
+                    list(target_blocks) if earliest_first else list(reversed(target_blocks)), priority
                 )
             else:
                 # Create batch range jobs
                 total_jobs_created, total_blocks_queued = self._queue_block_ranges(
-                    target_blocks, batch_size, priority
+                    target_blocks, batch_size, priority, earliest_first
                 )
             
             stats = {
@@ -340,8 +333,8 @@ class BatchPipeline:
             }
             
             if target_blocks:
-                stats["earliest_block"] = min(target_blocks)
-                stats["latest_block"] = max(target_blocks)
+                stats["earliest_block"] = target_blocks.first
+                stats["latest_block"] = target_blocks.last
             
             log_with_context(
                 self.logger, INFO, "Block queue population completed",
@@ -412,6 +405,7 @@ class BatchPipeline:
                         continue
                 
                 session.flush()
+                self.repository_manager.get_processing_job_repository().notify_jobs_available(session, jobs_created)
                 
         except Exception as e:
             log_with_context(
@@ -421,14 +415,16 @@ class BatchPipeline:
         
         return jobs_created, blocks_queued
     
-    def _queue_block_ranges(self, target_blocks: List[int], batch_size: int, priority: int) -> Tuple[int, int]:
+    def _queue_block_ranges(self, target_blocks: BlockRangeSet, batch_size: int, priority: int,
+                            earliest_first: bool = True) -> Tuple[int, int]:
         """
         Create block range jobs for efficient batch processing.
         
         Args:
-            target_blocks: List of block numbers to queue
+            target_blocks: Block numbers to queue
             batch_size: Number of blocks per batch job
             priority: Priority level for jobs
+            earliest_first: Create jobs for the lowest blocks first
             
         Returns:
             Tuple[int, int]: (jobs_created, blocks_queued)
@@ -440,21 +436,10 @@ class BatchPipeline:
         try:
             with self.repository_manager.get_transaction() as session:
                 # Group blocks into ranges for batch processing
-                for i in range(0, len(target_blocks), batch_size):
-                    batch_blocks = target_blocks[i:i + batch_size]
-                    
-                    if not batch_blocks:
-                        continue
-                    
-                    # Use only the blocks in this specific batch
-                    start_block = min(batch_blocks)
-                    end_block = max(batch_blocks)
-                    
-                    # For non-sequential blocks, we need to store the actual block list
-                    # Check if blocks are sequential
-                    expected_blocks = list(range(start_block, end_block + 1))
-                    is_sequential = (len(batch_blocks) == len(expected_blocks) and 
-                                sorted(batch_blocks) == expected_blocks)
+                for batch_blocks in target_blocks.chunks(batch_size, reverse=not earliest_first):
+                    start_block = batch_blocks.first
+                    end_block = batch_blocks.last
+                    is_sequential = batch_blocks.range_count == 1
                     
                     try:
                         if is_sequential:
@@ -463,19 +448,8 @@ class BatchPipeline:
                                 start_block, end_block, priority=priority
                             )
                         else:
-                            # Create custom job with explicit block list for non-sequential blocks
-                            job_data = {
-                                'job_type': 'block_list',
-                                'block_list': batch_blocks,
-                                'start_block': start_block,
-                                'end_block': end_block
-                            }
-                            job = ProcessingJob(
-                                job_type=JobType.BLOCK_RANGE,
-                                job_data=job_data,
-                                priority=priority,
-                                status=JobStatus.PENDING
-                            )
+                            # Gapped batches store their runs rather than every block number
+                            job = ProcessingJob.create_block_ranges_job(batch_blocks, priority=priority)
                         
                         session.add(job)
                         
@@ -500,6 +474,7 @@ class BatchPipeline:
                         continue
                 
                 session.flush()
+                self.repository_manager.get_processing_job_repository().notify_jobs_available(session, jobs_created)
                 
         except Exception as e:
             log_with_context(
@@ -724,12 +699,12 @@ class BatchPipeline:
             }
             
             if available_blocks:
-                block_stats["earliest_available"] = min(available_blocks)
-                block_stats["latest_available"] = max(available_blocks)
+                block_stats["earliest_available"] = available_blocks[0]
+                block_stats["latest_available"] = available_blocks[-1]
             
             if processed_blocks:
-                block_stats["earliest_processed"] = min(processed_blocks)
-                block_stats["latest_processed"] = max(processed_blocks)
+                block_stats["earliest_processed"] = processed_blocks.first
+                block_stats["latest_processed"] = processed_blocks.last
             
             # Combine all statistics
             status = {
@@ -795,18 +770,18 @@ class BatchPipeline:
                 return stats
                 
             print(f"✅ Found {len(rpc_blocks):,} total RPC blocks")
-            print(f"📍 Range: {min(rpc_blocks):,} → {max(rpc_blocks):,}")
+            print(f"📍 Range: {rpc_blocks[0]:,} → {rpc_blocks[-1]:,}")
             
             # Step 2: Get all already processed/queued blocks from database
             print("🔍 Checking database for already processed blocks...")
             already_handled = self._get_all_handled_blocks()
             stats["already_processed"] = len(already_handled)
             
-            print(f"⏭️  Already handled: {len(already_handled):,} blocks")
+            print(f"⏭️  Already handled: {len(already_handled):,} blocks in {already_handled.range_count:,} ranges")
             
-            # Step 3: Filter to only new blocks
+            # Step 3: Filter to only new blocks (range difference, RPC blocks are sorted)
             print("🎯 Filtering to new blocks only...")
-            new_blocks = [block for block in rpc_blocks if block not in already_handled]
+            new_blocks = BlockRangeSet.from_sorted(rpc_blocks) - already_handled
 
             if not new_blocks:
                 print("✅ No new blocks to queue - all blocks already handled")
@@ -815,23 +790,20 @@ class BatchPipeline:
             # NEW: Apply max_blocks limit if specified
             if max_blocks is not None and len(new_blocks) > max_blocks:
                 if earliest_first:
-                    new_blocks = sorted(new_blocks)[:max_blocks]
+                    new_blocks = new_blocks.head(max_blocks)
                     print(f"📈 Queueing {len(new_blocks):,} blocks (earliest first, limited to {max_blocks:,})")
                 else:
-                    new_blocks = sorted(new_blocks, reverse=True)[:max_blocks]
+                    new_blocks = new_blocks.tail(max_blocks)
                     print(f"📉 Queueing {len(new_blocks):,} blocks (latest first, limited to {max_blocks:,})")
             else:
-                # Sort blocks by preference (no limit)
                 if earliest_first:
-                    new_blocks.sort()
                     print(f"📈 Queueing {len(new_blocks):,} new blocks (earliest first)")
                 else:
-                    new_blocks.sort(reverse=True)
                     print(f"📉 Queueing {len(new_blocks):,} new blocks (latest first)")
             
             # Step 4: Create jobs in batches with progress updates
             print(f"🎯 Creating jobs (batch size: {batch_size})...")
-            jobs_created = self._create_jobs_with_progress(new_blocks, batch_size)
+            jobs_created = self._create_jobs_with_progress(new_blocks, batch_size, earliest_first)
             stats["newly_queued"] = len(new_blocks)
             stats["jobs_created"] = jobs_created
             
@@ -877,6 +849,12 @@ class BatchPipeline:
             print(f"   Source: {primary_source.name}")
             print(f"   Path: {primary_source.path}")
             
+            if self.storage_handler.block_manifest:
+                # Only names after the last one seen are listed
+                block_numbers = self.storage_handler.list_rpc_blocks(source=primary_source)
+                print(f"   ✅ Manifest up to date: {len(block_numbers):,} valid blocks found")
+                return block_numbers
+            
             # Get all blobs with progress tracking
             prefix = primary_source.path
             blobs = self.storage_handler.list_blobs(prefix=prefix)
@@ -920,48 +898,31 @@ class BatchPipeline:
             )
             raise
 
-    def _get_all_handled_blocks(self) -> Set[int]:
+    def _get_all_handled_blocks(self) -> BlockRangeSet:
         """Get all blocks that are already processed, queued, or complete"""
         
         try:
-            handled_blocks = set()
-            
-            # Get blocks from processing jobs (queued, processing, complete, failed)
+            # Block ranges referenced by processing jobs (queued, processing, complete, failed)
             with self.repository_manager.get_session() as session:
-                from indexer.database.model.tables.processing import ProcessingJob
-                
-                # Query all jobs to get their block lists
-                jobs = session.query(ProcessingJob).all()
-                
-                for job in jobs:
-                    if hasattr(job, 'job_data') and job.job_data:
-                        # Parse block data from job
-                        try:
-                            if 'block_number' in job.job_data:
-                                # Single block job
-                                handled_blocks.add(job.job_data['block_number'])
-                            elif 'block_list' in job.job_data:
-                                # Block list job - explicit blocks only
-                                blocks = job.job_data['block_list']
-                                if isinstance(blocks, list):
-                                    handled_blocks.update(blocks)
-                        except (KeyError, TypeError, ValueError):
-                            # Skip jobs with invalid data
-                            continue
+                job_blocks = self.repository_manager.get_processing_job_repository().get_handled_block_ranges(session)
             
             # Get blocks from storage (processing and complete)
             processing_blocks = self.storage_handler.list_processing_blocks()
             complete_blocks = self.storage_handler.list_complete_blocks()
+            self.storage_handler.update_stage_index(processing_blocks, complete_blocks)
             
-            handled_blocks.update(processing_blocks)
-            handled_blocks.update(complete_blocks)
+            handled_blocks = job_blocks.union(
+                BlockRangeSet.from_sorted(sorted(processing_blocks)),
+                BlockRangeSet.from_sorted(sorted(complete_blocks))
+            )
             
             log_with_context(
                 self.logger, INFO, "Retrieved handled blocks",
-                job_blocks=len(handled_blocks) - len(processing_blocks) - len(complete_blocks),
+                job_blocks=len(job_blocks),
                 processing_blocks=len(processing_blocks),
                 complete_blocks=len(complete_blocks),
-                total_handled=len(handled_blocks)
+                total_handled=len(handled_blocks),
+                handled_ranges=handled_blocks.range_count
             )
             
             return handled_blocks
@@ -972,9 +933,9 @@ class BatchPipeline:
                 error=str(e)
             )
             # Return empty set on error - will queue all blocks (safe fallback)
-            return set()
+            return BlockRangeSet()
 
-    def _create_jobs_with_progress(self, blocks: List[int], batch_size: int) -> int:
+    def _create_jobs_with_progress(self, blocks: BlockRangeSet, batch_size: int, earliest_first: bool = True) -> int:
         """Create processing jobs with progress updates"""
         
         jobs_created = 0
@@ -986,18 +947,13 @@ class BatchPipeline:
             with self.repository_manager.get_session() as session:
                 from indexer.database.model.tables.processing import ProcessingJob, JobType, JobStatus
                 
-                # Create jobs in batches
-                for i in range(0, len(blocks), batch_size):
-                    batch_blocks = blocks[i:i + batch_size]
-                    
-                    # Create job record with block list in job_data
-                    job = ProcessingJob(
-                        job_type=JobType.BLOCK_RANGE,  # ✅ Use enum, not string
-                        status=JobStatus.PENDING,     # ✅ Use enum, not string
-                        job_data={'block_list': batch_blocks},
-                        priority=min(batch_blocks),  # Use earliest block as priority
-                        created_at=datetime.now(timezone.utc)
+                # Create jobs in batches, stored as block runs rather than block lists
+                for batch_blocks in blocks.chunks(batch_size, reverse=not earliest_first):
+                    job = ProcessingJob.create_block_ranges_job(
+                        batch_blocks,
+                        priority=batch_blocks.first  # Use earliest block as priority
                     )
+                    job.created_at = datetime.now(timezone.utc)
                     
                     session.add(job)
                     jobs_created += 1
@@ -1006,6 +962,7 @@ class BatchPipeline:
                     if jobs_created % 100 == 0:
                         print(f"   🎯 Created {jobs_created:,}/{total_jobs:,} jobs...")
                 
+                self.repository_manager.get_processing_job_repository().notify_jobs_available(session, jobs_created)
                 session.commit()
                 
             print(f"   ✅ Job creation complete: {jobs_created:,} jobs created")
@@ -6,6 +6,11 @@ CLI Runner for Batch Block Processing
 Usage:
     python -m indexer.pipeline.batch_runner queue 10000 --batch-size 100
     python -m indexer.pipeline.batch_runner process --max-jobs 50
+    python -m indexer.pipeline.batch_runner process --parallel-workers 8
+    python -m indexer.pipeline.batch_runner process --prefetch-depth 16 --stage-index-ttl 300
+    python -m indexer.pipeline.batch_runner process --copy-load
+    python -m indexer.pipeline.batch_runner process --claim-batch-size 10 --lease-seconds 600
+    python -m indexer.pipeline.batch_runner process --keep-alive
     python -m indexer.pipeline.batch_runner run-full --blocks 10000 --batch-size 100
     python -m indexer.pipeline.batch_runner status
 """
@@ -37,7 +42,11 @@ from indexer.pipeline.batch_pipeline import BatchPipeline
 class BatchRunner:
     """CLI runner for batch processing operations"""
     
-    def __init__(self, model_name: Optional[str] = None):
+    def __init__(self, model_name: Optional[str] = None, parallel_workers: Optional[int] = None,
+                 prefetch_depth: Optional[int] = None, stage_index_ttl: Optional[int] = None,
+                 copy_load: bool = False, claim_batch_size: Optional[int] = None,
+                 lease_seconds: Optional[int] = None, worker_id: Optional[str] = None,
+                 keep_alive: bool = False, listen_for_jobs: bool = True):
         # Initialize indexer with DI container
         self.container = create_indexer(model_name=model_name)
         self.config = self.container._config
@@ -57,7 +66,16 @@ class BatchRunner:
             rpc_client=self.rpc_client,
             storage_handler=self.storage_handler,
             block_decoder=self.block_decoder,
-            transform_manager=self.transform_manager
+            transform_manager=self.transform_manager,
+            worker_id=worker_id,
+            parallel_workers=parallel_workers,
+            prefetch_depth=prefetch_depth,
+            stage_index_ttl=stage_index_ttl,
+            copy_load=copy_load,
+            claim_batch_size=claim_batch_size or 1,
+            lease_seconds=lease_seconds or 300,
+            listen_for_jobs=listen_for_jobs,
+            keep_alive=keep_alive
         )
         
         self.batch_pipeline = BatchPipeline(
@@ -198,6 +216,11 @@ class BatchRunner:
             print(f"✅ Block {block_number:,} processed successfully!")
         else:
             print(f"❌ Block {block_number:,} processing failed!")
+        
+        cache_stats = self.storage_handler.get_cache_stats()
+        if cache_stats:
+            print(f"💾 Block cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                  f"{cache_stats['revalidated']} revalidated")
 
     def queue_all_blocks(self, batch_size: int = 1000, earliest_first: bool = True, max_blocks: Optional[int] = None) -> None:
         """Queue ALL available blocks from storage (or up to max_blocks)"""
@@ -241,6 +264,14 @@ def main():
     process_parser = subparsers.add_parser('process', help='Process queued jobs')
     process_parser.add_argument('--max-jobs', type=int, help='Maximum jobs to process')
     process_parser.add_argument('--timeout', type=int, help='Timeout in seconds')
+    process_parser.add_argument('--parallel-workers', type=int, help='Decode/transform block range jobs across N processes')
+    process_parser.add_argument('--prefetch-depth', type=int, help='Download up to N blocks ahead in block range jobs')
+    process_parser.add_argument('--stage-index-ttl', type=int, help='Resolve block storage stage from listings refreshed every N seconds')
+    process_parser.add_argument('--copy-load', action='store_true', help='Write domain events with COPY bulk loading (backfills)')
+    process_parser.add_argument('--claim-batch-size', type=int, help='Jobs claimed per queue round-trip (default: 1)')
+    process_parser.add_argument('--lease-seconds', type=int, help='Lease on claimed jobs, kept alive by heartbeat (default: 300)')
+    process_parser.add_argument('--keep-alive', action='store_true', help='Wait for new jobs when the queue is empty instead of exiting')
+    process_parser.add_argument('--no-listen', action='store_true', help='Poll for jobs instead of waking on LISTEN/NOTIFY')
     
     # Run-full command
     full_parser = subparsers.add_parser('run-full', help='Queue and process blocks in one go')
@@ -249,6 +280,13 @@ def main():
     full_parser.add_argument('--latest-first', action='store_true', help='Process latest blocks first')
     full_parser.add_argument('--max-jobs', type=int, help='Maximum jobs to process')
     full_parser.add_argument('--timeout', type=int, help='Timeout in seconds')
+    full_parser.add_argument('--parallel-workers', type=int, help='Decode/transform block range jobs across N processes')
+    full_parser.add_argument('--prefetch-depth', type=int, help='Download up to N blocks ahead in block range jobs')
+    full_parser.add_argument('--stage-index-ttl', type=int, help='Resolve block storage stage from listings refreshed every N seconds')
+    full_parser.add_argument('--copy-load', action='store_true', help='Write domain events with COPY bulk loading (backfills)')
+    full_parser.add_argument('--claim-batch-size', type=int, help='Jobs claimed per queue round-trip (default: 1)')
+    full_parser.add_argument('--lease-seconds', type=int, help='Lease on claimed jobs, kept alive by heartbeat (default: 300)')
+    full_parser.add_argument('--no-listen', action='store_true', help='Poll for jobs instead of waking on LISTEN/NOTIFY')
     
     # Status command
     subparsers.add_parser('status', help='Show processing status')
@@ -272,7 +310,17 @@ def main():
     try:
         # Initialize runner
         print(f"🚀 Initializing batch runner...")
-        runner = BatchRunner(model_name=args.model)
+        runner = BatchRunner(
+            model_name=args.model,
+            parallel_workers=getattr(args, 'parallel_workers', None),
+            prefetch_depth=getattr(args, 'prefetch_depth', None),
+            stage_index_ttl=getattr(args, 'stage_index_ttl', None),
+            copy_load=getattr(args, 'copy_load', False),
+            claim_batch_size=getattr(args, 'claim_batch_size', None),
+            lease_seconds=getattr(args, 'lease_seconds', None),
+            keep_alive=getattr(args, 'keep_alive', False),
+            listen_for_jobs=not getattr(args, 'no_listen', False)
+        )
         
         # Execute command
         if args.command == 'queue':
@@ -9,7 +9,7 @@ from contextlib import contextmanager
 from sqlalchemy import text, Integer
 from sqlalchemy.exc import IntegrityError
 
-from ..core.logging import IndexerLogger, log_with_context, INFO, DEBUG, WARNING, ERROR, CRITICAL
+from ..core.logging import IndexerLogger, log_with_context, lazy, INFO, DEBUG, WARNING, ERROR, CRITICAL
 from ..database.repository_manager import RepositoryManager
 from ..database.model.tables.processing import ProcessingJob, JobStatus, JobType, TransactionStatus
 from ..database.writers.domain_event_writer import DomainEventWriter
@@ -18,7 +18,25 @@ from ..storage.gcs_handler import GCSHandler
 from ..decode.block_decoder import BlockDecoder
 from ..transform.manager import TransformManager
 from ..types.indexer import Transaction, Block
+from .parallel_processor import ParallelBlockProcessor, RAW_BLOCK, STORED_BLOCK
+from .job_lease import JobLeaseHeartbeat
+from .job_listener import JobNotificationListener
 from ..types.new import EvmHash
+from ..utils.block_ranges import BlockRangeSet
+
+
+def _sample_transaction_summary(transactions: Dict[EvmHash, Transaction]) -> Optional[Dict]:
+    """Event/position counts and first event of a block's first transaction, for debug logging"""
+    if not transactions:
+        return None
+    
+    sample_tx = next(iter(transactions.values()))
+    return {
+        'events_count': len(sample_tx.events or {}),
+        'positions_count': len(sample_tx.positions or {}),
+        'events_types': [type(event).__name__ for event in (sample_tx.events or {}).values()],
+        'sample_event': str(list(sample_tx.events.values())[:1]) if sample_tx.events else "None"
+    }
 
 
 class IndexingPipeline:
@@ -46,7 +64,17 @@ class IndexingPipeline:
         storage_handler: GCSHandler,
         block_decoder: BlockDecoder,
         transform_manager: TransformManager,
-        worker_id: Optional[str] = None
+        worker_id: Optional[str] = None,
+        parallel_workers: Optional[int] = None,
+        prefetch_depth: Optional[int] = None,
+        prefetch_max_bytes: int = 256 * 1024 * 1024,
+        stage_index_ttl: Optional[int] = None,
+        copy_load: bool = False,
+        claim_batch_size: int = 1,
+        lease_seconds: int = 300,
+        reap_interval: int = 60,
+        listen_for_jobs: bool = True,
+        keep_alive: bool = False
     ):
         """
         Initialize pipeline with all dependencies via dependency injection.
@@ -59,6 +87,16 @@ class IndexingPipeline:
             block_decoder: For decoding raw blockchain data
             transform_manager: For converting decoded data to domain events
             worker_id: Optional worker identifier for multi-worker coordination
+            parallel_workers: Optional process count for parallel decode/transform of block range jobs
+            prefetch_depth: Optional number of blocks to download ahead in block range jobs
+            prefetch_max_bytes: Cap on downloaded-but-unprocessed block bytes while prefetching
+            stage_index_ttl: Optional seconds between storage listings used to resolve each block's stage
+            copy_load: Write domain events and positions with COPY bulk loading (for backfills)
+            claim_batch_size: Jobs claimed per queue round-trip
+            lease_seconds: Lease on claimed jobs, extended by heartbeat while the worker is alive
+            reap_interval: Seconds between sweeps returning jobs with expired leases to the queue
+            listen_for_jobs: Wake idle workers by LISTEN/NOTIFY when jobs are queued (polling stays as fallback)
+            keep_alive: Keep waiting for new jobs when the queue is empty instead of exiting
         """
         self.repository_manager = repository_manager
         self.domain_event_writer = domain_event_writer
@@ -67,35 +105,76 @@ class IndexingPipeline:
         self.block_decoder = block_decoder
         self.transform_manager = transform_manager
         self.worker_id = worker_id or f"worker-{uuid.uuid4().hex[:8]}"
+        self.prefetch_depth = prefetch_depth or 0
+        self.prefetch_max_bytes = prefetch_max_bytes
+        self.copy_load = copy_load
+        self.claim_batch_size = max(claim_batch_size or 1, 1)
+        self.lease_seconds = lease_seconds
+        self.reap_interval = reap_interval
+        self._last_reap = None
+        self.lease_heartbeat = JobLeaseHeartbeat(repository_manager, self.worker_id, lease_seconds)
+        self.keep_alive = keep_alive
+        self.job_listener = JobNotificationListener(repository_manager) if listen_for_jobs else None
+        
+        if stage_index_ttl:
+            self.storage_handler.enable_stage_index(stage_index_ttl)
         
         self.logger = IndexerLogger.get_logger('pipeline.indexing_pipeline')
         self.running = False
         
+        # Cumulative throughput counters, read by the multi-worker supervisor
+        self.stats: Dict[str, int] = {
+            "jobs_processed": 0,
+            "jobs_failed": 0,
+            "blocks_processed": 0,
+            "events_written": 0,
+            "positions_written": 0
+        }
+        
+        # Workers rebuild decoder/transformers from the same config the transform manager uses
+        self.parallel_processor = None
+        if parallel_workers and parallel_workers > 1:
+            self.parallel_processor = ParallelBlockProcessor(
+                transform_manager.config, 
+                max_workers=parallel_workers
+            )
+        
         log_with_context(
             self.logger, INFO, "IndexingPipeline initialized",
             worker_id=self.worker_id,
-            has_shared_db=repository_manager.has_shared_access()
+            has_shared_db=repository_manager.has_shared_access(),
+            parallel_workers=parallel_workers,
+            prefetch_depth=self.prefetch_depth,
+            stage_index_ttl=stage_index_ttl,
+            copy_load=copy_load,
+            claim_batch_size=self.claim_batch_size,
+            lease_seconds=lease_seconds,
+            listen_for_jobs=listen_for_jobs,
+            keep_alive=keep_alive
         )
     
     def run(self, max_jobs: Optional[int] = None, poll_interval: int = 5) -> None:
         """
         Start the pipeline worker loop - DEBUG VERSION
         
-        Continuously polls for available jobs and processes them until:
+        Continuously claims available jobs and processes them until:
         - max_jobs limit reached (if specified)
-        - No more jobs available
+        - No more jobs available (unless keep_alive)
         - Manual stop via stop() method
+        
+        While idle the worker waits on job notifications, with poll_interval
+        as the fallback wait when no notification arrives.
         """
         
         log_with_context(
-            self.logger, INFO, "=== STARTING RUN METHOD DEBUG ===",
+            self.logger, DEBUG, "=== STARTING RUN METHOD DEBUG ===",
             worker_id=self.worker_id,
             max_jobs=max_jobs,
             poll_interval=poll_interval
         )
         
         log_with_context(
-            self.logger, INFO, "Setting running flag",
+            self.logger, DEBUG, "Setting running flag",
             worker_id=self.worker_id
         )
         
@@ -112,16 +191,20 @@ class IndexingPipeline:
         )
         
         log_with_context(
-            self.logger, INFO, "Entering main worker loop",
+            self.logger, DEBUG, "Entering main worker loop",
             worker_id=self.worker_id
         )
         
+        self.lease_heartbeat.start()
+        if self.job_listener:
+            self.job_listener.start()
+        
         try:
             iteration = 0
             while self.running:
                 iteration += 1
                 log_with_context(
-                    self.logger, INFO, "=== WORKER LOOP ITERATION ===",
+                    self.logger, DEBUG, "=== WORKER LOOP ITERATION ===",
                     worker_id=self.worker_id,
                     iteration=iteration,
                     jobs_processed=jobs_processed,
@@ -130,7 +213,7 @@ class IndexingPipeline:
                 
                 # Check if we've hit the job limit
                 log_with_context(
-                    self.logger, INFO, "Checking job limit",
+                    self.logger, DEBUG, "Checking job limit",
                     worker_id=self.worker_id,
                     jobs_processed=jobs_processed,
                     max_jobs=max_jobs
@@ -145,23 +228,24 @@ class IndexingPipeline:
                     break
                 
                 log_with_context(
-                    self.logger, INFO, "About to process next job",
+                    self.logger, DEBUG, "About to process next job",
                     worker_id=self.worker_id,
                     iteration=iteration
                 )
                 
-                # Try to process next available job
-                job_processed = self._process_next_job()
+                # Claim and process the next batch of available jobs
+                remaining_jobs = max_jobs - jobs_processed if max_jobs else None
+                batch_processed = self._process_next_job(remaining_jobs)
                 
                 log_with_context(
-                    self.logger, INFO, "Returned from _process_next_job",
+                    self.logger, DEBUG, "Returned from _process_next_job",
                     worker_id=self.worker_id,
-                    job_processed=job_processed,
+                    batch_processed=batch_processed,
                     iteration=iteration
                 )
                 
-                if job_processed:
-                    jobs_processed += 1
+                if batch_processed:
+                    jobs_processed += batch_processed
                     consecutive_no_jobs = 0  # Reset counter
                     log_with_context(
                         self.logger, DEBUG, "Job processed successfully",
@@ -176,8 +260,8 @@ class IndexingPipeline:
                         consecutive_no_jobs=consecutive_no_jobs
                     )
                     
-                    # Stop if no jobs available for several polls (unless max_jobs specified)
-                    if not max_jobs and consecutive_no_jobs >= max_consecutive_no_jobs:
+                    # Stop if no jobs available for several polls (unless max_jobs specified or keep_alive)
+                    if not max_jobs and not self.keep_alive and consecutive_no_jobs >= max_consecutive_no_jobs:
                         log_with_context(
                             self.logger, INFO, "No jobs available, stopping worker",
                             jobs_processed=jobs_processed,
@@ -186,16 +270,17 @@ class IndexingPipeline:
                         break
                     
                     log_with_context(
-                        self.logger, INFO, "About to sleep",
+                        self.logger, DEBUG, "Waiting for jobs",
                         worker_id=self.worker_id,
                         poll_interval=poll_interval
                     )
                     
-                    time.sleep(poll_interval)
+                    notified = self._wait_for_jobs(poll_interval)
                     
                     log_with_context(
-                        self.logger, INFO, "Woke up from sleep",
-                        worker_id=self.worker_id
+                        self.logger, DEBUG, "Woke up from wait",
+                        worker_id=self.worker_id,
+                        notified=notified
                     )
                     
         except KeyboardInterrupt:
@@ -218,10 +303,17 @@ class IndexingPipeline:
             raise
         finally:
             self.running = False
+            self.lease_heartbeat.stop()
+            self._release_held_jobs()
+            if self.job_listener:
+                self.job_listener.close()
+            if self.parallel_processor:
+                self.parallel_processor.shutdown()
             log_with_context(
                 self.logger, INFO, "=== PIPELINE WORKER STOPPED ===",
                 jobs_processed=jobs_processed,
-                worker_id=self.worker_id
+                worker_id=self.worker_id,
+                block_cache=self.storage_handler.get_cache_stats()
             )
     
     def stop(self) -> None:
@@ -231,6 +323,17 @@ class IndexingPipeline:
             worker_id=self.worker_id
         )
         self.running = False
+        if self.job_listener:
+            self.job_listener.interrupt()
+    
+    def _wait_for_jobs(self, timeout: float) -> bool:
+        """Wait up to timeout for a job notification, returning True if notified"""
+        if not self.running:
+            return False
+        if self.job_listener:
+            return self.job_listener.wait(timeout)
+        time.sleep(timeout)
+        return False
     
     def process_single_block(self, block_number: int, priority: int = 1000) -> bool:
         """
@@ -282,105 +385,56 @@ class IndexingPipeline:
             )
             return False
     
-    def _process_next_job(self) -> bool:
+    def _process_next_job(self, max_jobs: Optional[int] = None) -> int:
         """
-        Process the next available job from the queue - DEBUG VERSION
+        Claim the next batch of jobs and process them outside any database lock.
         
-        Uses database skip locks for multi-worker coordination.
+        Jobs are claimed (marked PROCESSING with a lease) in one short committed
+        transaction, so no row lock or open transaction is held while blocks are
+        downloaded and processed. The lease heartbeat keeps claimed jobs alive and
+        each outcome is recorded in its own short transaction.
+        
+        Args:
+            max_jobs: Optional cap on jobs to claim this round
         
         Returns:
-            bool: True if a job was processed, False if no jobs available
+            int: Number of jobs processed (0 if no jobs were available)
         """
         
-        log_with_context(
-            self.logger, INFO, "=== STARTING _process_next_job ===",
-            worker_id=self.worker_id
-        )
-        
         try:
-            log_with_context(
-                self.logger, INFO, "About to get transaction",
-                worker_id=self.worker_id
-            )
+            self._reap_expired_leases_if_due()
             
-            with self.repository_manager.get_transaction() as session:
-                log_with_context(
-                    self.logger, INFO, "Got transaction, about to get next job",
-                    worker_id=self.worker_id
-                )
-                
-                # Get next available job with skip lock
-                job = self._get_next_job_with_lock(session)
-                
-                log_with_context(
-                    self.logger, INFO, "Returned from _get_next_job_with_lock",
-                    worker_id=self.worker_id,
-                    job_found=job is not None,
-                    job_id=job.id if job else None
-                )
-                
-                if job is None:
-                    log_with_context(
-                        self.logger, INFO, "No job found, returning False",
-                        worker_id=self.worker_id
-                    )
-                    return False
-                
-                log_with_context(
-                    self.logger, INFO, "Marking job as processing",
-                    worker_id=self.worker_id,
-                    job_id=job.id
-                )
-                
-                # Mark job as processing
-                job.mark_processing(self.worker_id)
-                session.flush()
-                
+            limit = min(self.claim_batch_size, max_jobs) if max_jobs else self.claim_batch_size
+            jobs = self._claim_jobs(limit)
+            
+            if not jobs:
                 log_with_context(
-                    self.logger, DEBUG, "Processing job",
-                    job_id=job.id,
-                    job_type=job.job_type.value,
+                    self.logger, DEBUG, "No jobs available",
                     worker_id=self.worker_id
                 )
-                
-                # Process the job
-                success = self._process_job(session, job)
-                
-                log_with_context(
-                    self.logger, INFO, "Returned from _process_job",
-                    worker_id=self.worker_id,
-                    job_id=job.id,
-                    success=success
-                )
-                
-                # Update job status
-                if success:
-                    job.mark_complete()
-                    log_with_context(
-                        self.logger, DEBUG, "Job completed successfully",
-                        job_id=job.id,
-                        job_type=job.job_type.value
-                    )
-                else:
-                    job.mark_failed("Job processing failed")
-                    log_with_context(
-                        self.logger, WARNING, "Job marked as failed",
-                        job_id=job.id,
-                        job_type=job.job_type.value
-                    )
-                
-                log_with_context(
-                    self.logger, INFO, "=== _process_next_job COMPLETED ===",
-                    worker_id=self.worker_id,
-                    job_id=job.id,
-                    success=success
-                )
-                
-                return True
+                return 0
+            
+            log_with_context(
+                self.logger, INFO, "Claimed jobs",
+                worker_id=self.worker_id,
+                job_count=len(jobs),
+                job_ids=[job.id for job in jobs],
+                lease_seconds=self.lease_seconds
+            )
+            
+            processed = 0
+            for job in jobs:
+                if not self.running and processed:
+                    # Stopping: hand unstarted jobs back rather than waiting for their leases to expire
+                    break
+                self._run_claimed_job(job)
+                processed += 1
+            
+            return processed
                 
         except Exception as e:
             log_with_context(
-                self.logger, ERROR, "=== ERROR in _process_next_job ===",
+                self.logger, ERROR, "Failed to claim or process jobs",
                 worker_id=self.worker_id,
                 error=str(e),
                 exception_type=type(e).__name__
@@ -391,28 +445,136 @@ class IndexingPipeline:
                 worker_id=self.worker_id,
                 traceback=traceback.format_exc()
             )
-            return False
+            return 0
+        finally:
+            # Claimed jobs left unstarted must never stay on the heartbeat
+            self._release_held_jobs()
     
-    def _get_next_job_with_lock(self, session) -> Optional[ProcessingJob]:
-        """Get next available job using database skip locks for worker coordination"""
+    def _claim_jobs(self, limit: int) -> List[ProcessingJob]:
+        """Claim up to limit pending jobs and commit, returning them detached from the session"""
+        
+        with self.repository_manager.get_transaction() as session:
+            jobs = self.repository_manager.get_processing_job_repository().claim_jobs(
+                session, self.worker_id, limit, self.lease_seconds
+            )
+            # Keep loaded attributes usable after commit
+            session.expunge_all()
+        
+        self.lease_heartbeat.add(job.id for job in jobs)
+        return jobs
+    
+    def _run_claimed_job(self, job: ProcessingJob) -> bool:
+        """Process one claimed job and record its outcome"""
+        
+        log_with_context(
+            self.logger, DEBUG, "Processing job",
+            job_id=job.id,
+            job_type=job.job_type.value,
+            worker_id=self.worker_id
+        )
         
         try:
-            # Use skip locked to prevent multiple workers from processing same job
-            job = session.query(ProcessingJob).filter(
-                ProcessingJob.status == JobStatus.PENDING
-            ).order_by(
-                ProcessingJob.priority.asc(),
-                ProcessingJob.created_at.asc()
-            ).with_for_update(skip_locked=True).first()
-            
-            return job
+            # Session is only for handlers that need one; it holds no connection until used
+            with self.repository_manager.get_session() as session:
+                success = self._process_job(session, job)
+        except Exception as e:
+            log_with_context(
+                self.logger, ERROR, "Job processing raised",
+                job_id=job.id,
+                error=str(e),
+                exception_type=type(e).__name__
+            )
+            success = False
+        
+        self.lease_heartbeat.remove(job.id)
+        self.stats["jobs_processed" if success else "jobs_failed"] += 1
+        
+        try:
+            with self.repository_manager.get_transaction() as session:
+                recorded = self.repository_manager.get_processing_job_repository().finish_job(
+                    session, job.id, self.worker_id, success,
+                    error_message=None if success else "Job processing failed"
+                )
+        except Exception as e:
+            # Lease is off the heartbeat, so the reaper returns the job once it expires
+            log_with_context(
+                self.logger, ERROR, "Failed to record job outcome; job will be reaped when its lease expires",
+                job_id=job.id,
+                worker_id=self.worker_id,
+                success=success,
+                error=str(e),
+                exception_type=type(e).__name__
+            )
+            return success
+        
+        if not recorded:
+            log_with_context(
+                self.logger, WARNING, "Job lease was lost before completion; outcome not recorded",
+                job_id=job.id,
+                worker_id=self.worker_id,
+                success=success
+            )
+        elif success:
+            log_with_context(
+                self.logger, DEBUG, "Job completed successfully",
+                job_id=job.id,
+                job_type=job.job_type.value
+            )
+        else:
+            log_with_context(
+                self.logger, WARNING, "Job marked as failed",
+                job_id=job.id,
+                job_type=job.job_type.value
+            )
+        
+        return success
+    
+    def _release_held_jobs(self) -> None:
+        """Return claimed jobs that were never started to the queue"""
+        
+        job_ids = self.lease_heartbeat.held_job_ids()
+        if not job_ids:
+            return
+        
+        # Stop extending these leases whether or not the release succeeds, so the reaper can recover them
+        for job_id in job_ids:
+            self.lease_heartbeat.remove(job_id)
+        
+        try:
+            with self.repository_manager.get_transaction() as session:
+                released = self.repository_manager.get_processing_job_repository().release_jobs(
+                    session, self.worker_id, job_ids
+                )
             
+            log_with_context(
+                self.logger, INFO, "Released unstarted jobs",
+                worker_id=self.worker_id,
+                released=released
+            )
         except Exception as e:
             log_with_context(
-                self.logger, ERROR, "Failed to get next job",
+                self.logger, ERROR, "Failed to release unstarted jobs; they will be reaped when leases expire",
+                worker_id=self.worker_id,
+                job_count=len(job_ids),
+                error=str(e)
+            )
+    
+    def _reap_expired_leases_if_due(self) -> None:
+        """Periodically return jobs whose worker stopped heartbeating to the queue"""
+        
+        now = time.monotonic()
+        if self._last_reap is not None and now - self._last_reap < self.reap_interval:
+            return
+        self._last_reap = now
+        
+        try:
+            with self.repository_manager.get_transaction() as session:
+                self.repository_manager.get_processing_job_repository().reap_expired_leases(session)
+        except Exception as e:
+            log_with_context(
+                self.logger, ERROR, "Failed to reap expired job leases",
                 error=str(e)
             )
-            return None
     
     def _process_job(self, session, job: ProcessingJob) -> bool:
         """
@@ -453,7 +615,7 @@ class IndexingPipeline:
             )
             return False
     
-    def _process_block_job(self, session, job: ProcessingJob) -> bool:
+    def _process_block_job(self, session, job: ProcessingJob, prefetched: Optional[Tuple[str, bytes]] = None) -> bool:
         """Process a single block job with dual processing paths"""
         
         block_number = job.job_data.get('block_number')
@@ -472,7 +634,7 @@ class IndexingPipeline:
         
         try:
             # Determine processing path: fresh (from RPC) vs re-processing (from storage)
-            processed_block = self._load_or_fetch_block(block_number)
+            processed_block = self._load_or_fetch_block(block_number, prefetched)
             if not processed_block:
                 return False
             
@@ -505,13 +667,20 @@ class IndexingPipeline:
             )
             return False
     
-    def _load_or_fetch_block(self, block_number: int) -> Optional[Block]:
+    def _load_or_fetch_block(self, block_number: int, prefetched: Optional[Tuple[str, bytes]] = None) -> Optional[Block]:
         """
         Load block using dual processing paths:
         1. Try to load already-processed block from storage (re-processing path)
         2. If not found, fetch from RPC and decode (fresh processing path)
+        
+        If the block was already downloaded by the prefetcher, decode it from those bytes instead.
         """
         
+        if prefetched:
+            prefetched_block = self._decode_prefetched_block(block_number, prefetched)
+            if prefetched_block:
+                return prefetched_block
+        
         # Path 1: Try to load from storage (already decoded)
         stored_block = self._load_from_storage(block_number)
         if stored_block:
@@ -530,66 +699,92 @@ class IndexingPipeline:
         return self._fetch_and_decode_from_rpc(block_number)
     
     def _load_from_storage(self, block_number: int) -> Optional[Block]:
-        """Load already-processed block from storage"""
+        """Load block from complete, processing or raw RPC storage, decoding raw blocks"""
         
         try:
-            # First try complete storage
-            block_data = self.storage_handler.get_complete_block(block_number)
-            if block_data:
-                log_with_context(
-                    self.logger, DEBUG, "Block loaded from complete storage",
-                    block_number=block_number
-                )
-                return block_data
-            
-            # Then try processing storage
-            block_data = self.storage_handler.get_processing_block(block_number)
-            if block_data:
-                log_with_context(
-                    self.logger, DEBUG, "Block loaded from processing storage",
-                    block_number=block_number
-                )
-                return block_data
-            
-            # NEW: Try RPC storage (external stream source)
-            try:
-                # Use hardcoded primary source for now - this matches the diagnostic results
-                from indexer.database.shared.tables.config.config import Source
-                primary_source = Source(
-                    id=1,
-                    name="quicknode-blub",
-                    path="streams/quicknode/blub/",
-                    format="avalanche-mainnet_block_with_receipts_{:012d}-{:012d}.json"
-                )
-                
-                if primary_source:
-                    rpc_block = self.storage_handler.get_rpc_block(block_number, source=primary_source)
-                    if rpc_block:
-                        # Convert EvmFilteredBlock to Block using decoder
-                        decoded_block = self.block_decoder.decode_block(rpc_block)
-                        if decoded_block:
-                            log_with_context(
-                                self.logger, DEBUG, "Block loaded from RPC storage and decoded",
-                                block_number=block_number
-                            )
-                            return decoded_block
-            except Exception as e:
-                log_with_context(
-                    self.logger, DEBUG, "Failed to load from RPC storage",
-                    block_number=block_number,
-                    error=str(e)
-                )
+            fetched = self._fetch_block_bytes(block_number)
+            if not fetched:
+                return None
+            return self._decode_prefetched_block(block_number, fetched)
             
+        except Exception as e:
+            log_with_context(
+                self.logger, ERROR, "Failed to load from storage",
+                block_number=block_number,
+                error=str(e)
+            )
             return None
+    
+    def _get_rpc_storage_source(self):
+        """Source for raw RPC blocks in storage"""
+        # Use hardcoded primary source for now - this matches the diagnostic results
+        from indexer.database.shared.tables.config.config import Source
+        return Source(
+            id=1,
+            name="quicknode-blub",
+            path="streams/quicknode/blub/",
+            format="avalanche-mainnet_block_with_receipts_{:012d}-{:012d}.json"
+        )
+    
+    def _fetch_block_bytes(self, block_number: int) -> Optional[Tuple[str, bytes]]:
+        """
+        Download raw block bytes without decoding.
+        
+        Tries complete, processing, then raw RPC storage, starting with the stage the
+        storage handler's stage index resolves for the block.
+        Returns (stage, bytes), or None if the block was not found.
+        """
+        
+        return self.storage_handler.fetch_block_bytes(block_number, self._get_rpc_storage_source())
+    
+    def _decode_prefetched_block(self, block_number: int, prefetched: Tuple[str, bytes]) -> Optional[Block]:
+        """Decode block bytes fetched by _fetch_block_bytes, decoding raw RPC blocks with the block decoder"""
+        
+        stage, data_bytes = prefetched
+        try:
+            block_data = self.storage_handler.decode_block_bytes(stage, data_bytes)
+            if stage == "rpc":
+                block_data = self.block_decoder.decode_block(block_data)
+            
+            log_with_context(
+                self.logger, DEBUG, "Block loaded from storage data",
+                block_number=block_number,
+                stage=stage
+            )
+            return block_data
             
         except Exception as e:
             log_with_context(
-                self.logger, ERROR, "Failed to load from storage",
+                self.logger, WARNING, "Failed to decode stored block",
                 block_number=block_number,
+                stage=stage,
                 error=str(e)
             )
             return None
     
+    def _iter_block_bytes(self, block_list: List[int]):
+        """Yield (block_number, (stage, bytes) or None), downloading ahead when prefetching is enabled"""
+        
+        if self.prefetch_depth:
+            yield from self.storage_handler.prefetch_blocks(
+                self._fetch_block_bytes, 
+                block_list, 
+                depth=self.prefetch_depth, 
+                max_bytes=self.prefetch_max_bytes
+            )
+            return
+        
+        for block_number in block_list:
+            try:
+                yield block_number, self._fetch_block_bytes(block_number)
+            except Exception as e:
+                log_with_context(
+                    self.logger, ERROR, "Failed to load block bytes",
+                    block_number=block_number,
+                    error=str(e)
+                )
+                yield block_number, None
+    
     def _fetch_and_decode_from_rpc(self, block_number: int) -> Optional[Block]:
         """Fetch raw block from RPC and decode it (fresh processing path)"""
         
@@ -680,7 +875,9 @@ class IndexingPipeline:
             return None
     
     def _persist_block_results(self, transformed_block: Block) -> None:
-        """Persist domain events and update processing status (matches end-to-end test)"""
+        """Persist domain events and update processing status in one batched database transaction"""
+        
+        self.stats["blocks_processed"] += 1
         
         if not transformed_block.transactions:
             log_with_context(
@@ -689,78 +886,33 @@ class IndexingPipeline:
             )
             return
         
-        total_events_written = 0
-        total_positions_written = 0
-        total_events_skipped = 0
-        
-        for tx_hash, transaction in transformed_block.transactions.items():
-            try:
-                # 🔍 DEBUG: Log what we're about to persist
-                log_with_context(
-                    self.logger, INFO, "🔍 DEBUG: About to persist transaction",
-                    tx_hash=tx_hash,
-                    events_count=len(transaction.events or {}),
-                    positions_count=len(transaction.positions or {}),
-                    events_types=[type(event).__name__ for event in (transaction.events or {}).values()],
-                    sample_event_data=str(list(transaction.events.values())[:1]) if transaction.events else "None"
-                )
-                # Write transaction results using domain event writer (same as end-to-end test)
-                events_written, positions_written, events_skipped = self.domain_event_writer.write_transaction_results(
-                    tx_hash=tx_hash,
-                    block_number=transaction.block,
-                    timestamp=transaction.timestamp,
-                    events=transaction.events or {},
-                    positions=transaction.positions or {},
-                    tx_success=transaction.tx_success
-                )
-                
-                total_events_written += events_written
-                total_positions_written += positions_written
-                total_events_skipped += events_skipped
-                
-            except Exception as e:
-                log_with_context(
-                    self.logger, ERROR, "Failed to persist transaction results",
-                    tx_hash=tx_hash,
-                    block_number=transaction.block,
-                    error=str(e)
-                )
-                # Continue with other transactions rather than failing entire block
-                continue
+        events_written, positions_written, events_skipped = self.domain_event_writer.write_block_results(
+            transformed_block, use_copy=self.copy_load
+        )
+        self.stats["events_written"] += events_written
+        self.stats["positions_written"] += positions_written
         
         log_with_context(
             self.logger, INFO, "Block results persisted",
             block_number=transformed_block.block_number,
             transactions_processed=len(transformed_block.transactions),
-            total_events_written=total_events_written,
-            total_positions_written=total_positions_written,
-            total_events_skipped=total_events_skipped
+            total_events_written=events_written,
+            total_positions_written=positions_written,
+            total_events_skipped=events_skipped
         )
     
     def _save_to_storage(self, transformed_block: Block) -> None:
         """Save processed block to storage (matches end-to-end test)"""
         
         try:
-            # 🔍 DEBUG: Log what we're about to save to GCS
-            total_events = sum(len(tx.events or {}) for tx in transformed_block.transactions.values())
-            total_positions = sum(len(tx.positions or {}) for tx in transformed_block.transactions.values())
-            
-            sample_transaction = None
-            if transformed_block.transactions:
-                sample_tx = next(iter(transformed_block.transactions.values()))
-                sample_transaction = {
-                    'events_count': len(sample_tx.events or {}),
-                    'positions_count': len(sample_tx.positions or {}),
-                    'events_types': [type(event).__name__ for event in (sample_tx.events or {}).values()],
-                    'sample_event': str(list(sample_tx.events.values())[:1]) if sample_tx.events else "None"
-                }
-            
+            # 🔍 DEBUG: Log what we're about to save to GCS (computed only when DEBUG is enabled)
+            transactions = transformed_block.transactions
             log_with_context(
-                self.logger, INFO, "🔍 DEBUG: About to save to GCS",
+                self.logger, DEBUG, "🔍 DEBUG: About to save to GCS",
                 block_number=transformed_block.block_number,
-                total_events=total_events,
-                total_positions=total_positions,
-                sample_transaction=sample_transaction
+                total_events=lazy(lambda: sum(len(tx.events or {}) for tx in transactions.values())),
+                total_positions=lazy(lambda: sum(len(tx.positions or {}) for tx in transactions.values())),
+                sample_transaction=lazy(lambda: _sample_transaction_summary(transactions))
             )
             # Save to processing stage first (same as end-to-end test)
             processing_success = self.storage_handler.save_processing_block(
@@ -822,12 +974,15 @@ class IndexingPipeline:
             )
             return False
         
-        # Handle explicit block lists (new format)
-        if 'block_list' in job_data:
-            block_list = job_data['block_list']
+        # Handle explicit block sets: [start, end] runs or a block list
+        if 'block_ranges' in job_data or 'block_list' in job_data:
+            if 'block_ranges' in job_data:
+                block_list = list(BlockRangeSet.from_json(job_data['block_ranges']))
+            else:
+                block_list = job_data['block_list']
             if not isinstance(block_list, list) or not block_list:
                 log_with_context(
-                    self.logger, ERROR, "Invalid or empty block_list in job data",
+                    self.logger, ERROR, "Invalid or empty block set in job data",
                     job_id=job.id,
                     block_list_type=type(block_list).__name__
                 )
@@ -841,11 +996,20 @@ class IndexingPipeline:
                 last_block=max(block_list)
             )
             
+            if self.parallel_processor:
+                return self._process_block_list_parallel(job, block_list)
+            
             # Process each block in the explicit list using the working single block logic
             successful_blocks = 0
             failed_blocks = 0
             
-            for block_number in block_list:
+            # Downloads for upcoming blocks overlap with transforming the current one
+            if self.prefetch_depth:
+                block_iter = self._iter_block_bytes(block_list)
+            else:
+                block_iter = ((block_number, None) for block_number in block_list)
+            
+            for block_number, prefetched in block_iter:
                 try:
                     log_with_context(
                         self.logger, DEBUG, "Processing block from range job",
@@ -859,7 +1023,7 @@ class IndexingPipeline:
                     temp_job.id = f"temp_block_{block_number}"  # Temporary ID for logging
                     
                     # Use the same processing logic that works in process_single_block()
-                    if self._process_block_job(session, temp_job):
+                    if self._process_block_job(session, temp_job, prefetched):
                         successful_blocks += 1
                         log_with_context(
                             self.logger, DEBUG, "Block processed successfully in range job",
@@ -951,6 +1115,70 @@ class IndexingPipeline:
             )
             return False
 
+    def _process_block_list_parallel(self, job: ProcessingJob, block_list: List[int]) -> bool:
+        """
+        Decode and transform blocks in worker processes, then persist and store them in order.
+        
+        Raw storage bytes are handed to workers as-is; storage reads for later blocks are
+        issued while workers transform earlier ones.
+        """
+        
+        successful_blocks = 0
+        failed_blocks = 0
+        missing_blocks = set()
+        
+        def block_inputs():
+            for block_number, prefetched in self._iter_block_bytes(block_list):
+                if prefetched:
+                    yield block_number, RAW_BLOCK if prefetched[0] == "rpc" else STORED_BLOCK, prefetched[1]
+                else:
+                    missing_blocks.add(block_number)
+                    yield block_number, None, None
+        
+        for block_number, transformed_block, error in self.parallel_processor.process_blocks(block_inputs()):
+            if block_number in missing_blocks:
+                # Same fallback as the sequential path: fetch from RPC and process in this process
+                missing_blocks.discard(block_number)
+                decoded_block = self._fetch_and_decode_from_rpc(block_number)
+                transformed_block = self._transform_block(decoded_block) if decoded_block else None
+                if transformed_block is None:
+                    error = "Block not found in storage or RPC"
+            
+            if transformed_block is None:
+                failed_blocks += 1
+                log_with_context(
+                    self.logger, WARNING, "Block processing failed in parallel range job",
+                    job_id=job.id,
+                    block_number=block_number,
+                    error=error
+                )
+                continue
+            
+            try:
+                self._persist_block_results(transformed_block)
+                self._save_to_storage(transformed_block)
+                successful_blocks += 1
+                
+            except Exception as e:
+                failed_blocks += 1
+                log_with_context(
+                    self.logger, ERROR, "Exception persisting block in parallel range job",
+                    job_id=job.id,
+                    block_number=block_number,
+                    error=str(e)
+                )
+        
+        log_with_context(
+            self.logger, INFO, "Parallel block range job completed",
+            job_id=job.id,
+            total_blocks=len(block_list),
+            successful=successful_blocks,
+            failed=failed_blocks,
+            parallel_workers=self.parallel_processor.max_workers
+        )
+        
+        return failed_blocks == 0
+    
     def _process_single_block_in_job(self, block_number: int) -> bool:
         """
         Process a single block within a job context.
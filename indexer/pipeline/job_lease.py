@@ -0,0 +1,101 @@
+# indexer/pipeline/job_lease.py
+
+import threading
+import uuid
+from typing import Set, Iterable, Dict, Any
+
+from ..core.logging import IndexerLogger, log_with_context, INFO, DEBUG, WARNING, ERROR, CRITICAL
+from ..database.repository_manager import RepositoryManager
+
+
+class JobLeaseHeartbeat:
+    """
+    Background thread that keeps a worker's claimed job leases alive.
+
+    Every interval it extends the lease of all jobs currently held, in one short
+    transaction. Jobs are added when claimed and removed once finished, so a
+    worker that dies stops heartbeating and its jobs are reaped after the lease.
+    """
+
+    def __init__(self, repository_manager: RepositoryManager, worker_id: str, lease_seconds: int,
+                 interval_seconds: float = None):
+        self.repository_manager = repository_manager
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.interval_seconds = interval_seconds or max(lease_seconds / 3, 1)
+
+        self._job_ids: Set[uuid.UUID] = set()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.stats: Dict[str, Any] = {"beats": 0, "extended": 0, "lost": 0, "errors": 0}
+
+        self.logger = IndexerLogger.get_logger('pipeline.job_lease')
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"job-lease-{self.worker_id}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def add(self, job_ids: Iterable[uuid.UUID]) -> None:
+        with self._lock:
+            self._job_ids.update(job_ids)
+
+    def remove(self, job_id: uuid.UUID) -> None:
+        with self._lock:
+            self._job_ids.discard(job_id)
+
+    def held_job_ids(self) -> Set[uuid.UUID]:
+        with self._lock:
+            return set(self._job_ids)
+
+    def beat(self) -> int:
+        """Extend all held leases now, returning how many were extended"""
+        job_ids = self.held_job_ids()
+        if not job_ids:
+            return 0
+
+        with self.repository_manager.get_transaction() as session:
+            extended = self.repository_manager.get_processing_job_repository().extend_leases(
+                session, self.worker_id, job_ids, self.lease_seconds
+            )
+
+        self.stats["beats"] += 1
+        self.stats["extended"] += extended
+
+        # Jobs finished during the beat drop out of the held set; any other
+        # shortfall means a lease already expired and the job was reaped
+        still_held = len(job_ids & self.held_job_ids())
+        if extended < still_held:
+            self.stats["lost"] += still_held - extended
+            log_with_context(
+                self.logger, WARNING, "Some job leases could not be extended",
+                worker_id=self.worker_id,
+                held=still_held,
+                extended=extended
+            )
+        return extended
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval_seconds):
+            try:
+                self.beat()
+            except Exception as e:
+                self.stats["errors"] += 1
+                log_with_context(
+                    self.logger, ERROR, "Job lease heartbeat failed",
+                    worker_id=self.worker_id,
+                    error=str(e),
+                    exception_type=type(e).__name__
+                )
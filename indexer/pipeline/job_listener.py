@@ -0,0 +1,172 @@
+# indexer/pipeline/job_listener.py
+
+import select
+import socket
+
+from ..core.logging import IndexerLogger, log_with_context, INFO, DEBUG, WARNING, ERROR, CRITICAL
+from ..database.repository_manager import RepositoryManager
+from ..database.model.repositories.processing_job_repository import JOB_NOTIFY_CHANNEL
+
+
+class JobNotificationListener:
+    """
+    Waits for job queue notifications on a dedicated LISTEN connection.
+
+    Job creation, release and lease reaping NOTIFY JOB_NOTIFY_CHANNEL, so an
+    idle worker wakes as soon as work is committed instead of sleeping out a
+    fixed poll interval. wait() always returns by its timeout, which keeps
+    polling as the fallback; if the connection fails, wait() degrades to a
+    plain sleep and reconnects on the next call.
+
+    Works with both psycopg (3, notify handlers) and psycopg2 (poll/notifies).
+    """
+
+    def __init__(self, repository_manager: RepositoryManager, channel: str = JOB_NOTIFY_CHANNEL):
+        self.repository_manager = repository_manager
+        self.channel = channel
+
+        self._raw_connection = None
+        self._driver_connection = None
+        self._pending = 0
+        # Self-pipe so interrupt() can cut a wait short from a signal handler or other thread
+        self._wakeup_reader, self._wakeup_writer = socket.socketpair()
+        self._wakeup_reader.setblocking(False)
+        self._wakeup_writer.setblocking(False)
+        self.stats = {"notifications": 0, "timeouts": 0, "errors": 0}
+
+        self.logger = IndexerLogger.get_logger('pipeline.job_listener')
+
+    def start(self) -> bool:
+        """Open the LISTEN connection, returning False if it could not be set up"""
+        if self._driver_connection is not None:
+            return True
+
+        try:
+            self._raw_connection = self.repository_manager.model_db_manager.engine.raw_connection()
+            driver_connection = self._raw_connection.driver_connection
+            driver_connection.autocommit = True
+
+            if hasattr(driver_connection, "add_notify_handler"):
+                # psycopg 3: notifications are dispatched whenever the connection reads results
+                driver_connection.add_notify_handler(self._on_notify)
+
+            with driver_connection.cursor() as cursor:
+                cursor.execute(f'LISTEN "{self.channel}"')
+
+            self._driver_connection = driver_connection
+            log_with_context(
+                self.logger, DEBUG, "Listening for job notifications",
+                channel=self.channel
+            )
+            return True
+
+        except Exception as e:
+            self.stats["errors"] += 1
+            log_with_context(
+                self.logger, WARNING, "Could not listen for job notifications, polling only",
+                channel=self.channel,
+                error=str(e),
+                exception_type=type(e).__name__
+            )
+            self._close_connection()
+            return False
+
+    def close(self) -> None:
+        """Drop the LISTEN connection; start() or wait() opens a new one"""
+        self._close_connection()
+        self._clear_wakeups()
+
+    def interrupt(self) -> None:
+        """Return from a wait() in progress (safe to call from a signal handler)"""
+        try:
+            self._wakeup_writer.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Block until a job notification arrives, interrupt() is called or timeout passes.
+
+        Returns:
+            bool: True if woken by a notification
+        """
+        if self._driver_connection is None:
+            if not self.start():
+                self._sleep(timeout)
+                return False
+
+        try:
+            if self._drain():
+                return True
+
+            readable, _, _ = select.select(
+                [self._driver_connection.fileno(), self._wakeup_reader], [], [], timeout
+            )
+            if self._wakeup_reader in readable:
+                self._clear_wakeups()
+            if self._driver_connection.fileno() in readable and self._drain(read=True):
+                return True
+
+            self.stats["timeouts"] += 1
+            return False
+
+        except Exception as e:
+            self.stats["errors"] += 1
+            log_with_context(
+                self.logger, WARNING, "Job notification connection failed, will reconnect",
+                channel=self.channel,
+                error=str(e),
+                exception_type=type(e).__name__
+            )
+            self._close_connection()
+            return False
+
+    def _drain(self, read: bool = False) -> bool:
+        """Consume received notifications, reading from the socket first if read is set"""
+        connection = self._driver_connection
+
+        if hasattr(connection, "add_notify_handler"):
+            if read:
+                # psycopg 3 has no separate poll; a round trip processes pending input
+                connection.execute("SELECT 1")
+            count = self._pending
+        else:
+            if read:
+                connection.poll()
+            count = len(connection.notifies)
+            connection.notifies.clear()
+
+        self._pending = 0
+        if count:
+            self.stats["notifications"] += count
+            log_with_context(
+                self.logger, DEBUG, "Woken by job notification",
+                channel=self.channel,
+                notifications=count
+            )
+        return count > 0
+
+    def _on_notify(self, notify) -> None:
+        self._pending += 1
+
+    def _sleep(self, timeout: float) -> None:
+        readable, _, _ = select.select([self._wakeup_reader], [], [], timeout)
+        if readable:
+            self._clear_wakeups()
+
+    def _clear_wakeups(self) -> None:
+        try:
+            while self._wakeup_reader.recv(64):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _close_connection(self) -> None:
+        if self._raw_connection is not None:
+            try:
+                self._raw_connection.invalidate()
+            except Exception:
+                pass
+        self._raw_connection = None
+        self._driver_connection = None
+        self._pending = 0
@@ -0,0 +1,212 @@
+# indexer/pipeline/parallel_processor.py
+
+"""
+Process-pool block decoding and transformation.
+
+Decode and transform are pure CPU work over msgspec structs, so a block range
+job can fan them out to worker processes. Each worker builds its own
+BlockDecoder and TransformManager from the IndexerConfig once, at pool start.
+Blocks are sent to workers in their storage encoding and come back as msgspec
+JSON (decoded log attributes hold uint256 values that plain msgpack cannot
+represent); the parent keeps all I/O (storage reads, database writes, storage
+saves) and consumes results in order.
+"""
+
+import logging
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Iterable, Iterator, Tuple, Deque
+
+import msgspec
+
+from ..core.logging import IndexerLogger, log_with_context, INFO, DEBUG, WARNING, ERROR, CRITICAL
+from ..core.indexer_config import IndexerConfig
+from ..types import Block, EvmFilteredBlock
+from ..storage.block_format import decode_block
+
+# Payload kinds sent to workers
+RAW_BLOCK = "rpc"        # encoded EvmFilteredBlock, needs decode + transform
+STORED_BLOCK = "block"   # encoded Block from processing/complete storage, needs transform
+
+BlockInput = Tuple[int, Optional[str], Optional[bytes]]
+BlockResult = Tuple[int, Optional[Block], Optional[str]]
+
+# Per-process state, populated by _init_worker
+_block_decoder = None
+_transform_manager = None
+
+
+def _init_worker(config: IndexerConfig, log_level: str, hot_path_quiet: bool = False) -> None:
+    """Build decoder and transform services for this worker process"""
+    global _block_decoder, _transform_manager
+
+    from ..contracts.abi_loader import ABILoader
+    from ..contracts.registry import ContractRegistry
+    from ..contracts.manager import ContractManager
+    from ..decode.block_decoder import BlockDecoder
+    from ..transform.registry import TransformRegistry
+    from ..transform.manager import TransformManager
+
+    IndexerLogger.configure(log_level=log_level, file_enabled=False, structured_format=False)
+    if hot_path_quiet:
+        IndexerLogger.set_hot_path_quiet(True)
+
+    contract_manager = ContractManager(ContractRegistry(config, ABILoader()))
+
+    _block_decoder = BlockDecoder(contract_manager)
+    _transform_manager = TransformManager(TransformRegistry(config), config)
+
+
+def _process_block_payload(block_number: int, kind: str, payload: bytes) -> Tuple[int, Optional[bytes], Optional[str]]:
+    """Decode (if raw) and transform one block in a worker process"""
+    try:
+        if kind == RAW_BLOCK:
+            raw_block = decode_block(payload, EvmFilteredBlock)
+            decoded_block = _block_decoder.decode_block(raw_block)
+        else:
+            decoded_block = decode_block(payload, Block)
+
+        transformed_transactions = {}
+        for tx_hash, transaction in (decoded_block.transactions or {}).items():
+            success, transformed_tx = _transform_manager.process_transaction(transaction)
+            transformed_transactions[tx_hash] = transformed_tx
+
+        transformed_block = Block(
+            block_number=decoded_block.block_number,
+            timestamp=decoded_block.timestamp,
+            transactions=transformed_transactions,
+            indexing_status=decoded_block.indexing_status,
+            processing_metadata=decoded_block.processing_metadata
+        )
+        return block_number, msgspec.json.encode(transformed_block), None
+
+    except Exception as e:
+        return block_number, None, f"{type(e).__name__}: {e}"
+
+
+class ParallelBlockProcessor:
+    """
+    Fans block decode/transform out to a process pool and yields results in input order.
+
+    The pool is started lazily and reused across jobs so worker setup
+    (config decode, ABI loading, transformer registry) is paid once per process.
+    """
+
+    def __init__(self, config: IndexerConfig, max_workers: Optional[int] = None,
+                 max_in_flight: Optional[int] = None, start_method: str = "spawn"):
+        self.config = config
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self.max_in_flight = max_in_flight or self.max_workers * 2
+        self.start_method = start_method
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._decoder = msgspec.json.Decoder(Block)
+
+        self.logger = IndexerLogger.get_logger('pipeline.parallel_processor')
+
+    def start(self) -> None:
+        if self._executor is not None:
+            return
+
+        log_level = IndexerLogger.get_logger('pipeline').getEffectiveLevel()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context(self.start_method),
+            initializer=_init_worker,
+            # Config is pickled as-is: its PathsConfig holds pathlib.Path values msgspec JSON cannot encode
+            initargs=(self.config, logging.getLevelName(log_level), IndexerLogger.is_hot_path_quiet()),
+        )
+
+        log_with_context(
+            self.logger, INFO, "Parallel block processor started",
+            max_workers=self.max_workers,
+            max_in_flight=self.max_in_flight,
+            start_method=self.start_method
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is None:
+            return
+
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+
+        log_with_context(self.logger, INFO, "Parallel block processor stopped")
+
+    def _discard_broken_pool(self) -> None:
+        """Drop a pool whose worker died so the next start() builds a fresh one"""
+        if self._executor is None:
+            return
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+        log_with_context(self.logger, WARNING, "Parallel block processor pool broken, will restart")
+
+    def __enter__(self) -> 'ParallelBlockProcessor':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
+
+    def process_blocks(self, block_inputs: Iterable[BlockInput]) -> Iterator[BlockResult]:
+        """
+        Submit (block_number, kind, payload) inputs and yield (block_number, block, error) in input order.
+
+        Inputs are pulled lazily, so loading the next blocks overlaps with workers
+        transforming earlier ones. An input with no payload is reported as not found.
+        """
+        self.start()
+
+        pending: Deque[Tuple[int, Future, Optional[ProcessPoolExecutor]]] = deque()
+        for block_number, kind, payload in block_inputs:
+            if payload is None:
+                future = Future()
+                future.set_result((block_number, None, "Block not found in storage"))
+                executor = None
+            else:
+                executor, future = self._submit(block_number, kind, payload)
+
+            pending.append((block_number, future, executor))
+
+            if len(pending) >= self.max_in_flight:
+                yield self._collect(*pending.popleft())
+
+        while pending:
+            yield self._collect(*pending.popleft())
+
+    def _submit(self, block_number: int, kind: str, payload: bytes) -> Tuple[ProcessPoolExecutor, Future]:
+        """Submit one block, replacing the pool once if a worker death has already broken it"""
+        # A worker death earlier in this job drops the pool; rebuild it for the remaining blocks
+        self.start()
+        try:
+            return self._executor, self._executor.submit(_process_block_payload, block_number, kind, payload)
+        except BrokenProcessPool:
+            # Broken pools refuse submissions before their failed futures are collected
+            self._discard_broken_pool()
+            self.start()
+            return self._executor, self._executor.submit(_process_block_payload, block_number, kind, payload)
+
+    def _collect(self, block_number: int, future: Future, executor: Optional[ProcessPoolExecutor]) -> BlockResult:
+        try:
+            _, payload, error = future.result()
+        except Exception as e:
+            # Worker process died (BrokenProcessPool) or task could not be pickled
+            log_with_context(
+                self.logger, ERROR, "Parallel worker task failed",
+                block_number=block_number,
+                error=str(e),
+                exception_type=type(e).__name__
+            )
+            # Futures from an already replaced pool must not tear down its successor
+            if isinstance(e, BrokenProcessPool) and executor is self._executor:
+                self._discard_broken_pool()
+            return block_number, None, f"{type(e).__name__}: {e}"
+
+        if error:
+            return block_number, None, error
+
+        return block_number, self._decoder.decode(payload), None
+
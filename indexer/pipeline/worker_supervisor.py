@@ -0,0 +1,421 @@
+# indexer/pipeline/worker_supervisor.py
+
+"""
+Multi-process supervisor for queue workers.
+
+Runs N IndexingPipeline workers as separate processes on one host, each with
+a stable worker id (worker_1 .. worker_N) and its own log file. Workers that
+die with a non-zero exit code are restarted with exponential backoff; workers
+that exit cleanly (queue drained or job limit reached) stay down. SIGTERM and
+SIGINT are forwarded to workers as SIGTERM, which makes each pipeline finish
+its current job, hand unstarted claimed jobs back and exit. Each worker
+publishes its pipeline counters to shared memory and the supervisor folds
+them into one live status line.
+"""
+
+import os
+import sys
+import time
+import signal
+import threading
+import multiprocessing
+from pathlib import Path
+from typing import Optional, Dict, Any, List, TextIO
+
+from ..core.logging import IndexerLogger, log_with_context, INFO, DEBUG, WARNING, ERROR, CRITICAL
+
+# Pipeline counters published by each worker, in shared array order
+COUNTER_FIELDS = ("jobs_processed", "jobs_failed", "blocks_processed", "events_written", "positions_written")
+
+
+def _publish_counters(pipeline, counters) -> None:
+    for index, field in enumerate(COUNTER_FIELDS):
+        counters[index] = pipeline.stats.get(field, 0)
+
+
+def _worker_main(worker_id: str, model_name: Optional[str], runner_options: Dict[str, Any],
+                 max_jobs: Optional[int], log_path: str, log_level: str, counters,
+                 publish_interval: float) -> None:
+    """Entry point of a supervised worker process"""
+
+    # Terminal Ctrl-C reaches the whole process group; the supervisor turns it into SIGTERM
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    log_file = open(log_path, 'a', buffering=1)
+    sys.stdout = log_file
+    sys.stderr = log_file
+
+    # Console handler binds the redirected stdout, so structured logs land in this worker's file
+    IndexerLogger.configure(
+        log_level=log_level,
+        console_enabled=True,
+        file_enabled=False,
+        structured_format=True
+    )
+
+    from .batch_runner import BatchRunner
+
+    runner = BatchRunner(model_name=model_name, worker_id=worker_id, **runner_options)
+    pipeline = runner.indexing_pipeline
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: pipeline.stop())
+
+    stop_publishing = threading.Event()
+
+    def publish_loop():
+        while not stop_publishing.wait(publish_interval):
+            _publish_counters(pipeline, counters)
+
+    publisher = threading.Thread(target=publish_loop, name=f"counters-{worker_id}", daemon=True)
+    publisher.start()
+
+    try:
+        # Run the pipeline directly so a crash raises and exits non-zero (BatchPipeline swallows it)
+        pipeline.run(max_jobs=max_jobs)
+    finally:
+        stop_publishing.set()
+        publisher.join()
+        _publish_counters(pipeline, counters)
+        log_file.flush()
+
+
+class _WorkerSlot:
+    """One supervised worker id and the process currently running it"""
+
+    def __init__(self, worker_id: str, counters, initial_backoff: float):
+        self.worker_id = worker_id
+        self.counters = counters
+        self.process = None
+        self.started_at = None
+        self.restart_at = None
+        self.restarts = 0
+        self.backoff = initial_backoff
+        self.finished = False
+        self.exit_code = None
+        # Counters carried over from earlier processes of this slot
+        self.retired = [0.0] * len(COUNTER_FIELDS)
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def totals(self) -> List[float]:
+        return [retired + current for retired, current in zip(self.retired, self.counters[:])]
+
+
+class WorkerSupervisor:
+    """
+    Spawn and supervise a fixed number of queue worker processes.
+
+    Workers claim jobs from the shared queue under leases, so any number of
+    them (on this host or others) can run side by side. The supervisor only
+    manages process lifetimes and reporting; it never touches the queue.
+    """
+
+    def __init__(
+        self,
+        model_name: Optional[str],
+        worker_count: int,
+        runner_options: Optional[Dict[str, Any]] = None,
+        max_jobs: Optional[int] = None,
+        timeout_seconds: Optional[int] = None,
+        worker_prefix: str = "worker",
+        log_dir: Optional[Path] = None,
+        log_level: str = "INFO",
+        restart_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        stable_seconds: float = 60.0,
+        max_restarts: Optional[int] = None,
+        status_interval: float = 5.0,
+        drain_timeout: float = 120.0,
+        start_method: str = "spawn",
+        status_stream: Optional[TextIO] = None
+    ):
+        """
+        Args:
+            model_name: Model to index (None uses INDEXER_MODEL)
+            worker_count: Number of worker processes
+            runner_options: Extra BatchRunner keyword arguments for every worker
+            max_jobs: Optional job limit per worker, shared across its restarts
+            timeout_seconds: Optional wall clock limit, after which workers are drained
+            worker_prefix: Worker ids are {worker_prefix}_{n}
+            log_dir: Directory for per-worker log files
+            log_level: Log level inside workers
+            restart_backoff: Delay before the first restart of a crashed worker
+            max_backoff: Cap on the doubling restart delay
+            stable_seconds: Uptime after which a worker's backoff is reset
+            max_restarts: Optional cap on restarts per worker
+            status_interval: Seconds between status line updates
+            drain_timeout: Seconds to wait for workers after SIGTERM before killing them
+            start_method: multiprocessing start method for workers
+            status_stream: Where the status line is written (default stdout)
+        """
+        self.model_name = model_name
+        self.worker_count = worker_count
+        self.runner_options = runner_options or {}
+        self.max_jobs = max_jobs
+        self.timeout_seconds = timeout_seconds
+        self.log_dir = Path(log_dir or Path("logs/batch_processing") / (model_name or "default"))
+        self.log_level = log_level
+        self.restart_backoff = restart_backoff
+        self.max_backoff = max_backoff
+        self.stable_seconds = stable_seconds
+        self.max_restarts = max_restarts
+        self.status_interval = status_interval
+        self.drain_timeout = drain_timeout
+        self.status_stream = status_stream or sys.stdout
+
+        self._mp_context = multiprocessing.get_context(start_method)
+        self._slots = [
+            _WorkerSlot(
+                f"{worker_prefix}_{i}",
+                self._mp_context.Array('d', len(COUNTER_FIELDS)),
+                restart_backoff
+            )
+            for i in range(1, worker_count + 1)
+        ]
+        self._stopping = False
+        self._stop_requested_at = None
+        self._killed = False
+        self._started_at = None
+        self._last_status = None
+
+        self.logger = IndexerLogger.get_logger('pipeline.worker_supervisor')
+
+    def run(self) -> Dict[str, Any]:
+        """Run workers until all have exited, returning aggregate counters"""
+
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        previous_handlers = {
+            signum: signal.signal(signum, self._handle_signal)
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+
+        self._started_at = time.monotonic()
+        self._last_status = (self._started_at, self._totals())
+
+        log_with_context(
+            self.logger, INFO, "Worker supervisor starting",
+            worker_count=self.worker_count,
+            model_name=self.model_name,
+            max_jobs=self.max_jobs,
+            timeout_seconds=self.timeout_seconds,
+            log_dir=str(self.log_dir)
+        )
+
+        try:
+            for slot in self._slots:
+                self._start_worker(slot)
+
+            next_status = self._started_at + self.status_interval
+            while not all(slot.finished for slot in self._slots):
+                now = time.monotonic()
+                self._check_timeout(now)
+                self._check_drain_deadline(now)
+                for slot in self._slots:
+                    self._supervise(slot, now)
+                if now >= next_status:
+                    self._write_status(now)
+                    next_status = now + self.status_interval
+                time.sleep(0.2)
+
+        finally:
+            if any(slot.is_alive() for slot in self._slots):
+                self._kill_workers()
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+        self._write_status(time.monotonic(), final=True)
+        summary = self.get_summary()
+        log_with_context(self.logger, INFO, "Worker supervisor finished", **summary)
+        return summary
+
+    def request_stop(self) -> None:
+        """Drain workers: each finishes its current job and exits"""
+        if self._stopping:
+            return
+        self._stopping = True
+        self._stop_requested_at = time.monotonic()
+
+        log_with_context(
+            self.logger, INFO, "Draining workers",
+            live_workers=sum(slot.is_alive() for slot in self._slots),
+            drain_timeout=self.drain_timeout
+        )
+
+        for slot in self._slots:
+            if slot.is_alive():
+                os.kill(slot.process.pid, signal.SIGTERM)
+
+    def get_summary(self) -> Dict[str, Any]:
+        totals = self._totals()
+        elapsed = time.monotonic() - self._started_at if self._started_at else 0
+        summary = {field: int(value) for field, value in zip(COUNTER_FIELDS, totals)}
+        summary["elapsed_seconds"] = round(elapsed, 1)
+        summary["restarts"] = sum(slot.restarts for slot in self._slots)
+        summary["failed_workers"] = [
+            slot.worker_id for slot in self._slots if slot.exit_code not in (0, None)
+        ]
+        return summary
+
+    def _handle_signal(self, signum, frame) -> None:
+        if self._stopping:
+            # Second signal: stop waiting for the drain
+            self._kill_workers()
+        else:
+            self.request_stop()
+
+    def _remaining_jobs(self, slot: _WorkerSlot) -> Optional[int]:
+        """Job limit for the slot's next process, net of jobs its earlier processes handled"""
+        if not self.max_jobs:
+            return None
+        handled = slot.retired[COUNTER_FIELDS.index("jobs_processed")] + slot.retired[COUNTER_FIELDS.index("jobs_failed")]
+        return max(self.max_jobs - int(handled), 0)
+
+    def _start_worker(self, slot: _WorkerSlot) -> None:
+        slot.counters[:] = [0.0] * len(COUNTER_FIELDS)
+        # Not daemonic: workers may start their own decode/transform process pools
+        slot.process = self._mp_context.Process(
+            target=_worker_main,
+            name=slot.worker_id,
+            args=(
+                slot.worker_id,
+                self.model_name,
+                self.runner_options,
+                self._remaining_jobs(slot),
+                str(self.log_dir / f"{slot.worker_id}.log"),
+                self.log_level,
+                slot.counters,
+                min(self.status_interval, 1.0)
+            )
+        )
+        slot.process.start()
+        slot.started_at = time.monotonic()
+        slot.restart_at = None
+
+        log_with_context(
+            self.logger, DEBUG, "Worker started",
+            worker_id=slot.worker_id,
+            pid=slot.process.pid,
+            restarts=slot.restarts
+        )
+
+    def _supervise(self, slot: _WorkerSlot, now: float) -> None:
+        if slot.finished:
+            return
+
+        if slot.process is None:
+            # Waiting out restart backoff
+            if self._stopping or self._remaining_jobs(slot) == 0:
+                slot.finished = True
+            elif now >= slot.restart_at:
+                slot.restarts += 1
+                self._start_worker(slot)
+            return
+
+        if slot.process.is_alive():
+            return
+
+        slot.process.join()
+        slot.exit_code = slot.process.exitcode
+        slot.retired = slot.totals()
+        slot.counters[:] = [0.0] * len(COUNTER_FIELDS)
+        uptime = now - slot.started_at
+        slot.process = None
+
+        if slot.exit_code == 0 or self._stopping:
+            slot.finished = True
+            log_with_context(
+                self.logger, INFO, "Worker exited",
+                worker_id=slot.worker_id,
+                exit_code=slot.exit_code,
+                uptime_seconds=round(uptime, 1)
+            )
+            return
+
+        if self.max_restarts is not None and slot.restarts >= self.max_restarts:
+            slot.finished = True
+            log_with_context(
+                self.logger, ERROR, "Worker crashed and is out of restarts",
+                worker_id=slot.worker_id,
+                exit_code=slot.exit_code,
+                restarts=slot.restarts
+            )
+            return
+
+        if uptime >= self.stable_seconds:
+            slot.backoff = self.restart_backoff
+        slot.restart_at = now + slot.backoff
+
+        log_with_context(
+            self.logger, WARNING, "Worker crashed, restarting after backoff",
+            worker_id=slot.worker_id,
+            exit_code=slot.exit_code,
+            uptime_seconds=round(uptime, 1),
+            backoff_seconds=slot.backoff,
+            restarts=slot.restarts
+        )
+        slot.backoff = min(slot.backoff * 2, self.max_backoff)
+
+    def _check_timeout(self, now: float) -> None:
+        if self.timeout_seconds and not self._stopping and now - self._started_at >= self.timeout_seconds:
+            log_with_context(
+                self.logger, INFO, "Supervisor timeout reached",
+                timeout_seconds=self.timeout_seconds
+            )
+            self.request_stop()
+
+    def _check_drain_deadline(self, now: float) -> None:
+        if self._stopping and not self._killed and now - self._stop_requested_at >= self.drain_timeout:
+            log_with_context(
+                self.logger, WARNING, "Workers did not drain in time, killing",
+                drain_timeout=self.drain_timeout
+            )
+            self._kill_workers()
+
+    def _kill_workers(self) -> None:
+        self._stopping = True
+        self._killed = True
+        for slot in self._slots:
+            if slot.is_alive():
+                slot.process.kill()
+        for slot in self._slots:
+            if slot.process is not None:
+                slot.process.join()
+
+    def _totals(self) -> List[float]:
+        totals = [0.0] * len(COUNTER_FIELDS)
+        for slot in self._slots:
+            for index, value in enumerate(slot.totals()):
+                totals[index] += value
+        return totals
+
+    def _write_status(self, now: float, final: bool = False) -> None:
+        totals = self._totals()
+        last_time, last_totals = self._last_status
+        self._last_status = (now, totals)
+
+        counts = dict(zip(COUNTER_FIELDS, totals))
+        if final:
+            elapsed = max(now - self._started_at, 1e-9)
+            block_rate = counts["blocks_processed"] / elapsed
+            event_rate = counts["events_written"] / elapsed
+        else:
+            interval = max(now - last_time, 1e-9)
+            block_rate = (counts["blocks_processed"] - last_totals[COUNTER_FIELDS.index("blocks_processed")]) / interval
+            event_rate = (counts["events_written"] - last_totals[COUNTER_FIELDS.index("events_written")]) / interval
+
+        live = sum(slot.is_alive() for slot in self._slots)
+        state = " | draining" if self._stopping and not final else ""
+        line = (
+            f"workers {live}/{self.worker_count} | "
+            f"jobs {int(counts['jobs_processed']):,} ok {int(counts['jobs_failed']):,} failed | "
+            f"blocks {int(counts['blocks_processed']):,} ({block_rate:,.1f}/s) | "
+            f"events {int(counts['events_written']):,} ({event_rate:,.1f}/s) | "
+            f"restarts {sum(slot.restarts for slot in self._slots)}{state}"
+        )
+
+        if self.status_stream.isatty():
+            self.status_stream.write(f"\r\033[K{line}" + ("\n" if final else ""))
+        else:
+            self.status_stream.write(line + "\n")
+        self.status_stream.flush()
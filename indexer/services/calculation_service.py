@@ -1,6 +1,6 @@
 # indexer/services/calculation_service.py
 
-from typing import List, Optional, Dict, Tuple
+from typing import List, Optional, Dict, Tuple, Set
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 
@@ -8,9 +8,40 @@ from ..core.logging import IndexerLogger, log_with_context, INFO, DEBUG, WARNING
 from ..database.repository_manager import RepositoryManager
 from ..database.connection import DatabaseManager
 from ..database.shared.tables.periods import DBPeriod
+from ..database.shared.tables import DBAddress
 from ..database.model.tables.detail.pool_swap_detail import PricingDenomination, PricingMethod
+from ..database.model.repositories.event_detail_repository import VALUED_EVENT_COLUMNS
 from ..database.types import PeriodType
 
+
+def _minute_price_array(
+    minute_prices: List[Tuple[int, Decimal]],
+    start_minute: int,
+    end_minute: int
+) -> List[Optional[Decimal]]:
+    """Canonical prices indexed by (minute - start_minute) // 60, None where no price exists"""
+    prices = [None] * ((end_minute - start_minute) // 60 + 1)
+    for minute, price in minute_prices:
+        if start_minute <= minute <= end_minute:
+            prices[(minute - start_minute) // 60] = price
+    return prices
+
+
+def _rollup_protocol_volumes(
+    pool_volumes: List[Tuple[int, PricingDenomination, str, Decimal, int]],
+    pool_protocols: Dict[str, str]
+) -> Dict[Tuple[int, PricingDenomination, str], Decimal]:
+    """Sum per-pool period volumes into {(period_id, denom, protocol): volume}, skipping pools without a protocol"""
+    protocol_volumes = {}
+    for period_id, denom, pool, volume, _ in pool_volumes:
+        protocol = pool_protocols.get(str(pool).lower())
+        if protocol is None:
+            continue
+        key = (period_id, denom, protocol.lower())
+        protocol_volumes[key] = protocol_volumes.get(key, Decimal('0')) + volume
+    return protocol_volumes
+
+
 class CalculationService:
     """
     Calculation service responsible for event valuations and analytics aggregation.
@@ -57,22 +88,17 @@ class CalculationService:
         
         Creates event_details records with USD/AVAX valuations using canonical prices.
         Independent from pricing service - processes available canonical prices gracefully.
+        Adjacent periods are merged into time ranges, each valued in bulk by
+        calculate_event_valuations_for_range().
         
         Args:
-            period_ids: List of period IDs to process events for
+            period_ids: Five-minute periods to process events for (period time_open)
             asset_address: Asset to calculate event valuations for
             denomination: usd, avax, or None for both
             
         Returns:
             Dict with statistics: {'transfers_valued': 0, 'liquidity_valued': 0, 'rewards_valued': 0, 'positions_valued': 0, 'errors': 0}
         """
-        log_with_context(
-            self.logger, INFO, "Calculating event valuations",
-            asset_address=asset_address,
-            periods_count=len(period_ids),
-            denomination=denomination.value if denomination else "both"
-        )
-        
         results = {
             'transfers_valued': 0,
             'liquidity_valued': 0, 
@@ -81,140 +107,122 @@ class CalculationService:
             'errors': 0
         }
         
+        if not period_ids:
+            return results
+        
+        periods = self._get_periods(period_ids)
+        
+        # Merge adjacent periods into time ranges
+        time_ranges = []
+        for _, time_open, time_close in periods:
+            if time_ranges and time_open <= time_ranges[-1][1] + 1:
+                time_ranges[-1][1] = max(time_ranges[-1][1], time_close)
+            else:
+                time_ranges.append([time_open, time_close])
+        
+        log_with_context(
+            self.logger, INFO, "Calculating event valuations",
+            asset_address=asset_address,
+            periods_count=len(periods),
+            range_count=len(time_ranges),
+            denomination=denomination.value if denomination else "both"
+        )
+        
+        for start_timestamp, end_timestamp in time_ranges:
+            range_results = self.calculate_event_valuations_for_range(
+                asset_address, start_timestamp, end_timestamp, denomination
+            )
+            for key, count in range_results.items():
+                results[key] += count
+        
+        log_with_context(
+            self.logger, INFO, "Event valuation calculation complete",
+            asset_address=asset_address,
+            **results
+        )
+        
+        return results
+
+    def calculate_event_valuations_for_range(
+        self,
+        asset_address: str,
+        start_timestamp: int,
+        end_timestamp: int,
+        denomination: Optional[PricingDenomination] = None
+    ) -> Dict[str, int]:
+        """
+        Value unvalued events in [start_timestamp, end_timestamp] in bulk.
+        
+        Per denomination, the canonical price series for the covered minutes is
+        loaded once into a minute-indexed list. Each event table is read once
+        (anti-join against event_details), joined to the prices in memory, and
+        its valuations written with multi-row INSERTs.
+        
+        Args:
+            asset_address: Asset to calculate event valuations for
+            start_timestamp: Earliest event timestamp (inclusive)
+            end_timestamp: Latest event timestamp (inclusive)
+            denomination: usd, avax, or None for both
+            
+        Returns:
+            Dict with statistics: {'transfers_valued': 0, 'liquidity_valued': 0, 'rewards_valued': 0, 'positions_valued': 0, 'errors': 0}
+        """
+        results = {f"{event_type}_valued": 0 for event_type in VALUED_EVENT_COLUMNS}
+        results['errors'] = 0
+        
         denominations = [denomination] if denomination else [PricingDenomination.USD, PricingDenomination.AVAX]
+        start_minute = (start_timestamp // 60) * 60
+        end_minute = (end_timestamp // 60) * 60
         
-        price_vwap_repo = self.shared_db_manager.get_price_vwap_repository()
+        price_vwap_repo = self.shared_db_manager.get_price_vwap_repo()
         event_detail_repo = self.model_db_manager.get_event_detail_repo()
-        transfer_repo = self.model_db_manager.get_transfer_repo()
-        liquidity_repo = self.model_db_manager.get_liquidity_repo()
-        reward_repo = self.model_db_manager.get_reward_repo()
-        position_repo = self.model_db_manager.get_position_repo()
-
+        
         with self.shared_db_manager.get_session() as shared_session, \
              self.model_db_manager.get_session() as model_session:
             
-            for period_id in period_ids:
+            decimals = self.shared_db_manager.get_token_repo().get_decimals(shared_session, asset_address)
+            if decimals is None:
+                results['errors'] += 1
+                return results
+            
+            for denom in denominations:
                 try:
-                    # 1. Process transfers
-                    unvalued_transfers = transfer_repo.get_unvalued_events_in_period(
-                        model_session, period_id, asset_address
+                    minute_prices = _minute_price_array(
+                        price_vwap_repo.get_canonical_vwap_series(
+                            shared_session, asset_address, start_minute, end_minute, denom
+                        ),
+                        start_minute,
+                        end_minute
                     )
                     
-                    for transfer in unvalued_transfers:
-                        transfer_minute = int(transfer.timestamp.timestamp() // 60 * 60)
+                    for event_type in VALUED_EVENT_COLUMNS:
+                        events = event_detail_repo.get_unvalued_event_amounts(
+                            model_session, event_type, asset_address, start_timestamp, end_timestamp, denom, decimals
+                        )
                         
-                        for denom in denominations:
-                            # Skip if already valued
-                            if event_detail_repo.has_valuation(model_session, transfer.content_id, denom):
-                                continue
-                                
-                            canonical_price = price_vwap_repo.get_canonical_price(
-                                shared_session, asset_address, transfer_minute, denom
-                            )
-                            
-                            if canonical_price:
-                                event_detail_repo.create_event_valuation(
-                                    model_session,
-                                    event=transfer,
-                                    denomination=denom,
-                                    canonical_price=canonical_price.price,
-                                    pricing_method=PricingMethod.CANONICAL
-                                )
-                                results['transfers_valued'] += 1
-                    
-                    # 2. Process liquidity events
-                    unvalued_liquidity = liquidity_repo.get_unvalued_events_in_period(
-                        model_session, period_id, asset_address
-                    )
-                    
-                    for liquidity_event in unvalued_liquidity:
-                        liquidity_minute = int(liquidity_event.timestamp.timestamp() // 60 * 60)
+                        valuations = []
+                        for content_id, timestamp, amount in events:
+                            price = minute_prices[(timestamp - start_minute) // 60]
+                            if price is not None and amount:
+                                valuations.append((content_id, amount * price))
                         
-                        for denom in denominations:
-                            if event_detail_repo.has_valuation(model_session, liquidity_event.content_id, denom):
-                                continue
-                                
-                            canonical_price = price_vwap_repo.get_canonical_price(
-                                shared_session, asset_address, liquidity_minute, denom
-                            )
-                            
-                            if canonical_price:
-                                event_detail_repo.create_event_valuation(
-                                    model_session,
-                                    event=liquidity_event,
-                                    denomination=denom,
-                                    canonical_price=canonical_price.price,
-                                    pricing_method=PricingMethod.CANONICAL
-                                )
-                                results['liquidity_valued'] += 1
-                    
-                    # 3. Process reward events
-                    unvalued_rewards = reward_repo.get_unvalued_events_in_period(
-                        model_session, period_id, asset_address
-                    )
+                        results[f"{event_type}_valued"] += event_detail_repo.insert_valuations(
+                            model_session, denom, valuations
+                        )
                     
-                    for reward in unvalued_rewards:
-                        reward_minute = int(reward.timestamp.timestamp() // 60 * 60)
-                        
-                        for denom in denominations:
-                            if event_detail_repo.has_valuation(model_session, reward.content_id, denom):
-                                continue
-                                
-                            canonical_price = price_vwap_repo.get_canonical_price(
-                                shared_session, asset_address, reward_minute, denom
-                            )
-                            
-                            if canonical_price:
-                                event_detail_repo.create_event_valuation(
-                                    model_session,
-                                    event=reward,
-                                    denomination=denom,
-                                    canonical_price=canonical_price.price,
-                                    pricing_method=PricingMethod.CANONICAL
-                                )
-                                results['rewards_valued'] += 1
+                    model_session.commit()
                     
-                    # 4. Process position events
-                    unvalued_positions = position_repo.get_unvalued_events_in_period(
-                        model_session, period_id, asset_address
-                    )
-                    
-                    for position in unvalued_positions:
-                        position_minute = int(position.timestamp.timestamp() // 60 * 60)
-                        
-                        for denom in denominations:
-                            if event_detail_repo.has_valuation(model_session, position.content_id, denom):
-                                continue
-                                
-                            canonical_price = price_vwap_repo.get_canonical_price(
-                                shared_session, asset_address, position_minute, denom
-                            )
-                            
-                            if canonical_price:
-                                event_detail_repo.create_event_valuation(
-                                    model_session,
-                                    event=position,
-                                    denomination=denom,
-                                    canonical_price=canonical_price.price,
-                                    pricing_method=PricingMethod.CANONICAL
-                                )
-                                results['positions_valued'] += 1
-                                
                 except Exception as e:
                     results['errors'] += 1
+                    model_session.rollback()
                     log_with_context(
                         self.logger, ERROR, "Error calculating event valuations",
                         asset_address=asset_address,
-                        period_id=period_id,
+                        start_timestamp=start_timestamp,
+                        end_timestamp=end_timestamp,
+                        denomination=denom.value,
                         error=str(e)
                     )
-                    continue
-        
-        log_with_context(
-            self.logger, INFO, "Event valuation calculation complete",
-            asset_address=asset_address,
-            **results
-        )
         
         return results
 
@@ -227,11 +235,13 @@ class CalculationService:
         """
         Generate OHLC candles from trade data aggregation per period.
         
-        Creates asset_price records with open/high/low/close/volume data from trade_details.
-        Uses volume-weighted calculations for accurate price candles.
+        Creates asset_price records with open/high/low/close data from trade_details.
+        All periods and denominations without a candle are aggregated in one
+        window-function query (TradeDetailRepository.get_period_ohlc) and the
+        candles are inserted in bulk.
         
         Args:
-            period_ids: List of period IDs to generate candles for
+            period_ids: Five-minute periods to generate candles for (period time_open)
             asset_address: Asset to generate OHLC data for
             denomination: usd, avax, or None for both
             
@@ -251,66 +261,35 @@ class CalculationService:
         asset_price_repo = self.model_db_manager.get_asset_price_repo()
         trade_detail_repo = self.model_db_manager.get_trade_detail_repo()
 
-        with self.model_db_manager.get_session() as session:
-            for period_id in period_ids:
-                try:
-                    for denom in denominations:
-                        # Check if OHLC candle already exists
-                        existing_candle = asset_price_repo.get_candle(
-                            session, period_id, asset_address, denom
-                        )
-                        if existing_candle:
-                            continue
-                        
-                        # Get trade details for this period
-                        trade_details = trade_detail_repo.get_trades_in_period(
-                            session, period_id, asset_address, denom
-                        )
-                        
-                        if not trade_details:
-                            log_with_context(
-                                self.logger, DEBUG, "No trade data for OHLC candle",
-                                asset_address=asset_address,
-                                period_id=period_id,
-                                denomination=denom.value
-                            )
-                            continue
-                        
-                        # Calculate OHLC from trade data
-                        ohlc_data = self._calculate_ohlc_from_trades(trade_details, denom)
-                        
-                        if ohlc_data:
-                            # Create asset_price record
-                            asset_price_repo.create_ohlc_candle(
-                                session,
-                                period_id=period_id,
-                                asset_address=asset_address,
-                                denomination=denom,
-                                **ohlc_data
-                            )
-                            
-                            if denom == PricingDenomination.USD:
-                                results['usd_candles_created'] += 1
-                            else:
-                                results['avax_candles_created'] += 1
-                            
-                            log_with_context(
-                                self.logger, DEBUG, "Created OHLC candle",
-                                asset_address=asset_address,
-                                period_id=period_id,
-                                denomination=denom.value,
-                                **{k: float(v) if isinstance(v, Decimal) else v for k, v in ohlc_data.items()}
-                            )
+        try:
+            periods = self._get_periods(period_ids)
+            
+            with self.model_db_manager.get_session() as session:
+                ohlc_rows = trade_detail_repo.get_period_ohlc(
+                    session, asset_address, periods, denominations
+                )
                 
-                except Exception as e:
-                    results['errors'] += 1
-                    log_with_context(
-                        self.logger, ERROR, "Error generating OHLC candle",
-                        asset_address=asset_address,
-                        period_id=period_id,
-                        error=str(e)
-                    )
-                    continue
+                created = asset_price_repo.insert_candles(
+                    session,
+                    asset_address,
+                    [row[:6] for row in ohlc_rows]
+                )
+                session.commit()
+            
+            for _, denom in created:
+                if denom == PricingDenomination.USD:
+                    results['usd_candles_created'] += 1
+                else:
+                    results['avax_candles_created'] += 1
+        
+        except Exception as e:
+            results['errors'] += 1
+            log_with_context(
+                self.logger, ERROR, "Error generating OHLC candles",
+                asset_address=asset_address,
+                periods_count=len(period_ids),
+                error=str(e)
+            )
         
         log_with_context(
             self.logger, INFO, "OHLC candle generation complete",
@@ -327,13 +306,15 @@ class CalculationService:
         denomination: Optional[PricingDenomination] = None
     ) -> Dict[str, int]:
         """
-        Calculate protocol-level volume metrics per period using contract.project.
+        Calculate protocol-level volume metrics per period using the pool's address project.
         
         Creates asset_volume records aggregating swap volume by protocol (Blub, LFJ, Pharaoh, etc.).
-        Depends on contract.project field being populated correctly.
+        Swap volume is grouped per period, denomination and pool in one query,
+        attributed to protocols with one address lookup, and new records are
+        inserted in bulk. Depends on addresses.project being populated for pools.
         
         Args:
-            period_ids: List of period IDs to calculate volume for
+            period_ids: Five-minute periods to calculate volume for (period time_open)
             asset_address: Asset to calculate protocol volume for
             denomination: usd, avax, or None for both
             
@@ -353,60 +334,44 @@ class CalculationService:
         asset_volume_repo = self.model_db_manager.get_asset_volume_repo()
         pool_swap_detail_repo = self.model_db_manager.get_pool_swap_detail_repo()
 
-        with self.shared_db_manager.get_session() as shared_session, \
-             self.model_db_manager.get_session() as model_session:
+        try:
+            periods = self._get_periods(period_ids)
             
-            for period_id in period_ids:
-                try:
-                    for denom in denominations:
-                        # Get protocol volume aggregations for this period
-                        protocol_volumes = pool_swap_detail_repo.get_protocol_volume_aggregation(
-                            model_session, shared_session, period_id, asset_address, denom
-                        )
-                        
-                        for protocol, volume_data in protocol_volumes.items():
-                            # Check if volume record already exists
-                            existing_volume = asset_volume_repo.get_volume(
-                                model_session, period_id, asset_address, denom, protocol
-                            )
-                            if existing_volume:
-                                continue
-                            
-                            # Create asset_volume record
-                            asset_volume_repo.create_volume_metric(
-                                model_session,
-                                period_id=period_id,
-                                asset_address=asset_address,
-                                denomination=denom,
-                                protocol=protocol,
-                                volume=volume_data['total_volume'],
-                                pool_count=volume_data['pool_count'],
-                                swap_count=volume_data['swap_count']
-                            )
-                            
-                            if denom == PricingDenomination.USD:
-                                results['usd_volumes_created'] += 1
-                            else:
-                                results['avax_volumes_created'] += 1
-                            
-                            log_with_context(
-                                self.logger, DEBUG, "Created protocol volume metric",
-                                asset_address=asset_address,
-                                period_id=period_id,
-                                denomination=denom.value,
-                                protocol=protocol,
-                                volume=float(volume_data['total_volume'])
-                            )
+            with self.model_db_manager.get_session() as model_session:
+                pool_volumes = pool_swap_detail_repo.get_period_pool_volumes(
+                    model_session, asset_address, periods, denominations
+                )
                 
-                except Exception as e:
-                    results['errors'] += 1
-                    log_with_context(
-                        self.logger, ERROR, "Error calculating protocol volume",
-                        asset_address=asset_address,
-                        period_id=period_id,
-                        error=str(e)
-                    )
-                    continue
+                protocol_volumes = _rollup_protocol_volumes(
+                    pool_volumes, self._get_pool_protocols({pool for _, _, pool, _, _ in pool_volumes})
+                )
+                
+                existing = asset_volume_repo.get_existing_volume_keys(
+                    model_session, asset_address, [period_id for period_id, _, _ in periods], denominations
+                )
+                new_volumes = [
+                    (period_id, denom, protocol, volume)
+                    for (period_id, denom, protocol), volume in protocol_volumes.items()
+                    if (period_id, denom, protocol) not in existing
+                ]
+                
+                created = asset_volume_repo.insert_volumes(model_session, asset_address, new_volumes)
+                model_session.commit()
+            
+            for _, denom, _ in created:
+                if denom == PricingDenomination.USD:
+                    results['usd_volumes_created'] += 1
+                else:
+                    results['avax_volumes_created'] += 1
+        
+        except Exception as e:
+            results['errors'] += 1
+            log_with_context(
+                self.logger, ERROR, "Error calculating protocol volume",
+                asset_address=asset_address,
+                periods_count=len(period_ids),
+                error=str(e)
+            )
         
         log_with_context(
             self.logger, INFO, "Protocol volume calculation complete",
@@ -416,6 +381,32 @@ class CalculationService:
         
         return results
 
+    def _get_periods(self, period_ids: List[int]) -> List[Tuple[int, int, int]]:
+        """(period_id, time_open, time_close) of five-minute periods, by time_open, in one query"""
+        if not period_ids:
+            return []
+        
+        with self.shared_db_manager.get_session() as shared_session:
+            rows = shared_session.query(DBPeriod.time_open, DBPeriod.time_close).filter(
+                DBPeriod.period_type == PeriodType.FIVE_MINUTES,
+                DBPeriod.time_open.in_(period_ids)
+            ).order_by(DBPeriod.time_open).all()
+        
+        return [(time_open, time_open, time_close) for time_open, time_close in rows]
+
+    def _get_pool_protocols(self, pools: Set[str]) -> Dict[str, str]:
+        """{pool address: project} for pools with a project set"""
+        if not pools:
+            return {}
+        
+        with self.shared_db_manager.get_session() as shared_session:
+            rows = shared_session.query(DBAddress.address, DBAddress.project).filter(
+                DBAddress.address.in_(list(pools)),
+                DBAddress.project.isnot(None)
+            ).all()
+        
+        return {str(address).lower(): project for address, project in rows}
+
     def update_event_valuations(
         self, 
         asset_address: str, 
@@ -455,15 +446,14 @@ class CalculationService:
                 # Process specific number of days back
                 cutoff_time = datetime.now(timezone.utc) - timedelta(days=days)
                 target_periods = periods_repo.get_periods_since(
-                    shared_session, cutoff_time, PeriodType.FIVE_MINUTE
+                    shared_session, cutoff_time, PeriodType.FIVE_MINUTES
                 )
+                period_ids = [p.time_open for p in target_periods]
             else:
                 # Find periods with unvalued events
-                target_periods = event_detail_repo.find_periods_with_unvalued_events(
-                    model_session, asset_address
+                period_ids = event_detail_repo.find_periods_with_unvalued_events(
+                    model_session, asset_address, denomination
                 )
-            
-            period_ids = [p.id for p in target_periods]
         
         if not period_ids:
             log_with_context(
@@ -529,8 +519,9 @@ class CalculationService:
                 # Process specific number of days back
                 cutoff_time = datetime.now(timezone.utc) - timedelta(days=days)
                 target_periods = periods_repo.get_periods_since(
-                    shared_session, cutoff_time, PeriodType.FIVE_MINUTE
+                    shared_session, cutoff_time, PeriodType.FIVE_MINUTES
                 )
+                period_ids = [p.time_open for p in target_periods]
             else:
                 # Find periods with missing analytics
                 ohlc_gaps = asset_price_repo.find_periods_with_missing_candles(
@@ -540,13 +531,8 @@ class CalculationService:
                     model_session, asset_address
                 )
                 
-                # Combine gaps
-                all_period_ids = set(ohlc_gaps + volume_gaps)
-                target_periods = periods_repo.get_periods_by_ids(
-                    shared_session, list(all_period_ids)
-                )
-            
-            period_ids = [p.id for p in target_periods]
+                # Combine gaps (period time_open values; _get_periods resolves them)
+                period_ids = sorted(set(ohlc_gaps + volume_gaps))
         
         if not period_ids:
             log_with_context(
@@ -751,47 +737,3 @@ class CalculationService:
             }
         
         return status
-
-    def _calculate_ohlc_from_trades(self, trade_details: List, denomination: PricingDenomination) -> Optional[Dict[str, Decimal]]:
-        """
-        Calculate OHLC data from trade details.
-        
-        Args:
-            trade_details: List of trade detail records
-            denomination: USD or AVAX denomination
-            
-        Returns:
-            Dict with open, high, low, close, volume data or None if insufficient data
-        """
-        if not trade_details:
-            return None
-        
-        # Sort by timestamp
-        sorted_trades = sorted(trade_details, key=lambda t: t.timestamp)
-        
-        prices = []
-        total_volume = Decimal('0')
-        
-        for trade in sorted_trades:
-            if denomination == PricingDenomination.USD:
-                price = trade.price_usd
-                volume = trade.volume_usd
-            else:
-                price = trade.price_avax  
-                volume = trade.volume_avax
-            
-            if price and volume:
-                prices.append(price)
-                total_volume += volume
-        
-        if not prices:
-            return None
-        
-        return {
-            'open_price': prices[0],
-            'high_price': max(prices),
-            'low_price': min(prices),
-            'close_price': prices[-1],
-            'volume': total_volume,
-            'trade_count': len(prices)
-        }
\ No newline at end of file
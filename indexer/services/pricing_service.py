@@ -1,26 +1,95 @@
 # indexer/services/pricing_service.py
 
-from typing import List, Optional, Dict, Tuple
+from typing import List, Optional, Dict, Tuple, Set, Iterable
+from collections import deque
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 
-from sqlalchemy import and_, exists, distinct
+from sqlalchemy import func
 
 from ..core.logging import IndexerLogger, log_with_context, INFO, DEBUG, WARNING, ERROR, CRITICAL
 from ..database.repository_manager import RepositoryManager
 from ..database.connection import DatabaseManager
-from ..database.shared.tables.periods import Period
 from ..database.shared.repositories.block_prices_repository import BlockPricesRepository
 from ..database.shared.repositories.periods_repository import PeriodsRepository
 from ..clients.quicknode_rpc import QuickNodeRpcClient
-from ..database.model.tables.detail.pool_swap_detail import PricingDenomination, PricingMethod
-from ..database.shared.tables.config.config import Model, Contract
+from ..database.model.tables.detail.pool_swap_detail import PricingDenomination
+from ..database.shared.tables import DBModel
+from ..database.model.tables import DBPoolSwap, DBTrade
 from ..database.types import PeriodType
+from ..database.base_repository import in_block_ranges
+from ..utils.block_ranges import BlockRangeSet
 
-from ..database.model.tables.events.trade import PoolSwap
-from ..database.model.tables.events.trade import Trade, PoolSwap
-from ..database.model.tables.detail.pool_swap_detail import PoolSwapDetail
-from ..database.model.tables.detail.trade_detail import TradeDetail, TradePricingMethod
+
+VWAP_WINDOW_MINUTES = 5
+
+
+def compute_canonical_prices(
+    minute_aggregates: Iterable[Tuple[int, Decimal, Decimal]],
+    existing_prices: Dict[int, Tuple[Decimal, Decimal]],
+    only_minutes: Optional[Set[int]] = None
+) -> List[Tuple[int, Decimal, Decimal, Decimal, Decimal]]:
+    """
+    Per-minute VWAP and 5-minute trailing VWAP from per-minute swap aggregates.
+    
+    Args:
+        minute_aggregates: (minute, base volume, sum of price * base volume) ordered by minute;
+            volume is absolute token volume, minutes without positive volume are skipped
+        existing_prices: {minute: (price_period, base_volume)} already stored, used for
+            window minutes without new swap data (including the 4 minutes before the range)
+        only_minutes: Emit rows only for these minutes
+        
+    Returns:
+        (minute, base_volume, quote_volume, price_period, price_vwap) rows ordered by minute
+    """
+    computed = {
+        minute: (volume, weighted)
+        for minute, volume, weighted in minute_aggregates
+        if volume > 0
+    }
+    if not computed:
+        return []
+    
+    # Window entries as (volume, price * volume); fresh swap data replaces stored prices
+    def window_entry(minute: int) -> Tuple[Decimal, Decimal]:
+        if minute in computed:
+            return computed[minute]
+        stored = existing_prices.get(minute)
+        if stored:
+            price_period, base_volume = stored
+            return base_volume, price_period * base_volume
+        return Decimal('0'), Decimal('0')
+    
+    first_minute = min(computed)
+    last_minute = max(computed)
+    
+    window = deque(
+        (window_entry(first_minute - offset * 60) for offset in range(VWAP_WINDOW_MINUTES - 1, 0, -1)),
+        maxlen=VWAP_WINDOW_MINUTES
+    )
+    window_volume = sum((volume for volume, _ in window), Decimal('0'))
+    window_weighted = sum((weighted for _, weighted in window), Decimal('0'))
+    
+    prices = []
+    for minute in range(first_minute, last_minute + 60, 60):
+        if len(window) == VWAP_WINDOW_MINUTES:
+            dropped_volume, dropped_weighted = window[0]
+            window_volume -= dropped_volume
+            window_weighted -= dropped_weighted
+        
+        volume, weighted = window_entry(minute)
+        window.append((volume, weighted))
+        window_volume += volume
+        window_weighted += weighted
+        
+        if minute not in computed or (only_minutes is not None and minute not in only_minutes):
+            continue
+        
+        minute_price = weighted / volume
+        vwap_price = window_weighted / window_volume if window_volume > 0 else minute_price
+        prices.append((minute, volume, volume * minute_price, minute_price, vwap_price))
+    
+    return prices
 
 
 class PricingService:
@@ -209,15 +278,24 @@ class PricingService:
             )
             return {'swaps_priced': 0, 'errors': 1}
     
-    def calculate_trade_pricing(self, asset_address: str, days: Optional[int] = None) -> Dict[str, int]:
+    def calculate_trade_pricing(
+        self,
+        asset_address: str,
+        days: Optional[int] = None,
+        block_chunk_size: Optional[int] = None
+    ) -> Dict[str, int]:
         """
         Calculate direct pricing for trades using volume-weighted aggregation from constituent swaps.
         
         Uses INDEXER database for trade details (model-specific event data).
+        Each call is a single grouped INSERT ... SELECT; with block_chunk_size
+        the trades' block span is split into chunks, each its own statement
+        and transaction, to bound statement size for large backfills.
         
         Args:
             asset_address: Asset to calculate trade pricing for
             days: Number of days to look back. If None, processes all unpriced trades
+            block_chunk_size: Blocks per statement (default: whole window in one statement)
             
         Returns:
             Dict with pricing statistics
@@ -225,23 +303,46 @@ class PricingService:
         log_with_context(
             self.logger, INFO, "Calculating trade pricing",
             asset_address=asset_address,
-            days=days
+            days=days,
+            block_chunk_size=block_chunk_size
         )
         
         # Get repository for trade details
         trade_detail_repo = self.model_db_manager.get_trade_detail_repo()
         
-        
         try:
-            # Calculate direct pricing using repository method
-            with self.model_db_manager.get_session() as session:
-                results = trade_detail_repo.calculate_direct_pricing(
-                    session,
-                    asset_address=asset_address,
-                    days_back=days
-                )
+            block_chunks = [(None, None)]
+            if block_chunk_size:
+                with self.model_db_manager.get_session() as session:
+                    first_block, last_block = trade_detail_repo.get_trade_block_bounds(
+                        session, asset_address, days_back=days
+                    )
+                if first_block is None:
+                    return {'trades_priced': 0, 'errors': 0}
+                block_chunks = [
+                    (chunk_start, min(chunk_start + block_chunk_size - 1, last_block))
+                    for chunk_start in range(first_block, last_block + 1, block_chunk_size)
+                ]
+            
+            results = {'trades_priced': 0, 'errors': 0}
+            for start_block, end_block in block_chunks:
+                # Calculate direct pricing using repository method
+                with self.model_db_manager.get_session() as session:
+                    chunk_results = trade_detail_repo.calculate_direct_pricing(
+                        session,
+                        asset_address=asset_address,
+                        days_back=days,
+                        start_block=start_block,
+                        end_block=end_block
+                    )
+                    
+                    if chunk_results['errors']:
+                        session.rollback()
+                    else:
+                        session.commit()
                 
-                session.commit()
+                results['trades_priced'] += chunk_results['trades_priced']
+                results['errors'] += chunk_results['errors']
             
             log_with_context(
                 self.logger, INFO, "Trade pricing calculation complete",
@@ -273,220 +374,149 @@ class PricingService:
         Generate 5-minute VWAP canonical prices from pricing pools.
         
         Creates price_vwap records representing canonical price authority.
-        Uses pricing pools (pricing_pool=True) to calculate volume-weighted prices.
+        Uses pricing pools (price_feed=True) to calculate volume-weighted prices.
+        Runs the range engine over min..max of the given minutes and writes
+        only the requested minutes.
+        
+        Args:
+            timestamp_minutes: List of minute timestamps to generate prices for
+            asset_address: Target asset address to generate canonical prices for
+            denomination: USD, AVAX, or None for both (default: both)
+            
+        Returns:
+            Dict with canonical price creation statistics
+        """
+        if not timestamp_minutes:
+            return {'prices_created': 0, 'errors': 0, 'minutes_processed': 0}
+        
+        requested = {(minute // 60) * 60 for minute in timestamp_minutes}
+        return self.generate_canonical_prices_for_range(
+            min(requested), max(requested), asset_address, denomination, only_minutes=requested
+        )
+
+    def generate_canonical_prices_for_range(
+        self,
+        start_minute: int,
+        end_minute: int,
+        asset_address: str,
+        denomination: Optional[PricingDenomination] = None,
+        only_minutes: Optional[Set[int]] = None
+    ) -> Dict[str, int]:
+        """
+        Generate canonical prices for every minute in [start_minute, end_minute].
         
         Logic:
-        1. Find all pools configured as pricing pools for the asset
-        2. Get pool_swap_details from pricing pools for each minute 
-        3. Calculate volume-weighted price for that minute
-        4. Calculate 5-minute trailing VWAP (current + 4 previous minutes)
-        5. Create price_vwap records for USD and/or AVAX denominations
-        6. Return creation statistics
+        1. Load the asset's pricing pool block windows (one shared database query)
+        2. Aggregate pricing pool swap volume and price * volume per minute (one model database query)
+        3. Load existing canonical prices for the 4 minutes before the range and the range itself
+        4. Roll the 5-minute trailing VWAP window across the minutes
+        5. Bulk upsert the resulting price_vwap rows
+        
+        Minutes without pricing pool swaps get no record; as before, the trailing
+        window falls back to existing canonical prices for them.
         
         Args:
-            timestamp_minutes: List of minute timestamps to generate prices for
+            start_minute: First minute timestamp (inclusive)
+            end_minute: Last minute timestamp (inclusive)
             asset_address: Target asset address to generate canonical prices for
             denomination: USD, AVAX, or None for both (default: both)
+            only_minutes: Restrict writes to these minutes (window still uses the whole range)
             
         Returns:
             Dict with canonical price creation statistics
         """
+        start_minute = (start_minute // 60) * 60
+        end_minute = (end_minute // 60) * 60
+        minute_count = (end_minute - start_minute) // 60 + 1 if end_minute >= start_minute else 0
+        
         log_with_context(
             self.logger, INFO, "Generating canonical prices",
             asset_address=asset_address,
-            minute_count=len(timestamp_minutes),
+            start_minute=start_minute,
+            end_minute=end_minute,
+            minute_count=minute_count,
             denomination=denomination.value if denomination else "both"
         )
         
-        # Determine which denominations to process
+        results = {
+            'prices_created': 0,
+            'errors': 0,
+            'minutes_processed': len(only_minutes) if only_minutes is not None else minute_count
+        }
+        if minute_count == 0:
+            return results
+        
         denominations = [denomination] if denomination else [PricingDenomination.USD, PricingDenomination.AVAX]
+        database_name = self.model_db_manager.config.url.split('/')[-1]
+        
+        pool_pricing_repo = self.shared_db_manager.get_pool_pricing_config_repo()
+        pool_swap_detail_repo = self.model_db_manager.get_pool_swap_detail_repo()
+        price_vwap_repo = self.shared_db_manager.get_price_vwap_repo()
         
         try:
-            results = {'prices_created': 0, 'errors': 0, 'minutes_processed': 0}
-            
-            # Get pricing pool configurations and repositories
-            pool_pricing_repo = self.shared_db_manager.get_pool_pricing_config_repo()
-            pool_swap_detail_repo = self.model_db_manager.get_pool_swap_detail_repo()
-            price_vwap_repo = self.shared_db_manager.get_price_vwap_repository()
-            
             with self.shared_db_manager.get_session() as shared_session:
-                with self.model_db_manager.get_session() as model_session:
-                    
-                    # Get model ID for pool pricing config lookup
-                    model = shared_session.query(Model).filter(
-                        Model.database_name == self.model_db_manager.config.url.split('/')[-1]
-                    ).first()
-                    
-                    if not model:
+                model = shared_session.query(DBModel).filter(DBModel.model_db == database_name).first()
+                if not model:
+                    log_with_context(
+                        self.logger, ERROR, "Could not find model for database",
+                        database_name=database_name
+                    )
+                    return {'prices_created': 0, 'errors': 1, 'minutes_processed': 0}
+                
+                pool_windows = pool_pricing_repo.get_pricing_pool_windows(shared_session, model.id, asset_address)
+                if not pool_windows:
+                    log_with_context(
+                        self.logger, WARNING, "No pricing pools found for asset",
+                        asset_address=asset_address,
+                        model_id=model.id
+                    )
+                    return results
+                
+                base_decimals = self.shared_db_manager.get_token_repo().get_decimals(shared_session, asset_address)
+                if base_decimals is None:
+                    return {'prices_created': 0, 'errors': 1, 'minutes_processed': 0}
+                
+                for denom in denominations:
+                    try:
+                        with self.model_db_manager.get_session() as model_session:
+                            minute_aggregates = pool_swap_detail_repo.get_minute_vwap_aggregates(
+                                model_session, pool_windows, start_minute, end_minute, denom, base_decimals
+                            )
+                        
+                        existing_prices = price_vwap_repo.get_canonical_price_map(
+                            shared_session,
+                            asset_address,
+                            start_minute - (VWAP_WINDOW_MINUTES - 1) * 60,
+                            end_minute,
+                            denom
+                        )
+                        
+                        prices = compute_canonical_prices(minute_aggregates, existing_prices, only_minutes)
+                        created = price_vwap_repo.upsert_canonical_prices(shared_session, asset_address, denom, prices)
+                        results['prices_created'] += created
+                        
                         log_with_context(
-                            self.logger, ERROR, "Could not find model for database",
-                            database_name=self.model_db_manager.config.url.split('/')[-1]
+                            self.logger, DEBUG, "Canonical prices computed for denomination",
+                            asset_address=asset_address,
+                            denomination=denom.value,
+                            minutes_with_swaps=len(minute_aggregates),
+                            prior_prices=len(existing_prices),
+                            prices_written=created
                         )
-                        return {'prices_created': 0, 'errors': 1, 'minutes_processed': 0}
-                    
-                    # Process each timestamp minute
-                    for timestamp_minute in timestamp_minutes:
-                        try:
-                            results['minutes_processed'] += 1
-                            
-                            # Convert timestamp to datetime for period lookup
-                            minute_dt = datetime.fromtimestamp(timestamp_minute, tz=timezone.utc)
-                            
-                            # Find pricing pools for this asset and timestamp
-                            pricing_pools = pool_pricing_repo.get_pricing_pools_for_model(
-                                shared_session, model.id, timestamp_minute
-                            )
-                            
-                            # Filter pools where this asset is the base token
-                            asset_pricing_pools = []
-                            for pool_config in pricing_pools:
-                                contract = shared_session.query(Contract).filter(
-                                    Contract.id == pool_config.contract_id
-                                ).first()
-                                
-                                if contract and contract.base_token_address and contract.base_token_address.lower() == asset_address.lower():
-                                    asset_pricing_pools.append(pool_config)
-                            
-                            if not asset_pricing_pools:
-                                log_with_context(
-                                    self.logger, DEBUG, "No pricing pools found for asset at timestamp",
-                                    asset_address=asset_address,
-                                    timestamp_minute=timestamp_minute
-                                )
-                                continue
-                            
-                            # Process each denomination
-                            for denom in denominations:
-                                try:
-                                    # Get all pool swap details from pricing pools for this minute
-                                    swap_details = []
-                                    for pool_config in asset_pricing_pools:
-                                        details = pool_swap_detail_repo.get_details_for_pool_and_minute(
-                                            model_session,
-                                            pool_config.contract_id,
-                                            timestamp_minute,
-                                            denom
-                                        )
-                                        swap_details.extend(details)
-                                    
-                                    if not swap_details:
-                                        log_with_context(
-                                            self.logger, DEBUG, "No swap details found for minute",
-                                            asset_address=asset_address,
-                                            timestamp_minute=timestamp_minute,
-                                            denomination=denom.value
-                                        )
-                                        continue
-                                    
-                                    # Calculate volume-weighted price for this minute
-                                    total_volume = Decimal('0')
-                                    weighted_price_sum = Decimal('0')
-                                    
-                                    for detail in swap_details:
-                                        volume = Decimal(str(detail.base_amount))  # Volume in base token
-                                        price = Decimal(str(detail.price))  # Price per base token
-                                        
-                                        total_volume += volume
-                                        weighted_price_sum += (volume * price)
-                                    
-                                    if total_volume == 0:
-                                        log_with_context(
-                                            self.logger, DEBUG, "Zero volume for minute",
-                                            asset_address=asset_address,
-                                            timestamp_minute=timestamp_minute,
-                                            denomination=denom.value
-                                        )
-                                        continue
-                                    
-                                    # Calculate minute price (volume-weighted average)
-                                    minute_price = weighted_price_sum / total_volume
-                                    
-                                    # Calculate 5-minute trailing VWAP
-                                    # Get previous 4 minutes of canonical prices
-                                    vwap_prices = []
-                                    vwap_volumes = []
-                                    
-                                    for i in range(5):  # Current minute + 4 previous
-                                        lookup_timestamp = timestamp_minute - (i * 60)
-                                        
-                                        if i == 0:
-                                            # Current minute - use calculated values
-                                            vwap_prices.append(minute_price)
-                                            vwap_volumes.append(total_volume)
-                                        else:
-                                            # Previous minutes - lookup existing canonical prices
-                                            existing_price = price_vwap_repo.get_canonical_price(
-                                                shared_session,
-                                                asset_address,
-                                                lookup_timestamp,
-                                                denom
-                                            )
-                                            
-                                            if existing_price:
-                                                vwap_prices.append(Decimal(str(existing_price.price_period)))
-                                                vwap_volumes.append(Decimal(str(existing_price.base_volume)))
-                                    
-                                    # Calculate 5-minute VWAP
-                                    if len(vwap_prices) >= 1:  # At least current minute
-                                        total_vwap_volume = sum(vwap_volumes)
-                                        weighted_vwap_sum = sum(price * volume for price, volume in zip(vwap_prices, vwap_volumes))
-                                        
-                                        if total_vwap_volume > 0:
-                                            vwap_price = weighted_vwap_sum / total_vwap_volume
-                                        else:
-                                            vwap_price = minute_price
-                                    else:
-                                        vwap_price = minute_price
-                                    
-                                    # Calculate quote volume for storage
-                                    quote_volume = total_volume * minute_price
-                                    
-                                    # Create canonical price record
-                                    canonical_price = price_vwap_repo.create_canonical_price(
-                                        shared_session,
-                                        asset_address,
-                                        timestamp_minute,
-                                        denom,
-                                        total_volume,      # base_volume
-                                        quote_volume,      # quote_volume
-                                        minute_price,      # price_period
-                                        vwap_price         # price_vwap (5-minute VWAP)
-                                    )
-                                    
-                                    if canonical_price:
-                                        results['prices_created'] += 1
-                                        log_with_context(
-                                            self.logger, DEBUG, "Canonical price created",
-                                            asset_address=asset_address,
-                                            timestamp_minute=timestamp_minute,
-                                            denomination=denom.value,
-                                            minute_price=str(minute_price),
-                                            vwap_price=str(vwap_price),
-                                            volume=str(total_volume)
-                                        )
-                                    
-                                except Exception as e:
-                                    results['errors'] += 1
-                                    log_with_context(
-                                        self.logger, ERROR, "Error processing denomination",
-                                        asset_address=asset_address,
-                                        timestamp_minute=timestamp_minute,
-                                        denomination=denom.value,
-                                        error=str(e)
-                                    )
                         
-                        except Exception as e:
-                            results['errors'] += 1
-                            log_with_context(
-                                self.logger, ERROR, "Error processing timestamp minute",
-                                asset_address=asset_address,
-                                timestamp_minute=timestamp_minute,
-                                error=str(e)
-                            )
+                    except Exception as e:
+                        results['errors'] += 1
+                        shared_session.rollback()
+                        log_with_context(
+                            self.logger, ERROR, "Error processing denomination",
+                            asset_address=asset_address,
+                            denomination=denom.value,
+                            error=str(e)
+                        )
+                        continue
                     
-                    # Commit all changes
                     shared_session.commit()
-                    
+            
             log_with_context(
                 self.logger, INFO, "Canonical price generation complete",
                 asset_address=asset_address,
@@ -514,198 +544,144 @@ class PricingService:
         
         Finds pool swaps and trades without direct pricing and applies
         canonical prices from price_vwap table to create global pricing.
+        The blocks are collapsed into ranges and priced in one set-based
+        pass over first..last block by apply_canonical_pricing_for_range(),
+        filtered to those ranges, however sparse the block list is.
+        
+        Args:
+            block_numbers: List of blocks to process for global pricing
+            asset_address: Target asset address to apply pricing for
+            denomination: USD, AVAX, or None for both (default: both)
+            
+        Returns:
+            Dict with global pricing application statistics
+        """
+        block_set = BlockRangeSet.from_blocks(block_numbers)
+        if not block_set:
+            return {'swaps_priced': 0, 'trades_priced': 0, 'errors': 0, 'blocks_processed': 0}
+        
+        results = self.apply_canonical_pricing_for_range(
+            asset_address, block_set=block_set, denomination=denomination
+        )
+        results['blocks_processed'] = len(block_set)
+        return results
+
+    def apply_canonical_pricing_for_range(
+        self,
+        asset_address: str,
+        start_block: Optional[int] = None,
+        end_block: Optional[int] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        denomination: Optional[PricingDenomination] = None,
+        block_set: Optional[BlockRangeSet] = None
+    ) -> Dict[str, int]:
+        """
+        Apply canonical pricing to unpriced events in a block and/or time range.
         
         Logic:
-        1. Find pool_swaps without direct pricing (no pool_swap_details)
-        2. Find trades without direct pricing (pricing_method != 'DIRECT')
-        3. Use price_vwap to calculate pricing for these events
-        4. Create pool_swap_details and trade_details with pricing_method = 'GLOBAL'
-        5. Return pricing statistics
+        1. Resolve the time range from the events in the block range (if not given)
+        2. Load canonical prices for that time range (one shared database query per denomination)
+        3. INSERT ... SELECT pool_swap_details and trade_details joined to those prices
+           on minute, with pricing_method = 'GLOBAL' (one statement per table and
+           denomination, per 5000 minutes)
+        
+        Events with direct pricing are skipped and existing details are kept
+        (ON CONFLICT DO NOTHING), so reruns only fill in what is missing.
         
         Args:
-            block_numbers: List of blocks to process for global pricing
             asset_address: Target asset address to apply pricing for
+            start_block: First block (inclusive), None for no lower bound
+            end_block: Last block (inclusive), None for no upper bound
+            start_timestamp: Earliest event timestamp, None to derive from the blocks
+            end_timestamp: Latest event timestamp, None to derive from the blocks
             denomination: USD, AVAX, or None for both (default: both)
+            block_set: Only events in these blocks (sets start_block/end_block to its
+                first/last block; gaps are filtered in the same statements)
             
         Returns:
             Dict with global pricing application statistics
         """
+        block_ranges = None
+        if block_set:
+            start_block, end_block = block_set.first, block_set.last
+            if block_set.range_count > 1:
+                block_ranges = list(block_set.ranges())
+        
         log_with_context(
             self.logger, INFO, "Applying canonical pricing to global events",
             asset_address=asset_address,
-            block_count=len(block_numbers),
+            start_block=start_block,
+            end_block=end_block,
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+            block_range_count=len(block_ranges) if block_ranges else None,
             denomination=denomination.value if denomination else "both"
         )
         
-        # Determine which denominations to process
         denominations = [denomination] if denomination else [PricingDenomination.USD, PricingDenomination.AVAX]
+        results = {'swaps_priced': 0, 'trades_priced': 0, 'errors': 0}
+        
+        pool_swap_detail_repo = self.model_db_manager.get_pool_swap_detail_repo()
+        trade_detail_repo = self.model_db_manager.get_trade_detail_repo()
+        price_vwap_repo = self.shared_db_manager.get_price_vwap_repo()
         
         try:
-            results = {
-                'swaps_priced': 0, 
-                'trades_priced': 0, 
-                'errors': 0, 
-                'blocks_processed': 0
-            }
-            
-            # Get repositories
-            pool_swap_detail_repo = self.model_db_manager.get_pool_swap_detail_repo()
-            price_vwap_repo = self.shared_db_manager.get_price_vwap_repository()
-            trade_detail_repo = self.model_db_manager.get_trade_detail_repo()
-            
             with self.shared_db_manager.get_session() as shared_session:
-                with self.model_db_manager.get_session() as model_session:
-
-                    # Process each block
-                    for block_number in block_numbers:
-                        try:
-                            results['blocks_processed'] += 1
-                            
-                            # Find pool swaps without direct pricing in this block
-                            unpriced_swaps = model_session.query(PoolSwap).filter(
-                                and_(
-                                    PoolSwap.block_number == block_number,
-                                    PoolSwap.base_token == asset_address.lower(),
-                                    ~exists().where(
-                                        and_(
-                                            PoolSwapDetail.content_id == PoolSwap.content_id,
-                                            PoolSwapDetail.price_method.in_([
-                                                PricingMethod.DIRECT_AVAX,
-                                                PricingMethod.DIRECT_USD
-                                            ])
-                                        )
-                                    )
-                                )
-                            ).all()
-                            
-                            # Find trades without direct pricing in this block
-                            unpriced_trades = model_session.query(Trade).filter(
-                                and_(
-                                    Trade.block_number == block_number,
-                                    Trade.base_token == asset_address.lower(),
-                                    ~exists().where(
-                                        and_(
-                                            TradeDetail.content_id == Trade.content_id,
-                                            TradeDetail.price_method == TradePricingMethod.DIRECT
-                                        )
-                                    )
-                                )
-                            ).all()
-                            
-                            # Process unpriced swaps
-                            for swap in unpriced_swaps:
-                                try:
-                                    # Get minute timestamp for canonical price lookup
-                                    swap_minute = (swap.timestamp // 60) * 60
-                                    
-                                    # Process each denomination
-                                    for denom in denominations:
-                                        # Get canonical price for this minute
-                                        canonical_price = price_vwap_repo.get_canonical_price(
-                                            shared_session,
-                                            asset_address,
-                                            swap_minute,
-                                            denom
-                                        )
-                                        
-                                        if not canonical_price:
-                                            log_with_context(
-                                                self.logger, DEBUG, "No canonical price found for swap",
-                                                content_id=str(swap.content_id),
-                                                timestamp=swap.timestamp,
-                                                denomination=denom.value
-                                            )
-                                            continue
-                                        
-                                        # Calculate swap valuation using canonical price
-                                        base_amount = Decimal(str(swap.base_amount_human))
-                                        price_per_token = Decimal(str(canonical_price.price_vwap))
-                                        total_value = base_amount * price_per_token
-                                        
-                                        # Create pool swap detail with global pricing
-                                        swap_detail = pool_swap_detail_repo.create_swap_detail(
-                                            model_session,
-                                            swap.content_id,
-                                            denom,
-                                            base_amount,
-                                            price_per_token,
-                                            total_value,
-                                            PricingMethod.GLOBAL
-                                        )
-                                        
-                                        if swap_detail:
-                                            results['swaps_priced'] += 1
-                                    
-                                except Exception as e:
-                                    results['errors'] += 1
-                                    log_with_context(
-                                        self.logger, ERROR, "Error pricing swap",
-                                        content_id=str(swap.content_id),
-                                        error=str(e)
-                                    )
-                            
-                            # Process unpriced trades
-                            for trade in unpriced_trades:
-                                try:
-                                    # Get minute timestamp for canonical price lookup
-                                    trade_minute = (trade.timestamp // 60) * 60
-                                    
-                                    # Process each denomination
-                                    for denom in denominations:
-                                        # Get canonical price for this minute
-                                        canonical_price = price_vwap_repo.get_canonical_price(
-                                            shared_session,
-                                            asset_address,
-                                            trade_minute,
-                                            denom
-                                        )
-                                        
-                                        if not canonical_price:
-                                            log_with_context(
-                                                self.logger, DEBUG, "No canonical price found for trade",
-                                                content_id=str(trade.content_id),
-                                                timestamp=trade.timestamp,
-                                                denomination=denom.value
-                                            )
-                                            continue
-                                        
-                                        # Calculate trade valuation using canonical price
-                                        base_amount = Decimal(str(trade.base_amount_human))
-                                        price_per_token = Decimal(str(canonical_price.price_vwap))
-                                        total_value = base_amount * price_per_token
-                                        
-                                        # Create trade detail with global pricing
-                                        trade_detail = trade_detail_repo.create_trade_detail(
-                                            model_session,
-                                            trade.content_id,
-                                            denom,
-                                            total_value,
-                                            price_per_token,
-                                            TradePricingMethod.GLOBAL
-                                        )
-                                        
-                                        if trade_detail:
-                                            results['trades_priced'] += 1
-                                    
-                                except Exception as e:
-                                    results['errors'] += 1
-                                    log_with_context(
-                                        self.logger, ERROR, "Error pricing trade",
-                                        content_id=str(trade.content_id),
-                                        error=str(e)
-                                    )
+                base_decimals = self.shared_db_manager.get_token_repo().get_decimals(shared_session, asset_address)
+            if base_decimals is None:
+                return {'swaps_priced': 0, 'trades_priced': 0, 'errors': 1}
+            
+            with self.model_db_manager.get_session() as model_session:
+                if start_timestamp is None or end_timestamp is None:
+                    first_timestamp, last_timestamp = self._event_timestamp_bounds(
+                        model_session, asset_address, start_block, end_block, block_ranges
+                    )
+                    if first_timestamp is None:
+                        return results
+                    start_timestamp = first_timestamp if start_timestamp is None else start_timestamp
+                    end_timestamp = last_timestamp if end_timestamp is None else end_timestamp
+                
+                start_minute = (start_timestamp // 60) * 60
+                end_minute = (end_timestamp // 60) * 60
+                
+                for denom in denominations:
+                    try:
+                        with self.shared_db_manager.get_session() as shared_session:
+                            minute_prices = price_vwap_repo.get_canonical_vwap_series(
+                                shared_session, asset_address, start_minute, end_minute, denom
+                            )
                         
-                        except Exception as e:
-                            results['errors'] += 1
+                        if not minute_prices:
                             log_with_context(
-                                self.logger, ERROR, "Error processing block",
-                                block_number=block_number,
-                                error=str(e)
+                                self.logger, DEBUG, "No canonical prices for range",
+                                asset_address=asset_address,
+                                start_minute=start_minute,
+                                end_minute=end_minute,
+                                denomination=denom.value
                             )
-                    
-                    # Commit all changes
-                    model_session.commit()
-                    
+                            continue
+                        
+                        results['swaps_priced'] += pool_swap_detail_repo.apply_global_pricing(
+                            model_session, asset_address, minute_prices, denom, base_decimals,
+                            start_block, end_block, block_ranges
+                        )
+                        results['trades_priced'] += trade_detail_repo.apply_global_pricing(
+                            model_session, asset_address, minute_prices, denom, base_decimals,
+                            start_block, end_block, block_ranges
+                        )
+                        model_session.commit()
+                        
+                    except Exception as e:
+                        results['errors'] += 1
+                        model_session.rollback()
+                        log_with_context(
+                            self.logger, ERROR, "Error applying global pricing for denomination",
+                            asset_address=asset_address,
+                            denomination=denom.value,
+                            error=str(e)
+                        )
+            
             log_with_context(
                 self.logger, INFO, "Global pricing application complete",
                 asset_address=asset_address,
@@ -720,11 +696,35 @@ class PricingService:
                 asset_address=asset_address,
                 error=str(e)
             )
-            return {'swaps_priced': 0, 'trades_priced': 0, 'errors': 1, 'blocks_processed': 0}
+            return {'swaps_priced': 0, 'trades_priced': 0, 'errors': 1}
 
-    # =====================================================================
-    # CONVENIENCE METHODS (NEW)
-    # =====================================================================
+    def _event_timestamp_bounds(
+        self,
+        session,
+        asset_address: str,
+        start_block: Optional[int],
+        end_block: Optional[int],
+        block_ranges: Optional[List[Tuple[int, int]]] = None
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """Earliest and latest swap or trade timestamp for an asset within a block range (and block ranges)"""
+        bounds = []
+        for event in (DBPoolSwap, DBTrade):
+            query = session.query(func.min(event.timestamp), func.max(event.timestamp)).filter(
+                event.base_token == asset_address.lower()
+            )
+            if start_block is not None:
+                query = query.filter(event.block_number >= start_block)
+            if end_block is not None:
+                query = query.filter(event.block_number <= end_block)
+            if block_ranges:
+                query = query.filter(in_block_ranges(event.block_number, block_ranges))
+            first, last = query.one()
+            if first is not None:
+                bounds.append((first, last))
+        
+        if not bounds:
+            return None, None
+        return min(first for first, _ in bounds), max(last for _, last in bounds)
 
     def update_canonical_pricing(
         self, 
@@ -759,18 +759,11 @@ class PricingService:
         try:
             # Calculate timestamp range
             current_time = int(datetime.now(timezone.utc).timestamp())
-            start_time = current_time - (minutes * 60)
-            
-            # Generate minute timestamps
-            timestamp_minutes = []
-            for i in range(minutes):
-                minute_timestamp = start_time + (i * 60)
-                # Round to minute boundary
-                minute_timestamp = (minute_timestamp // 60) * 60
-                timestamp_minutes.append(minute_timestamp)
+            start_time = ((current_time - (minutes * 60)) // 60) * 60
+            end_time = start_time + (minutes - 1) * 60
             
             # Generate canonical prices
-            results = self.generate_canonical_prices(timestamp_minutes, asset_address, denomination)
+            results = self.generate_canonical_prices_for_range(start_time, end_time, asset_address, denomination)
             
             log_with_context(
                 self.logger, INFO, "Canonical pricing update complete",
@@ -798,11 +791,11 @@ class PricingService:
         Comprehensive global pricing update for an asset.
         
         Convenience method that applies canonical pricing to unpriced events.
-        If no blocks specified, finds recent blocks with unpriced events.
+        If no blocks specified, prices unpriced events from the last 24 hours.
         
         Args:
             asset_address: Target asset address
-            blocks: Specific blocks to process (default: auto-detect recent blocks)
+            blocks: Specific blocks to process (default: last 24 hours)
             denomination: USD, AVAX, or None for both (default: both)
             
         Returns:
@@ -817,55 +810,23 @@ class PricingService:
         
         try:
             if blocks is None:
-                # Auto-detect recent blocks with unpriced events
-                with self.model_db_manager.get_session() as session:
-                    
-                    # Look for blocks in last 24 hours with unpriced events
-                    cutoff_time = datetime.now(timezone.utc) - timedelta(hours=24)
-                    cutoff_timestamp = int(cutoff_time.timestamp())
-                    
-                    # Find blocks with unpriced swaps
-                    unpriced_swap_blocks = session.query(distinct(PoolSwap.block_number)).filter(
-                        and_(
-                            PoolSwap.base_token == asset_address.lower(),
-                            PoolSwap.timestamp >= cutoff_timestamp,
-                            ~exists().where(PoolSwapDetail.content_id == PoolSwap.content_id)
-                        )
-                    ).all()
-                    
-                    # Find blocks with unpriced trades
-                    unpriced_trade_blocks = session.query(distinct(Trade.block_number)).filter(
-                        and_(
-                            Trade.base_token == asset_address.lower(),
-                            Trade.timestamp >= cutoff_timestamp,
-                            ~exists().where(TradeDetail.content_id == Trade.content_id)
-                        )
-                    ).all()
-                    
-                    # Combine and deduplicate blocks
-                    all_blocks = set()
-                    for block_tuple in unpriced_swap_blocks:
-                        all_blocks.add(block_tuple[0])
-                    for block_tuple in unpriced_trade_blocks:
-                        all_blocks.add(block_tuple[0])
-                    
-                    blocks = sorted(list(all_blocks))
-                    
-                    log_with_context(
-                        self.logger, INFO, "Auto-detected blocks with unpriced events",
-                        asset_address=asset_address,
-                        block_count=len(blocks)
-                    )
-            
-            if not blocks:
+                # Price everything unpriced in the last 24 hours as one time range
+                cutoff_time = datetime.now(timezone.utc) - timedelta(hours=24)
+                results = self.apply_canonical_pricing_for_range(
+                    asset_address,
+                    start_timestamp=int(cutoff_time.timestamp()),
+                    end_timestamp=int(datetime.now(timezone.utc).timestamp()),
+                    denomination=denomination
+                )
+            elif not blocks:
                 log_with_context(
                     self.logger, INFO, "No blocks need global pricing",
                     asset_address=asset_address
                 )
                 return {'swaps_priced': 0, 'trades_priced': 0, 'errors': 0, 'blocks_processed': 0}
-            
-            # Apply canonical pricing to global events
-            results = self.apply_canonical_pricing_to_global_events(blocks, asset_address, denomination)
+            else:
+                # Apply canonical pricing to global events
+                results = self.apply_canonical_pricing_to_global_events(blocks, asset_address, denomination)
             
             log_with_context(
                 self.logger, INFO, "Global pricing update complete",
@@ -0,0 +1,195 @@
+# indexer/storage/block_format.py
+
+"""
+Storage encodings for Block blobs.
+
+"json" is the original msgspec JSON. "msgpack_zstd" is a versioned binary
+format: a 5-byte header (magic + version) followed by a zstd frame of the
+msgpack-encoded struct. Readers detect the format from the leading bytes, so
+buckets holding both formats keep working.
+
+msgpack integers stop at 64 bits, while decoded event attributes carry
+uint256 amounts. Those are written as a msgpack extension holding the
+signed big-endian bytes and restored to int on read. Only the untyped dicts
+of a Block (log attributes, method args, error context) can hold them, so
+just those are rewritten before the struct is encoded natively.
+"""
+
+import threading
+from typing import Any, Optional, Type, TypeVar
+
+import msgspec
+
+from ..types import Block
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+JSON_FORMAT = "json"
+MSGPACK_ZSTD_FORMAT = "msgpack_zstd"
+BLOCK_FORMATS = (JSON_FORMAT, MSGPACK_ZSTD_FORMAT)
+
+BINARY_MAGIC = b"IXBK"
+BINARY_VERSION = 1
+BINARY_HEADER = BINARY_MAGIC + bytes([BINARY_VERSION])
+
+# msgpack extension type code for integers outside the int64/uint64 range
+BIG_INT_EXT = 1
+
+MSGPACK_INT_MIN = -2 ** 63
+MSGPACK_INT_MAX = 2 ** 64 - 1
+
+ZSTD_LEVEL = 3
+
+T = TypeVar("T")
+
+_msgpack_encoder = msgspec.msgpack.Encoder()
+_msgpack_decoders = {}
+_zstd_local = threading.local()
+
+
+def _require_zstandard() -> None:
+    if zstandard is None:
+        raise ImportError(
+            "The msgpack_zstd block format requires the 'zstandard' package (pip install zstandard)"
+        )
+
+
+def _zstd_compressor():
+    compressor = getattr(_zstd_local, "compressor", None)
+    if compressor is None:
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+    return compressor
+
+
+def _zstd_decompressor():
+    decompressor = getattr(_zstd_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor
+
+
+def _wrap_big_ints(value: Any) -> Any:
+    """Replace integers msgpack cannot hold with BIG_INT_EXT extensions, in place"""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, (dict, list)):
+                _wrap_big_ints(item)
+            elif type(item) is int and not MSGPACK_INT_MIN <= item <= MSGPACK_INT_MAX:
+                value[key] = _big_int_ext(item)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            if isinstance(item, (dict, list)):
+                _wrap_big_ints(item)
+            elif type(item) is int and not MSGPACK_INT_MIN <= item <= MSGPACK_INT_MAX:
+                value[index] = _big_int_ext(item)
+    return value
+
+
+def _big_int_ext(value: int) -> msgspec.msgpack.Ext:
+    length = (value.bit_length() + 8) // 8
+    return msgspec.msgpack.Ext(BIG_INT_EXT, value.to_bytes(length, "big", signed=True))
+
+
+def _ext_hook(code: int, data: memoryview) -> Any:
+    if code == BIG_INT_EXT:
+        return int.from_bytes(data, "big", signed=True)
+    raise ValueError(f"Unknown msgpack extension type {code} in block data")
+
+
+def _wrap_untyped(value: Optional[dict]) -> Optional[dict]:
+    """Copy of an untyped dict with big ints wrapped (builtins, as a JSON round trip would give)"""
+    if not value:
+        return value
+    return _wrap_big_ints(msgspec.to_builtins(value))
+
+
+def _wrap_transaction(tx: Any) -> Any:
+    changes = {}
+
+    logs = tx.logs
+    for log_index, log in logs.items():
+        attributes = getattr(log, "attributes", None)
+        wrapped = _wrap_untyped(attributes)
+        if wrapped is not attributes:
+            if logs is tx.logs:
+                logs = dict(logs)
+            logs[log_index] = msgspec.structs.replace(log, attributes=wrapped)
+    if logs is not tx.logs:
+        changes["logs"] = logs
+
+    args = getattr(tx.function, "args", None)
+    wrapped_args = _wrap_untyped(args)
+    if wrapped_args is not args:
+        changes["function"] = msgspec.structs.replace(tx.function, args=wrapped_args)
+
+    if tx.errors:
+        errors = {
+            error_id: msgspec.structs.replace(error, context=_wrap_untyped(error.context))
+            for error_id, error in tx.errors.items()
+        }
+        changes["errors"] = errors
+
+    return msgspec.structs.replace(tx, **changes) if changes else tx
+
+
+def _prepare_block(block: Block) -> Block:
+    """Shallow copy of a Block with big ints in its untyped dicts wrapped as extensions"""
+    if not block.transactions:
+        return block
+    transactions = {tx_hash: _wrap_transaction(tx) for tx_hash, tx in block.transactions.items()}
+    return msgspec.structs.replace(block, transactions=transactions)
+
+
+def _encode_msgpack(block: Any) -> bytes:
+    if type(block) is Block:
+        try:
+            return _msgpack_encoder.encode(_prepare_block(block))
+        except OverflowError:
+            pass
+    # Other structs, or a big int outside the known untyped fields: rewrite everything
+    return _msgpack_encoder.encode(_wrap_big_ints(msgspec.to_builtins(block)))
+
+
+def _msgpack_decoder(struct_type: Type[T]) -> msgspec.msgpack.Decoder:
+    decoder = _msgpack_decoders.get(struct_type)
+    if decoder is None:
+        decoder = _msgpack_decoders[struct_type] = msgspec.msgpack.Decoder(struct_type, ext_hook=_ext_hook)
+    return decoder
+
+
+def is_binary_block(data: bytes) -> bool:
+    return data[:len(BINARY_MAGIC)] == BINARY_MAGIC
+
+
+def encode_block(block: Any, block_format: str = JSON_FORMAT) -> bytes:
+    """Encode a block struct for storage in the given format"""
+    if block_format == JSON_FORMAT:
+        return msgspec.json.encode(block)
+
+    if block_format == MSGPACK_ZSTD_FORMAT:
+        _require_zstandard()
+        payload = _encode_msgpack(block)
+        return BINARY_HEADER + _zstd_compressor().compress(payload)
+
+    raise ValueError(f"Unknown block format: {block_format}")
+
+
+def decode_block(data: bytes, struct_type: Type[T]) -> T:
+    """Decode a stored block of either format, detected from its leading bytes"""
+    if not is_binary_block(data):
+        return msgspec.json.decode(data, type=struct_type)
+
+    version = data[len(BINARY_MAGIC)]
+    if version != BINARY_VERSION:
+        raise ValueError(f"Unsupported binary block format version {version}")
+
+    _require_zstandard()
+    payload = _zstd_decompressor().decompress(memoryview(data)[len(BINARY_HEADER):])
+    return _msgpack_decoder(struct_type).decode(payload)
+
+
+def block_content_type(block_format: str) -> str:
+    return "application/json" if block_format == JSON_FORMAT else "application/octet-stream"
@@ -0,0 +1,235 @@
+# indexer/storage/block_manifest.py
+
+import os
+import time
+import zlib
+import heapq
+import operator
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, chain
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable, Callable
+
+import msgspec
+
+from ..core.logging import LoggingMixin, INFO, DEBUG, WARNING, ERROR, CRITICAL
+
+MANIFEST_SUFFIX = ".manifest"
+TEMP_SUFFIX = ".tmp"
+
+
+class _ManifestFile(msgspec.Struct):
+    prefix: str
+    last_name: Optional[str]
+    synced_at: float
+    blocks: bytes  # zlib-compressed deltas of the sorted block numbers (int64)
+
+
+def _encode_blocks(blocks: array) -> bytes:
+    deltas = array('q', map(operator.sub, blocks, chain((0,), blocks)))
+    return zlib.compress(deltas.tobytes())
+
+
+def _decode_blocks(data: bytes) -> array:
+    deltas = array('q')
+    deltas.frombytes(zlib.decompress(data))
+    return array('q', accumulate(deltas))
+
+
+def _merge_unique(left: Iterable[int], right: Iterable[int]) -> array:
+    merged = array('q')
+    previous = None
+    for value in heapq.merge(left, right):
+        if value != previous:
+            merged.append(value)
+            previous = value
+    return merged
+
+
+class _PrefixState:
+    def __init__(self, blocks: array, last_name: Optional[str], synced_at: float):
+        self.blocks = blocks
+        self.last_name = last_name
+        self.synced_at = synced_at
+        self.dirty = False
+
+
+class BlockManifest(LoggingMixin):
+    """
+    Persistent local manifest of block numbers stored under each bucket prefix.
+
+    Each prefix (an rpc source path, or the processing/complete prefix) keeps a
+    sorted int64 array of its block numbers and the greatest blob name seen.
+    Refreshes list only names after that one (GCS start_offset), so an
+    append-only stream prefix is brought up to date with a few list calls and
+    queueing/status commands no longer re-list millions of blobs.
+
+    Blobs written out of name order by other processes (workers completing old
+    blocks) and deletions are only picked up by a full re-list, done once a
+    prefix's last full sync is older than full_sync_seconds. Writes made through
+    this process are recorded directly with add()/discard().
+
+    State is stored as `<manifest_dir>/<prefix>.manifest` (msgpack, delta-encoded
+    and zlib-compressed, a few bytes per million sequential blocks).
+    """
+
+    def __init__(self, manifest_dir: str, full_sync_seconds: float = 3600.0):
+        self.manifest_dir = Path(manifest_dir)
+        self.full_sync_seconds = full_sync_seconds
+
+        self._lock = threading.Lock()
+        self._states: Dict[str, _PrefixState] = {}
+        self._decoder = msgspec.msgpack.Decoder(_ManifestFile)
+        self._encoder = msgspec.msgpack.Encoder()
+        self.stats: Dict[str, int] = {"full_syncs": 0, "incremental_syncs": 0, "names_listed": 0, "saves": 0}
+
+        self.manifest_dir.mkdir(parents=True, exist_ok=True)
+
+    def last_name(self, prefix: str) -> Optional[str]:
+        """Greatest blob name seen under prefix, the start_offset for the next incremental listing"""
+        return self._state(prefix).last_name
+
+    def needs_full_sync(self, prefix: str) -> bool:
+        state = self._state(prefix)
+        return state.last_name is None or time.time() - state.synced_at > self.full_sync_seconds
+
+    def apply_listing(self, prefix: str, names: Iterable[str], parse: Callable[[str], Optional[int]],
+                      full: bool = False) -> int:
+        """
+        Fold a listing into the manifest and save it.
+
+        Args:
+            prefix: Bucket prefix the names were listed under
+            names: Blob names in listing (lexicographic) order
+            parse: Block number of a blob name, or None for other files
+            full: The listing covers the whole prefix and replaces the manifest
+
+        Returns:
+            Number of block numbers added
+        """
+        state = self._state(prefix)
+        last_name = None if full else state.last_name
+
+        found = []
+        listed = 0
+        for name in names:
+            listed += 1
+            if last_name is not None and name <= last_name:
+                continue
+            last_name = name
+            block_number = parse(name)
+            if block_number is not None:
+                found.append(block_number)
+        found.sort()
+
+        with self._lock:
+            before = len(state.blocks)
+            if full:
+                state.blocks = _merge_unique(found, ())
+                state.synced_at = time.time()
+                self.stats["full_syncs"] += 1
+            elif found:
+                state.blocks = _merge_unique(state.blocks, found)
+            if not full:
+                self.stats["incremental_syncs"] += 1
+            if last_name is not None:
+                state.last_name = last_name
+            self.stats["names_listed"] += listed
+            added = len(state.blocks) - before
+            state.dirty = True
+
+        self.save(prefix)
+
+        self.log_debug("Block manifest updated",
+                       prefix=prefix,
+                       full=full,
+                       names_listed=listed,
+                       added=added,
+                       total_blocks=len(state.blocks))
+        return added
+
+    def add(self, prefix: str, block_number: int) -> None:
+        """Record a block written by this process (saved with the next listing or flush())"""
+        state = self._state(prefix)
+        with self._lock:
+            index = bisect_left(state.blocks, block_number)
+            if index == len(state.blocks) or state.blocks[index] != block_number:
+                state.blocks.insert(index, block_number)
+                state.dirty = True
+
+    def discard(self, prefix: str, block_number: int) -> None:
+        """Record a block deleted by this process"""
+        state = self._state(prefix)
+        with self._lock:
+            index = bisect_left(state.blocks, block_number)
+            if index < len(state.blocks) and state.blocks[index] == block_number:
+                del state.blocks[index]
+                state.dirty = True
+
+    def get_blocks(self, prefix: str, start_block: Optional[int] = None, end_block: Optional[int] = None) -> array:
+        """Sorted block numbers under prefix, optionally limited to start_block..end_block inclusive"""
+        state = self._state(prefix)
+        with self._lock:
+            blocks = state.blocks
+            low = bisect_left(blocks, start_block) if start_block is not None else 0
+            high = bisect_right(blocks, end_block) if end_block is not None else len(blocks)
+            return blocks[low:high]
+
+    def flush(self) -> None:
+        for prefix in list(self._states):
+            self.save(prefix)
+
+    def save(self, prefix: str) -> None:
+        state = self._state(prefix)
+        with self._lock:
+            if not state.dirty:
+                return
+            payload = self._encoder.encode(_ManifestFile(
+                prefix=prefix,
+                last_name=state.last_name,
+                synced_at=state.synced_at,
+                blocks=_encode_blocks(state.blocks)
+            ))
+            state.dirty = False
+
+        path = self._path_for(prefix)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}{TEMP_SUFFIX}")
+        temp_path.write_bytes(payload)
+        os.replace(temp_path, path)
+        self.stats["saves"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "prefixes": {prefix: len(state.blocks) for prefix, state in self._states.items()},
+            }
+
+    def _state(self, prefix: str) -> _PrefixState:
+        state = self._states.get(prefix)
+        if state is None:
+            with self._lock:
+                state = self._states.get(prefix)
+                if state is None:
+                    state = self._load(prefix)
+                    self._states[prefix] = state
+        return state
+
+    def _load(self, prefix: str) -> _PrefixState:
+        path = self._path_for(prefix)
+        try:
+            manifest = self._decoder.decode(path.read_bytes())
+            return _PrefixState(_decode_blocks(manifest.blocks), manifest.last_name, manifest.synced_at)
+        except FileNotFoundError:
+            return _PrefixState(array('q'), None, 0.0)
+        except (msgspec.DecodeError, zlib.error) as e:
+            self.log_warning("Unreadable block manifest, rebuilding",
+                             path=str(path),
+                             error=str(e))
+            return _PrefixState(array('q'), None, 0.0)
+
+    def _path_for(self, prefix: str) -> Path:
+        name = prefix.strip("/").replace("/", "__") or "_root"
+        return self.manifest_dir / f"{name}{MANIFEST_SUFFIX}"
@@ -1,30 +1,77 @@
 # indexer/storage/gcs_handler.py
 
 import os
-from typing import List, Dict, Any, Optional, Tuple, Union
+import time
+import threading
+from typing import List, Dict, Any, Optional, Tuple, Union, Callable, Iterator
 from datetime import datetime, timezone
 from google.cloud import storage
-import msgspec
+from google.api_core.exceptions import NotFound, NotModified
 
 from ..types import Block, EvmFilteredBlock, StorageConfig
 from ..database.shared.tables.config.config import Source
+from .prefetcher import BlockPrefetcher
+from .local_cache import LocalBlockCache
+from .block_manifest import BlockManifest
+from .block_format import encode_block, decode_block, block_content_type, BLOCK_FORMATS
+from ..utils.block_ranges import BlockRangeSet
+
+# Lookup order for a block with no stage index entry
+BLOCK_STAGES = ("complete", "processing", "rpc")
+
+# Listing only needs names
+BLOB_NAME_FIELDS = "items(name),nextPageToken"
+
+
+def block_number_from_blob_name(blob_name: str) -> Optional[int]:
+    """Block number of a stored block blob (block_{n}.json or block_with_receipts_{n}-{n}.json), else None"""
+    if not blob_name.endswith('.json'):
+        return None
+    filename = blob_name.split('/')[-1]
+    try:
+        if 'block_with_receipts_' in filename:
+            return int(filename.split('block_with_receipts_')[1].split('-')[0])
+        if filename.startswith('block_'):
+            return int(filename.replace('block_', '').replace('.json', ''))
+    except ValueError:
+        pass
+    return None
+
 
 class GCSHandler:
     def __init__(self, storage_config: StorageConfig, gcs_project: str, bucket_name: str,
                  credentials_path: Optional[str] = None, 
+                 block_cache: Optional[LocalBlockCache] = None,
+                 block_manifest: Optional[BlockManifest] = None,
                  # DEPRECATED: For backward compatibility only
                  rpc_prefix: Optional[str] = None, rpc_format: Optional[str] = None):
         
+        if storage_config.block_format not in BLOCK_FORMATS:
+            raise ValueError(f"Unknown block format {storage_config.block_format}, expected one of {BLOCK_FORMATS}")
+        
         self.storage_config = storage_config
         self.gcs_project = gcs_project
         self.bucket_name = bucket_name
         self.credentials_path = credentials_path if credentials_path else None
+        self.block_cache = block_cache
+        self.block_manifest = block_manifest
         
         # DEPRECATED: Keep for backward compatibility
         self.rpc_prefix = rpc_prefix
         self.rpc_format = rpc_format
 
+        # Stage resolution cache: block_number -> "complete" | "processing"
+        self.stage_index_ttl: Optional[float] = None
+        self._stage_index: Dict[int, str] = {}
+        self._stage_index_refreshed_at: Optional[float] = None
+        self._stage_index_lock = threading.Lock()
+        self._stage_refresh_lock = threading.Lock()
+
         self.client = None
+        self.bucket = None
+        if self.block_cache and self.block_cache.offline:
+            # Local cache directory stands in for the bucket
+            return
         self._initialize_gcs_client()
         self.bucket = self._connect_to_bucket(self.bucket_name)
 
@@ -50,9 +97,58 @@ class GCSHandler:
         blob = self.get_blob(blob_name)
         return blob.download_as_bytes()
 
+    def download_blob_if_exists(self, blob_name: str, immutable: bool = False) -> Optional[bytes]:
+        """
+        Download in a single request, returning None if the blob does not exist.
+        
+        With a local block cache, immutable blobs are served from disk without a request
+        and other cached blobs are revalidated by generation (no body on a match).
+        """
+        if self.block_cache:
+            return self._download_through_cache(blob_name, immutable)
+        
+        try:
+            return self.get_blob(blob_name).download_as_bytes()
+        except NotFound:
+            return None
+
+    def _download_through_cache(self, blob_name: str, immutable: bool) -> Optional[bytes]:
+        cached = self.block_cache.get(blob_name)
+        if cached and (immutable or self.block_cache.offline):
+            return cached[1]
+        if self.block_cache.offline:
+            return None
+        
+        cached_generation = cached[0] if cached else None
+        blob = self.get_blob(blob_name)
+        try:
+            data = blob.download_as_bytes(if_generation_not_match=cached_generation)
+        except NotModified:
+            self.block_cache.record_revalidated()
+            return cached[1]
+        except NotFound:
+            if cached:
+                self.block_cache.invalidate(blob_name)
+            return None
+        
+        generation = int(blob.generation) if blob.generation else None
+        self.block_cache.put(blob_name, generation, data)
+        return data
+
     def list_blobs(self, prefix: str = None, max_results: int = None) -> List:
+        if self.block_cache and self.block_cache.offline:
+            names = self.block_cache.list_blob_names(prefix or "")[:max_results]
+            return [storage.Blob(name, bucket=None) for name in names]
         return list(self.bucket.list_blobs(prefix=prefix, max_results=max_results))
 
+    def list_blob_names(self, prefix: str, start_offset: Optional[str] = None) -> Iterator[str]:
+        """Blob names under prefix in lexicographic order, from start_offset (inclusive) if given"""
+        if self.block_cache and self.block_cache.offline:
+            names = self.block_cache.list_blob_names(prefix)
+            return (name for name in names if start_offset is None or name >= start_offset)
+        blobs = self.bucket.list_blobs(prefix=prefix, start_offset=start_offset, fields=BLOB_NAME_FIELDS)
+        return (blob.name for blob in blobs)
+
     def compare_blob_versions(self, previous_blobs_info: Dict, current_blobs_info: Dict) -> Tuple[List, List, List]:
         previous_blobs = set(previous_blobs_info.keys())
         current_blobs = set(current_blobs_info.keys())
@@ -76,11 +172,25 @@ class GCSHandler:
     
     def upload_blob_from_string(self, data: Union[str, bytes], destination_blob_name: str, 
                                content_type: Optional[str] = None) -> bool:
+        if self.block_cache and self.block_cache.offline:
+            self.block_cache.put(destination_blob_name, None, data if isinstance(data, bytes) else data.encode())
+            return True
+        
         blob = self.bucket.blob(destination_blob_name)
         blob.upload_from_string(data, content_type=content_type)
+        
+        if self.block_cache and blob.generation:
+            # The new generation is known, so the next read of this blob is a revalidation hit
+            self.block_cache.put(destination_blob_name, int(blob.generation),
+                                 data if isinstance(data, bytes) else data.encode())
         return True
 
     def delete_blob(self, blob_name: str) -> bool:
+        if self.block_cache:
+            self.block_cache.invalidate(blob_name)
+            if self.block_cache.offline:
+                return True
+        
         blob = self.get_blob(blob_name)
         if not blob:
             return False
@@ -89,6 +199,8 @@ class GCSHandler:
         return True
 
     def blob_exists(self, blob_name: str) -> bool:
+        if self.block_cache and self.block_cache.offline:
+            return self.block_cache.contains(blob_name)
         blob = self.bucket.blob(blob_name)
         return blob.exists()
 
@@ -126,17 +238,46 @@ class GCSHandler:
             source_id: DEPRECATED - use source parameter instead
             source: Source object containing path and format information
         """
-        if source:
-            block_path = self.get_blob_string("rpc", block_number, source)
-        else:
-            # LEGACY: Fall back to old method
-            block_path = self.get_blob_string("rpc", block_number)
-
-        if self.blob_exists(block_path):
-            data_bytes = self.download_blob_as_bytes(block_path)
-            return msgspec.json.decode(data_bytes, type=EvmFilteredBlock)
-        else:
+        # LEGACY: source=None falls back to rpc_prefix/rpc_format
+        data_bytes = self.download_block_bytes("rpc", block_number, source)
+        if data_bytes is None:
             return None
+        return self.decode_block_bytes("rpc", data_bytes)
+
+    def download_block_bytes(self, stage: str, block_number: int, source: Optional[Source] = None) -> Optional[bytes]:
+        """
+        Download raw block bytes for a stage without decoding.
+        
+        Returns None if the block does not exist in that stage.
+        """
+        block_path = self.get_blob_string(stage, block_number, source)
+        # Raw stream blobs are written once; processing/complete blobs are rewritten on reprocess
+        return self.download_blob_if_exists(block_path, immutable=(stage == "rpc"))
+
+    def fetch_block_bytes(self, block_number: int, source: Optional[Source] = None) -> Optional[Tuple[str, bytes]]:
+        """
+        Download a block from the first stage that has it, in stage index order.
+        
+        Args:
+            block_number: Block number to retrieve
+            source: Source for the rpc stage; the rpc stage is skipped without one
+            
+        Returns:
+            (stage, bytes), or None if no stage has the block
+        """
+        for stage in self.resolve_block_stages(block_number):
+            if stage == "rpc" and source is None:
+                continue
+            data_bytes = self.download_block_bytes(stage, block_number, source)
+            if data_bytes is not None:
+                return stage, data_bytes
+        return None
+
+    def decode_block_bytes(self, stage: str, data_bytes: bytes) -> Union[Block, EvmFilteredBlock]:
+        """Decode raw block bytes (JSON or binary): EvmFilteredBlock for rpc stage, Block for processing/complete"""
+        if stage == "rpc":
+            return decode_block(data_bytes, EvmFilteredBlock)
+        return decode_block(data_bytes, Block)
 
     def save_processing_block(self, block_number: int, data: Block) -> bool:
         has_errors = any(
@@ -146,13 +287,18 @@ class GCSHandler:
         data.indexing_status = "error" if has_errors else "processing"
         
         destination_str = self.get_blob_string("processing", block_number)
-        encoded_data = msgspec.json.encode(data)
+        encoded_data = encode_block(data, self.storage_config.block_format)
         try:
-            return self.upload_blob_from_string(
+            success = self.upload_blob_from_string(
                 encoded_data, 
                 destination_str,
-                content_type="application/json"
+                content_type=block_content_type(self.storage_config.block_format)
             )
+            if success:
+                self._record_block_stage(block_number, "processing")
+                if self.block_manifest:
+                    self.block_manifest.add(self.storage_config.processing_prefix, block_number)
+            return success
         except Exception as e:
             return False
         
@@ -160,19 +306,25 @@ class GCSHandler:
         data.indexing_status = "complete"
         
         destination_str = self.get_blob_string("complete", block_number)
-        encoded_data = msgspec.json.encode(data)
+        encoded_data = encode_block(data, self.storage_config.block_format)
         
         try:
             success = self.upload_blob_from_string(
                 encoded_data, 
                 destination_str,
-                content_type="application/json"
+                content_type=block_content_type(self.storage_config.block_format)
             )
             
             if success:
+                self._record_block_stage(block_number, "complete")
                 processing_path = self.get_blob_string("processing", block_number)
-                if self.blob_exists(processing_path):
+                try:
                     self.delete_blob(processing_path)
+                except NotFound:
+                    pass
+                if self.block_manifest:
+                    self.block_manifest.add(self.storage_config.complete_prefix, block_number)
+                    self.block_manifest.discard(self.storage_config.processing_prefix, block_number)
                     
             return success
             
@@ -180,50 +332,97 @@ class GCSHandler:
             return False
 
     def get_processing_block(self, block_number: int) -> Optional[Block]:
-        block_path = self.get_blob_string("processing", block_number)
-        
-        if self.blob_exists(block_path):
-            data_bytes = self.download_blob_as_bytes(block_path)
-            return msgspec.json.decode(data_bytes, type=Block)
-        return None
+        data_bytes = self.download_block_bytes("processing", block_number)
+        if data_bytes is None:
+            return None
+        return self.decode_block_bytes("processing", data_bytes)
 
     def get_complete_block(self, block_number: int) -> Optional[Block]:
-        block_path = self.get_blob_string("complete", block_number)
+        data_bytes = self.download_block_bytes("complete", block_number)
+        if data_bytes is None:
+            return None
+        return self.decode_block_bytes("complete", data_bytes)
+
+    def prefetch_blocks(self, fetch: Callable[[int], Optional[Tuple[str, bytes]]], block_numbers: List[int],
+                        depth: int = 8, max_bytes: int = 256 * 1024 * 1024) -> Iterator[Tuple[int, Optional[Tuple[str, bytes]]]]:
+        """
+        Iterate blocks in order while downloading the next `depth` concurrently.
         
-        if self.blob_exists(block_path):
-            data_bytes = self.download_blob_as_bytes(block_path)
-            return msgspec.json.decode(data_bytes, type=Block)
-        return None
+        Args:
+            fetch: Returns (stage, bytes) for a block number, or None if not found
+            block_numbers: Blocks to load, in processing order
+            depth: Maximum blocks downloading or buffered at once
+            max_bytes: Stop starting new downloads while buffered bytes exceed this
+        """
+        prefetcher = BlockPrefetcher(fetch, depth=depth, max_bytes=max_bytes)
+        return prefetcher.iter_blocks(block_numbers)
     
-    def list_processing_blocks(self) -> List[int]:
-        blobs = self.list_blobs(prefix=self.storage_config.processing_prefix)
-        block_numbers = []
+    def enable_stage_index(self, ttl_seconds: float) -> None:
+        """Resolve block stages from cached listings, re-listing once they are older than ttl_seconds"""
+        self.stage_index_ttl = ttl_seconds
+
+    def update_stage_index(self, processing_blocks: List[int], complete_blocks: List[int]) -> None:
+        """Replace the stage index with fresh processing/complete listings"""
+        stage_index = dict.fromkeys(processing_blocks, "processing")
+        stage_index.update(dict.fromkeys(complete_blocks, "complete"))
+
+        with self._stage_index_lock:
+            self._stage_index = stage_index
+            self._stage_index_refreshed_at = time.monotonic()
+
+    def refresh_stage_index(self) -> None:
+        self.update_stage_index(self.list_processing_blocks(), self.list_complete_blocks())
+
+    def get_block_stage(self, block_number: int) -> Optional[str]:
+        """
+        Stage a block is known to be stored in.
         
-        for blob in blobs:
-            if blob.name.endswith('.json'):
-                try:
-                    filename = blob.name.split('/')[-1]
-                    block_num_str = filename.replace('block_', '').replace('.json', '')
-                    block_numbers.append(int(block_num_str))
-                except:
-                    continue
-                    
-        return sorted(block_numbers)
+        Returns "complete" or "processing" for indexed blocks, "rpc" if the index is
+        fresh and the block has not been processed, or None if there is no usable index.
+        """
+        if self.stage_index_ttl is None:
+            return None
 
-    def list_complete_blocks(self) -> List[int]:
-        blobs = self.list_blobs(prefix=self.storage_config.complete_prefix)
-        block_numbers = []
+        if self._stage_index_stale():
+            # Prefetch threads can race here; only one of them re-lists
+            with self._stage_refresh_lock:
+                if self._stage_index_stale():
+                    self.refresh_stage_index()
+
+        return self._stage_index.get(block_number, "rpc")
+
+    def resolve_block_stages(self, block_number: int) -> List[str]:
+        """
+        Stages to try for a block, most likely first.
         
-        for blob in blobs:
-            if blob.name.endswith('.json'):
-                try:
-                    filename = blob.name.split('/')[-1]
-                    block_num_str = filename.replace('block_', '').replace('.json', '')
-                    block_numbers.append(int(block_num_str))
-                except:
-                    continue
-                    
-        return sorted(block_numbers)
+        The index is a hint: a stage it names is tried first and the remaining stages are
+        kept as fallbacks, so a stale entry costs one extra request rather than a miss.
+        """
+        known_stage = self.get_block_stage(block_number)
+        if known_stage is None:
+            return list(BLOCK_STAGES)
+        return [known_stage] + [stage for stage in BLOCK_STAGES if stage != known_stage]
+
+    def _stage_index_stale(self) -> bool:
+        refreshed_at = self._stage_index_refreshed_at
+        return refreshed_at is None or time.monotonic() - refreshed_at > self.stage_index_ttl
+
+    def _record_block_stage(self, block_number: int, stage: str) -> None:
+        with self._stage_index_lock:
+            self._stage_index[block_number] = stage
+
+    def list_processing_blocks(self) -> List[int]:
+        if self.block_manifest:
+            processing_blocks = self._list_manifest_blocks(self.storage_config.processing_prefix)
+            # Completing a block deletes its processing blob, possibly from another worker
+            complete_blocks = set(self._list_manifest_blocks(self.storage_config.complete_prefix))
+            return [block for block in processing_blocks if block not in complete_blocks]
+        return self._list_prefix_blocks(self.storage_config.processing_prefix)
+
+    def list_complete_blocks(self) -> List[int]:
+        if self.block_manifest:
+            return self._list_manifest_blocks(self.storage_config.complete_prefix)
+        return self._list_prefix_blocks(self.storage_config.complete_prefix)
 
     def list_rpc_blocks(self, source: Optional[Source] = None) -> List[int]:
         """
@@ -232,34 +431,77 @@ class GCSHandler:
         Args:
             source: Source object containing path information
         """
-        if source:
-            prefix = source.path
-        elif self.rpc_prefix:
-            # LEGACY: Fallback to old configuration
-            prefix = self.rpc_prefix
+        prefix = self._rpc_prefix(source)
+        if self.block_manifest:
+            return self._list_manifest_blocks(prefix)
+        return self._list_prefix_blocks(prefix)
+
+    def list_stage_blocks(self, stage: str, start_block: Optional[int] = None, end_block: Optional[int] = None,
+                          source: Optional[Source] = None) -> List[int]:
+        """
+        Sorted block numbers stored for a stage, limited to start_block..end_block inclusive.
+        
+        Served from the block manifest when one is configured, otherwise by listing the prefix.
+        """
+        low = start_block if start_block is not None else float('-inf')
+        high = end_block if end_block is not None else float('inf')
+        
+        if stage == "processing":
+            return [block for block in self.list_processing_blocks() if low <= block <= high]
+        elif stage == "rpc":
+            prefix = self._rpc_prefix(source)
+        elif stage == "complete":
+            prefix = self.storage_config.complete_prefix
         else:
-            raise ValueError("No source configuration available for listing RPC blocks")
-            
-        blobs = self.list_blobs(prefix=prefix)
-        block_numbers = []
+            raise ValueError(f"Unknown stage: {stage}")
         
-        for blob in blobs:
-            if blob.name.endswith('.json'):
-                try:
-                    filename = blob.name.split('/')[-1]
-                    
-                    if 'block_with_receipts_' in filename:
-                        parts = filename.split('block_with_receipts_')[1]
-                        block_num_str = parts.split('-')[0]
-                        block_numbers.append(int(block_num_str))
-                    elif filename.startswith('block_'):
-                        block_num_str = filename.replace('block_', '').replace('.json', '')
-                        block_numbers.append(int(block_num_str))
-                except:
-                    continue
-                    
+        if self.block_manifest:
+            self.sync_block_manifest(prefix)
+            return list(self.block_manifest.get_blocks(prefix, start_block, end_block))
+        
+        return [block for block in self._list_prefix_blocks(prefix) if low <= block <= high]
+
+    def list_stage_block_ranges(self, stage: str, start_block: Optional[int] = None, end_block: Optional[int] = None,
+                                source: Optional[Source] = None) -> BlockRangeSet:
+        """list_stage_blocks as a compact BlockRangeSet"""
+        return BlockRangeSet.from_sorted(self.list_stage_blocks(stage, start_block, end_block, source))
+
+    def sync_block_manifest(self, prefix: str, full: Optional[bool] = None) -> int:
+        """
+        Bring the manifest for prefix up to date, returning the number of blocks added.
+        
+        Lists only names after the last one seen unless a full re-list is due (or full=True).
+        """
+        if full is None:
+            full = self.block_manifest.needs_full_sync(prefix)
+        start_offset = None if full else self.block_manifest.last_name(prefix)
+        names = self.list_blob_names(prefix, start_offset=start_offset)
+        return self.block_manifest.apply_listing(prefix, names, block_number_from_blob_name, full=full)
+
+    def _list_manifest_blocks(self, prefix: str) -> List[int]:
+        self.sync_block_manifest(prefix)
+        return list(self.block_manifest.get_blocks(prefix))
+
+    def _list_prefix_blocks(self, prefix: str) -> List[int]:
+        block_numbers = []
+        for name in self.list_blob_names(prefix):
+            block_number = block_number_from_blob_name(name)
+            if block_number is not None:
+                block_numbers.append(block_number)
         return sorted(block_numbers)
 
+    def _rpc_prefix(self, source: Optional[Source]) -> str:
+        if source:
+            return source.path
+        elif self.rpc_prefix:
+            # LEGACY: Fallback to old configuration
+            return self.rpc_prefix
+        raise ValueError("No source configuration available for listing RPC blocks")
+
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Local block cache hit/miss stats, or None without a cache"""
+        return self.block_cache.get_stats() if self.block_cache else None
+
     def get_processing_summary(self) -> Dict[str, Any]:
         processing_blocks = self.list_processing_blocks()
         complete_blocks = self.list_complete_blocks()
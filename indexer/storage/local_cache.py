@@ -0,0 +1,196 @@
+# indexer/storage/local_cache.py
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple, Dict, Any, List
+
+from ..core.logging import LoggingMixin, INFO, DEBUG, WARNING, ERROR, CRITICAL
+
+# Cached blob: (generation or None if unknown, raw bytes)
+CachedBlob = Tuple[Optional[int], bytes]
+
+GENERATION_SEPARATOR = "@"
+TEMP_SUFFIX = ".tmp"
+
+
+class LocalBlockCache(LoggingMixin):
+    """
+    On-disk LRU cache of raw GCS blob bytes.
+
+    Files mirror the bucket layout and are addressed by blob path and generation
+    (`<cache_dir>/<blob_path>@<generation>`), so a rewritten blob never serves stale
+    bytes once its new generation is known. Files without a generation suffix are
+    accepted too, which lets a directory of block JSON stand in for the bucket in
+    offline runs.
+
+    Least recently used files are evicted once the total size exceeds max_bytes.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 10 * 1024 * 1024 * 1024, offline: bool = False):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.offline = offline
+
+        self._lock = threading.Lock()
+        # blob_name -> (generation, file path, size), least recently used first
+        self._entries: "OrderedDict[str, Tuple[Optional[int], Path, int]]" = OrderedDict()
+        self._total_bytes = 0
+        self.stats: Dict[str, Any] = {}
+        self.reset_stats()
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_entries()
+
+        self.log_info("Local block cache ready",
+                      cache_dir=str(self.cache_dir),
+                      entries=len(self._entries),
+                      size_mb=round(self._total_bytes / 1024 / 1024, 1),
+                      max_mb=round(self.max_bytes / 1024 / 1024, 1),
+                      offline=self.offline)
+
+    def reset_stats(self) -> None:
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "writes": 0,
+            "evictions": 0,
+            "bytes_read": 0,
+            "bytes_written": 0,
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "size_bytes": self._total_bytes,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+        }
+
+    def get(self, blob_name: str) -> Optional[CachedBlob]:
+        """Return (generation, bytes) for a cached blob, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(blob_name)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(blob_name)
+
+        generation, path, size = entry
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            # Removed behind our back (another process evicted it)
+            with self._lock:
+                self._drop(blob_name)
+                self.stats["misses"] += 1
+            return None
+
+        # Persist recency so LRU order survives restarts
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        with self._lock:
+            self.stats["hits"] += 1
+            self.stats["bytes_read"] += size
+
+        return generation, data
+
+    def put(self, blob_name: str, generation: Optional[int], data: bytes) -> None:
+        """Store blob bytes for a generation, replacing any other cached generation"""
+        path = self._path_for(blob_name, generation)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_path = path.with_name(f"{path.name}.{threading.get_ident()}{TEMP_SUFFIX}")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            previous = self._entries.get(blob_name)
+            if previous and previous[1] != path:
+                self._drop(blob_name, unlink=True)
+            elif previous:
+                self._drop(blob_name)
+
+            self._entries[blob_name] = (generation, path, len(data))
+            self._total_bytes += len(data)
+            self.stats["writes"] += 1
+            self.stats["bytes_written"] += len(data)
+
+            self._evict()
+
+    def record_revalidated(self) -> None:
+        """Count a cached copy confirmed current by the server (not-modified response)"""
+        with self._lock:
+            self.stats["revalidated"] += 1
+
+    def invalidate(self, blob_name: str) -> None:
+        with self._lock:
+            self._drop(blob_name, unlink=True)
+
+    def contains(self, blob_name: str) -> bool:
+        with self._lock:
+            return blob_name in self._entries
+
+    def list_blob_names(self, prefix: str = "") -> List[str]:
+        with self._lock:
+            return sorted(name for name in self._entries if name.startswith(prefix))
+
+    def _path_for(self, blob_name: str, generation: Optional[int]) -> Path:
+        if generation is None:
+            return self.cache_dir / blob_name
+        return self.cache_dir / f"{blob_name}{GENERATION_SEPARATOR}{generation}"
+
+    def _load_entries(self) -> None:
+        """Index existing cache files, oldest access first"""
+        files = []
+        for path in self.cache_dir.rglob("*"):
+            if not path.is_file():
+                continue
+            if path.name.endswith(TEMP_SUFFIX):
+                path.unlink(missing_ok=True)
+                continue
+            files.append((path.stat(), path))
+
+        for stat, path in sorted(files, key=lambda item: item[0].st_mtime):
+            blob_name, generation = self._parse_path(path)
+            previous = self._entries.get(blob_name)
+            if previous:
+                # Keep only the newest generation of a blob
+                if (previous[0] or 0) > (generation or 0):
+                    path.unlink(missing_ok=True)
+                    continue
+                self._drop(blob_name, unlink=True)
+
+            self._entries[blob_name] = (generation, path, stat.st_size)
+            self._total_bytes += stat.st_size
+
+        self._evict()
+
+    def _parse_path(self, path: Path) -> Tuple[str, Optional[int]]:
+        relative = path.relative_to(self.cache_dir).as_posix()
+        blob_name, separator, suffix = relative.rpartition(GENERATION_SEPARATOR)
+        if separator and suffix.isdigit():
+            return blob_name, int(suffix)
+        return relative, None
+
+    def _drop(self, blob_name: str, unlink: bool = False) -> None:
+        """Remove an entry from the index. Caller holds the lock."""
+        entry = self._entries.pop(blob_name, None)
+        if entry is None:
+            return
+        self._total_bytes -= entry[2]
+        if unlink:
+            entry[1].unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """Evict least recently used files down to max_bytes. Caller holds the lock."""
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            blob_name = next(iter(self._entries))
+            self._drop(blob_name, unlink=True)
+            self.stats["evictions"] += 1
@@ -0,0 +1,98 @@
+# indexer/storage/prefetcher.py
+
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable, Iterable, Iterator, Optional, Tuple, Deque, Dict, Any
+
+from ..core.logging import LoggingMixin, INFO, DEBUG, WARNING, ERROR, CRITICAL
+
+# (stage, raw bytes) as returned by a block fetch, None if the block was not found
+FetchedBlock = Optional[Tuple[str, bytes]]
+
+
+class BlockPrefetcher(LoggingMixin):
+    """
+    Downloads upcoming blocks on a thread pool while the caller works on the current one.
+
+    Blocks are yielded in the order given. At most `depth` blocks are in flight or
+    buffered at once, and no new downloads are started while buffered (downloaded but
+    not yet consumed) bytes exceed `max_bytes`, so network latency overlaps with
+    decode/transform without unbounded memory growth.
+    """
+
+    def __init__(self, fetch: Callable[[int], FetchedBlock], depth: int = 8,
+                 max_workers: Optional[int] = None, max_bytes: int = 256 * 1024 * 1024):
+        if depth < 1:
+            raise ValueError("Prefetch depth must be at least 1")
+
+        self.fetch = fetch
+        self.depth = depth
+        self.max_workers = max_workers or depth
+        self.max_bytes = max_bytes
+        self.stats: Dict[str, Any] = {}
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.stats = {
+            "blocks": 0,
+            "not_found": 0,
+            "errors": 0,
+            "bytes": 0,
+            "wait_seconds": 0.0,
+        }
+
+    def iter_blocks(self, block_numbers: Iterable[int]) -> Iterator[Tuple[int, FetchedBlock]]:
+        """Yield (block_number, (stage, bytes) or None) in input order"""
+        block_iter = iter(block_numbers)
+        pending: Deque[Tuple[int, Future]] = deque()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="block-prefetch") as executor:
+            exhausted = False
+
+            while True:
+                # Top up the window unless it is full or buffered data is over the cap
+                while not exhausted and len(pending) < self.depth and self._buffered_bytes(pending) < self.max_bytes:
+                    block_number = next(block_iter, None)
+                    if block_number is None:
+                        exhausted = True
+                        break
+                    pending.append((block_number, executor.submit(self.fetch, block_number)))
+
+                if not pending:
+                    break
+
+                block_number, future = pending.popleft()
+                yield block_number, self._result(block_number, future)
+
+    def _result(self, block_number: int, future: Future) -> FetchedBlock:
+        start = time.perf_counter()
+        try:
+            fetched = future.result()
+        except Exception as e:
+            self.stats["errors"] += 1
+            self.log_warning("Block prefetch failed",
+                           block_number=block_number,
+                           error=str(e),
+                           exception_type=type(e).__name__)
+            return None
+        finally:
+            self.stats["wait_seconds"] += time.perf_counter() - start
+
+        self.stats["blocks"] += 1
+        if fetched is None:
+            self.stats["not_found"] += 1
+        else:
+            self.stats["bytes"] += len(fetched[1])
+
+        return fetched
+
+    @staticmethod
+    def _buffered_bytes(pending: Deque[Tuple[int, Future]]) -> int:
+        total = 0
+        for _, future in pending:
+            if future.done() and not future.exception():
+                fetched = future.result()
+                if fetched:
+                    total += len(fetched[1])
+        return total
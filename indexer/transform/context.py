@@ -1,6 +1,6 @@
 # indexer/transform/context.py
 
-from typing import Dict, List, Set, Optional, Type, Union, Tuple
+from typing import Dict, List, Set, Type, Union, Tuple
 from collections import defaultdict
 
 from ..types import (
@@ -18,10 +18,116 @@ from ..types import (
     SwapBatchSignal,
     Position,
 )
-from ..core.logging import LoggingMixin, INFO, DEBUG, WARNING, ERROR, CRITICAL
+from ..core.logging import LoggingMixin, lazy, INFO, DEBUG, WARNING, ERROR, CRITICAL
 
 TrfDict = Dict[EvmAddress, Dict[EvmAddress, Dict[int, TransferSignal]]] # {address: {token: {log_index: TransferSignal}}}
 
+TRF_IN = "trf_in"
+TRF_OUT = "trf_out"
+
+
+class TransferIndex:
+    """
+    Incrementally maintained index of a transaction's transfer signals.
+
+    Unmatched transfers are kept in two nested views per direction, by address
+    ({address: {token: {log_index: transfer}}}, the trf_dict shape) and by token
+    ({token: {address: {log_index: transfer}}}), so contract and token lookups
+    are dictionary reads. Adding, matching and unmatching a transfer touch only
+    that transfer's four entries.
+    """
+
+    __slots__ = ("transfers", "matched", "unmatched", "by_address", "by_token")
+
+    def __init__(self):
+        self.transfers: Dict[int, TransferSignal] = {}
+        self.matched: Set[int] = set()
+        self.unmatched: Dict[int, TransferSignal] = {}
+        self.by_address: Dict[str, TrfDict] = {TRF_IN: {}, TRF_OUT: {}}
+        self.by_token: Dict[str, TrfDict] = {TRF_IN: {}, TRF_OUT: {}}
+
+    def add(self, log_index: int, transfer: TransferSignal) -> bool:
+        """Index a transfer, returning False if it lacks address information"""
+        if log_index in self.transfers:
+            self._unlink(log_index)
+        self.transfers[log_index] = transfer
+
+        if not transfer.from_address or not transfer.to_address:
+            self.matched.discard(log_index)
+            return False
+        if log_index not in self.matched:
+            self._link(log_index)
+        return True
+
+    def mark_matched(self, log_index: int) -> bool:
+        """Remove a transfer from the unmatched views, returning False if it was not unmatched"""
+        if log_index not in self.unmatched:
+            return False
+        self._unlink(log_index)
+        self.matched.add(log_index)
+        return True
+
+    def unmatch(self, log_index: int) -> bool:
+        """Return a matched transfer to the unmatched views"""
+        if log_index not in self.matched:
+            return False
+        self.matched.discard(log_index)
+        self._link(log_index)
+        return True
+
+    def is_matched(self, log_index: int) -> bool:
+        return log_index not in self.unmatched
+
+    def for_address(self, direction: str, address: EvmAddress) -> Dict[EvmAddress, Dict[int, TransferSignal]]:
+        """Unmatched {token: {log_index: transfer}} into (trf_in) or out of (trf_out) address"""
+        return self.by_address[direction].get(address, {})
+
+    def for_token(self, direction: str, token: EvmAddress) -> Dict[EvmAddress, Dict[int, TransferSignal]]:
+        """Unmatched {address: {log_index: transfer}} of token into or out of each address"""
+        return self.by_token[direction].get(token, {})
+
+    def build_trf_dict(self, include_matched: bool = True) -> Dict[str, TrfDict]:
+        """Fresh nested trf_dict, optionally including matched transfers"""
+        if not include_matched:
+            return {
+                direction: {address: {token: dict(transfers) for token, transfers in tokens.items()}
+                            for address, tokens in view.items()}
+                for direction, view in self.by_address.items()
+            }
+
+        trf_dict = {TRF_OUT: {}, TRF_IN: {}}
+        for log_index, transfer in self.transfers.items():
+            if transfer.from_address and transfer.to_address:
+                trf_dict[TRF_OUT].setdefault(transfer.from_address, {}).setdefault(transfer.token, {})[log_index] = transfer
+                trf_dict[TRF_IN].setdefault(transfer.to_address, {}).setdefault(transfer.token, {})[log_index] = transfer
+        return trf_dict
+
+    def _link(self, log_index: int) -> None:
+        transfer = self.transfers[log_index]
+        self.unmatched[log_index] = transfer
+        for direction, address in ((TRF_OUT, transfer.from_address), (TRF_IN, transfer.to_address)):
+            self.by_address[direction].setdefault(address, {}).setdefault(transfer.token, {})[log_index] = transfer
+            self.by_token[direction].setdefault(transfer.token, {}).setdefault(address, {})[log_index] = transfer
+
+    def _unlink(self, log_index: int) -> None:
+        if self.unmatched.pop(log_index, None) is None:
+            return
+        transfer = self.transfers[log_index]
+        for direction, address in ((TRF_OUT, transfer.from_address), (TRF_IN, transfer.to_address)):
+            _discard_nested(self.by_address[direction], address, transfer.token, log_index)
+            _discard_nested(self.by_token[direction], transfer.token, address, log_index)
+
+
+def _discard_nested(view: TrfDict, outer: EvmAddress, inner: EvmAddress, log_index: int) -> None:
+    """Delete view[outer][inner][log_index], dropping dictionaries left empty"""
+    inner_dict = view[outer]
+    transfers = inner_dict[inner]
+    del transfers[log_index]
+    if not transfers:
+        del inner_dict[inner]
+        if not inner_dict:
+            del view[outer]
+
 
 class TransformContext(LoggingMixin):
     def __init__(self, transaction: Transaction, tracked_tokens: Set[EvmAddress]):
@@ -42,9 +148,7 @@ class TransformContext(LoggingMixin):
         self.consumed_signals: Set[int] = set()
 
         # Transfer tracking - trf_dict contains only UNMATCHED transfers
-        self._transfer_signals: Optional[Dict[int, TransferSignal]] = None
-        self._trf_dict: Optional[Dict[str, TrfDict]] = None
-        self._trf_dict_built = False
+        self.transfer_index = TransferIndex()
 
         self.log_debug("Transform context initialized",
                       tx_hash=transaction.tx_hash,
@@ -57,10 +161,8 @@ class TransformContext(LoggingMixin):
 
     @property
     def trf_dict(self) -> Dict[str, TrfDict]:
-        """Get the unmatched transfers dictionary"""
-        if not self._trf_dict_built:
-            self._build_trf_dict()
-        return self._trf_dict
+        """Get the unmatched transfers dictionary (live view of the transfer index)"""
+        return self.transfer_index.by_address
 
     def add_signals(self, signals: Dict[int, Signal]) -> None:
         """Add signals to context with validation"""
@@ -79,11 +181,7 @@ class TransformContext(LoggingMixin):
                 raise TypeError(f"Signal must be Signal instance, got {type(signal)}")
         
         self.signals.update(signals)
-        
-        # Reset cached computations when signals are added
-        self._transfer_signals = None
-        self._trf_dict = None
-        self._trf_dict_built = False
+        self._index_transfers(signals)
         
         self.log_debug("Signals added to context",
                       tx_hash=self.transaction.tx_hash,
@@ -223,138 +321,35 @@ class TransformContext(LoggingMixin):
                           exception_type=type(e).__name__)
             raise
 
-    def _build_transfer_signals(self) -> None:
-        """Build transfer signals dictionary"""
-        try:
-            self._transfer_signals = {
-                idx: signal for idx, signal in self.signals.items() 
-                if isinstance(signal, TransferSignal)
-            }
-            
-            self.log_debug("Transfer signals built",
-                          tx_hash=self.transaction.tx_hash,
-                          transfer_count=len(self._transfer_signals))
-            
-        except Exception as e:
-            self.log_error("Failed to build transfer signals",
-                          tx_hash=self.transaction.tx_hash,
-                          error=str(e),
-                          exception_type=type(e).__name__)
-            raise
-
-    def _build_trf_dict(self) -> None:
-        """Build transfer dictionary containing only UNMATCHED transfers"""
-        if self._transfer_signals is None:
-            self._build_transfer_signals()
-        
-        try:
-            trf_out = defaultdict(lambda: defaultdict(dict))
-            trf_in = defaultdict(lambda: defaultdict(dict))
-            
-            for idx, transfer in self._transfer_signals.items():
-                if not transfer.from_address or not transfer.to_address:
-                    self.log_warning("Transfer missing address information",
-                                    tx_hash=self.transaction.tx_hash,
-                                    transfer_index=idx)
-                    continue
-                
-                trf_out[transfer.from_address][transfer.token][idx] = transfer
-                trf_in[transfer.to_address][transfer.token][idx] = transfer
-
-            self._trf_dict = {
-                "trf_out": dict(trf_out),
-                "trf_in": dict(trf_in),
-            }
-            self._trf_dict_built = True
-            
-            self.log_debug("Transfer dictionary built (unmatched only)",
-                          tx_hash=self.transaction.tx_hash,
-                          transfers_processed=len(self._transfer_signals))
-            
-        except Exception as e:
-            self.log_error("Failed to build transfer dictionary",
-                          tx_hash=self.transaction.tx_hash,
-                          error=str(e),
-                          exception_type=type(e).__name__)
-            raise
+    def _index_transfers(self, signals: Dict[int, Signal]) -> None:
+        """Add new transfer signals to the transfer index"""
+        indexed = 0
+        for idx, signal in signals.items():
+            if not isinstance(signal, TransferSignal):
+                continue
+            if self.transfer_index.add(idx, signal):
+                indexed += 1
+            else:
+                self.log_warning("Transfer missing address information",
+                                tx_hash=self.transaction.tx_hash,
+                                transfer_index=idx)
 
-    def _remove_transfer_from_dict(self, log_index: int) -> None:
-        """Remove a matched transfer from the trf_dict"""
-        if not self._trf_dict_built or not self._transfer_signals:
-            return
-        
-        transfer = self._transfer_signals.get(log_index)
-        if not transfer:
-            return
-        
-        try:
-            # Remove from trf_out
-            if (transfer.from_address in self._trf_dict["trf_out"] and 
-                transfer.token in self._trf_dict["trf_out"][transfer.from_address] and
-                log_index in self._trf_dict["trf_out"][transfer.from_address][transfer.token]):
-                
-                del self._trf_dict["trf_out"][transfer.from_address][transfer.token][log_index]
-                
-                # Clean up empty dictionaries
-                if not self._trf_dict["trf_out"][transfer.from_address][transfer.token]:
-                    del self._trf_dict["trf_out"][transfer.from_address][transfer.token]
-                    if not self._trf_dict["trf_out"][transfer.from_address]:
-                        del self._trf_dict["trf_out"][transfer.from_address]
-            
-            # Remove from trf_in
-            if (transfer.to_address in self._trf_dict["trf_in"] and 
-                transfer.token in self._trf_dict["trf_in"][transfer.to_address] and
-                log_index in self._trf_dict["trf_in"][transfer.to_address][transfer.token]):
-                
-                del self._trf_dict["trf_in"][transfer.to_address][transfer.token][log_index]
-                
-                # Clean up empty dictionaries
-                if not self._trf_dict["trf_in"][transfer.to_address][transfer.token]:
-                    del self._trf_dict["trf_in"][transfer.to_address][transfer.token]
-                    if not self._trf_dict["trf_in"][transfer.to_address]:
-                        del self._trf_dict["trf_in"][transfer.to_address]
-            
-            self.log_debug("Transfer removed from trf_dict",
-                          tx_hash=self.transaction.tx_hash,
-                          log_index=log_index)
-                          
-        except Exception as e:
-            self.log_error("Failed to remove transfer from trf_dict",
+        if indexed:
+            self.log_debug("Transfer signals indexed",
                           tx_hash=self.transaction.tx_hash,
-                          log_index=log_index,
-                          error=str(e),
-                          exception_type=type(e).__name__)
+                          new_transfers=indexed,
+                          unmatched_transfers=len(self.transfer_index.unmatched))
 
     def rebuild_complete_trf_dict(self, include_matched: bool = True) -> Dict[str, TrfDict]:
         """Rebuild complete transfer dictionary with option to include matched transfers"""
-        if self._transfer_signals is None:
-            self._build_transfer_signals()
-        
         try:
-            trf_out = defaultdict(lambda: defaultdict(dict))
-            trf_in = defaultdict(lambda: defaultdict(dict))
-            
-            for idx, transfer in self._transfer_signals.items():
-                # Skip matched transfers if include_matched is False
-                if not include_matched and self._is_transfer_matched(idx):
-                    continue
-                
-                if not transfer.from_address or not transfer.to_address:
-                    continue
-                
-                trf_out[transfer.from_address][transfer.token][idx] = transfer
-                trf_in[transfer.to_address][transfer.token][idx] = transfer
-
-            result = {
-                "trf_out": dict(trf_out),
-                "trf_in": dict(trf_in),
-            }
+            result = self.transfer_index.build_trf_dict(include_matched)
             
             self.log_debug("Complete transfer dictionary rebuilt",
                           tx_hash=self.transaction.tx_hash,
                           include_matched=include_matched,
-                          transfers_included=len([t for idx, t in self._transfer_signals.items() 
-                                                if include_matched or not self._is_transfer_matched(idx)]))
+                          transfers_included=len(self.transfer_index.transfers) if include_matched
+                                             else len(self.transfer_index.unmatched))
             
             return result
             
@@ -366,20 +361,8 @@ class TransformContext(LoggingMixin):
             return {"trf_out": {}, "trf_in": {}}
 
     def _is_transfer_matched(self, log_index: int) -> bool:
-        """Check if a transfer signal has been matched by checking if it's in current trf_dict"""
-        if not self._trf_dict_built or not self._transfer_signals:
-            return False
-        
-        transfer = self._transfer_signals.get(log_index)
-        if not transfer:
-            return True  # If we can't find it, consider it matched
-        
-        # Check if it exists in the unmatched trf_dict
-        return not (
-            transfer.from_address in self._trf_dict["trf_out"] and
-            transfer.token in self._trf_dict["trf_out"][transfer.from_address] and
-            log_index in self._trf_dict["trf_out"][transfer.from_address][transfer.token]
-        )
+        """Check if a transfer signal has been matched (unknown transfers count as matched)"""
+        return self.transfer_index.is_matched(log_index)
 
     # =============================================================================
     # HELPER METHODS
@@ -399,7 +382,7 @@ class TransformContext(LoggingMixin):
             
             self.log_debug("Signals filtered by type",
                           tx_hash=self.transaction.tx_hash,
-                          requested_types=str(signal_types),
+                          requested_types=lazy(lambda: str(signal_types)),
                           matching_signals=len(result))
             
             return result
@@ -425,7 +408,7 @@ class TransformContext(LoggingMixin):
             
             self.log_debug("Events filtered by type",
                           tx_hash=self.transaction.tx_hash,
-                          requested_types=str(event_types),
+                          requested_types=lazy(lambda: str(event_types)),
                           matching_events=len(result))
             
             return result
@@ -464,9 +447,8 @@ class TransformContext(LoggingMixin):
             self.consumed_signals.add(log_index)
             
             # If this signal is a transfer, remove it from trf_dict (mark as matched)
-            if (log_index in self.signals and 
-                isinstance(self.signals[log_index], TransferSignal)):
-                self._remove_transfer_from_dict(log_index)
+            if log_index in self.transfer_index.transfers:
+                self.transfer_index.mark_matched(log_index)
                 transfer_count += 1
             else:
                 signal_count += 1
@@ -478,26 +460,36 @@ class TransformContext(LoggingMixin):
                       signals_consumed=signal_count,
                       total_consumed=len(self.consumed_signals))
 
+    def unmark_signals_consumed(self, log_indices: List[int]) -> None:
+        """Release consumed signals, returning transfer signals to the unmatched transfers"""
+        if not log_indices:
+            return
+        
+        released = 0
+        for log_index in log_indices:
+            self.consumed_signals.discard(log_index)
+            if self.transfer_index.unmatch(log_index):
+                released += 1
+        
+        self.log_debug("Signals released, transfers returned to unmatched",
+                      tx_hash=self.transaction.tx_hash,
+                      total_processed=len(log_indices),
+                      transfers_unmatched=released,
+                      total_consumed=len(self.consumed_signals))
+
     def is_signal_consumed(self, log_index: int) -> bool:
         """Check if a signal is already consumed"""
         return log_index in self.consumed_signals
 
     def get_unmatched_transfers(self) -> Dict[int, TransferSignal]:
         """Get all unmatched transfer signals"""
-        if not self._trf_dict_built:
-            self._build_trf_dict()
-        
         try:
-            # Collect all transfers from the unmatched trf_dict
-            unmatched_transfers = {}
-            
-            for address_dict in self._trf_dict["trf_out"].values():
-                for token_dict in address_dict.values():
-                    unmatched_transfers.update(token_dict)
+            unmatched = self.transfer_index.unmatched
+            unmatched_transfers = {idx: unmatched[idx] for idx in sorted(unmatched)}
             
             self.log_debug("Retrieved unmatched transfers",
                           tx_hash=self.transaction.tx_hash,
-                          total_transfers=len(self._transfer_signals) if self._transfer_signals else 0,
+                          total_transfers=len(self.transfer_index.transfers),
                           unmatched_transfers=len(unmatched_transfers))
             
             return unmatched_transfers
@@ -578,16 +570,13 @@ class TransformContext(LoggingMixin):
         return buy_swaps, sell_swaps
     
     def get_unmatched_contract_transfers(self, contract: EvmAddress) -> Tuple[Dict[EvmAddress, Dict[int, TransferSignal]], Dict[EvmAddress, Dict[int, TransferSignal]]]:
-        """Get unmatched transfers for a specific contract - EFFICIENT VERSION"""
+        """Get unmatched transfers for a specific contract, as {token: {log_index: transfer}} in and out"""
         if not contract:
             raise ValueError("Contract address cannot be empty")
         
-        if not self._trf_dict_built:
-            self._build_trf_dict()
-        
         try:
-            in_transfers = self._trf_dict["trf_in"].get(contract, {})
-            out_transfers = self._trf_dict["trf_out"].get(contract, {})
+            in_transfers = self.transfer_index.for_address(TRF_IN, contract)
+            out_transfers = self.transfer_index.for_address(TRF_OUT, contract)
             
             self.log_debug("Retrieved unmatched contract transfers",
                           tx_hash=self.transaction.tx_hash,
@@ -606,22 +595,13 @@ class TransformContext(LoggingMixin):
             return {}, {}
     
     def get_unmatched_token_transfers(self, token: EvmAddress) -> Tuple[Dict[EvmAddress, Dict[int, TransferSignal]], Dict[EvmAddress, Dict[int, TransferSignal]]]:
-        """Get unmatched transfers of a specific token - EFFICIENT VERSION"""
+        """Get unmatched transfers of a specific token, as {address: {log_index: transfer}} in and out"""
         if not token:
             raise ValueError("Token address cannot be empty")
         
-        if not self._trf_dict_built:
-            self._build_trf_dict()
-        
         try:
-            in_trf = {
-                address: trf[token] for address, trf in self._trf_dict["trf_in"].items() 
-                if token in trf
-            }
-            out_trf = {
-                address: trf[token] for address, trf in self._trf_dict["trf_out"].items() 
-                if token in trf
-            }
+            in_trf = self.transfer_index.for_token(TRF_IN, token)
+            out_trf = self.transfer_index.for_token(TRF_OUT, token)
             
             self.log_debug("Retrieved unmatched token transfers",
                           tx_hash=self.transaction.tx_hash,
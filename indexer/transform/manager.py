@@ -16,7 +16,7 @@ from ..types import (
     ZERO_ADDRESS,
     UnknownTransfer,
 )
-from ..core.logging import LoggingMixin, INFO, DEBUG, WARNING, ERROR, CRITICAL
+from ..core.logging import LoggingMixin, lazy, INFO, DEBUG, WARNING, ERROR, CRITICAL
 from .processors import TradeProcessor
 from ..utils.amounts import amount_to_negative_str
 
@@ -170,7 +170,7 @@ class TransformManager(LoggingMixin):
         self.log_debug("Grouped logs by contract",
                       tx_hash=context.transaction.tx_hash,
                       contract_count=len(logs_by_contract),
-                      contracts=list(logs_by_contract.keys()))
+                      contracts=lazy(lambda: list(logs_by_contract.keys())))
 
         overall_success = True
         processed_contracts = 0
@@ -201,7 +201,7 @@ class TransformManager(LoggingMixin):
                                   tx_hash=context.transaction.tx_hash,
                                   contract_address=contract_address,
                                   signal_count=len(signals),
-                                  signal_types=[type(s).__name__ for s in signals.values()])
+                                  signal_types=lazy(lambda: [type(s).__name__ for s in signals.values()]))
                     processed_contracts += 1
                 else:
                     self.log_debug("No signals generated",
@@ -6,6 +6,7 @@ from ...types import LiquiditySignal, ZERO_ADDRESS, Liquidity, Reward, Liquidity
 from .base import TransferPattern
 from ..context import TransformContext
 from ...utils.amounts import amount_to_int, abs_amount
+from ...core.logging import lazy
 
 
 class Mint_A(TransferPattern):    
@@ -172,8 +173,8 @@ class Mint_A(TransferPattern):
         self.log_debug("Provider identification",
                       pattern_name=self.name,
                       tx_hash=context.transaction.tx_hash,
-                      potential_providers=list(potential_providers),
-                      receipt_receivers=list(receipt_receivers))
+                      potential_providers=lazy(lambda: list(potential_providers)),
+                      receipt_receivers=lazy(lambda: list(receipt_receivers)))
 
         # Find provider who both sent tokens and received receipts
         for receiver in receipt_receivers:
@@ -173,6 +173,7 @@ class TransformRegistry(LoggingMixin):
                              instantiate_config=instantiate_config)
                 
                 instance = transformer_class(**instantiate_config)
+                instance.compile_plans()
                 
                 self._transformers[contract_address.lower()] = ContractTransformer(instance=instance)
                 
@@ -243,6 +244,7 @@ class TransformRegistry(LoggingMixin):
             raise TypeError("Instance must be a BaseTransformer")
         
         try:
+            instance.compile_plans()
             self._transformers[contract_address.lower()] = ContractTransformer(instance=instance)
             
             self.log_debug("Contract transformer registered",
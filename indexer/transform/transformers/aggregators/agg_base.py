@@ -13,6 +13,7 @@ from ....types import (
     ErrorId,
 )
 from ....utils.amounts import amount_to_str, is_zero
+from ....core.logging import lazy
 
 
 class AggregatorTransformer(BaseTransformer):    
@@ -368,8 +369,8 @@ class AggregatorTransformer(BaseTransformer):
                          log_index=log.index,
                          tokens_in_count=len(tokens_in),
                          tokens_out_count=len(tokens_out),
-                         total_amount_in=sum(float(amt) for amt in amounts_in),
-                         total_amount_out=sum(float(amt) for amt in amounts_out),
+                         total_amount_in=lazy(lambda: sum(float(amt) for amt in amounts_in)),
+                         total_amount_out=lazy(lambda: sum(float(amt) for amt in amounts_out)),
                          transformer_name=self.name)
             
         except Exception as e:
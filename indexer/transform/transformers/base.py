@@ -1,7 +1,7 @@
 # indexer/transform/transformers/base.py
 
 from abc import ABC
-from typing import List, Any, Optional, Dict, Tuple
+from typing import List, Any, Optional, Dict, Tuple, Callable
 
 from ...types import (
     ZERO_ADDRESS,
@@ -14,7 +14,7 @@ from ...types import (
     EvmHash,
 )
 from ...utils.amounts import is_positive
-from ...core.logging import log_with_context, LoggingMixin, INFO, DEBUG, WARNING, ERROR, CRITICAL
+from ...core.logging import log_with_context, LoggingMixin, lazy, INFO, DEBUG, WARNING, ERROR, CRITICAL
 
 
 class BaseTransformer(ABC, LoggingMixin):
@@ -22,11 +22,32 @@ class BaseTransformer(ABC, LoggingMixin):
         self.contract_address = EvmAddress(contract_address.lower()) if contract_address else None
         self.name = self.__class__.__name__
         self.handler_map = {}
+        # (contract, event name) -> handler, compiled from handler_map
+        self._plans: Optional[Dict[Tuple[Optional[EvmAddress], str], Callable]] = None
         
         self.log_info("Transformer initialized", 
                      contract_address=self.contract_address,
                      transformer_name=self.name)
     
+    def compile_plans(self) -> Dict[Tuple[Optional[EvmAddress], str], Callable]:
+        """
+        Build the (contract, event name) dispatch table from handler_map.
+
+        Called when the transformer is registered, or on first use. A log that
+        hits the table has already passed _validate_log's name and contract
+        checks, so it goes straight to its handler, which runs its own attribute
+        validation. Anything else (unknown event, other contract, malformed log)
+        takes the generic path with full validation and logging.
+        """
+        self._plans = {
+            (self.contract_address, event_name): handler
+            for event_name, handler in self.handler_map.items()
+        }
+        self.log_debug("Transformer dispatch plans compiled",
+                      transformer_name=self.name,
+                      plans=len(self._plans))
+        return self._plans
+
     def process_logs(self, logs: List[DecodedLog]) -> Tuple[
         Optional[Dict[int, Signal]], Optional[Dict[ErrorId, ProcessingError]]
     ]:
@@ -56,6 +77,10 @@ class BaseTransformer(ABC, LoggingMixin):
                           contract_address=self.contract_address)
             raise ValueError(f"Transformer {self.name} has no handler map configured")
 
+        plans = self._plans if self._plans is not None else self.compile_plans()
+        # Transformers without a contract address accept logs from any contract
+        plan_contract = self.contract_address
+
         try:
             processed_count = 0
             skipped_count = 0
@@ -63,6 +88,13 @@ class BaseTransformer(ABC, LoggingMixin):
             
             for log in logs:
                 try:
+                    # Fast path: a (contract, event) hit already satisfies _validate_log; handlers check attributes
+                    handler = plans.get((plan_contract and log.contract, log.name)) if isinstance(log, DecodedLog) and log.contract else None
+                    if handler is not None:
+                        handler(log, signals, errors)
+                        processed_count += 1
+                        continue
+
                     if not isinstance(log, DecodedLog):
                         self.log_error("Invalid log type in logs list",
                                       log_type=type(log).__name__,
@@ -99,7 +131,7 @@ class BaseTransformer(ABC, LoggingMixin):
                         self.log_debug("No handler found for log",
                                       log_index=log.index,
                                       log_name=log.name,
-                                      available_handlers=list(self.handler_map.keys()),
+                                      available_handlers=lazy(lambda: list(self.handler_map.keys())),
                                       transformer_name=self.name)
 
                 except Exception as e:
@@ -309,6 +341,10 @@ class BaseTransformer(ABC, LoggingMixin):
                           log_index=log_index,
                           transformer_name=self.name)
             raise TypeError("values parameter must be a list")
+        
+        # Common case: nothing null or empty, skip the per-value diagnostics
+        if all(v is not None and v != "" for v in values):
+            return True
             
         null_count = 0
         null_indices = []
@@ -350,6 +386,10 @@ class BaseTransformer(ABC, LoggingMixin):
     
     def _validate_addresses(self, *addresses: str) -> bool:
         """Validate Ethereum addresses"""
+        # Common case: all well formed (zero address included), skip the per-address diagnostics
+        if all(isinstance(addr, str) and len(addr) == 42 and addr.startswith('0x') for addr in addresses):
+            return True
+        
         for i, addr in enumerate(addresses):
             if not addr:
                 self.log_warning("Empty address found in validation", 
@@ -374,6 +414,10 @@ class BaseTransformer(ABC, LoggingMixin):
 
     def _validate_amounts(self, *amounts: Any) -> bool:
         """Validate amount values (accepts both int and string)"""
+        # Common case: non-negative integers, skip the per-amount diagnostics
+        if all(type(amount) is int and amount >= 0 for amount in amounts):
+            return True
+        
         for i, amount in enumerate(amounts):
             # Handle None
             if amount is None:
@@ -14,6 +14,7 @@ from ....types import (
     ErrorId,
 )
 from ....utils.amounts import amount_to_str, is_zero, add_amounts
+from ....core.logging import lazy
 
 
 class LbPairTransformer(PoolTransformer):
@@ -49,7 +50,7 @@ class LbPairTransformer(PoolTransformer):
             self.log_debug(
                 "Starting amount unpacking",
                 amounts_type=type(amounts).__name__,
-                amounts_value=str(amounts)[:100],  # Truncate for readability
+                amounts_value=lazy(lambda: str(amounts)[:100]),  # Truncate for readability
                 amounts_startswith_0x=amounts.startswith("0x") if isinstance(amounts, str) else False
             )
             
@@ -103,7 +104,7 @@ class LbPairTransformer(PoolTransformer):
             self.log_debug(
                 "Extracting swap in/out amounts",
                 log_index=log.index,
-                available_attributes=list(log.attributes.keys())
+                available_attributes=lazy(lambda: list(log.attributes.keys()))
             )
             
             amounts_in = log.attributes.get("amountsIn")
@@ -154,7 +155,7 @@ class LbPairTransformer(PoolTransformer):
             self.log_debug(
                 "Preparing bins and amounts",
                 log_index=log.index,
-                available_attributes=list(log.attributes.keys())
+                available_attributes=lazy(lambda: list(log.attributes.keys()))
             )
             
             ids = log.attributes.get("ids")
@@ -212,7 +213,7 @@ class LbPairTransformer(PoolTransformer):
                 "Preparing bins and packed amounts",
                 log_index=log.index,
                 negative=negative,
-                available_attributes=list(log.attributes.keys())
+                available_attributes=lazy(lambda: list(log.attributes.keys()))
             )
             
             multiplier = -1 if negative else 1
@@ -290,7 +291,7 @@ class LbPairTransformer(PoolTransformer):
             self.log_debug(
                 "Extracting swap attributes",
                 log_index=log.index,
-                available_attributes=list(log.attributes.keys())
+                available_attributes=lazy(lambda: list(log.attributes.keys()))
             )
             
             id_val = int(log.attributes.get("id", 0))
@@ -327,7 +328,7 @@ class LbPairTransformer(PoolTransformer):
             self.log_debug(
                 "Extracting batch transfer attributes",
                 log_index=log.index,
-                available_attributes=list(log.attributes.keys())
+                available_attributes=lazy(lambda: list(log.attributes.keys()))
             )
             
             from_addr = str(log.attributes.get("from", ""))
@@ -14,6 +14,7 @@ from ....types import (
     ErrorId,
 )
 from ....utils.amounts import amount_to_str, is_zero
+from ....core.logging import lazy
 
 
 class PharClPoolTransformer(PoolTransformer):
@@ -44,7 +45,7 @@ class PharClPoolTransformer(PoolTransformer):
                 "Extracting CL swap attributes",
                 log_index=log.index,
                 log_name=log.name,
-                available_attributes=list(log.attributes.keys())
+                available_attributes=lazy(lambda: list(log.attributes.keys()))
             )
             
             base_amount, quote_amount = self._get_amounts(log)
@@ -79,7 +80,7 @@ class PharClPoolTransformer(PoolTransformer):
                 "Extracting CL liquidity attributes",
                 log_index=log.index,
                 log_name=log.name,
-                available_attributes=list(log.attributes.keys())
+                available_attributes=lazy(lambda: list(log.attributes.keys()))
             )
             
             base_amount, quote_amount = self._get_amounts(log)
@@ -116,7 +117,7 @@ class PharClPoolTransformer(PoolTransformer):
                 "Extracting CL collect attributes",
                 log_index=log.index,
                 log_name=log.name,
-                available_attributes=list(log.attributes.keys())
+                available_attributes=lazy(lambda: list(log.attributes.keys()))
             )
             
             base_amount, quote_amount = self._get_amounts(log)
@@ -11,6 +11,7 @@ from ....types import (
     ErrorId,
     EvmAddress,
 )
+from ....core.logging import lazy
 
 
 class TokenTransformer(BaseTransformer):   
@@ -27,7 +28,7 @@ class TokenTransformer(BaseTransformer):
         self.log_info("TokenTransformer initialized",
                      contract_address=self.contract_address,
                      handler_count=len(self.handler_map),
-                     supported_events=list(self.handler_map.keys()),
+                     supported_events=lazy(lambda: list(self.handler_map.keys())),
                      transformer_type="ERC20_Token")
 
     def _get_transfer_attributes(self, log: DecodedLog) -> Tuple[str, str, str, str]:
@@ -11,6 +11,7 @@ class StorageConfig(Struct):
     complete_prefix: str
     processing_format: str
     complete_format: str
+    block_format: str = "json"  # "json" or "msgpack_zstd" for processing/complete blobs
 
 class DatabaseConfig(Struct):
     url: str
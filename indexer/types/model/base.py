@@ -7,6 +7,9 @@ from msgspec import Struct
 
 from ..new import EvmHash, DomainEventId
 
+# Instance __dict__ key holding a DomainEvent's memoized content_id
+_CONTENT_ID_CACHE = "_content_id"
+
 
 class Signal(Struct):
     log_index: int
@@ -19,13 +22,32 @@ class Signal(Struct):
     def to_dict(self) -> Dict[str, Any]:
         return msgspec.structs.asdict(self)
     
-class DomainEvent(Struct):
+class DomainEvent(Struct, dict=True):
+    """
+    Base for domain events.
+
+    content_id hashes the identifying content once per instance and keeps it in
+    the instance __dict__ (dict=True), which msgspec never serializes. Assigning
+    any field drops the cached value.
+    """
     timestamp: int
     tx_hash: EvmHash
 
     @property
     def content_id(self) -> DomainEventId:
-        return self._generate_content_id()
+        cache = self.__dict__
+        content_id = cache.get(_CONTENT_ID_CACHE)
+        if content_id is None:
+            content_id = cache[_CONTENT_ID_CACHE] = self._generate_content_id()
+        return content_id
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self.__dict__.pop(_CONTENT_ID_CACHE, None)
+        Struct.__setattr__(self, name, value)
+
+    def invalidate_content_id(self) -> None:
+        """Drop the cached content_id (after mutating a nested identifying value in place)"""
+        self.__dict__.pop(_CONTENT_ID_CACHE, None)
 
     def _generate_content_id(self) -> str:
         content_struct = self._get_identifying_content()
@@ -1,5 +1,7 @@
 from .dictionary import safe_nested_get
+from .block_ranges import BlockRangeSet
 
 all = [
     "safe_nested_get",
+    "BlockRangeSet",
 ]
\ No newline at end of file
@@ -0,0 +1,250 @@
+# indexer/utils/block_ranges.py
+"""
+Run-length encoded sets of block numbers
+"""
+
+import heapq
+from array import array
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Optional, Tuple, Dict, Any
+
+
+class BlockRangeSet:
+    """
+    Immutable set of block numbers stored as sorted, disjoint, non-adjacent
+    inclusive runs (two int64 arrays of run starts and ends).
+
+    A contiguous range of any length costs 16 bytes, so multi-million block
+    sets that are mostly contiguous take kilobytes instead of a Python int per
+    block, and set operations and gap finding run per run rather than per block.
+    Serializes to job data as a list of [start, end] pairs.
+    """
+
+    __slots__ = ("_starts", "_ends", "_count")
+
+    def __init__(self, ranges: Iterable[Tuple[int, int]] = ()):
+        """Build from (start, end) inclusive ranges in any order, overlapping or not"""
+        self._set_runs(*_coalesce(sorted(ranges)))
+
+    # ------------------------------------------------------------------ builders
+
+    @classmethod
+    def from_sorted_ranges(cls, ranges: Iterable[Tuple[int, int]]) -> "BlockRangeSet":
+        """Build from (start, end) ranges already ordered by start (skips the sort)"""
+        instance = cls.__new__(cls)
+        instance._set_runs(*_coalesce(ranges))
+        return instance
+
+    @classmethod
+    def from_sorted(cls, block_numbers: Iterable[int]) -> "BlockRangeSet":
+        """Build from ascending block numbers (duplicates allowed)"""
+        return cls.from_sorted_ranges((block, block) for block in block_numbers)
+
+    @classmethod
+    def from_blocks(cls, block_numbers: Iterable[int]) -> "BlockRangeSet":
+        return cls.from_sorted(sorted(block_numbers))
+
+    @classmethod
+    def from_json(cls, ranges: List[List[int]]) -> "BlockRangeSet":
+        """Inverse of to_json()"""
+        return cls.from_sorted_ranges((int(start), int(end)) for start, end in ranges)
+
+    @classmethod
+    def from_job_data(cls, job_data: Dict[str, Any]) -> "BlockRangeSet":
+        """Blocks covered by a processing job's data, in any of its formats"""
+        if not job_data:
+            return cls()
+        if 'block_ranges' in job_data:
+            return cls.from_json(job_data['block_ranges'])
+        if 'block_list' in job_data:
+            return cls.from_blocks(int(block) for block in job_data['block_list'])
+        if 'block_number' in job_data:
+            block_number = int(job_data['block_number'])
+            return cls.from_sorted_ranges([(block_number, block_number)])
+        if 'start_block' in job_data and 'end_block' in job_data:
+            return cls.from_sorted_ranges([(int(job_data['start_block']), int(job_data['end_block']))])
+        return cls()
+
+    # ----------------------------------------------------------------- accessors
+
+    @property
+    def first(self) -> Optional[int]:
+        return self._starts[0] if self._starts else None
+
+    @property
+    def last(self) -> Optional[int]:
+        return self._ends[-1] if self._ends else None
+
+    @property
+    def range_count(self) -> int:
+        return len(self._starts)
+
+    def ranges(self) -> Iterator[Tuple[int, int]]:
+        return zip(self._starts, self._ends)
+
+    def to_json(self) -> List[List[int]]:
+        return [[start, end] for start, end in self.ranges()]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __iter__(self) -> Iterator[int]:
+        for start, end in self.ranges():
+            yield from range(start, end + 1)
+
+    def __reversed__(self) -> Iterator[int]:
+        for start, end in zip(reversed(self._starts), reversed(self._ends)):
+            yield from range(end, start - 1, -1)
+
+    def __contains__(self, block_number: int) -> bool:
+        index = bisect_right(self._starts, block_number) - 1
+        return index >= 0 and block_number <= self._ends[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BlockRangeSet):
+            return NotImplemented
+        return self._starts == other._starts and self._ends == other._ends
+
+    def __repr__(self) -> str:
+        shown = ", ".join(
+            f"{start}" if start == end else f"{start}-{end}"
+            for start, end in zip(self._starts[:5], self._ends[:5])
+        )
+        more = ", ..." if len(self._starts) > 5 else ""
+        return f"BlockRangeSet([{shown}{more}], blocks={self._count}, ranges={len(self._starts)})"
+
+    # ---------------------------------------------------------------- operations
+
+    def union(self, *others: "BlockRangeSet") -> "BlockRangeSet":
+        return BlockRangeSet.from_sorted_ranges(
+            heapq.merge(self.ranges(), *(other.ranges() for other in others))
+        )
+
+    def difference(self, other: "BlockRangeSet") -> "BlockRangeSet":
+        runs = []
+        other_starts, other_ends = other._starts, other._ends
+        j = 0
+        for start, end in self.ranges():
+            # Skip exclusions entirely before this run
+            while j < len(other_starts) and other_ends[j] < start:
+                j += 1
+            k = j
+            while start <= end and k < len(other_starts) and other_starts[k] <= end:
+                if other_starts[k] > start:
+                    runs.append((start, other_starts[k] - 1))
+                start = max(start, other_ends[k] + 1)
+                k += 1
+            if start <= end:
+                runs.append((start, end))
+        return BlockRangeSet.from_sorted_ranges(runs)
+
+    def intersection(self, other: "BlockRangeSet") -> "BlockRangeSet":
+        runs = []
+        i = j = 0
+        while i < len(self._starts) and j < len(other._starts):
+            start = max(self._starts[i], other._starts[j])
+            end = min(self._ends[i], other._ends[j])
+            if start <= end:
+                runs.append((start, end))
+            if self._ends[i] < other._ends[j]:
+                i += 1
+            else:
+                j += 1
+        return BlockRangeSet.from_sorted_ranges(runs)
+
+    __or__ = union
+    __sub__ = difference
+    __and__ = intersection
+
+    def span(self, start_block: Optional[int] = None, end_block: Optional[int] = None) -> "BlockRangeSet":
+        """Blocks within start_block..end_block inclusive"""
+        low = self.first if start_block is None else start_block
+        high = self.last if end_block is None else end_block
+        if low is None or high is None or low > high:
+            return BlockRangeSet()
+        return self.intersection(BlockRangeSet.from_sorted_ranges([(low, high)]))
+
+    def gaps(self, start_block: Optional[int] = None, end_block: Optional[int] = None) -> "BlockRangeSet":
+        """Blocks missing from start_block..end_block (defaults to first..last)"""
+        low = self.first if start_block is None else start_block
+        high = self.last if end_block is None else end_block
+        if low is None or high is None or low > high:
+            return BlockRangeSet()
+        return BlockRangeSet.from_sorted_ranges([(low, high)]).difference(self)
+
+    def head(self, count: int) -> "BlockRangeSet":
+        """The lowest count blocks"""
+        runs = []
+        remaining = count
+        for start, end in self.ranges():
+            if remaining <= 0:
+                break
+            end = min(end, start + remaining - 1)
+            runs.append((start, end))
+            remaining -= end - start + 1
+        return BlockRangeSet.from_sorted_ranges(runs)
+
+    def tail(self, count: int) -> "BlockRangeSet":
+        """The highest count blocks"""
+        runs = []
+        remaining = count
+        for start, end in zip(reversed(self._starts), reversed(self._ends)):
+            if remaining <= 0:
+                break
+            start = max(start, end - remaining + 1)
+            runs.append((start, end))
+            remaining -= end - start + 1
+        runs.reverse()
+        return BlockRangeSet.from_sorted_ranges(runs)
+
+    def chunks(self, size: int, reverse: bool = False) -> Iterator["BlockRangeSet"]:
+        """Split into consecutive sets of size blocks, from the highest blocks down if reverse"""
+        if size <= 0:
+            raise ValueError("Chunk size must be positive")
+
+        runs = []
+        remaining = size
+        if reverse:
+            source = zip(reversed(self._starts), reversed(self._ends))
+        else:
+            source = self.ranges()
+
+        for start, end in source:
+            while start <= end:
+                if reverse:
+                    piece_start, piece_end = max(start, end - remaining + 1), end
+                    end = piece_start - 1
+                else:
+                    piece_start, piece_end = start, min(end, start + remaining - 1)
+                    start = piece_end + 1
+                runs.append((piece_start, piece_end))
+                remaining -= piece_end - piece_start + 1
+                if remaining == 0:
+                    yield BlockRangeSet.from_sorted_ranges(sorted(runs) if reverse else runs)
+                    runs = []
+                    remaining = size
+        if runs:
+            yield BlockRangeSet.from_sorted_ranges(sorted(runs) if reverse else runs)
+
+    def _set_runs(self, starts: array, ends: array) -> None:
+        self._starts = starts
+        self._ends = ends
+        self._count = sum(ends) - sum(starts) + len(starts)
+
+
+def _coalesce(ranges: Iterable[Tuple[int, int]]) -> Tuple[array, array]:
+    """Merge ranges ordered by start into disjoint, non-adjacent runs"""
+    starts, ends = array('q'), array('q')
+    for start, end in ranges:
+        if end < start:
+            continue
+        if ends and start <= ends[-1] + 1:
+            if end > ends[-1]:
+                ends[-1] = end
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
@@ -23,9 +23,10 @@ from indexer.database.connection import SharedDatabaseManager, ModelDatabaseMana
 class ProperLiquidityMigrator:
     """Migrate liquidity table using proper DI container setup."""
     
-    def __init__(self, v1_db_name: str = "blub_test", v2_db_name: str = "blub_test_v2"):
+    def __init__(self, v1_db_name: str = "blub_test", v2_db_name: str = "blub_test_v2", use_copy: bool = False):
         self.v1_db_name = v1_db_name
         self.v2_db_name = v2_db_name
+        self.use_copy = use_copy
         
         print(f"🔧 Initializing liquidity migration")
         print(f"   V1 DB: {v1_db_name}")
@@ -223,7 +224,11 @@ class ProperLiquidityMigrator:
                 print(f"   Cleared existing v2 data")
                 
                 # Insert new data
-                if rows_to_migrate:
+                if rows_to_migrate and self.use_copy:
+                    from indexer.database.writers.copy_loader import CopyBulkLoader
+                    inserted = CopyBulkLoader().load(v2_conn, "liquidity", rows_to_migrate, bind_types=False)
+                    print(f"   Loaded {inserted} rows into v2 via COPY")
+                elif rows_to_migrate:
                     v2_conn.execute(insert_query, rows_to_migrate)
                     print(f"   Inserted {len(rows_to_migrate)} rows into v2")
                 else:
@@ -373,9 +378,10 @@ def main():
     parser = argparse.ArgumentParser(description="Migrate liquidity table from v1 to v2")
     parser.add_argument("--v1-db", default="blub_test", help="V1 database name")
     parser.add_argument("--v2-db", default="blub_test_v2", help="V2 database name")
+    parser.add_argument("--use-copy", action="store_true", help="Load rows with PostgreSQL COPY instead of INSERT")
     args = parser.parse_args()
     
-    migrator = ProperLiquidityMigrator(v1_db_name=args.v1_db, v2_db_name=args.v2_db)
+    migrator = ProperLiquidityMigrator(v1_db_name=args.v1_db, v2_db_name=args.v2_db, use_copy=args.use_copy)
     result = migrator.run_full_migration()
     
     if not result["success"]:
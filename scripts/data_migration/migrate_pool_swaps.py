@@ -19,9 +19,10 @@ if str(PROJECT_ROOT) not in sys.path:
 class PoolSwapsMigrator:
     """Migrate pool_swaps table from v1 to v2 database."""
     
-    def __init__(self, v1_db_name: str = "blub_test", v2_db_name: str = "blub_test_v2"):
+    def __init__(self, v1_db_name: str = "blub_test", v2_db_name: str = "blub_test_v2", use_copy: bool = False):
         self.v1_db_name = v1_db_name
         self.v2_db_name = v2_db_name
+        self.use_copy = use_copy
         
         print(f"🔧 Initializing pool_swaps migration")
         print(f"   V1 DB: {v1_db_name}")
@@ -224,7 +225,11 @@ class PoolSwapsMigrator:
                 print(f"   Cleared existing v2 data")
                 
                 # Insert new data
-                if rows_to_migrate:
+                if rows_to_migrate and self.use_copy:
+                    from indexer.database.writers.copy_loader import CopyBulkLoader
+                    inserted = CopyBulkLoader().load(v2_conn, "pool_swaps", rows_to_migrate, bind_types=False)
+                    print(f"   Loaded {inserted} rows into v2 via COPY")
+                elif rows_to_migrate:
                     v2_conn.execute(insert_query, rows_to_migrate)
                     print(f"   Inserted {len(rows_to_migrate)} rows into v2")
                 else:
@@ -387,9 +392,10 @@ def main():
     parser = argparse.ArgumentParser(description="Migrate pool_swaps table from v1 to v2")
     parser.add_argument("--v1-db", default="blub_test", help="V1 database name")
     parser.add_argument("--v2-db", default="blub_test_v2", help="V2 database name")
+    parser.add_argument("--use-copy", action="store_true", help="Load rows with PostgreSQL COPY instead of INSERT")
     args = parser.parse_args()
     
-    migrator = PoolSwapsMigrator(v1_db_name=args.v1_db, v2_db_name=args.v2_db)
+    migrator = PoolSwapsMigrator(v1_db_name=args.v1_db, v2_db_name=args.v2_db, use_copy=args.use_copy)
     result = migrator.run_full_migration()
     
     if not result["success"]:
@@ -26,9 +26,10 @@ if str(PROJECT_ROOT) not in sys.path:
 class PositionsMigrator:
     """Migrate positions table from v1 to v2 database."""
     
-    def __init__(self, v1_db_name: str = "blub_test", v2_db_name: str = "blub_test_v2"):
+    def __init__(self, v1_db_name: str = "blub_test", v2_db_name: str = "blub_test_v2", use_copy: bool = False):
         self.v1_db_name = v1_db_name
         self.v2_db_name = v2_db_name
+        self.use_copy = use_copy
         
         print(f"🔧 Initializing positions migration")
         print(f"   V1 DB: {v1_db_name}")
@@ -221,7 +222,11 @@ class PositionsMigrator:
                 print(f"   Cleared existing v2 data")
                 
                 # Insert new data
-                if rows_to_migrate:
+                if rows_to_migrate and self.use_copy:
+                    from indexer.database.writers.copy_loader import CopyBulkLoader
+                    inserted = CopyBulkLoader().load(v2_conn, "positions", rows_to_migrate, bind_types=False)
+                    print(f"   Loaded {inserted} rows into v2 via COPY")
+                elif rows_to_migrate:
                     v2_conn.execute(insert_query, rows_to_migrate)
                     print(f"   Inserted {len(rows_to_migrate)} rows into v2")
                 else:
@@ -431,7 +436,13 @@ class PositionsMigrator:
 
 def main():
     """Main entry point."""
-    migrator = PositionsMigrator()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Migrate positions table from v1 to v2 database")
+    parser.add_argument("--use-copy", action="store_true", help="Load rows with PostgreSQL COPY instead of INSERT")
+    args = parser.parse_args()
+    
+    migrator = PositionsMigrator(use_copy=args.use_copy)
     migrator.run_full_migration()
 
 
@@ -0,0 +1,57 @@
+# testing/benchmarks/__init__.py
+"""
+Micro-benchmarks for hot paths in the indexing pipeline.
+
+Each benchmark compares the current implementation against a reference
+version of the previous code path and checks that both produce the same
+output before reporting timings.
+"""
+
+import time
+from pathlib import Path
+from typing import Callable, Optional, Tuple, Any
+
+import msgspec
+
+from indexer.types import EvmFilteredBlock, Block
+
+
+def time_call(func: Callable[[], Any], iterations: int = 5) -> Tuple[float, Any]:
+    """Run func `iterations` times and return (best seconds, last result)."""
+    best = float('inf')
+    result = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def load_raw_block(env, block_number: Optional[int] = None, block_file: Optional[str] = None) -> Optional[EvmFilteredBlock]:
+    """Load a recorded EvmFilteredBlock from a local JSON file or from GCS rpc storage."""
+    if block_file:
+        return msgspec.json.decode(Path(block_file).read_bytes(), type=EvmFilteredBlock)
+
+    from indexer.storage.gcs_handler import GCSHandler
+    primary_source = env.get_config().get_primary_source()
+    return env.get_service(GCSHandler).get_rpc_block(block_number, source=primary_source)
+
+
+def load_block(block_file: str) -> Block:
+    """Load a decoded/processed Block from a local JSON file."""
+    return msgspec.json.decode(Path(block_file).read_bytes(), type=Block)
+
+
+def print_comparison(label: str, before: float, after: float, units: int, unit_name: str) -> None:
+    """Print before/after throughput for a benchmark."""
+    before_rate = units / before if before > 0 else 0
+    after_rate = units / after if after > 0 else 0
+    speedup = before / after if after > 0 else 0
+    print(f"\n📊 {label}")
+    print("─" * 60)
+    print(f"   Before: {before * 1000:10.2f} ms  ({before_rate:12,.0f} {unit_name}/sec)")
+    print(f"   After:  {after * 1000:10.2f} ms  ({after_rate:12,.0f} {unit_name}/sec)")
+    print(f"   Speedup: {speedup:.2f}x")
+
+
+__all__ = ['time_call', 'load_raw_block', 'load_block', 'print_comparison']
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# testing/benchmarks/analytics_benchmark.py
+
+"""
+Analytics Benchmark
+
+Computes OHLC candles and protocol volumes for an asset over recent
+five-minute periods two ways: the previous per-period path (one trade detail
+query per period and denomination, OHLC folded in Python by the previous
+_calculate_ohlc_from_trades, kept here unchanged) and the set-based
+aggregations CalculationService now uses (one window-function query for all
+periods and denominations). Read-only: nothing is written to asset_price or
+asset_volume. Checks both produce identical results before reporting timings.
+
+The previous repository queries could not run against the current schema; the
+reference functions below note the minimal changes made to them.
+"""
+
+import sys
+import time
+from collections import defaultdict
+from decimal import Decimal
+from pathlib import Path
+
+# Add project root to Python path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import and_, func
+
+from testing import get_testing_environment
+from testing.benchmarks import time_call, print_comparison
+from indexer.database.connection import ModelDatabaseManager, SharedDatabaseManager
+from indexer.database.model.tables import DBTrade, DBTradeDetail, DBPoolSwap, DBPoolSwapDetail
+from indexer.database.shared.tables.periods import DBPeriod
+from indexer.database.types import PeriodType, PricingDenomination
+from indexer.services.calculation_service import CalculationService, _rollup_protocol_volumes
+
+DENOMINATIONS = [PricingDenomination.USD, PricingDenomination.AVAX]
+
+
+def reference_calculate_ohlc_from_trades(trade_details, denomination):
+    """Previous CalculationService._calculate_ohlc_from_trades, unchanged"""
+    if not trade_details:
+        return None
+    
+    # Sort by timestamp
+    sorted_trades = sorted(trade_details, key=lambda t: t.timestamp)
+    
+    prices = []
+    total_volume = Decimal('0')
+    
+    for trade in sorted_trades:
+        if denomination == PricingDenomination.USD:
+            price = trade.price_usd
+            volume = trade.volume_usd
+        else:
+            price = trade.price_avax  
+            volume = trade.volume_avax
+        
+        if price and volume:
+            prices.append(price)
+            total_volume += volume
+    
+    if not prices:
+        return None
+    
+    return {
+        'open_price': prices[0],
+        'high_price': max(prices),
+        'low_price': min(prices),
+        'close_price': prices[-1],
+        'volume': total_volume,
+        'trade_count': len(prices)
+    }
+
+
+def reference_trades_in_period(session, time_open, time_close, asset_address, denomination):
+    """
+    Previous TradeDetailRepository.get_trades_in_period, one query per period and denomination.
+    
+    The original joined DBPeriod on a nonexistent id column from the model session
+    (periods live in the shared database), so the period bounds are passed in. Rows
+    carry the price_<denom>/volume_<denom> names the original OHLC fold reads.
+    Ties on timestamp are ordered by content_id, as in get_period_ohlc.
+    """
+    suffix = 'usd' if denomination == PricingDenomination.USD else 'avax'
+    return session.query(
+        DBTrade.timestamp,
+        DBTradeDetail.price.label(f'price_{suffix}'),
+        DBTradeDetail.value.label(f'volume_{suffix}')
+    ).join(
+        DBTrade, DBTradeDetail.content_id == DBTrade.content_id
+    ).filter(
+        and_(
+            DBTrade.timestamp >= time_open,
+            DBTrade.timestamp <= time_close,
+            DBTrade.base_token == asset_address.lower(),
+            DBTradeDetail.denom == denomination
+        )
+    ).order_by(DBTrade.timestamp, DBTrade.content_id).all()
+
+
+def reference_ohlc(session, asset_address, periods):
+    """Previous per-period path: one trade detail query per period and denomination, OHLC folded in Python"""
+    candles = {}
+    for period_id, time_open, time_close in periods:
+        for denom in DENOMINATIONS:
+            trade_details = reference_trades_in_period(session, time_open, time_close, asset_address, denom)
+            ohlc = reference_calculate_ohlc_from_trades(trade_details, denom)
+            if ohlc:
+                candles[(period_id, denom)] = (
+                    ohlc['open_price'], ohlc['high_price'], ohlc['low_price'],
+                    ohlc['close_price'], ohlc['volume'], ohlc['trade_count']
+                )
+    return candles
+
+
+def reference_protocol_volumes(session, asset_address, periods, pool_protocols):
+    """
+    Previous per-period path: one swap detail aggregation per period and denomination.
+    
+    The original PoolSwapDetailRepository.get_protocol_volume_aggregation cannot run:
+    it joins the shared database contracts table from the model session, filters on
+    an undefined Period name and on nonexistent pool_swaps asset_in/asset_out columns,
+    and returns 'volume' where the caller read 'total_volume'. This keeps its shape
+    (one grouped query per period and denomination, base_token for the asset) and maps
+    pools to protocols with the same address project lookup as the set-based path.
+    """
+    volumes = defaultdict(lambda: Decimal('0'))
+    for period_id, time_open, time_close in periods:
+        for denom in DENOMINATIONS:
+            pool_volumes = session.query(
+                DBPoolSwap.pool,
+                func.sum(DBPoolSwapDetail.value)
+            ).join(
+                DBPoolSwap, DBPoolSwapDetail.content_id == DBPoolSwap.content_id
+            ).filter(
+                and_(
+                    DBPoolSwap.timestamp >= time_open,
+                    DBPoolSwap.timestamp <= time_close,
+                    DBPoolSwap.base_token == asset_address.lower(),
+                    DBPoolSwapDetail.denom == denom
+                )
+            ).group_by(DBPoolSwap.pool).all()
+
+            for pool, volume in pool_volumes:
+                protocol = pool_protocols.get(str(pool).lower())
+                if protocol is not None:
+                    volumes[(period_id, denom, protocol.lower())] += volume
+    return dict(volumes)
+
+
+class AnalyticsBenchmark:
+    """Benchmark per-period vs set-based OHLC and protocol volume aggregation."""
+
+    def __init__(self, model_name: str = None):
+        self.env = get_testing_environment(model_name=model_name)
+        self.shared_db = self.env.get_service(SharedDatabaseManager)
+        self.model_db = self.env.get_service(ModelDatabaseManager)
+        self.calculation_service = CalculationService(self.shared_db, self.model_db)
+        self.trade_detail_repo = self.model_db.get_trade_detail_repo()
+        self.pool_swap_detail_repo = self.model_db.get_pool_swap_detail_repo()
+
+    def load_periods(self, days: float):
+        cutoff = int(time.time() - days * 86400)
+        with self.shared_db.get_session() as session:
+            rows = session.query(DBPeriod.time_open).filter(
+                DBPeriod.period_type == PeriodType.FIVE_MINUTES,
+                DBPeriod.time_open >= cutoff
+            ).all()
+        return self.calculation_service._get_periods([time_open for time_open, in rows])
+
+    def set_based_ohlc(self, session, asset_address, periods):
+        rows = self.trade_detail_repo.get_period_ohlc(
+            session, asset_address, periods, DENOMINATIONS, missing_only=False
+        )
+        return {(row[0], row[1]): tuple(row[2:]) for row in rows}
+
+    def set_based_protocol_volumes(self, session, asset_address, periods, pool_protocols):
+        pool_volumes = self.pool_swap_detail_repo.get_period_pool_volumes(
+            session, asset_address, periods, DENOMINATIONS
+        )
+        return _rollup_protocol_volumes(pool_volumes, pool_protocols)
+
+    def run(self, asset_address: str, days: float = 1.0, iterations: int = 3) -> bool:
+        print(f"⏱️ Analytics Benchmark")
+        print("=" * 60)
+
+        periods = self.load_periods(days)
+        if not periods:
+            print(f"❌ No five-minute periods in the last {days} days")
+            return False
+
+        print(f"   Asset: {asset_address}")
+        print(f"   Periods: {len(periods):,}")
+
+        with self.model_db.get_session() as session:
+            pools = {pool for pool, in session.query(DBPoolSwap.pool.distinct()).filter(
+                DBPoolSwap.base_token == asset_address.lower()
+            ).all()}
+            pool_protocols = self.calculation_service._get_pool_protocols(pools)
+
+            before, reference_candles = time_call(
+                lambda: reference_ohlc(session, asset_address, periods), iterations
+            )
+            after, candles = time_call(
+                lambda: self.set_based_ohlc(session, asset_address, periods), iterations
+            )
+            print_comparison(f"OHLC candles ({len(candles):,})", before, after, len(periods), "periods")
+
+            before, reference_volumes = time_call(
+                lambda: reference_protocol_volumes(session, asset_address, periods, pool_protocols), iterations
+            )
+            after, volumes = time_call(
+                lambda: self.set_based_protocol_volumes(session, asset_address, periods, pool_protocols), iterations
+            )
+            print_comparison(f"Protocol volumes ({len(volumes):,})", before, after, len(periods), "periods")
+
+        identical = True
+        if candles != reference_candles:
+            mismatched = set(candles.items()) ^ set(reference_candles.items())
+            print(f"\n❌ OHLC differs for {len({key for key, _ in mismatched})} period/denomination pairs")
+            identical = False
+        if volumes != reference_volumes:
+            mismatched = set(volumes.items()) ^ set(reference_volumes.items())
+            print(f"\n❌ Protocol volume differs for {len({key for key, _ in mismatched})} records")
+            identical = False
+
+        if not identical:
+            return False
+
+        print(f"\n✅ Candles and protocol volumes identical")
+        return True
+
+
+def main():
+    """Run analytics benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark set-based OHLC and protocol volume aggregation')
+    parser.add_argument('asset_address', help='Asset address (trade/swap base token)')
+    parser.add_argument('--days', type=float, default=1.0, help='Five-minute periods from the last N days')
+    parser.add_argument('--iterations', type=int, default=3, help='Timing iterations (best is reported)')
+    parser.add_argument('--model', help='Model name (defaults to env var)')
+    args = parser.parse_args()
+
+    benchmark = AnalyticsBenchmark(model_name=args.model)
+    success = benchmark.run(args.asset_address, args.days, args.iterations)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
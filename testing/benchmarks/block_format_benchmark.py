@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# testing/benchmarks/block_format_benchmark.py
+
+"""
+Block Storage Format Benchmark
+
+Compares the JSON and msgpack+zstd storage encodings of processed Blocks:
+encode time, decode time and stored bytes. Uses the block_data recorded in
+the analysis files under testing/output by default.
+"""
+
+import sys
+import json
+from pathlib import Path
+from typing import List, Tuple
+
+# Add project root to Python path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import msgspec
+
+from testing.benchmarks import time_call, load_block, print_comparison
+from indexer.types import Block
+from indexer.storage.block_format import encode_block, decode_block, JSON_FORMAT, MSGPACK_ZSTD_FORMAT
+
+DEFAULT_OUTPUT_DIR = PROJECT_ROOT / "testing" / "output"
+
+
+def load_sample_blocks(output_dir: Path) -> List[Tuple[str, Block]]:
+    """Load block_data from analysis files (one per block number, newest file wins)."""
+    blocks = {}
+    for analysis_file in sorted(output_dir.glob("*/analysis_*.json")):
+        block_data = json.loads(analysis_file.read_text()).get("gcs_data", {}).get("block_data")
+        if block_data:
+            blocks[analysis_file.parent.name] = msgspec.convert(block_data, type=Block, strict=False)
+    return sorted(blocks.items())
+
+
+class BlockFormatBenchmark:
+    """Benchmark block storage encodings."""
+
+    def run(self, blocks: List[Tuple[str, Block]], iterations: int = 20) -> bool:
+        print(f"⏱️ Block Storage Format Benchmark")
+        print("=" * 60)
+
+        if not blocks:
+            print(f"❌ No sample blocks found")
+            return False
+
+        print(f"   Blocks: {len(blocks)}")
+        block_structs = [block for _, block in blocks]
+
+        json_encode, json_data = time_call(
+            lambda: [encode_block(block, JSON_FORMAT) for block in block_structs], iterations)
+        binary_encode, binary_data = time_call(
+            lambda: [encode_block(block, MSGPACK_ZSTD_FORMAT) for block in block_structs], iterations)
+
+        json_decode, json_blocks = time_call(
+            lambda: [decode_block(data, Block) for data in json_data], iterations)
+        binary_decode, binary_blocks = time_call(
+            lambda: [decode_block(data, Block) for data in binary_data], iterations)
+
+        print(f"\n📦 Stored size")
+        print("─" * 60)
+        print(f"   {'Block':<12} {'JSON':>10} {'msgpack+zstd':>14} {'Ratio':>8}")
+        for (name, _), json_bytes, binary_bytes in zip(blocks, json_data, binary_data):
+            print(f"   {name:<12} {len(json_bytes):>10,} {len(binary_bytes):>14,} {len(json_bytes) / len(binary_bytes):>7.1f}x")
+        json_total = sum(len(data) for data in json_data)
+        binary_total = sum(len(data) for data in binary_data)
+        print(f"   {'Total':<12} {json_total:>10,} {binary_total:>14,} {json_total / binary_total:>7.1f}x")
+
+        # Before = JSON, After = msgpack+zstd
+        print_comparison("Encode (json -> msgpack+zstd)", json_encode, binary_encode, len(blocks), "blocks")
+        print_comparison("Decode (json -> msgpack+zstd)", json_decode, binary_decode, len(blocks), "blocks")
+
+        mismatches = [
+            name for (name, block), json_block, binary_block in zip(blocks, json_blocks, binary_blocks)
+            if not (block == json_block == binary_block)
+        ]
+        if mismatches:
+            print(f"\n❌ Round trip differs for blocks: {', '.join(mismatches)}")
+            return False
+
+        print(f"\n✅ Both formats round trip identically")
+        return True
+
+
+def main():
+    """Run block format benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark JSON vs msgpack+zstd block storage')
+    parser.add_argument('block_files', nargs='*', help='Processed Block JSON files (defaults to testing/output samples)')
+    parser.add_argument('--output-dir', default=str(DEFAULT_OUTPUT_DIR), help='Analysis output directory to sample')
+    parser.add_argument('--iterations', type=int, default=20, help='Timing iterations (best is reported)')
+    args = parser.parse_args()
+
+    if args.block_files:
+        blocks = [(Path(block_file).stem, load_block(block_file)) for block_file in args.block_files]
+    else:
+        blocks = load_sample_blocks(Path(args.output_dir))
+
+    benchmark = BlockFormatBenchmark()
+    success = benchmark.run(blocks, args.iterations)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
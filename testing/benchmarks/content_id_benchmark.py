@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# testing/benchmarks/content_id_benchmark.py
+
+"""
+Content ID Benchmark
+
+Transforms one recorded block and reads every event and position content_id
+the way persistence does, comparing the memoized DomainEvent.content_id
+against the previous property that re-hashed on every access. Reports the
+number of content hashes computed by each.
+"""
+
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add project root to Python path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from testing import get_testing_environment
+from testing.benchmarks import time_call, load_raw_block, print_comparison
+from indexer.decode.block_decoder import BlockDecoder
+from indexer.transform.manager import TransformManager
+from indexer.types.model.base import DomainEvent
+
+
+class HashCounter:
+    """Counts DomainEvent._generate_content_id calls while installed."""
+
+    def __init__(self):
+        self.count = 0
+        self._original = DomainEvent._generate_content_id
+
+    @contextmanager
+    def installed(self):
+        original = self._original
+        counter = self
+
+        def counting_generate(event):
+            counter.count += 1
+            return original(event)
+
+        DomainEvent._generate_content_id = counting_generate
+        try:
+            yield self
+        finally:
+            DomainEvent._generate_content_id = original
+
+
+@contextmanager
+def unmemoized_content_id():
+    """Reference: previous content_id property hashing on every access."""
+    memoized = DomainEvent.__dict__["content_id"]
+    DomainEvent.content_id = property(lambda event: event._generate_content_id())
+    try:
+        yield
+    finally:
+        DomainEvent.content_id = memoized
+
+
+class ContentIdBenchmark:
+    """Benchmark content_id hashing over a block transform."""
+
+    def __init__(self, model_name: str = None):
+        self.env = get_testing_environment(model_name=model_name)
+        self.block_decoder = self.env.get_service(BlockDecoder)
+        self.transform_manager = self.env.get_service(TransformManager)
+
+    def transform_and_collect(self, decoded_block):
+        """Transform every transaction, then read ids as the writer and storage save do."""
+        content_ids = []
+        for transaction in decoded_block.transactions.values():
+            _, transformed_tx = self.transform_manager.process_transaction(transaction)
+            for event in (transformed_tx.events or {}).values():
+                content_ids.append(event.content_id)
+                for position in (getattr(event, "positions", None) or {}).values():
+                    content_ids.append(position.content_id)
+            for position in (transformed_tx.positions or {}).values():
+                content_ids.append(position.content_id)
+        return content_ids
+
+    def run(self, block_number: int = None, block_file: str = None, iterations: int = 5) -> bool:
+        print(f"⏱️ Content ID Benchmark")
+        print("=" * 60)
+
+        raw_block = load_raw_block(self.env, block_number, block_file)
+        if not raw_block:
+            print(f"❌ Block not found")
+            return False
+
+        decoded_block = self.block_decoder.decode_block(raw_block)
+        print(f"   Transactions in block: {len(decoded_block.transactions or {})}")
+
+        # Warm transformer and contract caches so both paths measure the same work
+        self.transform_and_collect(decoded_block)
+
+        with unmemoized_content_id(), HashCounter().installed() as before_counter:
+            before_ids = self.transform_and_collect(decoded_block)
+        with HashCounter().installed() as after_counter:
+            after_ids = self.transform_and_collect(decoded_block)
+
+        with unmemoized_content_id():
+            before, _ = time_call(lambda: self.transform_and_collect(decoded_block), iterations)
+        after, _ = time_call(lambda: self.transform_and_collect(decoded_block), iterations)
+
+        print(f"\n🔑 Content hashes per transform")
+        print("─" * 60)
+        print(f"   Content ids read: {len(after_ids):,}")
+        print(f"   Before: {before_counter.count:,} hashes")
+        print(f"   After:  {after_counter.count:,} hashes")
+
+        print_comparison("Block transform", before, after, len(decoded_block.transactions or {}), "txs")
+
+        if before_ids != after_ids:
+            print(f"\n❌ Content ids differ between implementations")
+            return False
+
+        print(f"\n✅ Content ids identical")
+        return True
+
+
+def main():
+    """Run content id benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark memoized content_id over a block transform')
+    parser.add_argument('block_number', type=int, nargs='?', help='Block number to load from rpc storage')
+    parser.add_argument('--block-file', help='Path to recorded EvmFilteredBlock JSON (skips GCS)')
+    parser.add_argument('--iterations', type=int, default=5, help='Timing iterations (best is reported)')
+    parser.add_argument('--model', help='Model name (defaults to env var)')
+    args = parser.parse_args()
+
+    if args.block_number is None and not args.block_file:
+        parser.error("block_number or --block-file is required")
+
+    benchmark = ContentIdBenchmark(model_name=args.model)
+    success = benchmark.run(args.block_number, args.block_file, args.iterations)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# testing/benchmarks/log_decoder_benchmark.py
+
+"""
+Log Decoder Benchmark
+
+Compares LogDecoder's topic0-indexed decode against the previous linear
+scan over every event ABI of the contract, over one recorded block.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import msgspec
+from web3._utils.events import get_event_data
+
+from testing import get_testing_environment
+from testing.benchmarks import time_call, load_raw_block, print_comparison
+from indexer.contracts.manager import ContractManager
+from indexer.decode.log_decoder import LogDecoder
+
+
+class LogDecoderBenchmark:
+    """Benchmark log decoding over a recorded EvmFilteredBlock."""
+
+    def __init__(self, model_name: str = None):
+        self.env = get_testing_environment(model_name=model_name)
+        self.contract_manager = self.env.get_service(ContractManager)
+        self.decoder = LogDecoder(self.contract_manager)
+
+    def linear_scan_decode(self, log):
+        """Reference: previous implementation trying each event ABI in turn."""
+        if not log.address:
+            return None
+        contract = self.contract_manager.get_contract(log.address)
+        if not contract:
+            return None
+
+        event_abis = [abi for abi in contract.abi if abi["type"] == "event"]
+        log_dict = msgspec.structs.asdict(log)
+        for event_abi in event_abis:
+            try:
+                event_data = get_event_data(self.decoder.w3.codec, event_abi, log_dict)
+                return event_data["event"]
+            except Exception:
+                continue
+        return None
+
+    def run(self, block_number: int = None, block_file: str = None, iterations: int = 5) -> bool:
+        print(f"⏱️ Log Decoder Benchmark")
+        print("=" * 60)
+
+        raw_block = load_raw_block(self.env, block_number, block_file)
+        if not raw_block:
+            print(f"❌ Block not found")
+            return False
+
+        logs = [log for receipt in raw_block.receipts if receipt for log in receipt.logs]
+        print(f"   Logs in block: {len(logs)}")
+
+        # Warm contract and event index caches so both paths measure decode only
+        for log in logs:
+            self.linear_scan_decode(log)
+            self.decoder.decode(log)
+
+        before, before_names = time_call(lambda: [self.linear_scan_decode(log) for log in logs], iterations)
+        after, after_results = time_call(lambda: [self.decoder.decode(log) for log in logs], iterations)
+
+        after_names = [getattr(result, 'name', None) for result in after_results]
+        mismatches = [
+            (log.logIndex, old, new) for log, old, new in zip(logs, before_names, after_names)
+            if old != new
+        ]
+
+        print_comparison("Log decode throughput", before, after, len(logs), "logs")
+
+        if mismatches:
+            # Linear scan can pick the first ABI with a matching shape regardless of topic0
+            print(f"\n⚠️ {len(mismatches)} logs decoded differently:")
+            for log_index, old, new in mismatches[:10]:
+                print(f"   • log {log_index}: linear={old} indexed={new}")
+        else:
+            print(f"\n✅ Decoded event names identical")
+
+        return True
+
+
+def main():
+    """Run log decoder benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark LogDecoder over a recorded block')
+    parser.add_argument('block_number', type=int, nargs='?', help='Block number to load from rpc storage')
+    parser.add_argument('--block-file', help='Path to recorded EvmFilteredBlock JSON (skips GCS)')
+    parser.add_argument('--iterations', type=int, default=5, help='Timing iterations (best is reported)')
+    parser.add_argument('--model', help='Model name (defaults to env var)')
+    args = parser.parse_args()
+
+    if args.block_number is None and not args.block_file:
+        parser.error("block_number or --block-file is required")
+
+    benchmark = LogDecoderBenchmark(model_name=args.model)
+    success = benchmark.run(args.block_number, args.block_file, args.iterations)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# testing/benchmarks/logging_benchmark.py
+
+"""
+Logging Overhead Benchmark
+
+Transforms one recorded block at different log levels and reports the
+per-transaction transform time: INFO, INFO with hot path quiet mode, and
+WARNING. Emitted records are formatted and written to os.devnull so the
+cost of handlers is included without flooding the console.
+
+Also times IndexingPipeline's per-block path (_transform_block and
+_save_to_storage) at the same levels, against the previous eager INFO
+"About to save to GCS" payload. Storage writes are discarded so only
+pipeline and logging time is measured; nothing is written to GCS or the
+database.
+"""
+
+import os
+import sys
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add project root to Python path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from testing import get_testing_environment
+from testing.benchmarks import time_call, load_raw_block, print_comparison
+from indexer.core.logging import IndexerLogger, IndexerFormatter, log_with_context, INFO
+from indexer.clients.quicknode_rpc import QuickNodeRpcClient
+from indexer.database.repository_manager import RepositoryManager
+from indexer.database.writers.domain_event_writer import DomainEventWriter
+from indexer.decode.block_decoder import BlockDecoder
+from indexer.pipeline.indexing_pipeline import IndexingPipeline
+from indexer.storage.gcs_handler import GCSHandler
+from indexer.transform.manager import TransformManager
+
+LEVELS = (("INFO", "INFO", False),
+          ("INFO + hot path quiet", "INFO", True),
+          ("WARNING", "WARNING", False))
+
+
+class DiscardingStorage:
+    """Accepts block saves without writing, so storage I/O stays out of the timings."""
+
+    def save_processing_block(self, block_number, block) -> bool:
+        return True
+
+    def save_complete_block(self, block_number, block) -> bool:
+        return True
+
+
+def reference_save_log(logger, transformed_block):
+    """Previous IndexingPipeline._save_to_storage payload, built eagerly and logged at INFO"""
+    total_events = sum(len(tx.events or {}) for tx in transformed_block.transactions.values())
+    total_positions = sum(len(tx.positions or {}) for tx in transformed_block.transactions.values())
+
+    sample_transaction = None
+    if transformed_block.transactions:
+        sample_tx = next(iter(transformed_block.transactions.values()))
+        sample_transaction = {
+            'events_count': len(sample_tx.events or {}),
+            'positions_count': len(sample_tx.positions or {}),
+            'events_types': [type(event).__name__ for event in (sample_tx.events or {}).values()],
+            'sample_event': str(list(sample_tx.events.values())[:1]) if sample_tx.events else "None"
+        }
+
+    log_with_context(
+        logger, INFO, "🔍 DEBUG: About to save to GCS",
+        block_number=transformed_block.block_number,
+        total_events=total_events,
+        total_positions=total_positions,
+        sample_transaction=sample_transaction
+    )
+
+
+@contextmanager
+def log_setup(level: str, hot_path_quiet: bool = False):
+    """Route indexer logs to os.devnull at the given level, restoring afterwards."""
+    root_logger = logging.getLogger('indexer')
+    saved_handlers = root_logger.handlers[:]
+    saved_level = logging.getLevelName(root_logger.level)
+    saved_quiet = IndexerLogger.is_hot_path_quiet()
+
+    with open(os.devnull, 'w') as devnull:
+        handler = logging.StreamHandler(devnull)
+        handler.setFormatter(IndexerFormatter(include_context=True))
+        root_logger.handlers = [handler]
+        IndexerLogger.set_level(level)
+        IndexerLogger.set_hot_path_quiet(hot_path_quiet)
+        try:
+            yield
+        finally:
+            root_logger.handlers = saved_handlers
+            IndexerLogger.set_level(saved_level)
+            IndexerLogger.set_hot_path_quiet(saved_quiet)
+
+
+class LoggingBenchmark:
+    """Benchmark transform time against log level."""
+
+    def __init__(self, model_name: str = None):
+        self.env = get_testing_environment(model_name=model_name)
+        self.block_decoder = self.env.get_service(BlockDecoder)
+        self.transform_manager = self.env.get_service(TransformManager)
+        self.pipeline = IndexingPipeline(
+            repository_manager=self.env.get_service(RepositoryManager),
+            domain_event_writer=self.env.get_service(DomainEventWriter),
+            rpc_client=self.env.get_service(QuickNodeRpcClient),
+            storage_handler=DiscardingStorage(),
+            block_decoder=self.block_decoder,
+            transform_manager=self.transform_manager,
+            listen_for_jobs=False
+        )
+
+    def transform_block(self, decoded_block):
+        return [
+            self.transform_manager.process_transaction(transaction)[1]
+            for transaction in decoded_block.transactions.values()
+        ]
+
+    def pipeline_block(self, decoded_block):
+        """IndexingPipeline per-block path without database persistence"""
+        transformed_block = self.pipeline._transform_block(decoded_block)
+        self.pipeline._save_to_storage(transformed_block)
+        return transformed_block
+
+    def reference_pipeline_block(self, decoded_block):
+        """Per-block path with the previous eager INFO save payload"""
+        transformed_block = self.pipeline._transform_block(decoded_block)
+        reference_save_log(self.pipeline.logger, transformed_block)
+        self.pipeline._save_to_storage(transformed_block)
+        return transformed_block
+
+    def run(self, block_number: int = None, block_file: str = None, iterations: int = 5) -> bool:
+        print(f"⏱️ Logging Overhead Benchmark")
+        print("=" * 60)
+
+        raw_block = load_raw_block(self.env, block_number, block_file)
+        if not raw_block:
+            print(f"❌ Block not found")
+            return False
+
+        decoded_block = self.block_decoder.decode_block(raw_block)
+        tx_count = len(decoded_block.transactions or {})
+        if not tx_count:
+            print(f"❌ Block has no transactions")
+            return False
+        print(f"   Transactions in block: {tx_count}")
+
+        # Warm transformer and contract caches
+        with log_setup("WARNING"):
+            self.transform_block(decoded_block)
+
+        timings = {}
+        for label, level, quiet in LEVELS:
+            with log_setup(level, quiet):
+                timings[label], _ = time_call(lambda: self.transform_block(decoded_block), iterations)
+
+        print(f"\n📝 Per-transaction transform time")
+        print("─" * 60)
+        for label, seconds in timings.items():
+            print(f"   {label:<24} {seconds / tx_count * 1000:8.3f} ms/tx")
+
+        print_comparison("Transform (INFO -> WARNING)", timings["INFO"], timings["WARNING"], tx_count, "txs")
+        print_comparison("Transform (INFO -> INFO + hot path quiet)",
+                         timings["INFO"], timings["INFO + hot path quiet"], tx_count, "txs")
+
+        block_timings = {}
+        for label, level, quiet in LEVELS:
+            with log_setup(level, quiet):
+                block_timings[label], _ = time_call(lambda: self.pipeline_block(decoded_block), iterations)
+        with log_setup("INFO"):
+            reference_timing, _ = time_call(lambda: self.reference_pipeline_block(decoded_block), iterations)
+
+        print(f"\n🧱 Pipeline per-block time (transform + storage save, writes discarded)")
+        print("─" * 60)
+        print(f"   {'INFO, eager save payload':<24} {reference_timing * 1000:8.3f} ms/block")
+        for label, seconds in block_timings.items():
+            print(f"   {label:<24} {seconds * 1000:8.3f} ms/block")
+
+        print_comparison("Pipeline block (eager INFO save payload -> lazy DEBUG)",
+                         reference_timing, block_timings["INFO"], 1, "blocks")
+        print_comparison("Pipeline block (INFO -> INFO + hot path quiet)",
+                         block_timings["INFO"], block_timings["INFO + hot path quiet"], 1, "blocks")
+        return True
+
+
+def main():
+    """Run logging overhead benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark block transform time by log level')
+    parser.add_argument('block_number', type=int, nargs='?', help='Block number to load from rpc storage')
+    parser.add_argument('--block-file', help='Path to recorded EvmFilteredBlock JSON (skips GCS)')
+    parser.add_argument('--iterations', type=int, default=5, help='Timing iterations (best is reported)')
+    parser.add_argument('--model', help='Model name (defaults to env var)')
+    args = parser.parse_args()
+
+    if args.block_number is None and not args.block_file:
+        parser.error("block_number or --block-file is required")
+
+    benchmark = LoggingBenchmark(model_name=args.model)
+    success = benchmark.run(args.block_number, args.block_file, args.iterations)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# testing/benchmarks/transformer_benchmark.py
+
+"""
+Transformer Benchmark
+
+Runs every registered transformer over the decoded logs of a recorded block,
+grouped per transaction and contract the way TransformManager calls them,
+comparing the compiled dispatch plans against the generic path (plans
+disabled, every log through _validate_log and the handler map). Reports
+per-transformer timings and checks both paths produce identical signals.
+"""
+
+import sys
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add project root to Python path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from testing import get_testing_environment
+from testing.benchmarks import time_call, load_raw_block, load_block, print_comparison
+from indexer.decode.block_decoder import BlockDecoder
+from indexer.transform.registry import TransformRegistry
+from indexer.types import DecodedLog
+
+
+@contextmanager
+def generic_dispatch(transformers):
+    """Reference: no compiled plans, every log takes the generic validation path."""
+    saved = {id(transformer): transformer._plans for transformer in transformers}
+    for transformer in transformers:
+        transformer._plans = {}
+    try:
+        yield
+    finally:
+        for transformer in transformers:
+            transformer._plans = saved[id(transformer)]
+
+
+class TransformerBenchmark:
+    """Benchmark transformer log dispatch over a recorded block."""
+
+    def __init__(self, model_name: str = None):
+        self.env = get_testing_environment(model_name=model_name)
+        self.block_decoder = self.env.get_service(BlockDecoder)
+        self.registry = self.env.get_service(TransformRegistry)
+
+    def collect_calls(self, decoded_block):
+        """(transformer, logs) per transaction and contract, grouped by transformer class"""
+        calls = defaultdict(list)
+        for transaction in (decoded_block.transactions or {}).values():
+            logs_by_contract = defaultdict(list)
+            for log in (transaction.logs or {}).values():
+                if isinstance(log, DecodedLog):
+                    logs_by_contract[log.contract].append(log)
+
+            for contract, logs in logs_by_contract.items():
+                transformer = self.registry.get_transformer(contract)
+                if transformer:
+                    calls[type(transformer).__name__].append((transformer, logs))
+        return calls
+
+    @staticmethod
+    def run_calls(calls):
+        results = []
+        for transformer, logs in calls:
+            signals, errors = transformer.process_logs(logs)
+            results.append((signals, len(errors or {})))
+        return results
+
+    def run(self, block_number: int = None, block_file: str = None, decoded_file: str = None,
+            iterations: int = 5) -> bool:
+        print(f"⏱️ Transformer Benchmark")
+        print("=" * 60)
+
+        if decoded_file:
+            decoded_block = load_block(decoded_file)
+        else:
+            raw_block = load_raw_block(self.env, block_number, block_file)
+            if not raw_block:
+                print(f"❌ Block not found")
+                return False
+            decoded_block = self.block_decoder.decode_block(raw_block)
+
+        calls = self.collect_calls(decoded_block)
+        if not calls:
+            print(f"❌ No logs for registered transformers in block")
+            return False
+
+        print(f"   Transactions in block: {len(decoded_block.transactions or {})}")
+        print(f"   Transformers exercised: {len(calls)}")
+
+        all_transformers = [transformer for group in calls.values() for transformer, _ in group]
+        identical = True
+        total_before = total_after = 0.0
+        total_logs = 0
+
+        for name, group in sorted(calls.items()):
+            log_count = sum(len(logs) for _, logs in group)
+            total_logs += log_count
+
+            with generic_dispatch(all_transformers):
+                before_results = self.run_calls(group)
+                before, _ = time_call(lambda: self.run_calls(group), iterations)
+            after_results = self.run_calls(group)
+            after, _ = time_call(lambda: self.run_calls(group), iterations)
+
+            total_before += before
+            total_after += after
+            print_comparison(f"{name} ({len(group)} calls)", before, after, log_count, "logs")
+
+            if before_results != after_results:
+                print(f"   ❌ Signals or error counts differ between dispatch paths")
+                identical = False
+
+        print_comparison("All transformers", total_before, total_after, total_logs, "logs")
+
+        if not identical:
+            print(f"\n❌ Dispatch plans changed transformer output")
+            return False
+
+        print(f"\n✅ Signals identical")
+        return True
+
+
+def main():
+    """Run transformer benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark compiled transformer dispatch plans over a block')
+    parser.add_argument('block_number', type=int, nargs='?', help='Block number to load from rpc storage')
+    parser.add_argument('--block-file', help='Path to recorded EvmFilteredBlock JSON (skips GCS)')
+    parser.add_argument('--decoded-file', help='Path to recorded decoded Block JSON (skips decoding)')
+    parser.add_argument('--iterations', type=int, default=5, help='Timing iterations (best is reported)')
+    parser.add_argument('--model', help='Model name (defaults to env var)')
+    args = parser.parse_args()
+
+    if args.block_number is None and not args.block_file and not args.decoded_file:
+        parser.error("block_number, --block-file or --decoded-file is required")
+
+    benchmark = TransformerBenchmark(model_name=args.model)
+    success = benchmark.run(args.block_number, args.block_file, args.decoded_file, args.iterations)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
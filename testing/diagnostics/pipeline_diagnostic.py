@@ -23,6 +23,9 @@ from indexer.decode.block_decoder import BlockDecoder
 from indexer.transform.manager import TransformManager
 from indexer.transform.registry import TransformRegistry
 from indexer.contracts.registry import ContractRegistry
+from indexer.pipeline.parallel_processor import ParallelBlockProcessor, STORED_BLOCK
+from indexer.storage.block_format import encode_block
+from indexer.types import Block
 
 
 class PipelineDiagnostic:
@@ -50,6 +53,7 @@ class PipelineDiagnostic:
         self._test_rpc_client()
         self._test_block_decoder()
         self._test_transform_system()
+        self._test_parallel_processor()
         
         # Print results
         self._print_results()
@@ -225,6 +229,23 @@ class PipelineDiagnostic:
         except Exception as e:
             self.results.append(("Transform System", False, str(e)))
     
+    def _test_parallel_processor(self):
+        """Start the decode/transform process pool and run an empty block through it."""
+        print("\n🧵 Testing Parallel Block Processor...")
+        
+        try:
+            with ParallelBlockProcessor(self.config, max_workers=1) as processor:
+                payload = encode_block(Block(block_number=0, timestamp=0, transactions={}))
+                block_number, block, error = next(processor.process_blocks([(0, STORED_BLOCK, payload)]))
+            
+            if block is not None:
+                self.results.append(("Parallel Processor", True, "Worker pool started"))
+            else:
+                self.results.append(("Parallel Processor", False, error))
+                
+        except Exception as e:
+            self.results.append(("Parallel Processor", False, str(e)))
+    
     def _print_results(self):
         """Print diagnostic results."""
         print("\n📊 Results:")